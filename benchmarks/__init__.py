@@ -0,0 +1,10 @@
+"""
+실제 모델 없이 실행 가능한 단계별 성능 벤치마크
+
+    PYTHONPATH=src python -m benchmarks --out bench.json
+    PYTHONPATH=src python -m benchmarks --out new.json --baseline bench.json
+
+Python / C++(pyrealtime) 점수 일치 및 속도 비교:
+
+    PYTHONPATH=src:<pyrealtime 빌드 경로> python -m benchmarks.parity --out parity.json
+"""
@@ -0,0 +1,62 @@
+import argparse
+import logging
+import os
+import sys
+
+from benchmarks.stage_bench import run_benchmark, compare_to_baseline, save_json, load_json, STAGES
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="GOP 파이프라인 단계별 벤치마크")
+    parser.add_argument("--tokenizer", default=os.path.join(BASE_DIR, "models/tokenizer.json"))
+    parser.add_argument("--model", default=None, help="ONNX 모델 경로 (없으면 작은 합성 모델 사용)")
+    parser.add_argument("--audio-seconds", type=float, nargs="+", default=[1.0, 2.0, 4.0, 8.0])
+    parser.add_argument("--words", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--hidden-dim", type=int, default=64)
+    parser.add_argument("--backend", default="python-dtw", help="DTW 정렬 백엔드 (python-dtw, numpy, native)")
+    parser.add_argument("--conv-stack", action="store_true",
+                        help="합성 모델에 Conv 특징 추출기 사용 (IOBinding 출력 버퍼 경로 측정)")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=1.2, help="회귀로 판단할 배율")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    result = run_benchmark(
+        tokenizer_path=args.tokenizer,
+        model_path=args.model,
+        audio_seconds=args.audio_seconds,
+        sentence_words=args.words,
+        repeats=args.repeats,
+        hidden_dim=args.hidden_dim,
+        alignment_backend=args.backend,
+        conv_stack=args.conv_stack
+    )
+
+    header = f"{'audio(s)':>8} {'words':>5} " + " ".join(f"{s:>13}" for s in STAGES) + f" {'total(ms)':>10}"
+    print(header)
+    for row in result["results"]:
+        cells = " ".join(f"{row['stages'][s]:>13.3f}" for s in STAGES)
+        print(f"{row['audio_seconds']:>8.1f} {row['num_words']:>5d} {cells} {row['total']:>10.3f}")
+
+    if args.out:
+        save_json(result, args.out)
+        print(f"\n결과 저장: {args.out}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(result, load_json(args.baseline), threshold=args.threshold)
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건 (기준 대비 {args.threshold}배 초과):")
+            for r in regressions:
+                print(f"  audio={r['audio_seconds']}s words={r['num_words']} {r['stage']}: "
+                      f"{r['baseline_ms']:.3f}ms -> {r['current_ms']:.3f}ms (x{r['ratio']})")
+            return 1
+        print("\n기준 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
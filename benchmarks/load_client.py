@@ -0,0 +1,223 @@
+"""
+스트리밍 서버 부하 생성 클라이언트
+
+동시 세션 여러 개를 열어 PCM을 실시간 속도(또는 --speed 배속)로 보내고,
+첫 점수까지 시간, 점수 간격, 본문 종료부터 최종 상태까지의 지연을 측정한다.
+
+    PYTHONPATH=src python -m benchmarks.load_client --port 8765 --sessions 16 --audio-seconds 6
+    PYTHONPATH=src python -m benchmarks.load_client --wav sample.wav --sentence "안녕하세요"
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import quote
+
+import numpy as np
+
+from benchmarks.synthetic import load_syllables, make_sentence, make_audio
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SAMPLE_RATE = 16000
+
+
+def to_pcm16(audio: np.ndarray) -> bytes:
+    """float [-1, 1] -> s16le"""
+    return (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+def load_wav(path: str) -> np.ndarray:
+    """16kHz 모노 float32로 읽기"""
+    import soundfile as sf
+    audio, sr = sf.read(path, dtype="float32")
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sr != SAMPLE_RATE:
+        raise ValueError(f"{path}: 16kHz만 지원합니다 (현재 {sr}Hz)")
+    return audio
+
+
+async def run_session(host: str, port: int, sentence: str, pcm: bytes, frame_ms: int = 100,
+                      speed: float = 1.0, model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    세션 하나 실행
+
+    Returns:
+        Dict[str, Any]: 상태, 이벤트 수, 첫 점수까지 시간, 최종 지연 (초)
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    target = f"/stream?sentence={quote(sentence)}" + (f"&model={quote(model)}" if model else "")
+    writer.write(f"POST {target} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/octet-stream\r\n"
+                 f"Transfer-Encoding: chunked\r\n\r\n".encode())
+
+    started = time.perf_counter()
+    stats: Dict[str, Any] = {"status": None, "scores": 0, "errors": [], "first_score": None,
+                             "end_latency": None, "score_times": []}
+    body_done_at = [None]
+
+    async def send() -> None:
+        frame_bytes = int(SAMPLE_RATE * frame_ms / 1000) * 2
+        interval = frame_ms / 1000.0 / speed if speed > 0 else 0.0
+        next_at = time.perf_counter()
+        try:
+            for offset in range(0, len(pcm), frame_bytes):
+                frame = pcm[offset:offset + frame_bytes]
+                writer.write(f"{len(frame):x}\r\n".encode() + frame + b"\r\n")
+                await writer.drain()
+                next_at += interval
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        except ConnectionError:
+            pass
+        body_done_at[0] = time.perf_counter()
+
+    async def receive() -> None:
+        status_line = await reader.readline()
+        stats["status"] = int(status_line.split()[1]) if status_line else None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if "chunked" not in headers.get("transfer-encoding", ""):
+            body = await reader.read()
+            stats["errors"].append(body.decode("utf-8", "replace"))
+            return
+        buffer = b""
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                break
+            size = int(size_line.strip() or b"0", 16)
+            if size == 0:
+                break
+            buffer += await reader.readexactly(size)
+            await reader.readexactly(2)
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                event = json.loads(line)
+                now = time.perf_counter()
+                if event["event"] == "score":
+                    stats["scores"] += 1
+                    stats["score_times"].append(now - started)
+                    if stats["first_score"] is None:
+                        stats["first_score"] = now - started
+                elif event["event"] == "end":
+                    if body_done_at[0] is not None:
+                        stats["end_latency"] = now - body_done_at[0]
+                elif event["event"] == "error":
+                    stats["errors"].append(event.get("reason"))
+
+    sender = asyncio.ensure_future(send())
+    try:
+        await receive()
+    finally:
+        sender.cancel()
+        writer.close()
+    stats["duration"] = time.perf_counter() - started
+    return stats
+
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+    p50, p95 = np.percentile(values, [50, 95])
+    return {"p50": round(float(p50), 4), "p95": round(float(p95), 4), "max": round(float(max(values)), 4)}
+
+
+async def run_load(host: str, port: int, sentences: List[str], audios: List[np.ndarray], sessions: int,
+                   ramp_seconds: float = 1.0, frame_ms: int = 100, speed: float = 1.0,
+                   model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    동시 세션 부하 실행
+
+    Args:
+        sentences / audios: 세션마다 돌려 쓸 문장과 오디오
+        sessions: 동시 세션 수
+        ramp_seconds: 세션 시작을 나눠 뿌릴 시간 (초)
+    """
+    async def delayed(index: int) -> Dict[str, Any]:
+        await asyncio.sleep(ramp_seconds * index / max(1, sessions))
+        k = index % len(sentences)
+        return await run_session(host, port, sentences[k], to_pcm16(audios[k]), frame_ms, speed, model)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(delayed(i) for i in range(sessions)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    ok = [r for r in results if isinstance(r, dict) and r["status"] == 200 and not r["errors"]]
+    failures = [r if isinstance(r, dict) else {"errors": [repr(r)]} for r in results if r not in ok]
+    gaps = []
+    for r in ok:
+        times = r["score_times"]
+        gaps.extend(b - a for a, b in zip(times, times[1:]))
+    return {
+        "sessions": sessions,
+        "succeeded": len(ok),
+        "failed": len(failures),
+        "failure_reasons": sorted({str(e) for f in failures for e in f.get("errors", []) or [f.get("status")]}),
+        "elapsed": round(elapsed, 3),
+        "scores_per_session": round(statistics.mean(r["scores"] for r in ok), 2) if ok else None,
+        "first_score": _percentiles([r["first_score"] for r in ok if r["first_score"] is not None]),
+        "score_gap": _percentiles(gaps),
+        "end_latency": _percentiles([r["end_latency"] for r in ok if r["end_latency"] is not None])
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="스트리밍 서버 부하 생성")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--ramp", type=float, default=1.0, help="세션 시작을 나눠 뿌릴 시간 (초)")
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--speed", type=float, default=1.0, help="전송 배속 (0이면 최대 속도)")
+    parser.add_argument("--wav", default=None, help="보낼 16kHz wav (없으면 합성 오디오)")
+    parser.add_argument("--sentence", default=None, help="wav에 대응하는 문장")
+    parser.add_argument("--audio-seconds", type=float, default=6.0)
+    parser.add_argument("--words", type=int, default=6)
+    parser.add_argument("--model", default=None, help="모델 키 (레지스트리 서버)")
+    parser.add_argument("--tokenizer", default=os.path.join(BASE_DIR, "models/tokenizer.json"))
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.wav:
+        if not args.sentence:
+            parser.error("--wav에는 --sentence가 필요합니다")
+        sentences, audios = [args.sentence], [load_wav(args.wav)]
+    else:
+        syllables = load_syllables(args.tokenizer)
+        sentences = [make_sentence(syllables, args.words, seed=i) for i in range(4)]
+        audios = [make_audio(args.audio_seconds, seed=i) for i in range(4)]
+
+    report = asyncio.run(run_load(args.host, args.port, sentences, audios, args.sessions,
+                                  args.ramp, args.frame_ms, args.speed, args.model))
+
+    print(f"sessions {report['succeeded']}/{report['sessions']} ok in {report['elapsed']}s, "
+          f"{report['scores_per_session']} scores/session")
+    for key in ("first_score", "score_gap", "end_latency"):
+        p = report[key]
+        print(f"  {key:>12}: p50 {p['p50']}s, p95 {p['p95']}s, max {p['max']}s")
+    if report["failed"]:
+        print(f"  failures: {report['failed']} {report['failure_reasons']}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.out}")
+    return 0 if not report["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
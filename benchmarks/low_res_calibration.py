@@ -0,0 +1,130 @@
+"""
+저해상도 정렬(프레임 평균 + prototype 주성분 투영) 보정 보고
+
+같은 인코더 출력으로 전체 해상도와 저해상도 점수를 모두 계산해 단어 점수 편차와 정렬 시간을 비교한다.
+
+    PYTHONPATH=src python -m benchmarks.low_res_calibration --dim 32 --pool 2 --out low_res.json
+"""
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, Any, Optional, Sequence
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.low_res_alignment import calibration_report
+from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+from benchmarks.synthetic import load_syllables, make_sentence, make_audio
+from benchmarks.stage_bench import _prepare_tensor, save_json
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def run_calibration(
+    tokenizer_path: str,
+    model_path: Optional[str] = None,
+    audio_seconds: Sequence[float] = (1.0, 2.0, 4.0, 8.0),
+    sentence_words: Sequence[int] = (2, 4, 8),
+    low_res_dim: int = 32,
+    low_res_pool: int = 2,
+    hidden_dim: int = 256,
+    tolerance: float = 5.0,
+    seed: int = 0,
+    alignment_backend: str = "python-dtw"
+) -> Dict[str, Any]:
+    """
+    오디오 길이 x 문장 길이 격자에 대해 저해상도 정렬 편차 측정
+
+    Args:
+        tokenizer_path: tokenizer.json 경로
+        model_path: ONNX 모델 (없으면 작은 합성 모델 생성)
+        audio_seconds: 오디오 길이 목록 (초)
+        sentence_words: 문장 단어 수 목록
+        low_res_dim: 투영 차원
+        low_res_pool: 평균할 연속 프레임 수
+        hidden_dim: 합성 모델 hidden 차원
+        tolerance: 허용할 단어 점수 차이
+        seed: 난수 시드
+        alignment_backend: DTW 정렬 백엔드
+
+    Returns:
+        Dict[str, Any]: JSON으로 저장 가능한 결과
+    """
+    tmp_dir = None
+    if model_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="gop_low_res_")
+        model_path = build_tiny_model(
+            os.path.join(tmp_dir, "tiny_w2v2_ctc.onnx"),
+            vocab_size=tokenizer_vocab_size(tokenizer_path),
+            hidden_dim=hidden_dim,
+            seed=seed
+        )
+
+    try:
+        core = Wav2VecCTCOnnxCore(model_path, tokenizer_path, alignment_backend=alignment_backend,
+                                  low_res_dim=low_res_dim, low_res_pool=low_res_pool)
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    syllables = load_syllables(tokenizer_path)
+    samples = []
+    for seconds in audio_seconds:
+        X, logits = core.encode(_prepare_tensor(make_audio(seconds, seed=seed)), reuse_outputs=False)
+        for num_words in sentence_words:
+            samples.append((X, logits, make_sentence(syllables, num_words, seed=seed)))
+
+    # 첫 실행은 워밍업으로 버림
+    calibration_report(core, samples[:1], tolerance=tolerance)
+    report = calibration_report(core, samples, tolerance=tolerance)
+    report["meta"] = {
+        "model": "synthetic" if tmp_dir else os.path.basename(model_path),
+        "hidden_dim": int(core.prototype_matrix.shape[1]),
+        "backend": core.aligner.name
+    }
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="저해상도 정렬 점수 편차 보고")
+    parser.add_argument("--tokenizer", default=os.path.join(BASE_DIR, "models/tokenizer.json"))
+    parser.add_argument("--model", default=None, help="ONNX 모델 경로 (없으면 작은 합성 모델 사용)")
+    parser.add_argument("--audio-seconds", type=float, nargs="+", default=[1.0, 2.0, 4.0, 8.0])
+    parser.add_argument("--words", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--dim", type=int, default=32, help="투영 차원")
+    parser.add_argument("--pool", type=int, default=2, help="평균할 연속 프레임 수")
+    parser.add_argument("--hidden-dim", type=int, default=256)
+    parser.add_argument("--backend", default="python-dtw", help="DTW 정렬 백엔드 (python-dtw, numpy, native)")
+    parser.add_argument("--tolerance", type=float, default=5.0, help="허용할 단어 점수 차이")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    report = run_calibration(
+        tokenizer_path=args.tokenizer,
+        model_path=args.model,
+        audio_seconds=args.audio_seconds,
+        sentence_words=args.words,
+        low_res_dim=args.dim,
+        low_res_pool=args.pool,
+        hidden_dim=args.hidden_dim,
+        tolerance=args.tolerance,
+        alignment_backend=args.backend
+    )
+
+    print(f"dim={report['dim']} pool={report['pool_factor']} ({report['samples']} samples, {report['words']} words)")
+    print(f"word |diff| mean {report['word_mean_abs_diff']}, p95 {report['word_p95_abs_diff']}, "
+          f"max {report['word_max_abs_diff']}, within {args.tolerance}: {report['within_tolerance']}")
+    print(f"overall |diff| mean {report['overall_mean_abs_diff']}")
+    print(f"scoring time: full {report['full_ms']}ms, low-res {report['low_res_ms']}ms (x{report['speedup']})")
+
+    if args.out:
+        save_json(report, args.out)
+        print(f"결과 저장: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
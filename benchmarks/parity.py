@@ -0,0 +1,285 @@
+"""
+Python 구현(realtime_engine_ko)과 C++ 포트(pyrealtime) 비교
+
+같은 입력으로 두 구현을 실행해 단계별 결과 차이와 속도를 나란히 보고한다.
+
+    PYTHONPATH=src:build python -m benchmarks.parity --out parity.json
+
+pyrealtime은 src/cpp를 -DBUILD_PYTHON_BINDINGS=ON으로 빌드해야 생긴다.
+C++ 코어는 prototype 행렬을 모델에서 읽지 않으므로 기본적으로 Python 쪽 행렬을 주입해서 비교한다
+(--native-prototype을 주면 C++ 기본값 그대로 비교).
+"""
+import argparse
+import importlib
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+from benchmarks.synthetic import load_syllables, make_sentence, make_audio
+from benchmarks.stage_bench import _prepare_tensor, save_json
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def load_native(module_name: str = "pyrealtime"):
+    """C++ 바인딩 모듈 로드 (없으면 None)"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def _timed(fn, repeats: int) -> Tuple[Any, float]:
+    """fn을 repeats번 실행하고 (마지막 결과, 중앙값 ms) 반환"""
+    times, result = [], None
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - started) * 1000.0)
+    return result, statistics.median(times)
+
+
+def _speed(python_ms: float, native_ms: float) -> Dict[str, float]:
+    return {
+        "python_ms": round(python_ms, 4),
+        "native_ms": round(native_ms, 4),
+        "speedup": round(python_ms / native_ms, 3) if native_ms > 0 else None
+    }
+
+
+def _frame_tokens(pX, pY, num_frames: int) -> np.ndarray:
+    """정렬 경로 -> 프레임별 토큰 인덱스 (여러 토큰에 걸친 프레임은 마지막 토큰)"""
+    tokens = np.full(num_frames, -1, dtype=np.int64)
+    for f, t in zip(pX, pY):
+        tokens[int(f)] = int(t)
+    return tokens
+
+
+def compare_words(python_words: List[dict], native_words: List[dict]) -> List[Dict[str, Any]]:
+    """단어별 발음 점수 차이 (단어 수가 다르면 짧은 쪽까지 비교하고 나머지는 None)"""
+    rows = []
+    for i in range(max(len(python_words), len(native_words))):
+        py_w = python_words[i] if i < len(python_words) else None
+        nt_w = native_words[i] if i < len(native_words) else None
+        py_s = py_w["scores"]["pronunciation"] if py_w else None
+        nt_s = nt_w["scores"]["pronunciation"] if nt_w else None
+        rows.append({
+            "word": (py_w or nt_w)["word"],
+            "python": py_s,
+            "native": nt_s,
+            "diff": round(abs(py_s - nt_s), 3) if py_s is not None and nt_s is not None else None
+        })
+    return rows
+
+
+def _score_diff(python_result: dict, native_result: dict) -> Dict[str, Any]:
+    words = compare_words(python_result["words"], native_result["words"])
+    diffs = [w["diff"] for w in words if w["diff"] is not None]
+    return {
+        "overall_python": python_result["overall"],
+        "overall_native": native_result["overall"],
+        "overall_diff": round(abs(python_result["overall"] - native_result["overall"]), 3),
+        "max_word_diff": max(diffs) if diffs else None,
+        "word_count_match": len(python_result["words"]) == len(native_result["words"]),
+        "words": words
+    }
+
+
+def compare_once(core: Wav2VecCTCOnnxCore, native, native_core, audio: np.ndarray, text: str,
+                 repeats: int = 5) -> Dict[str, Any]:
+    """
+    한 입력에 대해 단계별로 두 구현 비교
+
+    - encoder: 같은 오디오 -> hidden/logits 최대 절대 오차
+    - dtw: 같은 (hidden, 확장 prototype) 입력 -> 경로 일치율
+    - scoring: 같은 인코더 출력 -> 단어별 점수 차이 (인코더 차이와 분리)
+    - end_to_end: 오디오 -> 점수
+    """
+    tensor = _prepare_tensor(audio)
+    native_audio = tensor.numpy()[0]
+    stages: Dict[str, Any] = {}
+
+    # 1) 인코더
+    (X, logits), py_ms = _timed(lambda: core.encode(tensor), repeats)
+    (nX, nlogits), nt_ms = _timed(lambda: native_core.encode(native_audio), repeats)
+    stages["encoder"] = {
+        **_speed(py_ms, nt_ms),
+        "hidden_max_abs_diff": float(np.max(np.abs(X - nX))) if X.shape == nX.shape else None,
+        "logits_max_abs_diff": float(np.max(np.abs(logits - nlogits))) if logits.shape == nlogits.shape else None
+    }
+
+    # 2) DTW (Python 쪽 hidden과 prototype으로 같은 입력 구성)
+    safe_ids = core.tokenize(text)
+    T, M = X.shape[0], len(safe_ids)
+    avg = max(1, T // M)
+    Yexp = np.repeat(core.prototype_matrix[safe_ids], avg, axis=0)
+    (pX, pYexp), py_ms = _timed(lambda: core.dtw_align(X, Yexp), repeats)
+    (nX_path, nY_path), nt_ms = _timed(lambda: native.dtw_align(X.astype(np.float64), Yexp.astype(np.float64)),
+                                       repeats)
+    py_tokens = _frame_tokens(pX, [y // avg for y in pYexp], T)
+    nt_tokens = _frame_tokens(nX_path, [y // avg for y in nY_path], T)
+    stages["dtw"] = {
+        **_speed(py_ms, nt_ms),
+        "path_identical": list(map(int, pX)) == list(nX_path) and list(map(int, pYexp)) == list(nY_path),
+        "frame_token_agreement": round(float(np.mean(py_tokens == nt_tokens)), 4)
+    }
+
+    # 3) 채점 (같은 인코더 출력)
+    py_result, py_ms = _timed(lambda: core.calculate_gop_from_features(X, logits, text), repeats)
+    nt_result, nt_ms = _timed(lambda: native_core.calculate_gop_from_features(X, logits, text), repeats)
+    stages["scoring"] = {**_speed(py_ms, nt_ms), **_score_diff(py_result, nt_result)}
+
+    # 4) 전체 경로
+    py_result, py_ms = _timed(lambda: core.calculate_gop_from_tensor(tensor, text), repeats)
+    nt_result, nt_ms = _timed(lambda: native_core.calculate_gop_from_tensor(native_audio, text), repeats)
+    stages["end_to_end"] = {**_speed(py_ms, nt_ms), **_score_diff(py_result, nt_result)}
+
+    return stages
+
+
+def run_parity(
+    tokenizer_path: str,
+    model_path: Optional[str] = None,
+    audio_seconds: Sequence[float] = (1.0, 2.0, 4.0),
+    sentence_words: Sequence[int] = (2, 4, 8),
+    repeats: int = 5,
+    hidden_dim: int = 64,
+    seed: int = 0,
+    native_module: str = "pyrealtime",
+    sync_prototype: bool = True
+) -> Dict[str, Any]:
+    """
+    오디오 길이 x 문장 길이 격자에 대해 두 구현 비교
+
+    Args:
+        tokenizer_path: tokenizer.json 경로
+        model_path: ONNX 모델 (없으면 작은 합성 모델 생성)
+        audio_seconds: 오디오 길이 목록 (초)
+        sentence_words: 문장 단어 수 목록
+        repeats: 단계별 반복 횟수 (중앙값 사용)
+        hidden_dim: 합성 모델 hidden 차원
+        seed: 난수 시드
+        native_module: C++ 바인딩 모듈 이름
+        sync_prototype: C++ 코어에 Python 쪽 prototype 행렬을 주입할지 여부
+
+    Returns:
+        Dict[str, Any]: JSON으로 저장 가능한 결과
+    """
+    native = load_native(native_module)
+    if native is None:
+        raise RuntimeError(f"C++ 바인딩 모듈 '{native_module}'을 불러올 수 없습니다. "
+                           "src/cpp를 -DBUILD_PYTHON_BINDINGS=ON으로 빌드하고 PYTHONPATH에 추가하세요.")
+
+    tmp_dir = None
+    if model_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="gop_parity_")
+        model_path = build_tiny_model(
+            os.path.join(tmp_dir, "tiny_w2v2_ctc.onnx"),
+            vocab_size=tokenizer_vocab_size(tokenizer_path),
+            hidden_dim=hidden_dim,
+            seed=seed
+        )
+
+    try:
+        core = Wav2VecCTCOnnxCore(model_path, tokenizer_path)
+        native_core = native.Wav2VecCTCOnnxCore(model_path, tokenizer_path)
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    if sync_prototype:
+        native_core.set_prototype_matrix(np.asarray(core.prototype_matrix, dtype=np.float32))
+
+    syllables = load_syllables(tokenizer_path)
+    results: List[Dict[str, Any]] = []
+    py_total_ms = nt_total_ms = audio_total = 0.0
+    for seconds in audio_seconds:
+        audio = make_audio(seconds, seed=seed)
+        for num_words in sentence_words:
+            text = make_sentence(syllables, num_words, seed=seed)
+            # 첫 실행은 워밍업으로 버림
+            compare_once(core, native, native_core, audio, text, repeats=1)
+            stages = compare_once(core, native, native_core, audio, text, repeats=repeats)
+            results.append({"audio_seconds": seconds, "num_words": num_words, "text": text, "stages": stages})
+            py_total_ms += stages["end_to_end"]["python_ms"]
+            nt_total_ms += stages["end_to_end"]["native_ms"]
+            audio_total += seconds
+
+    return {
+        "meta": {
+            "model": "synthetic" if tmp_dir else os.path.basename(model_path),
+            "repeats": repeats,
+            "prototype": "python" if sync_prototype else "native-default"
+        },
+        "throughput": {
+            # 처리한 오디오 초 / 걸린 초
+            "python_x_realtime": round(audio_total / (py_total_ms / 1000.0), 2) if py_total_ms else None,
+            "native_x_realtime": round(audio_total / (nt_total_ms / 1000.0), 2) if nt_total_ms else None
+        },
+        "results": results
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Python / C++ 구현 점수 일치 및 속도 비교")
+    parser.add_argument("--tokenizer", default=os.path.join(BASE_DIR, "models/tokenizer.json"))
+    parser.add_argument("--model", default=None, help="ONNX 모델 경로 (없으면 작은 합성 모델 사용)")
+    parser.add_argument("--audio-seconds", type=float, nargs="+", default=[1.0, 2.0, 4.0])
+    parser.add_argument("--words", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--hidden-dim", type=int, default=64)
+    parser.add_argument("--native-module", default="pyrealtime")
+    parser.add_argument("--native-prototype", action="store_true",
+                        help="C++ 코어의 기본 prototype 행렬을 그대로 사용")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="허용할 단어 점수 차이")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    result = run_parity(
+        tokenizer_path=args.tokenizer,
+        model_path=args.model,
+        audio_seconds=args.audio_seconds,
+        sentence_words=args.words,
+        repeats=args.repeats,
+        hidden_dim=args.hidden_dim,
+        native_module=args.native_module,
+        sync_prototype=not args.native_prototype
+    )
+
+    stage_names = ("encoder", "dtw", "scoring", "end_to_end")
+    print(f"{'audio(s)':>8} {'words':>5} " + " ".join(f"{s + ' py/cpp ms':>24}" for s in stage_names)
+          + f" {'dtw agree':>9} {'max diff':>8}")
+    mismatches = 0
+    for row in result["results"]:
+        st = row["stages"]
+        cells = " ".join(f"{st[s]['python_ms']:>11.3f}/{st[s]['native_ms']:<12.3f}" for s in stage_names)
+        max_diff = st["end_to_end"]["max_word_diff"]
+        if max_diff is None or max_diff > args.tolerance or not st["end_to_end"]["word_count_match"]:
+            mismatches += 1
+        print(f"{row['audio_seconds']:>8.1f} {row['num_words']:>5d} {cells} "
+              f"{st['dtw']['frame_token_agreement']:>9.3f} {max_diff if max_diff is not None else '-':>8}")
+
+    tp = result["throughput"]
+    print(f"\n처리량 (실시간 대비 배수): python {tp['python_x_realtime']}x, native {tp['native_x_realtime']}x")
+
+    if args.out:
+        save_json(result, args.out)
+        print(f"결과 저장: {args.out}")
+
+    if mismatches:
+        print(f"점수 불일치 {mismatches}건 (허용 오차 {args.tolerance})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+워커 수에 따른 전체 메모리 비교: 워커마다 모델을 따로 로드 vs 부모에서 공유(SharedModel)
+
+각 워커가 엔진을 만들고 추론을 한 번 실행한 뒤 자신의 RSS/PSS를 보고한다.
+PSS 합은 공유 페이지를 한 번만 세므로 실제 사용량에 가깝다 (Linux 전용).
+
+    PYTHONPATH=src python -m benchmarks.shared_workers --workers 1 2 4 8 --model models/model.onnx
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, Any, List, Optional, Sequence
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.shared_model import SharedModel, start_workers, process_memory
+from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+from benchmarks.synthetic import make_audio
+from benchmarks.stage_bench import _prepare_tensor, save_json
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _measure_workers(spawn, num_workers: int) -> Dict[str, Any]:
+    """워커들을 띄우고 각자 보고한 메모리를 모아 합산"""
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    release = context.Event()
+
+    def body(engine: Wav2VecCTCOnnxCore, index: int) -> None:
+        engine.encode(_prepare_tensor(make_audio(2.0, seed=index)))
+        queue.put(process_memory())
+        # 모든 워커가 측정할 때까지 살아 있어야 공유 페이지가 나뉘어 계산됨
+        release.wait()
+
+    workers = spawn(body, num_workers, context)
+    reports = [queue.get() for _ in range(num_workers)]
+    release.set()
+    for worker in workers:
+        worker.join()
+
+    reports = [r for r in reports if r]
+    return {
+        "workers": num_workers,
+        "rss_total": sum(r.get("rss", 0) for r in reports),
+        "pss_total": sum(r.get("pss", 0) for r in reports),
+        "private_dirty_total": sum(r.get("private_dirty", 0) for r in reports)
+    }
+
+
+def run_shared_workers(
+    tokenizer_path: str,
+    model_path: Optional[str] = None,
+    worker_counts: Sequence[int] = (1, 2, 4),
+    hidden_dim: int = 256
+) -> Dict[str, Any]:
+    """
+    워커 수별로 독립 로드/공유 로드의 메모리 합 비교
+
+    Returns:
+        Dict[str, Any]: JSON으로 저장 가능한 결과
+    """
+    if process_memory() is None:
+        raise RuntimeError("/proc/<pid>/smaps_rollup을 읽을 수 없습니다 (Linux 전용)")
+
+    tmp_dir = None
+    if model_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="gop_shared_")
+        model_path = build_tiny_model(
+            os.path.join(tmp_dir, "tiny_w2v2_ctc.onnx"),
+            vocab_size=tokenizer_vocab_size(tokenizer_path),
+            hidden_dim=hidden_dim
+        )
+
+    try:
+        def private(body, n, context):
+            workers = []
+            for index in range(n):
+                target = lambda i=index: body(Wav2VecCTCOnnxCore(model_path, tokenizer_path), i)
+                worker = context.Process(target=target, daemon=True)
+                worker.start()
+                workers.append(worker)
+            return workers
+
+        shared = SharedModel(model_path, tokenizer_path)
+        try:
+            def forked(body, n, context):
+                return start_workers(shared, body, n)
+
+            results: List[Dict[str, Any]] = []
+            for n in worker_counts:
+                results.append({
+                    "workers": n,
+                    "private": _measure_workers(private, n),
+                    "shared": _measure_workers(forked, n)
+                })
+        finally:
+            shared.close()
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {"model": "synthetic" if tmp_dir else os.path.basename(model_path), "results": results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="공유 모델 워커 메모리 비교")
+    parser.add_argument("--tokenizer", default=os.path.join(BASE_DIR, "models/tokenizer.json"))
+    parser.add_argument("--model", default=None, help="ONNX 모델 경로 (없으면 작은 합성 모델 사용)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--hidden-dim", type=int, default=256)
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    result = run_shared_workers(args.tokenizer, args.model, args.workers, args.hidden_dim)
+
+    print(f"{'workers':>7} {'private PSS(MB)':>16} {'shared PSS(MB)':>15} {'private RSS(MB)':>16} {'shared RSS(MB)':>15}")
+    for row in result["results"]:
+        p, s = row["private"], row["shared"]
+        print(f"{row['workers']:>7d} {p['pss_total'] / 1e6:>16.1f} {s['pss_total'] / 1e6:>15.1f} "
+              f"{p['rss_total'] / 1e6:>16.1f} {s['rss_total'] / 1e6:>15.1f}")
+
+    if args.out:
+        save_json(result, args.out)
+        print(f"결과 저장: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+from benchmarks.synthetic import load_syllables, make_sentence, make_audio
+
+STAGES = ("encoder", "softmax", "tokenize", "dtw", "token_scores", "word_grouping")
+
+
+def _prepare_tensor(audio: np.ndarray) -> torch.Tensor:
+    """AudioProcessor._preprocess_chunk와 같은 정규화"""
+    audio = (audio - audio.mean()) / (audio.std() + 1e-8)
+    return torch.from_numpy(audio.astype(np.float32)).unsqueeze(0)
+
+
+def time_stages(core: Wav2VecCTCOnnxCore, audio_tensor: torch.Tensor, text: str,
+                eps: float = 1e-8) -> Dict[str, float]:
+    """
+    calculate_gop_from_tensor의 각 단계를 순서대로 실행하며 소요 시간 측정
+
+    Returns:
+        Dict[str, float]: 단계 이름 -> 소요 시간 (ms)
+    """
+    timings = {}
+
+    t0 = time.perf_counter()
+    X, logits = core.encode(audio_tensor)
+    t1 = time.perf_counter()
+    timings["encoder"] = t1 - t0
+
+    stats = core.softmax_stats(logits)
+    t2 = time.perf_counter()
+    timings["softmax"] = t2 - t1
+
+    safe_ids = core.tokenize(text)
+    t3 = time.perf_counter()
+    timings["tokenize"] = t3 - t2
+
+    pX, pY = core.align_tokens(X, safe_ids)
+    t4 = time.perf_counter()
+    timings["dtw"] = t4 - t3
+
+    raw = core.token_scores(logits, stats, pX, pY, safe_ids, eps)
+    norm = core.normalize_scores(raw, eps)
+    t5 = time.perf_counter()
+    timings["token_scores"] = t5 - t4
+
+    core.group_words(core.token_strings(safe_ids), norm)
+    t6 = time.perf_counter()
+    timings["word_grouping"] = t6 - t5
+
+    return {k: v * 1000.0 for k, v in timings.items()}
+
+
+def run_benchmark(
+    tokenizer_path: str,
+    model_path: Optional[str] = None,
+    audio_seconds: Sequence[float] = (1.0, 2.0, 4.0, 8.0),
+    sentence_words: Sequence[int] = (2, 4, 8),
+    repeats: int = 5,
+    hidden_dim: int = 64,
+    seed: int = 0,
+    alignment_backend: str = "python-dtw",
+    conv_stack: bool = False
+) -> Dict[str, Any]:
+    """
+    오디오 길이 x 문장 길이 격자에 대해 단계별 시간 측정
+
+    Args:
+        tokenizer_path: tokenizer.json 경로
+        model_path: 사용할 ONNX 모델 (없으면 작은 합성 모델을 생성)
+        audio_seconds: 측정할 오디오 길이 목록 (초)
+        sentence_words: 측정할 문장 단어 수 목록
+        repeats: 조합당 반복 횟수 (중앙값 사용)
+        hidden_dim: 합성 모델 hidden 차원
+        seed: 난수 시드
+        alignment_backend: DTW 정렬 백엔드 이름
+        conv_stack: 합성 모델에 Conv 특징 추출기 사용 (인코더가 IOBinding 출력 버퍼 경로를 탐)
+
+    Returns:
+        Dict[str, Any]: JSON으로 저장 가능한 결과
+    """
+    tmp_dir = None
+    if model_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="gop_bench_")
+        model_path = build_tiny_model(
+            os.path.join(tmp_dir, "tiny_w2v2_ctc.onnx"),
+            vocab_size=tokenizer_vocab_size(tokenizer_path),
+            hidden_dim=hidden_dim,
+            seed=seed,
+            conv_stack=conv_stack
+        )
+
+    core = Wav2VecCTCOnnxCore(model_path, tokenizer_path, alignment_backend=alignment_backend)
+    if tmp_dir:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    syllables = load_syllables(tokenizer_path)
+
+    results: List[Dict[str, Any]] = []
+    for seconds in audio_seconds:
+        tensor = _prepare_tensor(make_audio(seconds, seed=seed))
+        for num_words in sentence_words:
+            text = make_sentence(syllables, num_words, seed=seed)
+            # 첫 실행은 워밍업으로 버림
+            time_stages(core, tensor, text)
+            runs = [time_stages(core, tensor, text) for _ in range(repeats)]
+            stages = {name: round(statistics.median(r[name] for r in runs), 4) for name in STAGES}
+            results.append({
+                "audio_seconds": seconds,
+                "num_words": num_words,
+                "stages": stages,
+                "total": round(sum(stages.values()), 4)
+            })
+
+    return {
+        "meta": {
+            "model": ("synthetic-conv" if conv_stack else "synthetic") if tmp_dir else os.path.basename(model_path),
+            "hidden_dim": hidden_dim if tmp_dir else int(core.prototype_matrix.shape[1]),
+            "vocab_size": int(core.prototype_matrix.shape[0]),
+            "repeats": repeats,
+            "alignment_backend": alignment_backend,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count()
+        },
+        "results": results
+    }
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = 1.2, min_ms: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    기준 결과 대비 느려진 단계 목록
+
+    Args:
+        current: 이번 측정 결과
+        baseline: 기준 측정 결과
+        threshold: 회귀로 판단할 배율 (현재 / 기준)
+        min_ms: 이보다 짧은 단계는 측정 잡음으로 보고 무시
+
+    Returns:
+        List[Dict[str, Any]]: 회귀 항목 (비어 있으면 회귀 없음)
+    """
+    base_index = {(r["audio_seconds"], r["num_words"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for row in current.get("results", []):
+        base = base_index.get((row["audio_seconds"], row["num_words"]))
+        if base is None:
+            continue
+        for name, value in list(row["stages"].items()) + [("total", row["total"])]:
+            ref = base["total"] if name == "total" else base["stages"].get(name)
+            if ref is None or max(ref, value) < min_ms:
+                continue
+            ratio = value / max(ref, 1e-9)
+            if ratio > threshold:
+                regressions.append({
+                    "audio_seconds": row["audio_seconds"],
+                    "num_words": row["num_words"],
+                    "stage": name,
+                    "baseline_ms": ref,
+                    "current_ms": value,
+                    "ratio": round(ratio, 3)
+                })
+    return regressions
+
+
+def save_json(data: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,74 @@
+import json
+from typing import List
+
+import numpy as np
+
+SPECIAL_TOKENS = ("|", "[PAD]", "[UNK]")
+
+
+def load_syllables(tokenizer_path: str) -> List[str]:
+    """토크나이저 어휘에서 한글 음절 토큰만 추출"""
+    with open(tokenizer_path, "r", encoding="utf-8") as f:
+        vocab = json.load(f)["model"]["vocab"]
+    return sorted(
+        tok for tok in vocab
+        if tok not in SPECIAL_TOKENS and len(tok) == 1 and "가" <= tok <= "힣"
+    )
+
+
+def make_sentence(syllables: List[str], num_words: int, seed: int = 0,
+                  min_syllables: int = 1, max_syllables: int = 4) -> str:
+    """
+    무작위 한국어 문장 생성 (어휘에 있는 음절로만 구성)
+
+    Args:
+        syllables: 사용할 음절 목록
+        num_words: 단어 수
+        seed: 난수 시드
+        min_syllables: 단어당 최소 음절 수
+        max_syllables: 단어당 최대 음절 수
+
+    Returns:
+        str: 공백으로 구분된 문장
+    """
+    rng = np.random.default_rng(seed)
+    words = []
+    for _ in range(num_words):
+        n = int(rng.integers(min_syllables, max_syllables + 1))
+        words.append("".join(rng.choice(syllables, size=n)))
+    return " ".join(words)
+
+
+def make_audio(duration: float, sample_rate: int = 16000, seed: int = 0,
+               syllable_duration: float = 0.2, noise_level: float = 0.01) -> np.ndarray:
+    """
+    음성과 비슷한 합성 오디오 생성
+
+    음절마다 다른 기본 주파수의 배음 묶음에 포락선을 씌우고, 음절 사이에 짧은 휴지를 넣는다.
+    에너지 기반 VAD를 통과하는 수준의 크기로 만든다.
+
+    Args:
+        duration: 길이 (초)
+        sample_rate: 샘플링 레이트 (Hz)
+        seed: 난수 시드
+        syllable_duration: 음절 길이 (초)
+        noise_level: 배경 잡음 크기
+
+    Returns:
+        np.ndarray: float32 모노 오디오 [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    n = int(duration * sample_rate)
+    audio = noise_level * rng.standard_normal(n)
+
+    syl_len = int(syllable_duration * sample_rate)
+    gap = syl_len // 4
+    t = np.arange(syl_len - gap) / sample_rate
+    envelope = np.sin(np.pi * np.arange(syl_len - gap) / (syl_len - gap))
+    for start in range(0, n - syl_len, syl_len):
+        f0 = rng.uniform(100, 250)
+        tone = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+        audio[start:start + syl_len - gap] += 0.3 * envelope * tone
+
+    peak = np.max(np.abs(audio)) or 1.0
+    return (audio / peak * 0.8).astype(np.float32)
@@ -0,0 +1,176 @@
+import json
+import logging
+from typing import List, Tuple
+
+import numpy as np
+import onnx
+from onnx import helper, numpy_helper, NodeProto, TensorProto
+
+logger = logging.getLogger("TinyModel")
+
+# wav2vec2 특징 추출기의 전체 stride (16kHz 기준 20ms)
+FRAME_STRIDE = 320
+
+# wav2vec2 conv 특징 추출기 층 (kernel, stride): 수용 영역 400 샘플, stride 320
+CONV_LAYERS = ((10, 5), (3, 2), (3, 2), (3, 2), (3, 2), (2, 2), (2, 2))
+
+
+def tokenizer_vocab_size(tokenizer_path: str) -> int:
+    """tokenizer.json의 어휘 크기"""
+    with open(tokenizer_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    vocab = data["model"]["vocab"]
+    added = [t["id"] for t in data.get("added_tokens", [])]
+    return max(list(vocab.values()) + added) + 1
+
+
+def build_tiny_model(
+    out_path: str,
+    vocab_size: int,
+    hidden_dim: int = 64,
+    seed: int = 0,
+    opset: int = 13,
+    conv_stack: bool = False,
+    conv_dim: int = 32
+) -> str:
+    """
+    실제 모델과 같은 입출력 시그니처를 가진 작은 ONNX CTC 모델 생성
+
+    input [1, N] -> (hidden [1, T, D], logits [1, T, V]),  T = N // 320
+    lm_head는 실제 모델처럼 `_quantized/_scale/_zero_point` 초기값(uint8, 채널별)으로 저장된다.
+    conv_stack이면 프레임 투영 대신 wav2vec2와 같은 층 구성의 Conv 특징 추출기와 패딩/그룹
+    위치 Conv를 쓰므로 T = (N - 400) // 320 + 1 이고, 엔진이 프레임 수를 미리 계산해
+    IOBinding 출력 버퍼를 쓰는 경로를 실제 모델처럼 탄다.
+
+    Args:
+        out_path: 저장할 .onnx 경로
+        vocab_size: 어휘 크기 V (토크나이저와 맞춰야 함)
+        hidden_dim: hidden 차원 D
+        seed: 가중치 난수 시드
+        opset: ONNX opset (채널별 DequantizeLinear는 13 이상 필요)
+        conv_stack: Conv 특징 추출기 사용 여부 (N은 400 샘플 이상이어야 함)
+        conv_dim: Conv 특징 추출기 채널 수 (위치 Conv가 두 그룹이라 짝수)
+
+    Returns:
+        str: 저장된 모델 경로
+    """
+    rng = np.random.default_rng(seed)
+    D, V = hidden_dim, vocab_size
+
+    # 오디오 -> hidden_states
+    if conv_stack:
+        initializers, nodes = _conv_features(rng, D, conv_dim)
+    else:
+        initializers, nodes = _frame_features(rng, D)
+
+    # lm_head (D, V) 채널별 uint8 양자화
+    w_head = (rng.standard_normal((D, V)) / np.sqrt(D)).astype(np.float32)
+    w_min = w_head.min(axis=0)
+    w_max = w_head.max(axis=0)
+    scale = ((w_max - w_min) / 255.0).astype(np.float32)
+    scale[scale == 0] = 1.0
+    zero_point = np.clip(np.round(-w_min / scale), 0, 255).astype(np.uint8)
+    w_q = np.clip(np.round(w_head / scale) + zero_point, 0, 255).astype(np.uint8)
+    b_head = np.zeros(V, dtype=np.float32)
+
+    initializers += [
+        numpy_helper.from_array(w_q, "lm_head.weight_quantized"),
+        numpy_helper.from_array(scale, "lm_head.weight_scale"),
+        numpy_helper.from_array(zero_point, "lm_head.weight_zero_point"),
+        numpy_helper.from_array(b_head, "lm_head.bias"),
+    ]
+    nodes += [
+        # 양자화된 lm_head
+        helper.make_node("DequantizeLinear",
+                         ["lm_head.weight_quantized", "lm_head.weight_scale", "lm_head.weight_zero_point"],
+                         ["lm_head.weight"], axis=1),
+        helper.make_node("MatMul", ["hidden_states", "lm_head.weight"], ["head"]),
+        helper.make_node("Add", ["head", "lm_head.bias"], ["logits"]),
+    ]
+
+    graph = helper.make_graph(
+        nodes,
+        "tiny_wav2vec2_ctc",
+        inputs=[helper.make_tensor_value_info("input_values", TensorProto.FLOAT, [1, "num_samples"])],
+        outputs=[
+            helper.make_tensor_value_info("hidden_states", TensorProto.FLOAT, [1, "num_frames", D]),
+            helper.make_tensor_value_info("logits", TensorProto.FLOAT, [1, "num_frames", V]),
+        ],
+        initializer=initializers,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", opset)])
+    model.ir_version = min(model.ir_version, 8)
+    onnx.checker.check_model(model)
+    onnx.save(model, out_path)
+    logger.info("tiny model saved: %s (D=%d, V=%d, conv_stack=%s)", out_path, D, V, conv_stack)
+    return out_path
+
+
+def _frame_features(rng: np.random.Generator, D: int) -> Tuple[List[TensorProto], List[NodeProto]]:
+    """N을 320 배수로 잘라 프레임별 선형 투영 + tanh (T = N // 320)"""
+    w_frame = (rng.standard_normal((FRAME_STRIDE, D)) / np.sqrt(FRAME_STRIDE)).astype(np.float32)
+    b_frame = np.zeros(D, dtype=np.float32)
+
+    initializers = [
+        numpy_helper.from_array(w_frame, "frame_proj.weight"),
+        numpy_helper.from_array(b_frame, "frame_proj.bias"),
+        numpy_helper.from_array(np.array(1, dtype=np.int64), "axis_one"),
+        numpy_helper.from_array(np.array(FRAME_STRIDE, dtype=np.int64), "stride"),
+        numpy_helper.from_array(np.array([0], dtype=np.int64), "slice_start"),
+        numpy_helper.from_array(np.array([1], dtype=np.int64), "slice_axes"),
+        numpy_helper.from_array(np.array([0], dtype=np.int64), "unsqueeze_axes"),
+        numpy_helper.from_array(np.array([1, -1, FRAME_STRIDE], dtype=np.int64), "frame_shape"),
+    ]
+    nodes = [
+        # N을 stride 배수로 자르기
+        helper.make_node("Shape", ["input_values"], ["in_shape"]),
+        helper.make_node("Gather", ["in_shape", "axis_one"], ["num_samples"], axis=0),
+        helper.make_node("Div", ["num_samples", "stride"], ["num_frames"]),
+        helper.make_node("Mul", ["num_frames", "stride"], ["num_used"]),
+        helper.make_node("Unsqueeze", ["num_used", "unsqueeze_axes"], ["slice_end"]),
+        helper.make_node("Slice", ["input_values", "slice_start", "slice_end", "slice_axes"], ["trimmed"]),
+        helper.make_node("Reshape", ["trimmed", "frame_shape"], ["framed"]),
+        # 프레임 -> hidden
+        helper.make_node("MatMul", ["framed", "frame_proj.weight"], ["proj"]),
+        helper.make_node("Add", ["proj", "frame_proj.bias"], ["proj_b"]),
+        helper.make_node("Tanh", ["proj_b"], ["hidden_states"]),
+    ]
+    return initializers, nodes
+
+
+def _conv_features(rng: np.random.Generator, D: int, C: int) -> Tuple[List[TensorProto], List[NodeProto]]:
+    """
+    wav2vec2 구성의 Conv 특징 추출기 (padding 없음, T = (N - 400) // 320 + 1)
+    + 길이를 유지하는 패딩/그룹 위치 Conv 잔차 + 선형 투영 + tanh
+    """
+    initializers = [numpy_helper.from_array(np.array([1], dtype=np.int64), "channel_axes")]
+    nodes = [helper.make_node("Unsqueeze", ["input_values", "channel_axes"], ["conv0"])]
+    in_channels = 1
+    for i, (kernel, stride) in enumerate(CONV_LAYERS):
+        w = (rng.standard_normal((C, in_channels, kernel)) / np.sqrt(in_channels * kernel)).astype(np.float32)
+        initializers.append(numpy_helper.from_array(w, f"conv{i}.weight"))
+        nodes += [
+            helper.make_node("Conv", [f"conv{i}", f"conv{i}.weight"], [f"conv{i}.out"],
+                             kernel_shape=[kernel], strides=[stride]),
+            helper.make_node("Relu", [f"conv{i}.out"], [f"conv{i + 1}"]),
+        ]
+        in_channels = C
+    features = f"conv{len(CONV_LAYERS)}"
+
+    # 위치 Conv: 짝수 kernel 4에 pads (2, 1)로 길이 유지, 2그룹
+    w_pos = (rng.standard_normal((C, C // 2, 4)) / np.sqrt(C // 2 * 4)).astype(np.float32)
+    w_proj = (rng.standard_normal((C, D)) / np.sqrt(C)).astype(np.float32)
+    initializers += [
+        numpy_helper.from_array(w_pos, "pos_conv.weight"),
+        numpy_helper.from_array(w_proj, "feature_proj.weight"),
+        numpy_helper.from_array(np.zeros(D, dtype=np.float32), "feature_proj.bias"),
+    ]
+    nodes += [
+        helper.make_node("Conv", [features, "pos_conv.weight"], ["pos"], kernel_shape=[4], pads=[2, 1], group=2),
+        helper.make_node("Add", [features, "pos"], ["encoded"]),
+        helper.make_node("Transpose", ["encoded"], ["encoded_t"], perm=[0, 2, 1]),
+        helper.make_node("MatMul", ["encoded_t", "feature_proj.weight"], ["proj"]),
+        helper.make_node("Add", ["proj", "feature_proj.bias"], ["proj_b"]),
+        helper.make_node("Tanh", ["proj_b"], ["hidden_states"]),
+    ]
+    return initializers, nodes
@@ -0,0 +1 @@
+PYTHONPATH=src python -m benchmarks "$@"
\ No newline at end of file
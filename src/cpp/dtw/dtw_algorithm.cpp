@@ -3,6 +3,8 @@
 #include <limits>
 #include <cmath>
 #include <algorithm>
+#include <cstdint>
+#include <stdexcept>
 
 namespace realtime_engine_ko {
 namespace dtw {
@@ -87,5 +89,105 @@ PairVI dtw_align(const std::vector<VecD>& X,
     return {idx1, idx2};
 }
 
+// 한 행의 지역 비용 (X의 i번째 프레임과 Y 전체의 유클리드 거리)
+static void local_cost_row(const float* x, const float* Y, int m, int d, double* out) {
+    for (int j = 0; j < m; ++j) {
+        const float* y = Y + static_cast<size_t>(j) * d;
+        double sum = 0.0;
+        for (int k = 0; k < d; ++k) {
+            double diff = static_cast<double>(x[k]) - static_cast<double>(y[k]);
+            sum += diff * diff;
+        }
+        out[j] = std::sqrt(sum);
+    }
+}
+
+PairVI dtw_align_f32(const float* X, int n,
+                     const float* Y, int m,
+                     int d, int window) {
+    if (n <= 0 || m <= 0) {
+        return {{}, {}};
+    }
+    const double INF = std::numeric_limits<double>::infinity();
+    auto in_band = [window](int i, int j) {
+        return window < 0 || std::abs(i - j) <= window;
+    };
+
+    // 누적 비용은 직전 두 행만 필요, 방향은 역추적을 위해 보관 (int8).
+    // 대역이 있으면 행마다 대역 폭만 보관: 행 i의 열 j는 dir[i * width + (j - base(i))]
+    const bool banded = window >= 0 && 2 * window + 1 < m;
+    const int width = banded ? 2 * window + 1 : m;
+    auto dir_index = [banded, window, width](int i, int j) -> long long {
+        int col = banded ? j - (i - window) : j;
+        if (col < 0 || col >= width) return -1;
+        return static_cast<long long>(i) * width + col;
+    };
+    VecD lm_prev(m), lm_cur(m);
+    VecD cm_prev2(m, INF), cm_prev(m, INF), cm_cur(m, INF);
+    std::vector<int8_t> dir(static_cast<size_t>(n) * width, -1);
+
+    local_cost_row(X, Y, m, d, lm_cur.data());
+    cm_cur[0] = lm_cur[0];  // 시작점 고정
+
+    for (int i = 1; i < n; ++i) {
+        std::swap(cm_prev2, cm_prev);
+        std::swap(cm_prev, cm_cur);
+        std::swap(lm_prev, lm_cur);
+        local_cost_row(X + static_cast<size_t>(i) * d, Y, m, d, lm_cur.data());
+
+        std::fill(cm_cur.begin(), cm_cur.end(), INF);
+        for (int j = 1; j < m; ++j) {
+            if (!in_band(i, j)) continue;
+            double best = INF;
+            int best_p = -1;
+            // 패턴 0: (i-1, j-2) + .5 c(i, j-1) + .5 c(i, j)
+            if (j >= 2) {
+                double c = cm_prev[j-2] + 0.5 * lm_cur[j-1] + 0.5 * lm_cur[j];
+                if (c < best) { best = c; best_p = 0; }
+            }
+            // 패턴 1: (i-1, j-1) + c(i, j)
+            {
+                double c = cm_prev[j-1] + lm_cur[j];
+                if (c < best) { best = c; best_p = 1; }
+            }
+            // 패턴 2: (i-2, j-1) + c(i-1, j) + c(i, j)
+            if (i >= 2) {
+                double c = cm_prev2[j-1] + lm_prev[j] + lm_cur[j];
+                if (c < best) { best = c; best_p = 2; }
+            }
+            cm_cur[j] = best;
+            dir[static_cast<size_t>(dir_index(i, j))] = static_cast<int8_t>(best_p);
+        }
+    }
+
+    if (!(cm_cur[m-1] < INF)) {
+        throw std::runtime_error("No warping path found compatible with the local constraints");
+    }
+
+    // 역추적: (n-1, m-1) -> (0, 0), 패턴의 중간 셀 포함
+    std::vector<int> idx1 = {n - 1}, idx2 = {m - 1};
+    int i = n - 1, j = m - 1;
+    while (!(i == 0 && j == 0)) {
+        long long at = dir_index(i, j);
+        int p = at < 0 ? -1 : dir[static_cast<size_t>(at)];
+        if (p < 0) break;
+        if (p == 0) {
+            idx1.push_back(i);     idx2.push_back(j - 1);
+            idx1.push_back(i - 1); idx2.push_back(j - 2);
+            i -= 1; j -= 2;
+        } else if (p == 1) {
+            idx1.push_back(i - 1); idx2.push_back(j - 1);
+            i -= 1; j -= 1;
+        } else {
+            idx1.push_back(i - 1); idx2.push_back(j);
+            idx1.push_back(i - 2); idx2.push_back(j - 1);
+            i -= 2; j -= 1;
+        }
+    }
+    std::reverse(idx1.begin(), idx1.end());
+    std::reverse(idx2.begin(), idx2.end());
+    return {idx1, idx2};
+}
+
 } // namespace dtw
 } // namespace realtime_engine_ko
\ No newline at end of file
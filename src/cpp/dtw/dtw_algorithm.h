@@ -19,5 +19,13 @@ double euclidean(const VecD& a, const VecD& b);
 PairVI dtw_align(const std::vector<VecD>& X,
                  const std::vector<VecD>& Y);
 
+// 연속 float32 버퍼용 DTW 정렬 (X: n×d, Y: m×d, 행 우선)
+// dtw-python의 asymmetricP1과 같은 규칙: 시작점 (0,0) 고정, 중간 셀을 포함한 경로 반환.
+// window >= 0이면 |i - j| <= window인 Sakoe-Chiba 대역 안에서만 탐색.
+// 경로가 없으면 std::runtime_error.
+PairVI dtw_align_f32(const float* X, int n,
+                     const float* Y, int m,
+                     int d, int window = -1);
+
 } // namespace dtw
 } // namespace realtime_engine_ko
\ No newline at end of file
@@ -30,6 +30,16 @@ public:
     std::vector<std::map<std::string, std::any>> GroupWordsSigmoid(
         const std::vector<std::pair<std::string, float>>& syllable_scores);
     
+    // 인코더만 실행 -> (hidden (T, D), logits (T, V))
+    std::pair<MatrixXf, MatrixXf> Encode(const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor);
+    
+    // 이미 계산된 인코더 출력에서 GOP 계산 (인코더 재실행 없음)
+    std::map<std::string, std::any> CalculateGopFromFeatures(
+        const MatrixXf& X,
+        const MatrixXf& logits,
+        const std::string& text,
+        float eps = 1e-8f);
+    
     std::map<std::string, std::any> CalculateGopFromTensor(
         const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor,
         const std::string& text,
@@ -42,6 +52,10 @@ public:
         const std::string& context_after = "",
         std::optional<int> target_index = std::nullopt);
     
+    // prototype 행렬 교체 (Python 구현과 같은 lm_head 가중치로 비교할 때 사용)
+    void SetPrototypeMatrix(const MatrixXf& matrix);
+    const MatrixXf& GetPrototypeMatrix() const { return prototype_matrix; }
+    
 private:
     float weight_norm_mid = 50.0f;
     float weight_norm_steepness = 0.2f;
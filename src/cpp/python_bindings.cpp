@@ -2,13 +2,61 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>            // std::vector, std::map 자동 변환
 #include <pybind11/functional.h>     // std::function 콜백
+#include <pybind11/numpy.h>          // numpy 배열 입출력
+#include <pybind11/eigen.h>          // Eigen 행렬 ↔ numpy 변환
 #include <nlohmann/json.hpp>         // JSON ↔ Python dict 변환용
 
-#include "recognition_engine.h"
+#include "realtime_engine_ko/recognition_engine.h"
+#include "realtime_engine_ko/w2v_onnx_core.h"
+#include "dtw/dtw_algorithm.h"
 
 namespace py = pybind11;
 using json = nlohmann::json;
 
+namespace {
+
+using AnyMap = std::map<std::string, std::any>;
+
+// GOP 결과(std::any 중첩 맵)를 Python 객체로 변환
+py::object any_to_py(const std::any& value) {
+    if (value.type() == typeid(float))       return py::float_(std::any_cast<float>(value));
+    if (value.type() == typeid(double))      return py::float_(std::any_cast<double>(value));
+    if (value.type() == typeid(int))         return py::int_(std::any_cast<int>(value));
+    if (value.type() == typeid(bool))        return py::bool_(std::any_cast<bool>(value));
+    if (value.type() == typeid(std::string)) return py::str(std::any_cast<std::string>(value));
+    if (value.type() == typeid(AnyMap)) {
+        py::dict d;
+        for (const auto& kv : std::any_cast<const AnyMap&>(value))
+            d[py::str(kv.first)] = any_to_py(kv.second);
+        return d;
+    }
+    if (value.type() == typeid(std::vector<AnyMap>)) {
+        py::list l;
+        for (const auto& item : std::any_cast<const std::vector<AnyMap>&>(value))
+            l.append(any_to_py(item));
+        return l;
+    }
+    return py::none();
+}
+
+py::dict map_to_py(const AnyMap& m) {
+    return any_to_py(std::any(m)).cast<py::dict>();
+}
+
+// (n, d) float64 numpy 배열 -> 행 벡터 목록
+std::vector<realtime_engine_ko::dtw::VecD> rows_from_array(
+    const py::array_t<double, py::array::c_style | py::array::forcecast>& arr) {
+    if (arr.ndim() != 2) throw std::invalid_argument("2차원 배열이 필요합니다.");
+    auto r = arr.unchecked<2>();
+    std::vector<realtime_engine_ko::dtw::VecD> rows(r.shape(0), realtime_engine_ko::dtw::VecD(r.shape(1)));
+    for (py::ssize_t i = 0; i < r.shape(0); ++i)
+        for (py::ssize_t j = 0; j < r.shape(1); ++j)
+            rows[i][j] = r(i, j);
+    return rows;
+}
+
+} // namespace
+
 PYBIND11_MODULE(pyrealtime, m) {
     m.doc() = "Realtime Korean speech evaluation engine";
 
@@ -80,4 +128,80 @@ PYBIND11_MODULE(pyrealtime, m) {
         py::arg("record_listener") = realtime_engine_ko::RecordListener()
         )
         ;
+
+    //--- Wav2VecCTCOnnxCore 바인딩 (Python 구현과 단계별 비교용) ---
+    using Core = realtime_engine_ko::Wav2VecCTCOnnxCore;
+    py::class_<Core>(m, "Wav2VecCTCOnnxCore")
+        .def(py::init<const std::string&, const std::string&, const std::string&>(),
+             py::arg("onnx_model_path"),
+             py::arg("tokenizer_path"),
+             py::arg("device") = "CPU"
+        )
+        .def("encode", [](Core &self, const Eigen::VectorXf &audio) {
+            std::pair<Core::MatrixXf, Core::MatrixXf> out;
+            {
+                py::gil_scoped_release release;
+                out = self.Encode(audio);
+            }
+            return py::make_tuple(out.first, out.second);
+        }, py::arg("audio"))
+        .def("calculate_gop_from_tensor", [](Core &self, const Eigen::VectorXf &audio,
+                                             const std::string &text, float eps) {
+            std::map<std::string, std::any> result;
+            {
+                py::gil_scoped_release release;
+                result = self.CalculateGopFromTensor(audio, text, eps);
+            }
+            return map_to_py(result);
+        }, py::arg("audio"), py::arg("text"), py::arg("eps") = 1e-8f)
+        .def("calculate_gop_from_features", [](Core &self, const Core::MatrixXf &X,
+                                               const Core::MatrixXf &logits,
+                                               const std::string &text, float eps) {
+            std::map<std::string, std::any> result;
+            {
+                py::gil_scoped_release release;
+                result = self.CalculateGopFromFeatures(X, logits, text, eps);
+            }
+            return map_to_py(result);
+        }, py::arg("hidden"), py::arg("logits"), py::arg("text"), py::arg("eps") = 1e-8f)
+        .def("dtw_align", [](Core &self, const Core::MatrixXf &X, const Core::MatrixXf &Y) {
+            py::gil_scoped_release release;
+            return self.DtwAlign(X, Y);
+        }, py::arg("X"), py::arg("Y"))
+        .def("set_prototype_matrix", &Core::SetPrototypeMatrix, py::arg("matrix"))
+        .def_property_readonly("prototype_matrix", &Core::GetPrototypeMatrix)
+        ;
+
+    //--- DTW 단독 바인딩 ---
+    m.def("dtw_align", [](py::array_t<double, py::array::c_style | py::array::forcecast> X,
+                          py::array_t<double, py::array::c_style | py::array::forcecast> Y) {
+        auto x_rows = rows_from_array(X);
+        auto y_rows = rows_from_array(Y);
+        py::gil_scoped_release release;
+        return realtime_engine_ko::dtw::dtw_align(x_rows, y_rows);
+    }, py::arg("X"), py::arg("Y"),
+    "asymmetricP1 DTW 정렬 경로 (index1, index2)");
+
+    // 연속 float32 버퍼를 복사 없이 넘기는 DTW 커널 (GIL 해제, 세션별 병렬 정렬용)
+    m.def("dtw_align_f32", [](py::array_t<float, py::array::c_style | py::array::forcecast> X,
+                              py::array_t<float, py::array::c_style | py::array::forcecast> Y,
+                              int window) {
+        if (X.ndim() != 2 || Y.ndim() != 2 || X.shape(1) != Y.shape(1))
+            throw std::invalid_argument("X (n, d), Y (m, d) 배열이 필요합니다.");
+        const float* x = X.data();
+        const float* y = Y.data();
+        int n = static_cast<int>(X.shape(0));
+        int mm = static_cast<int>(Y.shape(0));
+        int d = static_cast<int>(X.shape(1));
+        realtime_engine_ko::dtw::PairVI path;
+        {
+            py::gil_scoped_release release;
+            path = realtime_engine_ko::dtw::dtw_align_f32(x, n, y, mm, d, window);
+        }
+        py::array_t<int64_t> idx1(path.first.size()), idx2(path.second.size());
+        std::copy(path.first.begin(), path.first.end(), idx1.mutable_data());
+        std::copy(path.second.begin(), path.second.end(), idx2.mutable_data());
+        return py::make_tuple(idx1, idx2);
+    }, py::arg("X"), py::arg("Y"), py::arg("window") = -1,
+    "dtw-python asymmetricP1과 같은 규칙의 float32 DTW (window >= 0이면 Sakoe-Chiba 대역)");
 }
@@ -278,192 +278,211 @@ std::vector<std::map<std::string, std::any>> Wav2VecCTCOnnxCore::GroupWordsSigmo
     return words;
 }
 
-std::map<std::string, std::any> Wav2VecCTCOnnxCore::CalculateGopFromTensor(
-    const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor,
-    const std::string& text,
-    float eps) {
+std::pair<Wav2VecCTCOnnxCore::MatrixXf, Wav2VecCTCOnnxCore::MatrixXf> Wav2VecCTCOnnxCore::Encode(
+    const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor) {
     
-    try {
-        // 입력 텐서 준비 (배치 차원 추가)
-        std::vector<int64_t> input_shape = {1, static_cast<int64_t>(audio_tensor.size())};
-        std::vector<float> input_data(audio_tensor.data(), audio_tensor.data() + audio_tensor.size());
-        
-        Ort::MemoryInfo memory_info = Ort::MemoryInfo::CreateCpu(OrtArenaAllocator, OrtMemTypeDefault);
-        Ort::Value input_tensor = Ort::Value::CreateTensor<float>(
-            memory_info, input_data.data(), input_data.size(), input_shape.data(), input_shape.size());
-        
-        // 입출력 이름 설정
-        std::vector<const char*> input_names = {input_name.c_str()};
-        std::vector<const char*> output_names = {hidden_name.c_str(), logits_name.c_str()};
-        
-        // 모델 실행
-        auto output_tensors = session->Run(
-            Ort::RunOptions{nullptr}, 
-            input_names.data(), 
-            &input_tensor, 
-            1, 
-            output_names.data(), 
-            output_names.size()
-        );
-        
-        if (output_tensors.size() != 2) {
-            LOG_ERROR("Wav2VecCTCOnnxCore", "ONNX 모델 실행 결과가 예상과 다릅니다.");
-            throw std::runtime_error("ONNX 모델 실행 결과가 예상과 다릅니다.");
-        }
-        
-        // 출력 텐서 정보
-        auto* hidden_data = output_tensors[0].GetTensorData<float>();
-        auto* logits_data = output_tensors[1].GetTensorData<float>();
-        
-        auto hidden_info = output_tensors[0].GetTensorTypeAndShapeInfo();
-        auto logits_info = output_tensors[1].GetTensorTypeAndShapeInfo();
-        
-        auto hidden_shape = hidden_info.GetShape();
-        auto logits_shape = logits_info.GetShape();
-        
-        // 배치 차원 제거
-        int T = hidden_shape[1];  // 시퀀스 길이
-        int D = hidden_shape[2];  // 히든 차원
-        int V = logits_shape[2];  // 어휘 크기
-        
-        // hidden 및 logits를 Eigen 행렬로 변환
-        MatrixXf X(T, D);
-        for (int t = 0; t < T; ++t) {
-            for (int d = 0; d < D; ++d) {
-                X(t, d) = hidden_data[t * D + d];
-            }
+    // 입력 텐서 준비 (배치 차원 추가)
+    std::vector<int64_t> input_shape = {1, static_cast<int64_t>(audio_tensor.size())};
+    std::vector<float> input_data(audio_tensor.data(), audio_tensor.data() + audio_tensor.size());
+    
+    Ort::MemoryInfo memory_info = Ort::MemoryInfo::CreateCpu(OrtArenaAllocator, OrtMemTypeDefault);
+    Ort::Value input_tensor = Ort::Value::CreateTensor<float>(
+        memory_info, input_data.data(), input_data.size(), input_shape.data(), input_shape.size());
+    
+    // 입출력 이름 설정
+    std::vector<const char*> input_names = {input_name.c_str()};
+    std::vector<const char*> output_names = {hidden_name.c_str(), logits_name.c_str()};
+    
+    // 모델 실행
+    auto output_tensors = session->Run(
+        Ort::RunOptions{nullptr}, 
+        input_names.data(), 
+        &input_tensor, 
+        1, 
+        output_names.data(), 
+        output_names.size()
+    );
+    
+    if (output_tensors.size() != 2) {
+        LOG_ERROR("Wav2VecCTCOnnxCore", "ONNX 모델 실행 결과가 예상과 다릅니다.");
+        throw std::runtime_error("ONNX 모델 실행 결과가 예상과 다릅니다.");
+    }
+    
+    // 출력 텐서 정보
+    auto* hidden_data = output_tensors[0].GetTensorData<float>();
+    auto* logits_data = output_tensors[1].GetTensorData<float>();
+    
+    auto hidden_info = output_tensors[0].GetTensorTypeAndShapeInfo();
+    auto logits_info = output_tensors[1].GetTensorTypeAndShapeInfo();
+    
+    auto hidden_shape = hidden_info.GetShape();
+    auto logits_shape = logits_info.GetShape();
+    
+    // 배치 차원 제거
+    int T = hidden_shape[1];  // 시퀀스 길이
+    int D = hidden_shape[2];  // 히든 차원
+    int V = logits_shape[2];  // 어휘 크기
+    
+    // hidden 및 logits를 Eigen 행렬로 변환
+    MatrixXf X(T, D);
+    for (int t = 0; t < T; ++t) {
+        for (int d = 0; d < D; ++d) {
+            X(t, d) = hidden_data[t * D + d];
         }
-        
-        MatrixXf logits(T, V);
-        for (int t = 0; t < T; ++t) {
-            for (int v = 0; v < V; ++v) {
-                logits(t, v) = logits_data[t * V + v];
-            }
+    }
+    
+    MatrixXf logits(T, V);
+    for (int t = 0; t < T; ++t) {
+        for (int v = 0; v < V; ++v) {
+            logits(t, v) = logits_data[t * V + v];
         }
-        
-        // 3) temperature‐scaled softmax → probs
-        MatrixXf scaled = logits;
-        VectorXf max_vals = scaled.rowwise().maxCoeff();
-        MatrixXf exp_logits = (scaled.colwise() - max_vals).array().exp();
-        VectorXf sum_exp = exp_logits.rowwise().sum();
-        MatrixXf probs = exp_logits.array().colwise() / sum_exp.array();
-        
-        // 4) 텍스트 토큰화 - tokenizers-cpp API 사용
-        std::string processed_text = text;
-        std::replace(processed_text.begin(), processed_text.end(), ' ', '|');
-        std::vector<int> token_ids = tokenizer->Encode(processed_text);
-        
-        // special token 처리
-        std::string blank_token = "|";
-        int blank_id = tokenizer->TokenToId(blank_token);
-        
-        std::vector<int> safe_ids;
-        for (int tid : token_ids) {
-            if (tid >= 0 && tid < V) {
-                safe_ids.push_back(tid);
-            } else {
-                safe_ids.push_back(blank_id);
-            }
+    }
+    
+    return {X, logits};
+}
+
+std::map<std::string, std::any> Wav2VecCTCOnnxCore::CalculateGopFromFeatures(
+    const MatrixXf& X,
+    const MatrixXf& logits,
+    const std::string& text,
+    float eps) {
+    
+    int T = static_cast<int>(X.rows());
+    int D = static_cast<int>(X.cols());
+    int V = static_cast<int>(logits.cols());
+    
+    // 3) temperature‐scaled softmax → probs
+    MatrixXf scaled = logits;
+    VectorXf max_vals = scaled.rowwise().maxCoeff();
+    MatrixXf exp_logits = (scaled.colwise() - max_vals).array().exp();
+    VectorXf sum_exp = exp_logits.rowwise().sum();
+    MatrixXf probs = exp_logits.array().colwise() / sum_exp.array();
+    
+    // 4) 텍스트 토큰화 - tokenizers-cpp API 사용
+    std::string processed_text = text;
+    std::replace(processed_text.begin(), processed_text.end(), ' ', '|');
+    std::vector<int> token_ids = tokenizer->Encode(processed_text);
+    
+    // special token 처리
+    std::string blank_token = "|";
+    int blank_id = tokenizer->TokenToId(blank_token);
+    
+    std::vector<int> safe_ids;
+    for (int tid : token_ids) {
+        if (tid >= 0 && tid < V) {
+            safe_ids.push_back(tid);
+        } else {
+            safe_ids.push_back(blank_id);
         }
-        
-        // 5) prototype 확장 및 DTW
-        MatrixXf proto(safe_ids.size(), D);
-        for (size_t i = 0; i < safe_ids.size(); ++i) {
-            proto.row(i) = prototype_matrix.row(safe_ids[i]);
+    }
+    
+    // 5) prototype 확장 및 DTW
+    MatrixXf proto(safe_ids.size(), D);
+    for (size_t i = 0; i < safe_ids.size(); ++i) {
+        proto.row(i) = prototype_matrix.row(safe_ids[i]);
+    }
+    
+    int M = safe_ids.size();
+    int avg = std::max(1, T / M);
+    
+    // Y 확장
+    MatrixXf Yexp(M * avg, D);
+    for (int i = 0; i < M; ++i) {
+        for (int j = 0; j < avg; ++j) {
+            Yexp.row(i * avg + j) = proto.row(i);
         }
-        
-        int M = safe_ids.size();
-        int avg = std::max(1, T / M);
-        
-        // Y 확장
-        MatrixXf Yexp(M * avg, D);
-        for (int i = 0; i < M; ++i) {
-            for (int j = 0; j < avg; ++j) {
-                Yexp.row(i * avg + j) = proto.row(i);
+    }
+    
+    // DTW 정렬
+    auto [pX, pYexp] = DtwAlign(X, Yexp);
+    
+    std::vector<int> pY;
+    for (int y : pYexp) {
+        pY.push_back(y / avg);
+    }
+    
+    // 6) 토큰별 프레임 수집
+    std::map<int, std::vector<int>> frames;
+    for (size_t i = 0; i < pX.size(); ++i) {
+        frames[pY[i]].push_back(pX[i]);
+    }
+    
+    // 7) 토큰별 로그 확률 점수
+    std::vector<std::pair<std::string, float>> tok_scores;
+    for (size_t idx = 0; idx < safe_ids.size(); ++idx) {
+        int tid = safe_ids[idx];
+        std::string tok = tokenizer->IdToToken(tid);
+        
+        float score;
+        const auto& frs = frames[idx];
+        
+        if (!frs.empty()) {
+            float sum_log_p = 0.0f;
+            for (int fr : frs) {
+                sum_log_p += std::log(probs(fr, tid) + eps);
             }
+            score = sum_log_p / frs.size();
+        } else {
+            score = -std::numeric_limits<float>::infinity();
         }
         
-        // DTW 정렬
-        auto [pX, pYexp] = DtwAlign(X, Yexp);
-        
-        std::vector<int> pY;
-        for (int y : pYexp) {
-            pY.push_back(y / avg);
-        }
-        
-        // 6) 토큰별 프레임 수집
-        std::map<int, std::vector<int>> frames;
-        for (size_t i = 0; i < pX.size(); ++i) {
-            frames[pY[i]].push_back(pX[i]);
-        }
-        
-        // 7) 토큰별 로그 확률 점수
-        std::vector<std::pair<std::string, float>> tok_scores;
-        for (size_t idx = 0; idx < safe_ids.size(); ++idx) {
-            int tid = safe_ids[idx];
-            std::string tok = tokenizer->IdToToken(tid);
-            
-            float score;
-            const auto& frs = frames[idx];
-            
-            if (!frs.empty()) {
-                float sum_log_p = 0.0f;
-                for (int fr : frs) {
-                    sum_log_p += std::log(probs(fr, tid) + eps);
-                }
-                score = sum_log_p / frs.size();
-            } else {
-                score = -std::numeric_limits<float>::infinity();
-            }
-            
-            tok_scores.push_back({tok, score});
+        tok_scores.push_back({tok, score});
+    }
+    
+    // 8) [0,100] 범위로 정규화
+    std::vector<float> raw;
+    for (const auto& [_, s] : tok_scores) {
+        if (std::isfinite(s)) {
+            raw.push_back(s);
         }
-        
-        // 8) [0,100] 범위로 정규화
-        std::vector<float> raw;
-        for (const auto& [_, s] : tok_scores) {
-            if (std::isfinite(s)) {
-                raw.push_back(s);
-            }
+    }
+    
+    std::vector<std::pair<std::string, float>> norm;
+    if (!raw.empty()) {
+        float mn = *std::min_element(raw.begin(), raw.end());
+        float mx = *std::max_element(raw.begin(), raw.end());
+        float span = (mx > mn) ? (mx - mn) : eps;
+        
+        for (const auto& [t, s] : tok_scores) {
+            float normalized = std::isfinite(s) ? (s - mn) / span * 100.0f : 0.0f;
+            norm.push_back({t, normalized});
         }
-        
-        std::vector<std::pair<std::string, float>> norm;
-        if (!raw.empty()) {
-            float mn = *std::min_element(raw.begin(), raw.end());
-            float mx = *std::max_element(raw.begin(), raw.end());
-            float span = (mx > mn) ? (mx - mn) : eps;
-            
-            for (const auto& [t, s] : tok_scores) {
-                float normalized = std::isfinite(s) ? (s - mn) / span * 100.0f : 0.0f;
-                norm.push_back({t, normalized});
-            }
-        } else {
-            for (const auto& [t, _] : tok_scores) {
-                norm.push_back({t, 0.0f});
-            }
+    } else {
+        for (const auto& [t, _] : tok_scores) {
+            norm.push_back({t, 0.0f});
         }
-        
-        // 9) 단어로 그룹화
-        auto words = GroupWordsSigmoid(norm);
-        
-        // 전체 점수 계산
-        float overall = 0.0f;
-        if (!words.empty()) {
-            for (const auto& word : words) {
-                auto scores = std::any_cast<std::map<std::string, std::any>>(word.at("scores"));
-                overall += std::any_cast<int>(scores.at("pronunciation"));
-            }
-            overall /= words.size();
+    }
+    
+    // 9) 단어로 그룹화
+    auto words = GroupWordsSigmoid(norm);
+    
+    // 전체 점수 계산
+    float overall = 0.0f;
+    if (!words.empty()) {
+        for (const auto& word : words) {
+            auto scores = std::any_cast<std::map<std::string, std::any>>(word.at("scores"));
+            overall += std::any_cast<int>(scores.at("pronunciation"));
         }
-        
-        // 결과 맵 생성
-        std::map<std::string, std::any> result;
-        result["overall"] = std::round(overall * 10) / 10;  // 소수점 첫째 자리까지
-        result["pronunciation"] = std::round(overall * 10) / 10;
-        result["words"] = words;
-        
-        return result;
-        
+        overall /= words.size();
+    }
+    
+    // 결과 맵 생성
+    std::map<std::string, std::any> result;
+    result["overall"] = std::round(overall * 10) / 10;  // 소수점 첫째 자리까지
+    result["pronunciation"] = std::round(overall * 10) / 10;
+    result["words"] = words;
+    
+    return result;
+}
+
+std::map<std::string, std::any> Wav2VecCTCOnnxCore::CalculateGopFromTensor(
+    const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor,
+    const std::string& text,
+    float eps) {
+    
+    try {
+        auto [X, logits] = Encode(audio_tensor);
+        return CalculateGopFromFeatures(X, logits, text, eps);
     } catch (const Ort::Exception& e) {
         LOG_ERROR("Wav2VecCTCOnnxCore", "ONNX 실행 오류: " + std::string(e.what()));
         
@@ -485,6 +504,13 @@ std::map<std::string, std::any> Wav2VecCTCOnnxCore::CalculateGopFromTensor(
     }
 }
 
+void Wav2VecCTCOnnxCore::SetPrototypeMatrix(const MatrixXf& matrix) {
+    if (matrix.rows() != prototype_matrix.rows() || matrix.cols() != prototype_matrix.cols()) {
+        throw std::invalid_argument("prototype 행렬 크기가 모델 (vocab_size, hidden_dim)과 다릅니다.");
+    }
+    prototype_matrix = matrix;
+}
+
 std::map<std::string, std::any> Wav2VecCTCOnnxCore::CalculateGopWithContext(
     const Eigen::Matrix<float, Eigen::Dynamic, 1>& audio_tensor,
     const std::string& target_text,
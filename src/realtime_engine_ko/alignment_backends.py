@@ -0,0 +1,306 @@
+import importlib
+import logging
+from typing import Dict, Optional, Tuple, Type
+
+import numpy as np
+
+try:
+    from scipy.spatial.distance import cdist
+except ImportError:  # scipy가 없으면 numpy로 거리 계산
+    cdist = None
+
+logger = logging.getLogger("AlignmentBackends")
+
+Path = Tuple[np.ndarray, np.ndarray]
+
+
+def band_window(num_frames: int, ref_len: int, band: Optional[float]) -> Optional[int]:
+    """
+    Sakoe-Chiba 대역 폭 계산 (끝점에 도달할 수 있도록 길이 차이보다 넓게)
+
+    Args:
+        num_frames: 쿼리 길이 T
+        ref_len: 참조 길이 N
+        band: T 대비 비율 (없으면 제한 없음)
+
+    Returns:
+        Optional[int]: |i - j| 허용 폭
+    """
+    if band is None:
+        return None
+    return max(int(band * num_frames), abs(num_frames - ref_len) + 1)
+
+
+class AlignmentBackend:
+    """
+    asymmetricP1 DTW 정렬 백엔드
+
+    모든 백엔드는 dtw-python과 같은 경로를 낸다: 시작점 (0,0)과 끝점 (T-1, N-1) 고정,
+    패턴의 중간 셀을 포함한 (index1, index2). 대역 안에 경로가 없으면 ValueError.
+    """
+
+    name = "base"
+
+    def align(self, X: np.ndarray, Y: np.ndarray, window: Optional[int] = None) -> Path:
+        """
+        Args:
+            X: 쿼리 (T, D)
+            Y: 참조 (N, D)
+            window: Sakoe-Chiba 대역 폭 (없으면 전체 탐색)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (프레임 인덱스, 참조 인덱스)
+        """
+        raise NotImplementedError
+
+    def matrix_bytes(self, num_frames: int, ref_len: int, window: Optional[int] = None) -> int:
+        """
+        align() 한 번이 잡는 (T, N) 크기 행렬 메모리 추정 (바이트)
+
+        기본값은 dtw-python처럼 지역 비용/누적 비용(float64)과 방향(int32) 행렬을 모두 만드는 경우다.
+        """
+        return int(num_frames) * int(ref_len) * (8 + 8 + 4)
+
+    def subsequence_bytes(self, num_frames: int, ref_len: int) -> int:
+        """subsequence_align() 한 번이 잡는 행렬 메모리 추정 (비용 float64 + 방향 int8)"""
+        return int(num_frames) * int(ref_len) * (8 + 1)
+
+    def subsequence_align(self, X: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        열린 시작/열린 끝 부분열 DTW: 참조 Y 전체가 쿼리 X의 어느 구간에 가장 잘 맞는지 찾음
+
+        Y의 각 행은 정확히 한 걸음씩 진행하고 X는 0~2 프레임씩 진행한다 (dtw-python의 "asymmetric"
+        패턴을 Y 기준으로 적용, open_begin/open_end). 경로 길이가 len(Y)로 고정되므로 누적 비용을
+        len(Y)로 나눈 값이 구간 길이와 무관하게 비교 가능한 비용이 된다.
+        기본 구현은 numpy 행 단위 벡터화이며 백엔드가 필요하면 재정의한다.
+
+        Args:
+            X: 쿼리 (T, D), 예: 청크 hidden state
+            Y: 참조 (N, D), 예: 블록 prototype (토큰당 여러 행으로 펼친 것)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, float]: (프레임 인덱스, 참조 인덱스, 길이 정규화 비용)
+                일치 구간은 프레임 인덱스의 처음과 끝
+
+        Raises:
+            ValueError: X나 Y가 비어 있음
+        """
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        n, m = X.shape[0], Y.shape[0]
+        if n == 0 or m == 0:
+            raise ValueError("Subsequence alignment needs non-empty inputs")
+
+        if cdist is not None:
+            cost = cdist(Y, X)
+        else:
+            cost = np.sqrt(((Y[:, None, :] - X[None, :, :]) ** 2).sum(axis=2))
+
+        # 후보 순서: 대각선(1) -> 머묾(0) -> 건너뜀(2), 동점이면 대각선 우선
+        steps = np.array([1, 0, 2], dtype=np.int64)
+        step_index = np.zeros((m, n), dtype=np.int8)
+        acc = cost[0].copy()  # 열린 시작: 어느 프레임에서든 시작 가능
+        cols = np.arange(n)
+        candidates = np.empty((3, n))
+        for j in range(1, m):
+            candidates.fill(np.inf)
+            candidates[0, 1:] = acc[:-1]
+            candidates[1] = acc
+            candidates[2, 2:] = acc[:-2]
+            best = np.argmin(candidates, axis=0)
+            acc = candidates[best, cols] + cost[j]
+            step_index[j] = best
+
+        # 열린 끝: 마지막 참조 행의 최소 비용 프레임에서 끝남
+        i = int(np.argmin(acc))
+        normalized = float(acc[i] / m)
+        idx1 = np.empty(m, dtype=np.int64)
+        for j in range(m - 1, -1, -1):
+            idx1[j] = i
+            i -= steps[step_index[j, i]]
+        return idx1, np.arange(m, dtype=np.int64), normalized
+
+
+class PythonDtwBackend(AlignmentBackend):
+    """dtw-python 패키지 사용 (기존 동작)"""
+
+    name = "python-dtw"
+
+    def __init__(self):
+        from dtw import dtw
+        self._dtw = dtw
+
+    def align(self, X: np.ndarray, Y: np.ndarray, window: Optional[int] = None) -> Path:
+        # 경로만 쓰므로 비용/방향 행렬은 결과에 남기지 않음 (호출이 끝나면 바로 해제).
+        # 대역을 줘도 행렬은 (T, N) 전체를 잡으므로 대역은 계산량만 줄인다
+        if window is not None:
+            alignment = self._dtw(X, Y, keep_internals=False, step_pattern="asymmetricP1",
+                                  window_type="sakoechiba", window_args={"window_size": window})
+        else:
+            alignment = self._dtw(X, Y, keep_internals=False, step_pattern="asymmetricP1")
+        return alignment.index1, alignment.index2
+
+
+class NumpyDtwBackend(AlignmentBackend):
+    """
+    numpy 행 단위 벡터화 구현
+
+    asymmetricP1의 세 패턴은 모두 이전 두 행에서 출발하므로 한 행 전체를 한 번에 계산할 수 있다.
+    누적 비용은 직전 두 행만, 방향은 int8로 보관한다. 대역이 있으면 방향도 행마다 대역 폭만
+    보관하므로 (T, 2w+1) 크기가 된다.
+    """
+
+    name = "numpy"
+
+    def matrix_bytes(self, num_frames: int, ref_len: int, window: Optional[int] = None) -> int:
+        width = ref_len if window is None else min(ref_len, 2 * window + 1)
+        return int(num_frames) * int(width) + 6 * 8 * int(ref_len)
+
+    @staticmethod
+    def _cost_row(x: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        if cdist is not None:
+            return cdist(x[None, :], Y)[0]
+        return np.sqrt(((Y - x) ** 2).sum(axis=1))
+
+    def align(self, X: np.ndarray, Y: np.ndarray, window: Optional[int] = None) -> Path:
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        n, m = X.shape[0], Y.shape[0]
+        if n == 0 or m == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        inf = np.inf
+        # 방향 저장: 행 i의 열 j는 direction[i, j - base(i)] (대역이면 base(i) = i - window)
+        banded = window is not None and 2 * window + 1 < m
+        width = 2 * window + 1 if banded else m
+        direction = np.full((n, width), -1, dtype=np.int8)
+        cm_prev2 = np.full(m, inf)
+        cm_prev = np.full(m, inf)
+        cm_cur = np.full(m, inf)
+        lm_cur = self._cost_row(X[0], Y)
+        cm_cur[0] = lm_cur[0]  # 시작점 고정
+
+        cols = np.arange(m)
+        candidates = np.full((3, m), inf)
+        for i in range(1, n):
+            cm_prev2, cm_prev = cm_prev, cm_cur
+            lm_prev, lm_cur = lm_cur, self._cost_row(X[i], Y)
+
+            candidates.fill(inf)
+            # 패턴 0: (i-1, j-2) + .5 c(i, j-1) + .5 c(i, j)
+            candidates[0, 2:] = cm_prev[:-2] + 0.5 * lm_cur[1:-1] + 0.5 * lm_cur[2:]
+            # 패턴 1: (i-1, j-1) + c(i, j)
+            candidates[1, 1:] = cm_prev[:-1] + lm_cur[1:]
+            # 패턴 2: (i-2, j-1) + c(i-1, j) + c(i, j)
+            if i >= 2:
+                candidates[2, 1:] = cm_prev2[:-1] + lm_prev[1:] + lm_cur[1:]
+
+            # 동점이면 앞 패턴 우선 (dtw-python과 같음)
+            best = np.argmin(candidates, axis=0)
+            cm_cur = candidates[best, cols]
+            reachable = np.isfinite(cm_cur)
+            if window is not None:
+                reachable &= np.abs(cols - i) <= window
+                cm_cur = np.where(reachable, cm_cur, inf)
+            base = i - window if banded else 0
+            lo, hi = max(0, base), min(m, base + width)
+            if lo < hi:
+                direction[i, lo - base:hi - base] = np.where(reachable[lo:hi], best[lo:hi], -1)
+
+        if not np.isfinite(cm_cur[m - 1]):
+            raise ValueError("No warping path found compatible with the local constraints")
+
+        # 역추적: (n-1, m-1) -> (0, 0), 패턴의 중간 셀 포함
+        idx1, idx2 = [n - 1], [m - 1]
+        i, j = n - 1, m - 1
+        while not (i == 0 and j == 0):
+            col = j - (i - window if banded else 0)
+            p = direction[i, col] if 0 <= col < width else -1
+            if p < 0:
+                break
+            if p == 0:
+                idx1 += [i, i - 1]
+                idx2 += [j - 1, j - 2]
+                i, j = i - 1, j - 2
+            elif p == 1:
+                idx1.append(i - 1)
+                idx2.append(j - 1)
+                i, j = i - 1, j - 1
+            else:
+                idx1 += [i - 1, i - 2]
+                idx2 += [j, j - 1]
+                i, j = i - 2, j - 1
+        return np.array(idx1[::-1], dtype=np.int64), np.array(idx2[::-1], dtype=np.int64)
+
+
+class NativeDtwBackend(AlignmentBackend):
+    """
+    C++ 커널 (pyrealtime.dtw_align_f32)
+
+    연속 float32 버퍼를 그대로 넘기고 계산 중에는 GIL을 놓으므로 여러 세션이 동시에 정렬할 수 있다.
+    """
+
+    name = "native"
+
+    def matrix_bytes(self, num_frames: int, ref_len: int, window: Optional[int] = None) -> int:
+        # 커널도 numpy 구현과 같은 방식으로 방향을 대역 폭만 보관
+        width = ref_len if window is None or window < 0 else min(ref_len, 2 * window + 1)
+        return int(num_frames) * int(width) + 5 * 8 * int(ref_len)
+
+    def __init__(self, module_name: str = "pyrealtime"):
+        module = importlib.import_module(module_name)
+        if not hasattr(module, "dtw_align_f32"):
+            raise ImportError(f"{module_name}에 dtw_align_f32가 없습니다. 바인딩을 다시 빌드하세요.")
+        self._kernel = module.dtw_align_f32
+
+    def align(self, X: np.ndarray, Y: np.ndarray, window: Optional[int] = None) -> Path:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        Y = np.ascontiguousarray(Y, dtype=np.float32)
+        try:
+            return self._kernel(X, Y, -1 if window is None else int(window))
+        except RuntimeError as e:
+            raise ValueError(str(e)) from e
+
+
+_BACKENDS: Dict[str, Type[AlignmentBackend]] = {
+    PythonDtwBackend.name: PythonDtwBackend,
+    NumpyDtwBackend.name: NumpyDtwBackend,
+    NativeDtwBackend.name: NativeDtwBackend,
+}
+
+
+def register_backend(name: str, backend_cls: Type[AlignmentBackend]) -> None:
+    """정렬 백엔드 등록 (같은 이름이 있으면 교체)"""
+    _BACKENDS[name] = backend_cls
+
+
+def available_backends() -> Dict[str, bool]:
+    """등록된 백엔드와 현재 환경에서 생성 가능 여부"""
+    status = {}
+    for name, backend_cls in _BACKENDS.items():
+        try:
+            backend_cls()
+            status[name] = True
+        except ImportError:
+            status[name] = False
+    return status
+
+
+def create_backend(name: str) -> AlignmentBackend:
+    """
+    이름으로 정렬 백엔드 생성
+
+    Args:
+        name: "python-dtw", "numpy", "native" 또는 register_backend로 등록한 이름
+
+    Returns:
+        AlignmentBackend: 백엔드 인스턴스
+
+    Raises:
+        ValueError: 등록되지 않은 이름
+        ImportError: 백엔드 의존성(dtw-python, pyrealtime)이 없음
+    """
+    backend_cls = _BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"알 수 없는 정렬 백엔드: {name} (사용 가능: {', '.join(_BACKENDS)})")
+    return backend_cls()
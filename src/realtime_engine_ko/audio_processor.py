@@ -4,9 +4,12 @@ import numpy as np
 import soundfile as sf
 import torch
 from typing import Optional, Tuple, Dict, Any, List
-import threading
 import logging
 
+from realtime_engine_ko.telemetry import telemetry
+from realtime_engine_ko.scheduler import Scheduler, FileWatch, get_scheduler
+from realtime_engine_ko.audio_ring import AudioRingBuffer
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AudioProcessor")
@@ -20,7 +23,10 @@ class AudioProcessor:
         self,
         sample_rate: int = 16000,
         chunk_duration: float = 2.5,  # 2.5초로 증가
-        polling_interval: float = 0.1
+        polling_interval: float = 0.1,
+        keep_recording: bool = False,
+        scheduler: Optional[Scheduler] = None,
+        crop_padding: Optional[float] = 0.2
     ):
         """
         오디오 프로세서 초기화
@@ -28,7 +34,10 @@ class AudioProcessor:
         Args:
             sample_rate: 목표 샘플링 레이트 (Hz)
             chunk_duration: 처리할 청크 단위 시간 (초)
-            polling_interval: 파일 변경 확인 간격 (초)
+            polling_interval: 파일 변경 확인 최소 간격 (초)
+            keep_recording: 전체 녹음을 메모리에 보관할지 여부 (최종 재채점용)
+            scheduler: 파일 감시를 등록할 스케줄러 (없으면 프로세스 전역 스케줄러)
+            crop_padding: 청크 앞뒤 무음을 잘라낼 때 음성 구간 바깥에 남길 여유 (초, None이면 자르지 않음)
         """
         self.sample_rate = sample_rate
         self.chunk_duration = chunk_duration
@@ -39,14 +48,33 @@ class AudioProcessor:
         self.last_file_size: int = 0
         self.last_processed_pos: int = 0
         self.is_monitoring: bool = False
-        self.monitoring_thread: Optional[threading.Thread] = None
+        self.scheduler = scheduler
+        self.file_watch: Optional[FileWatch] = None
         
-        # 청크 처리를 위한 상태
-        self.buffer: List[np.ndarray] = []
+        # 청크 처리를 위한 상태 (수신 버퍼와 인코더 입력 버퍼는 세션 내내 재사용)
+        self.buffer = AudioRingBuffer(int(sample_rate * max(chunk_duration, 1.0) * 4))
+        self._input = np.zeros(int(sample_rate * chunk_duration), dtype=np.float32)
         self.last_chunk_time: Optional[float] = None
         self.total_duration: float = 0.0
         self.latest_chunk: Optional[torch.Tensor] = None
         
+        # 절대 오디오 시간 추적 (청크가 녹음의 어느 구간인지)
+        self.processed_samples: int = 0
+        self.latest_chunk_span: Tuple[float, float] = (0.0, 0.0)
+        
+        # 무음 자르기: 인코더에 들어간 구간 (청크 안 샘플 범위)
+        self.crop_padding = crop_padding
+        self.latest_crop: Tuple[int, int] = (0, 0)
+        
+        # 수신 시각 추적: (해당 묶음 끝 샘플 위치, 수신 시각) 목록
+        self.received_samples: int = 0
+        self.ingest_marks: List[Tuple[int, float]] = []
+        self.latest_chunk_ingest: Tuple[Optional[float], Optional[float]] = (None, None)
+        
+        # 전체 녹음 보관 (최종 재채점용)
+        self.keep_recording = keep_recording
+        self.recording: List[np.ndarray] = []
+        
         # 이벤트 기반 메커니즘
         self.chunk_callbacks = []  # 청크 생성 시 호출할 콜백 함수 목록
         
@@ -68,10 +96,39 @@ class AudioProcessor:
         self.last_file_size = os.path.getsize(file_path)
         self.last_processed_pos = 0
         self.total_duration = 0.0
-        self.buffer = []
+        self.buffer.clear()
         self.latest_chunk = None
+        self.processed_samples = 0
+        self.latest_chunk_span = (0.0, 0.0)
+        self.latest_crop = (0, 0)
+        self.received_samples = 0
+        self.ingest_marks = []
+        self.latest_chunk_ingest = (None, None)
+        self.recording = []
         return True
         
+    @staticmethod
+    def read_file(file_path: str) -> Optional[np.ndarray]:
+        """
+        녹음 파일 전체를 모니터링 경로와 같은 방식(모노, [-1, 1])으로 읽기
+        
+        Args:
+            file_path: 오디오 파일 경로
+            
+        Returns:
+            Optional[np.ndarray]: float32 모노 오디오 (읽을 수 없으면 None)
+        """
+        try:
+            audio_data = sf.read(file_path)[0]
+        except Exception as e:
+            logger.error(f"오디오 파일 읽기 오류: {e}")
+            return None
+        if len(audio_data) and np.max(np.abs(audio_data)) > 1.0:
+            audio_data = audio_data / np.max(np.abs(audio_data))
+        if audio_data.ndim > 1:
+            audio_data = np.mean(audio_data, axis=1)
+        return audio_data.astype(np.float32)
+        
     def start_monitoring(self) -> bool:
         """
         오디오 파일 모니터링 시작
@@ -87,46 +144,54 @@ class AudioProcessor:
             logger.error("모니터링할 오디오 파일이 설정되지 않았습니다.")
             return False
             
+        # 세션마다 폴링 스레드를 두지 않고 공용 스케줄러의 파일 감시에 등록
         self.is_monitoring = True
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_loop,
-            daemon=True
+        self.file_watch = (self.scheduler or get_scheduler()).watch_file(
+            self.audio_file_path,
+            self._on_file_changed,
+            min_interval=self.polling_interval,
+            name="audio_file"
         )
-        self.monitoring_thread.start()
         logger.info(f"오디오 파일 모니터링 시작: {self.audio_file_path}")
         return True
         
     def stop_monitoring(self) -> None:
         """모니터링 중지"""
         self.is_monitoring = False
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=1.0)
+        if self.file_watch is not None:
+            self.file_watch.cancel(timeout=1.0)
+            self.file_watch = None
         logger.info("오디오 파일 모니터링 중지")
         
-    def _monitoring_loop(self) -> None:
+    def read_remaining(self) -> None:
         """
-        오디오 파일 변경 모니터링 루프
-        (내부 스레드에서 실행)
+        모니터링 중지 후 파일에 남아 있는 마지막 데이터를 읽어 들임
         """
-        if not self.audio_file_path:
+        if self.audio_file_path and os.path.exists(self.audio_file_path):
+            self._process_new_audio_data()
+            self.last_file_size = os.path.getsize(self.audio_file_path)
+        # 청크 길이에 못 미친 남은 샘플도 마지막 청크로 처리
+        self._drain_chunks(flush=True)
+        
+    def _on_file_changed(self) -> None:
+        """
+        오디오 파일 변경 이벤트 처리
+        (스케줄러 작업자 스레드에서 실행, 같은 파일 감시의 호출은 겹치지 않음)
+        """
+        if not self.is_monitoring or not self.audio_file_path:
             return
             
-        while self.is_monitoring:
-            try:
-                # 파일 크기 확인
-                current_size = os.path.getsize(self.audio_file_path)
-                
-                # 파일 크기가 증가했으면 새 데이터 처리
-                if current_size > self.last_file_size:
-                    self._process_new_audio_data()
-                    self.last_file_size = current_size
-                    
-                # 다음 확인까지 대기
-                time.sleep(self.polling_interval)
+        try:
+            # 파일 크기 확인
+            current_size = os.path.getsize(self.audio_file_path)
+            
+            # 파일 크기가 증가했으면 새 데이터 처리
+            if current_size > self.last_file_size:
+                self._process_new_audio_data()
+                self.last_file_size = current_size
                 
-            except Exception as e:
-                logger.error(f"파일 모니터링 중 오류 발생: {e}")
-                time.sleep(self.polling_interval)
+        except Exception as e:
+            logger.error(f"파일 모니터링 중 오류 발생: {e}")
                 
     def _process_new_audio_data(self) -> None:
         """
@@ -137,16 +202,17 @@ class AudioProcessor:
             
         try:
             # 파일에서 새 데이터 읽기
-            with sf.SoundFile(self.audio_file_path, 'r') as f:
+            with telemetry.span("audio_read"), sf.SoundFile(self.audio_file_path, 'r') as f:
                 # 마지막 처리 위치로 이동
                 f.seek(self.last_processed_pos)
                 
                 # 새 데이터 읽기
                 frames = f.read()
+                ingest_time = time.time()
                 
                 if len(frames) > 0:
                     # 새 데이터 처리
-                    self._add_to_buffer(frames)
+                    self._add_to_buffer(frames, ingest_time)
                     
                     # 처리 위치 업데이트
                     self.last_processed_pos = f.tell()
@@ -154,12 +220,68 @@ class AudioProcessor:
         except Exception as e:
             logger.error(f"새 오디오 데이터 처리 중 오류 발생: {e}")
             
-    def _add_to_buffer(self, audio_data: np.ndarray) -> None:
+    def start_stream(self) -> None:
+        """
+        파일 모니터링 대신 push_audio로 샘플을 직접 받는 모드 시작 (스트리밍 서버용)
+        """
+        self.stop_monitoring()
+        self.audio_file_path = None
+        self.last_file_size = 0
+        self.last_processed_pos = 0
+        self.total_duration = 0.0
+        self.buffer.clear()
+        self.latest_chunk = None
+        self.processed_samples = 0
+        self.latest_chunk_span = (0.0, 0.0)
+        self.latest_crop = (0, 0)
+        self.received_samples = 0
+        self.ingest_marks = []
+        self.latest_chunk_ingest = (None, None)
+        self.recording = []
+        
+    def push_audio(self, samples: np.ndarray, ingest_time: Optional[float] = None) -> None:
+        """
+        스트림 샘플 추가 (모노, sample_rate, [-1, 1] 범위)
+        
+        청크 길이만큼 모일 때마다 청크를 처리하므로 작은 프레임을 자주 넣어도 된다.
+        
+        Args:
+            samples: 오디오 샘플
+            ingest_time: 수신 시각 (없으면 현재 시각)
+        """
+        if len(samples) == 0:
+            return
+        self._add_to_buffer(np.asarray(samples, dtype=np.float32), ingest_time, process=False)
+        self._drain_chunks()
+        
+    def end_stream(self) -> None:
+        """스트림 종료: 청크 길이에 못 미친 남은 샘플을 마지막 청크로 처리"""
+        self._drain_chunks(flush=True)
+        
+    def _drain_chunks(self, flush: bool = False) -> None:
+        """
+        버퍼에 청크 길이만큼 모인 만큼 청크 처리를 반복
+        
+        청크 콜백이 chunk_duration을 바꾸면 (활성 블록 길이에 맞춘 청크) 다음 청크부터 새 길이를 쓴다.
+        
+        Args:
+            flush: 마지막에 청크 길이에 못 미친 나머지도 처리
+        """
+        while True:
+            pending = self.received_samples - self.processed_samples
+            if pending <= 0 or (pending < int(self.chunk_duration * self.sample_rate) and not flush):
+                return
+            self._check_and_process_chunks()
+        
+    def _add_to_buffer(self, audio_data: np.ndarray, ingest_time: Optional[float] = None,
+                       process: bool = True) -> None:
         """
         오디오 데이터를 버퍼에 추가
         
         Args:
             audio_data: 추가할 오디오 데이터 (numpy 배열)
+            ingest_time: 이 묶음을 읽어 들인 시각 (없으면 현재 시각)
+            process: 청크 길이만큼 모인 청크를 바로 처리할지 여부 (push_audio는 직접 처리)
         """
         # 데이터 정규화 (필요시)
         if np.max(np.abs(audio_data)) > 1.0:
@@ -169,14 +291,19 @@ class AudioProcessor:
         if audio_data.ndim > 1:
             audio_data = np.mean(audio_data, axis=1)
             
-        # 버퍼에 추가
-        self.buffer.append(audio_data)
+        # 버퍼에 추가하고 수신 시각 기록
+        self.buffer.write(audio_data)
+        self.received_samples += len(audio_data)
+        self.ingest_marks.append((self.received_samples, ingest_time if ingest_time is not None else time.time()))
+        if self.keep_recording:
+            self.recording.append(audio_data.astype(np.float32))
         
         # 총 녹음 시간 업데이트
         self.total_duration += len(audio_data) / self.sample_rate
         
-        # 새 청크 생성 가능한지 확인
-        self._check_and_process_chunks()
+        # 청크 길이만큼 모였으면 처리 (한 번에 여러 청크 분량이 들어와도 모두 처리)
+        if process:
+            self._drain_chunks()
         
     def _check_and_process_chunks(self) -> None:
         """
@@ -188,8 +315,18 @@ class AudioProcessor:
         # 청크 추출
         chunk = self._extract_chunk(chunk_samples)
         
+        # 청크의 절대 시간 구간 기록
+        chunk_start_sample = self.processed_samples
+        self.processed_samples += len(chunk)
+        self.latest_chunk_span = (chunk_start_sample / self.sample_rate, self.processed_samples / self.sample_rate)
+        self.latest_chunk_ingest = self._consume_ingest_marks(chunk_start_sample, self.processed_samples)
+        
         # 청크 전처리 및 저장
-        self.latest_chunk = self._preprocess_chunk(chunk)
+        with telemetry.span("preprocess"):
+            self.latest_chunk = self._preprocess_chunk(chunk)
+        telemetry.inc("chunks_total")
+        if self.latest_chunk is None:
+            telemetry.inc("dropped_windows_total", labels={"reason": "vad"})
         # 청크 타임스탬프 업데이트
         self.last_chunk_time = time.time()
         
@@ -198,15 +335,39 @@ class AudioProcessor:
         
         # 청크 생성 후 콜백 호출
         if self.latest_chunk is not None:
-            metadata = {
-                "timestamp": time.time(),
-                "duration": self.chunk_duration,
-                "total_duration": self.total_duration
-            }
+            telemetry.inc("cropped_samples_total", len(chunk) - (self.latest_crop[1] - self.latest_crop[0]))
+            metadata = self._chunk_metadata()
             for callback in self.chunk_callbacks:
                 callback(self.latest_chunk, metadata)
             
         
+    def _consume_ingest_marks(self, start_sample: int, end_sample: int) -> Tuple[Optional[float], Optional[float]]:
+        """
+        청크 구간의 첫 샘플과 마지막 샘플이 도착한 시각 반환, 다 쓴 기록은 제거
+        
+        Args:
+            start_sample: 청크 시작 샘플 위치 (녹음 시작 기준)
+            end_sample: 청크 끝 샘플 위치 (미포함)
+            
+        Returns:
+            Tuple[Optional[float], Optional[float]]: (첫 샘플 도착 시각, 마지막 샘플 도착 시각)
+        """
+        if end_sample <= start_sample:
+            return None, None
+        
+        first = last = None
+        for mark_end, ingest_time in self.ingest_marks:
+            if first is None and mark_end > start_sample:
+                first = ingest_time
+            if mark_end >= end_sample:
+                last = ingest_time
+                break
+        
+        # 이후 청크에 걸치지 않는 기록 제거
+        while self.ingest_marks and self.ingest_marks[0][0] <= end_sample:
+            self.ingest_marks.pop(0)
+        return first, last
+        
     def _extract_chunk(self, chunk_samples: int) -> np.ndarray:
         """
         버퍼에서 지정된 크기의 청크 추출
@@ -215,63 +376,128 @@ class AudioProcessor:
             chunk_samples: 추출할 샘플 수
             
         Returns:
-            np.ndarray: 추출된 청크
+            np.ndarray: 추출된 청크 (수신 버퍼의 뷰, 다음 수신 전까지 유효)
         """
-        result = np.array([], dtype=np.float32)
-        samples_collected = 0
+        return self.buffer.read(chunk_samples)
         
-        while samples_collected < chunk_samples and self.buffer:
-            buffer_data = self.buffer[0]
-            samples_needed = chunk_samples - samples_collected
-            
-            if len(buffer_data) <= samples_needed:
-                # 버퍼 데이터 전체 사용
-                result = np.append(result, buffer_data)
-                samples_collected += len(buffer_data)
-                self.buffer.pop(0)
-            else:
-                # 버퍼 데이터 일부만 사용
-                result = np.append(result, buffer_data[:samples_needed])
-                self.buffer[0] = buffer_data[samples_needed:]
-                samples_collected += samples_needed
-                
-        return result
+    def _chunk_metadata(self) -> Dict[str, Any]:
+        """
+        최근 청크 메타데이터
+        
+        start_time/end_time은 인코더에 들어간 (무음을 잘라낸) 구간의 절대 시간이므로
+        인코더 프레임 i의 시각은 start_time + i * (end_time - start_time) / 프레임 수이다.
+        chunk_start_time/chunk_end_time은 자르기 전 청크 구간, crop_offset은 잘라낸 앞부분 길이 (초).
+        """
+        chunk_start, chunk_end = self.latest_chunk_span
+        offset = self.latest_crop[0] / self.sample_rate
+        return {
+            "timestamp": time.time(),
+            "duration": self.chunk_duration,
+            "total_duration": self.total_duration,
+            "start_time": chunk_start + offset,
+            "end_time": min(chunk_end, chunk_start + self.latest_crop[1] / self.sample_rate),
+            "chunk_start_time": chunk_start,
+            "chunk_end_time": chunk_end,
+            "crop_offset": offset,
+            "first_ingest_time": self.latest_chunk_ingest[0],
+            "ingest_time": self.latest_chunk_ingest[1]
+        }
         
     def _preprocess_chunk(self, chunk: np.ndarray, do_normalize: bool = True) -> torch.Tensor:
         """
         오디오 청크를 w2v_onnx_core와 호환되는 포맷으로 전처리
         
+        음성 프레임 앞뒤의 무음은 crop_padding만 남기고 잘라내며, 인코더에 들어간 샘플 범위를
+        latest_crop에 기록한다 (메타데이터의 절대 시간 계산용).
+        
         Args:
             chunk: 처리할 오디오 청크
             do_normalize: 정규화 여부
             
         Returns:
-            torch.Tensor: 처리된 오디오 텐서 [1, T]
+            torch.Tensor: 처리된 오디오 텐서 [1, T] (재사용 입력 버퍼의 뷰, 다음 청크 전까지 유효)
         """
-        # VAD 검사 - 음성이 없으면 None 반환
-        if not self._detect_voice_activity(chunk):
-            return None
         # 1) 모노화 (이미 모노인 경우 건너뜀)
         if chunk.ndim > 1:
             chunk = np.mean(chunk, axis=1)
+        self.latest_crop = (0, len(chunk))
         
-        # 2) 정규화
-        if do_normalize:
-            m = chunk.mean()
-            s = chunk.std()
-            chunk = (chunk - m) / (s + 1e-8)
+        # VAD 검사 - 음성이 없으면 None 반환
+        speech = self._speech_frames(chunk)
+        if not self._detect_voice_activity(chunk, speech=speech):
+            return None
+        
+        # 앞뒤 무음 자르기 (프레임 에너지 마스크 기준)
+        if self.crop_padding is not None:
+            self.latest_crop = self._speech_bounds(speech, len(chunk))
+            chunk = chunk[self.latest_crop[0]:self.latest_crop[1]]
         
-        # 3) float32로 캐스팅
-        chunk = chunk.astype(np.float32)
+        # 2) 입력 버퍼로 옮기며 정규화 (float32, 제자리 연산으로 임시 배열 없이)
+        n = len(chunk)
+        if len(self._input) < n:
+            self._input = np.zeros(n, dtype=np.float32)
+        out = self._input[:n]
+        if do_normalize:
+            m = chunk.mean(dtype=np.float64)
+            s = chunk.std(dtype=np.float64)
+            np.subtract(chunk, m, out=out, casting="unsafe")
+            out /= np.float32(s + 1e-8)
+        else:
+            out[:] = chunk
         
-        # 4) torch.Tensor로 변환 및 배치 차원 추가
-        tensor = torch.from_numpy(chunk).unsqueeze(0)  # shape: [1, T]
+        # 3) torch.Tensor로 변환 및 배치 차원 추가 (메모리 공유)
+        tensor = torch.from_numpy(out).unsqueeze(0)  # shape: [1, T]
         
         return tensor
     
+    def _speech_frames(self, audio_data: np.ndarray, energy_threshold: float = 0.0005) -> np.ndarray:
+        """
+        10ms 프레임별 에너지 기반 음성 마스크
+        
+        Args:
+            audio_data: 모노 오디오 데이터
+            energy_threshold: 음성으로 판단할 에너지 임계값
+            
+        Returns:
+            np.ndarray: 완전한 프레임마다 음성 여부 (bool)
+        """
+        frame_size = int(self.sample_rate * 0.01)
+        num_frames = len(audio_data) // frame_size
+        frames = audio_data[:num_frames * frame_size].reshape(num_frames, frame_size)
+        energies = np.mean(frames.astype(np.float64) ** 2, axis=1)
+        
+        # 로깅 (디버깅용)
+        avg_energy = energies.mean() if num_frames else 0
+        logger.debug(f"VAD: 평균 에너지={avg_energy:.6f}, 음성 프레임={int(np.sum(energies > energy_threshold))}/{num_frames}")
+        return energies > energy_threshold
+    
+    def _speech_bounds(self, speech: np.ndarray, num_samples: int) -> Tuple[int, int]:
+        """
+        음성 프레임 첫/끝에 crop_padding을 더한 샘플 범위 (청크 안)
+        
+        Args:
+            speech: _speech_frames() 마스크
+            num_samples: 청크 샘플 수
+            
+        Returns:
+            Tuple[int, int]: (시작 샘플, 끝 샘플)
+        """
+        frame_size = int(self.sample_rate * 0.01)
+        voiced = np.flatnonzero(speech)
+        if voiced.size == 0:
+            return 0, num_samples
+        pad = int(round(self.crop_padding * self.sample_rate))
+        start = max(0, int(voiced[0]) * frame_size - pad)
+        end = min(num_samples, (int(voiced[-1]) + 1) * frame_size + pad)
+        # 마지막 불완전 프레임은 마스크에 없으므로 끝까지 가까우면 포함
+        if num_samples - end < frame_size:
+            end = num_samples
+        return start, end
+    
     def _detect_voice_activity(self, audio_data: np.ndarray, 
                             energy_threshold: float = 0.0005,
-                            min_speech_frames: int = 10) -> bool:
+                            min_speech_frames: int = 10,
+                            speech: Optional[np.ndarray] = None) -> bool:
         """
         간단한 에너지 기반 VAD 구현
         
@@ -279,30 +505,19 @@ class AudioProcessor:
             audio_data: 오디오 데이터 (numpy 배열)
             energy_threshold: 음성으로 판단할 에너지 임계값
             min_speech_frames: 음성으로 판단할 최소 프레임 수
+            speech: 이미 계산한 프레임 마스크 (있으면 재사용)
             
         Returns:
             bool: 음성이 있는지 여부
         """
-        # 모노 데이터로 변환
-        if audio_data.ndim > 1:
-            audio_data = np.mean(audio_data, axis=1)
-            
-        # 프레임 단위로 분할 (10ms 프레임)
-        frame_size = int(self.sample_rate * 0.01)
-        frames = [audio_data[i:i+frame_size] for i in range(0, len(audio_data), frame_size)]
-        
-        # 각 프레임의 에너지 계산
-        energies = [np.sum(frame**2) / len(frame) for frame in frames if len(frame) == frame_size]
-        
-        # 임계값을 넘는 프레임 수 계산
-        speech_frames = sum(1 for energy in energies if energy > energy_threshold)
-        
-        # 로깅 (디버깅용)
-        avg_energy = np.mean(energies) if energies else 0
-        logger.debug(f"VAD: 평균 에너지={avg_energy:.6f}, 음성 프레임={speech_frames}/{len(energies)}")
+        if speech is None:
+            # 모노 데이터로 변환
+            if audio_data.ndim > 1:
+                audio_data = np.mean(audio_data, axis=1)
+            speech = self._speech_frames(audio_data, energy_threshold)
         
         # 임계값을 넘는 프레임이 충분한지 확인
-        return speech_frames >= min_speech_frames
+        return int(np.sum(speech)) >= min_speech_frames
         
     def get_latest_chunk(self) -> Tuple[Optional[torch.Tensor], Dict[str, Any]]:
         """
@@ -313,11 +528,7 @@ class AudioProcessor:
             Tuple[Optional[torch.Tensor], Dict[str, Any]]: 
                 (전처리된 청크 텐서[1,T], 메타데이터)
         """
-        metadata = {
-            "timestamp": time.time(),
-            "duration": self.chunk_duration,
-            "total_duration": self.total_duration
-        }
+        metadata = self._chunk_metadata()
         
         # 실제 청크가 없는 경우
         if self.latest_chunk is None:
@@ -331,10 +542,37 @@ class AudioProcessor:
         self.audio_file_path = None
         self.last_file_size = 0
         self.last_processed_pos = 0
-        self.buffer = []
+        self.buffer.clear()
         self.total_duration = 0.0
         self.last_chunk_time = None
         self.latest_chunk = None
+        self.received_samples = 0
+        self.processed_samples = 0
+        self.ingest_marks = []
+        self.latest_chunk_ingest = (None, None)
+        self.latest_chunk_span = (0.0, 0.0)
+        self.latest_crop = (0, 0)
+        self.recording = []
+        
+    def buffered_bytes(self) -> int:
+        """
+        수신/인코더 입력 버퍼 할당 크기와 보관 중인 전체 녹음의 바이트 수
+        
+        Returns:
+            int: 바이트 수
+        """
+        return self.buffer.nbytes + self._input.nbytes + sum(a.nbytes for a in self.recording)
+        
+    def get_recording(self) -> np.ndarray:
+        """
+        지금까지 수신한 전체 녹음 반환 (keep_recording=True일 때만 유효)
+        
+        Returns:
+            np.ndarray: 모노 오디오 (float32)
+        """
+        if not self.recording:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self.recording)
         
     def add_chunk_callback(self, callback):
         """청크 생성 시 호출할 콜백 함수 등록"""
@@ -0,0 +1,84 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger("AudioRingBuffer")
+
+
+class AudioRingBuffer:
+    """
+    수신 오디오를 모아 두는 재사용 버퍼 (float32 모노)
+
+    읽기 구간이 항상 연속 메모리가 되도록 끝에서 감싸 쓰지 않고, 쓰기 공간이 모자라면
+    아직 읽지 않은 샘플만 앞으로 옮긴다 (그래도 모자라면 용량을 두 배로 늘림).
+    read()는 복사 없이 내부 배열의 뷰를 돌려주므로 다음 write() 전까지만 유효하다.
+    """
+
+    def __init__(self, capacity: int = 16000 * 8):
+        """
+        Args:
+            capacity: 초기 용량 (샘플 수)
+        """
+        self._data = np.zeros(max(1, capacity), dtype=np.float32)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        """아직 읽지 않은 샘플 수"""
+        return self._end - self._start
+
+    @property
+    def nbytes(self) -> int:
+        """할당된 버퍼 크기 (바이트)"""
+        return self._data.nbytes
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        샘플 추가 (float32로 변환하며 내부 배열에 바로 복사)
+
+        Args:
+            samples: 모노 오디오
+        """
+        n = len(samples)
+        if n == 0:
+            return
+        if self._end + n > len(self._data):
+            self._make_room(n)
+        self._data[self._end:self._end + n] = samples
+        self._end += n
+
+    def read(self, n: int) -> np.ndarray:
+        """
+        앞에서부터 최대 n개 샘플을 꺼냄
+
+        Args:
+            n: 읽을 샘플 수
+
+        Returns:
+            np.ndarray: 내부 배열의 연속 뷰 (다음 write() 전까지 유효)
+        """
+        n = min(n, len(self))
+        view = self._data[self._start:self._start + n]
+        self._start += n
+        if self._start == self._end:
+            self._start = self._end = 0
+        return view
+
+    def clear(self) -> None:
+        """읽지 않은 샘플 버림 (할당은 유지)"""
+        self._start = self._end = 0
+
+    def _make_room(self, n: int) -> None:
+        """읽지 않은 샘플을 앞으로 옮기고, 그래도 n개가 안 들어가면 용량 확장"""
+        pending = len(self)
+        capacity = len(self._data)
+        if pending + n > capacity:
+            while pending + n > capacity:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=np.float32)
+            grown[:pending] = self._data[self._start:self._end]
+            self._data = grown
+            logger.debug("오디오 버퍼 확장: %d 샘플", capacity)
+        elif pending:
+            self._data[:pending] = self._data[self._start:self._end]
+        self._start, self._end = 0, pending
@@ -0,0 +1,121 @@
+import time
+import logging
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger("CadenceController")
+
+
+class AdaptiveCadenceController:
+    """
+    세션별 부하 적응형 평가 주기 제어기
+
+    청크마다 추론 지연과 실시간 계수(RTF = 추론 시간 / 오디오 길이)를 측정하고,
+    목표 종단 지연을 맞추도록 채점 간격과 청크 길이를 늘이거나 줄인다.
+    처리가 밀린 세션은 중간 청크 채점을 건너뛰어 큐가 쌓이지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 1.0,
+        min_interval: float = 0.0,
+        max_interval: float = 2.0,
+        min_chunk_scale: float = 0.5,
+        max_chunk_scale: float = 2.0,
+        smoothing: float = 0.3
+    ):
+        """
+        제어기 초기화
+
+        Args:
+            target_latency: 목표 종단 지연 (초)
+            min_interval: 최소 채점 간격 (초)
+            max_interval: 최대 채점 간격 (초)
+            min_chunk_scale: 기본 청크 길이에 곱할 최소 배율
+            max_chunk_scale: 기본 청크 길이에 곱할 최대 배율
+            smoothing: 지수 이동 평균 계수 (0~1, 클수록 최근 값 반영이 빠름)
+        """
+        self.target_latency = target_latency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.min_chunk_scale = min_chunk_scale
+        self.max_chunk_scale = max_chunk_scale
+        self.smoothing = smoothing
+
+        self.reset()
+
+    def reset(self) -> None:
+        """측정값 및 조정 상태 초기화"""
+        self.eval_interval: float = self.min_interval
+        self.chunk_scale: float = 1.0
+        self.avg_latency: Optional[float] = None
+        self.avg_rtf: Optional[float] = None
+        self.last_scored_time: Optional[float] = None
+        self.scored_chunks: int = 0
+        self.skipped_chunks: int = 0
+
+    def should_score(self, metadata: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        이번 청크를 채점할지 결정
+
+        Args:
+            metadata: 청크 메타데이터 (total_duration, chunk_end_time 또는 end_time 사용)
+            now: 현재 시각 (테스트용, 없으면 time.time())
+
+        Returns:
+            bool: 채점해야 하면 True
+        """
+        now = time.time() if now is None else now
+
+        # 아직 청크로 만들어지지 않은 오디오가 목표 지연보다 많으면 밀린 상태 -> 중간 청크 건너뜀
+        backlog = metadata.get("total_duration", 0.0) - metadata.get("chunk_end_time", metadata.get("end_time", 0.0))
+        if backlog > self.target_latency:
+            self.skipped_chunks += 1
+            logger.debug(f"처리 지연으로 청크 채점 건너뜀 (backlog={backlog:.2f}s)")
+            return False
+
+        if self.last_scored_time is not None and now - self.last_scored_time < self.eval_interval:
+            self.skipped_chunks += 1
+            return False
+
+        return True
+
+    def record(self, inference_latency: float, audio_duration: float, now: Optional[float] = None) -> None:
+        """
+        채점 결과 측정값 반영 및 주기/청크 길이 조정
+
+        Args:
+            inference_latency: 이번 청크 채점에 걸린 시간 (초)
+            audio_duration: 이번 청크의 오디오 길이 (초)
+            now: 현재 시각 (테스트용)
+        """
+        self.last_scored_time = time.time() if now is None else now
+        self.scored_chunks += 1
+
+        rtf = inference_latency / audio_duration if audio_duration > 0 else 0.0
+        a = self.smoothing
+        self.avg_latency = inference_latency if self.avg_latency is None else (1 - a) * self.avg_latency + a * inference_latency
+        self.avg_rtf = rtf if self.avg_rtf is None else (1 - a) * self.avg_rtf + a * rtf
+
+        if self.avg_latency > self.target_latency or self.avg_rtf > 1.0:
+            # 따라가지 못함: 채점 간격을 늘리고 더 긴 청크로 호출 횟수를 줄임
+            self.eval_interval = min(self.max_interval, max(self.eval_interval * 1.5, self.avg_latency))
+            self.chunk_scale = min(self.max_chunk_scale, self.chunk_scale * 1.25)
+        elif self.avg_latency < 0.5 * self.target_latency and self.avg_rtf < 0.5:
+            # 여유 있음: 간격과 청크를 줄여 응답성을 높임
+            self.eval_interval = max(self.min_interval, self.eval_interval * 0.8)
+            self.chunk_scale = max(self.min_chunk_scale, self.chunk_scale * 0.9)
+
+    def chunk_duration(self, base_duration: float) -> float:
+        """기본 청크 길이에 현재 배율을 적용한 청크 길이 (초)"""
+        return base_duration * self.chunk_scale
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 제어 상태 반환"""
+        return {
+            "eval_interval": round(self.eval_interval, 3),
+            "chunk_scale": round(self.chunk_scale, 3),
+            "avg_latency": round(self.avg_latency, 4) if self.avg_latency is not None else None,
+            "avg_rtf": round(self.avg_rtf, 4) if self.avg_rtf is not None else None,
+            "scored_chunks": self.scored_chunks,
+            "skipped_chunks": self.skipped_chunks
+        }
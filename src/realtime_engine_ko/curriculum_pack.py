@@ -0,0 +1,340 @@
+"""
+커리큘럼 팩: 고정 문장 목록을 미리 컴파일한 바이너리 파일
+
+문장마다 블록 분할, 토큰 ID, 블록(단어) 토큰 경계, 미리 모은 prototype 행을 담는다.
+워커는 시작할 때 팩을 mmap으로 열고, 세션 준비는 문장 ID 조회로 끝난다.
+같은 호스트의 프로세스들은 팩 페이지를 공유한다.
+
+    python -m realtime_engine_ko.curriculum_pack build catalog.jsonl curriculum.pack \\
+        --model models/model.onnx --tokenizer models/tokenizer.json
+
+카탈로그는 JSON Lines({"id": ..., "sentence": ...}) 또는 탭 구분(id<TAB>문장) 텍스트.
+"""
+import os
+import sys
+import json
+import struct
+import logging
+import argparse
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from realtime_engine_ko.result_cache import model_fingerprint
+
+logger = logging.getLogger("CurriculumPack")
+
+PACK_MAGIC = b"GOPPACK\x01"
+PACK_VERSION = 1
+_ALIGN = 64
+
+
+def split_blocks(sentence: str, delimiter: str = " ") -> List[str]:
+    """SentenceBlockManager와 같은 규칙의 블록 분할 (빈 블록 제외)"""
+    return [b.strip() for b in sentence.split(delimiter) if b.strip()]
+
+
+def read_catalog(path: str) -> List[Tuple[str, str]]:
+    """
+    문장 카탈로그 읽기
+
+    Args:
+        path: .jsonl ({"id", "sentence"}) 또는 탭 구분 텍스트
+
+    Returns:
+        List[Tuple[str, str]]: (문장 ID, 문장)
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                item = json.loads(line)
+                entries.append((str(item["id"]), item["sentence"]))
+            else:
+                sentence_id, sep, sentence = line.partition("\t")
+                if not sep:
+                    raise ValueError(f"{path}:{line_no}: 'id<TAB>문장' 형식이 아닙니다")
+                entries.append((sentence_id, sentence))
+    return entries
+
+
+def _block_token_ranges(engine, blocks: List[str], token_ids: np.ndarray) -> np.ndarray:
+    """
+    전체 문장 토큰에서 블록별 [시작, 끝) 토큰 구간 찾기
+
+    런타임 컨텍스트 창(연속 블록을 공백으로 이은 문장)의 토큰이 이 구간들의 연속 조각과 같아야
+    팩을 쓸 수 있으므로, 블록 토큰 사이에 구분자가 정확히 하나씩 있는지 확인한다.
+    """
+    ranges = np.zeros((len(blocks), 2), dtype=np.int64)
+    pos = 0
+    for i, block in enumerate(blocks):
+        ids = engine.tokenize(block)
+        if i > 0:
+            if pos >= len(token_ids) or token_ids[pos] != engine.blank_id:
+                raise ValueError(f"블록 '{block}' 앞에 구분자 토큰이 없습니다")
+            pos += 1
+        if not np.array_equal(token_ids[pos:pos + len(ids)], ids):
+            raise ValueError(f"블록 '{block}'의 토큰이 문장 토큰과 다릅니다 (토크나이저가 블록 경계를 보존하지 않음)")
+        ranges[i] = (pos, pos + len(ids))
+        pos += len(ids)
+    if pos != len(token_ids):
+        raise ValueError("문장 끝에 블록에 속하지 않는 토큰이 있습니다")
+    return ranges
+
+
+def build_pack(
+    entries: Iterable[Tuple[str, str]],
+    engine,
+    out_path: str,
+    include_rows: bool = True
+) -> Dict[str, Any]:
+    """
+    문장 목록을 팩 파일 하나로 컴파일
+
+    Args:
+        entries: (문장 ID, 문장) 목록
+        engine: 토크나이저와 prototype 행렬을 쓸 Wav2VecCTCOnnxCore
+        out_path: 출력 경로
+        include_rows: 문장별 prototype 행을 미리 모아 저장할지 여부
+            (토큰 수 x hidden_dim x 4바이트만큼 커지며, 끄면 런타임에 엔진 행렬에서 모음)
+
+    Returns:
+        Dict[str, Any]: 팩 요약 (문장/블록/토큰 수, 파일 크기)
+    """
+    ids_blob, texts_blob = [], []
+    id_offsets, text_offsets, block_offsets, token_offsets = [0], [0], [0], [0]
+    block_ranges, token_chunks = [], []
+    seen = set()
+
+    for sentence_id, sentence in entries:
+        if sentence_id in seen:
+            raise ValueError(f"중복된 문장 ID: {sentence_id}")
+        seen.add(sentence_id)
+        blocks = split_blocks(sentence)
+        # 런타임 컨텍스트 창과 같은 형태 (블록을 공백 하나로 이음)
+        token_ids = engine.tokenize(" ".join(blocks))
+        block_ranges.append(_block_token_ranges(engine, blocks, token_ids))
+        token_chunks.append(token_ids)
+
+        encoded_id = sentence_id.encode("utf-8")
+        encoded_text = "\n".join(blocks).encode("utf-8")
+        ids_blob.append(encoded_id)
+        texts_blob.append(encoded_text)
+        id_offsets.append(id_offsets[-1] + len(encoded_id))
+        text_offsets.append(text_offsets[-1] + len(encoded_text))
+        block_offsets.append(block_offsets[-1] + len(blocks))
+        token_offsets.append(token_offsets[-1] + len(token_ids))
+
+    hidden_dim = int(engine.prototype_matrix.shape[1])
+    all_tokens = np.concatenate(token_chunks) if token_chunks else np.zeros(0, dtype=np.int64)
+    arrays = {
+        "id_blob": np.frombuffer(b"".join(ids_blob), dtype=np.uint8),
+        "id_offsets": np.asarray(id_offsets, dtype=np.int64),
+        "text_blob": np.frombuffer(b"".join(texts_blob), dtype=np.uint8),
+        "text_offsets": np.asarray(text_offsets, dtype=np.int64),
+        "block_offsets": np.asarray(block_offsets, dtype=np.int64),
+        "block_tokens": np.concatenate(block_ranges) if block_ranges else np.zeros((0, 2), dtype=np.int64),
+        "token_offsets": np.asarray(token_offsets, dtype=np.int64),
+        "token_ids": all_tokens.astype(np.int64)
+    }
+    if include_rows:
+        arrays["prototype_rows"] = np.ascontiguousarray(engine.prototype_matrix[all_tokens], dtype=np.float32)
+
+    header = {
+        "version": PACK_VERSION,
+        "model_hash": model_fingerprint(engine.onnx_model_path) if engine.onnx_model_path else None,
+        "hidden_dim": hidden_dim,
+        "count": len(id_offsets) - 1,
+        "arrays": {}
+    }
+    # 헤더 크기가 배열 오프셋에 영향을 주므로 데이터 시작 위치가 바뀌지 않을 때까지 다시 직렬화
+    data_start, previous = 0, None
+    while data_start != previous:
+        previous = data_start
+        offset = data_start
+        for name, arr in arrays.items():
+            header["arrays"][name] = {"offset": offset, "dtype": arr.dtype.str, "shape": list(arr.shape)}
+            offset = _aligned(offset + arr.nbytes)
+        header_bytes = json.dumps(header).encode("utf-8")
+        data_start = max(data_start, _aligned(len(PACK_MAGIC) + 8 + len(header_bytes)))
+
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for name, arr in arrays.items():
+            f.seek(header["arrays"][name]["offset"])
+            f.write(arr.tobytes())
+        # 빈 배열의 오프셋도 파일 안에 있도록 끝까지 채움
+        f.truncate(offset)
+    # 실행 중인 워커가 연 팩은 그대로 두고 새 파일로 교체
+    os.replace(tmp_path, out_path)
+
+    summary = {
+        "sentences": header["count"],
+        "blocks": int(arrays["block_offsets"][-1]),
+        "tokens": int(len(all_tokens)),
+        "bytes": os.path.getsize(out_path)
+    }
+    logger.info(f"커리큘럼 팩 저장: {out_path} ({summary['sentences']}문장, {summary['tokens']}토큰, "
+                f"{summary['bytes'] / 1e6:.1f}MB)")
+    return summary
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class PackedSentence:
+    """팩에서 꺼낸 문장 하나 (배열은 팩 mmap의 뷰)"""
+
+    def __init__(self, sentence_id: str, blocks: List[str], token_ids: np.ndarray,
+                 block_tokens: np.ndarray, prototype_rows: Optional[np.ndarray]):
+        self.sentence_id = sentence_id
+        self.blocks = blocks
+        self.sentence = " ".join(blocks)
+        self.token_ids = token_ids
+        self.block_tokens = block_tokens
+        self.prototype_rows = prototype_rows
+
+    def window(self, first_block: int, last_block: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        연속 블록 [first_block, last_block]을 공백으로 이은 텍스트의 토큰과 prototype 행
+
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray]]: (토큰 ID, prototype 행 (행을 저장하지 않았으면 None))
+        """
+        start = self.block_tokens[first_block, 0]
+        end = self.block_tokens[last_block, 1]
+        rows = self.prototype_rows[start:end] if self.prototype_rows is not None else None
+        return self.token_ids[start:end], rows
+
+
+class CurriculumPack:
+    """
+    mmap으로 연 커리큘럼 팩
+
+    파일 전체를 읽기 전용으로 매핑하므로 같은 팩을 연 프로세스들은 페이지 캐시를 공유한다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: build_pack()으로 만든 팩 경로
+        """
+        self.path = path
+        self._mm = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(self._mm[:len(PACK_MAGIC)]) != PACK_MAGIC:
+            raise ValueError(f"커리큘럼 팩 형식이 아닙니다: {path}")
+        (header_len,) = struct.unpack("<Q", bytes(self._mm[len(PACK_MAGIC):len(PACK_MAGIC) + 8]))
+        start = len(PACK_MAGIC) + 8
+        self.header = json.loads(bytes(self._mm[start:start + header_len]).decode("utf-8"))
+        if self.header.get("version") != PACK_VERSION:
+            raise ValueError(f"지원하지 않는 팩 버전: {self.header.get('version')}")
+        self.model_hash: Optional[str] = self.header.get("model_hash")
+        self.hidden_dim: int = self.header["hidden_dim"]
+
+        self._arrays = {name: self._view(spec) for name, spec in self.header["arrays"].items()}
+        id_blob, id_offsets = self._arrays["id_blob"], self._arrays["id_offsets"]
+        # 문장 ID -> 인덱스 (팩에서 유일하게 프로세스마다 만드는 구조)
+        blob = id_blob.tobytes()
+        self._index = {
+            blob[id_offsets[i]:id_offsets[i + 1]].decode("utf-8"): i
+            for i in range(len(id_offsets) - 1)
+        }
+        logger.info(f"커리큘럼 팩 로드: {path} ({len(self)}문장, {self._mm.nbytes / 1e6:.1f}MB mmap)")
+
+    def _view(self, spec: Dict[str, Any]) -> np.ndarray:
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        count = int(np.prod(shape)) if shape else 1
+        return np.frombuffer(self._mm, dtype=dtype, count=count, offset=spec["offset"]).reshape(shape)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, sentence_id: str) -> bool:
+        return sentence_id in self._index
+
+    def ids(self) -> List[str]:
+        return list(self._index)
+
+    def matches(self, onnx_model_path: Optional[str]) -> bool:
+        """팩의 토큰/prototype 행이 이 모델로 만든 것인지 여부"""
+        if not self.model_hash or not onnx_model_path:
+            return False
+        return model_fingerprint(onnx_model_path) == self.model_hash
+
+    def get(self, sentence_id: str) -> PackedSentence:
+        """
+        문장 ID 조회
+
+        Raises:
+            KeyError: 팩에 없는 ID
+        """
+        i = self._index[sentence_id]
+        a = self._arrays
+        text = a["text_blob"][a["text_offsets"][i]:a["text_offsets"][i + 1]].tobytes().decode("utf-8")
+        t0, t1 = a["token_offsets"][i], a["token_offsets"][i + 1]
+        b0, b1 = a["block_offsets"][i], a["block_offsets"][i + 1]
+        rows = a["prototype_rows"][t0:t1] if "prototype_rows" in a else None
+        blocks = text.split("\n") if text else []
+        return PackedSentence(sentence_id, blocks, a["token_ids"][t0:t1], a["block_tokens"][b0:b1], rows)
+
+
+# 경로 -> 열린 팩 (프로세스당 한 번만 매핑)
+_packs: Dict[str, CurriculumPack] = {}
+_packs_lock = threading.Lock()
+
+
+def load_pack(path: str) -> CurriculumPack:
+    """팩을 열거나 이미 연 팩 반환 (fork 전에 부르면 워커들이 매핑을 물려받음)"""
+    key = os.path.abspath(path)
+    with _packs_lock:
+        pack = _packs.get(key)
+        if pack is None:
+            pack = _packs[key] = CurriculumPack(key)
+    return pack
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="커리큘럼 팩 빌드/조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="문장 카탈로그를 팩으로 컴파일")
+    build.add_argument("catalog", help="문장 카탈로그 (.jsonl 또는 id<TAB>문장)")
+    build.add_argument("out", help="출력 팩 경로")
+    build.add_argument("--model", required=True, help="ONNX 모델 경로")
+    build.add_argument("--tokenizer", required=True, help="tokenizer.json 경로")
+    build.add_argument("--no-rows", action="store_true", help="prototype 행을 저장하지 않음 (팩 크기 축소)")
+    show = sub.add_parser("show", help="팩 요약 또는 문장 하나 출력")
+    show.add_argument("pack")
+    show.add_argument("--id", default=None)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.command == "build":
+        from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+        engine = Wav2VecCTCOnnxCore(args.model, args.tokenizer)
+        summary = build_pack(read_catalog(args.catalog), engine, args.out, include_rows=not args.no_rows)
+        print(json.dumps(summary, ensure_ascii=False))
+        return 0
+
+    pack = CurriculumPack(args.pack)
+    if args.id is None:
+        print(json.dumps({"sentences": len(pack), "model_hash": pack.model_hash, "hidden_dim": pack.hidden_dim,
+                          "rows": "prototype_rows" in pack.header["arrays"]}))
+    else:
+        packed = pack.get(args.id)
+        print(json.dumps({"id": packed.sentence_id, "blocks": packed.blocks,
+                          "block_tokens": packed.block_tokens.tolist(),
+                          "token_ids": packed.token_ids.tolist()}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,11 @@ import numpy as np
 from realtime_engine_ko.sentence_block import SentenceBlockManager, BlockStatus
 from realtime_engine_ko.progress_tracker import ProgressTracker
 from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+from realtime_engine_ko.telemetry import telemetry
+from realtime_engine_ko.memory_governor import SessionMemory, DegradationPolicy
+from realtime_engine_ko.curriculum_pack import PackedSentence
+from realtime_engine_ko.model_cascade import TrackingAgreement
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -23,7 +28,15 @@ class EvaluationController:
         sentence_manager: SentenceBlockManager,
         progress_tracker: ProgressTracker,
         confidence_threshold: float = 10,
-        min_time_between_evals: float = 0.1
+        subsequence_threshold: float = 20.0,
+        min_time_between_evals: float = 0.1,
+        timeline: Optional[PosteriorTimeline] = None,
+        memory: Optional[SessionMemory] = None,
+        low_res_search: bool = False,
+        packed: Optional[PackedSentence] = None,
+        block_alignment: str = "context",
+        tracking_engine: Optional[Wav2VecCTCOnnxCore] = None,
+        agreement: Optional[TrackingAgreement] = None
     ):
         """
         평가 컨트롤러 초기화
@@ -32,20 +45,54 @@ class EvaluationController:
             recognition_engine: 음성 인식 엔진
             sentence_manager: 문장 블록 관리자
             progress_tracker: 진행 상황 추적기
-            confidence_threshold: 인식 신뢰도 임계값
+            confidence_threshold: 인식 신뢰도 임계값 ("context" 정렬의 점수 척도)
+            subsequence_threshold: "subsequence" 정렬에서 쓰는 임계값. 이 모드의 점수는 절대 척도
+                (100 * (1 - 평균 로그 확률 / log(1/V)))라서 20은 블록 토큰의 기하평균 사후확률이
+                균등 분포(1/V)의 V^0.2배, 어휘 1207개 기준 약 0.34%인 지점. 맞는 블록은 무음 프레임을
+                포함해도 대략 35~50, 다른 블록은 0 근처로 떨어지는 사이에 둔 값
             min_time_between_evals: 블록 간 최소 평가 간격 (초)
+            timeline: 청크별 인코더 출력을 보관할 타임라인 (재채점용, 선택)
+            memory: 세션 메모리 계정 (주어지면 사용량을 보고하고 예산 단계에 따라 품질을 낮춤)
+            low_res_search: 후보 블록 탐색은 저해상도 정렬로 하고 최적 블록만 전체 해상도로 다시 채점
+            packed: 커리큘럼 팩의 문장 (주어지면 토큰화와 prototype 행 모으기를 건너뜀)
+            block_alignment: "context" (앞뒤 블록을 붙여 청크 전체와 정렬) 또는
+                "subsequence" (블록만 청크 안에서 찾아 한 번에 채점, 저해상도 탐색은 쓰지 않음)
+            tracking_engine: 청크마다 후보 블록 매칭에 쓸 작은 모델 (주어지면 채점 모델은 확정된 블록에만 실행)
+            agreement: 추적/채점 모델 일치도 집계
         """
         self.recognition_engine = recognition_engine
         self.sentence_manager = sentence_manager
         self.progress_tracker = progress_tracker
         self.confidence_threshold = confidence_threshold
+        self.subsequence_threshold = subsequence_threshold
         self.min_time_between_evals = min_time_between_evals
+        self.timeline = timeline
+        self.memory = memory
+        # 엔진에 저해상도 설정이 없으면 전체 해상도로만 채점
+        self.low_res_search = low_res_search and getattr(recognition_engine, "low_res", None) is not None
+        self.packed = packed
+        if block_alignment not in ("context", "subsequence"):
+            raise ValueError(f"알 수 없는 블록 정렬 방식: {block_alignment}")
+        self.block_alignment = block_alignment
+        self.tracking_engine = tracking_engine
+        self.agreement = agreement
+        
+        # 블록 앞뒤로 붙일 컨텍스트 블록 수 (메모리 압박 시 줄어듦)
+        self.context_blocks = 2
+        self.dtw_band: Optional[float] = None
         
         # 평가 상태 추적
         self.last_eval_time: Optional[float] = None
         self.pending_evaluations: Dict[int, Dict[str, Any]] = {}
         self.cached_results: Dict[int, Dict[str, Any]] = {}
         
+    @property
+    def match_threshold(self) -> float:
+        """현재 블록 정렬 방식의 점수 척도에 맞는 인식 임계값"""
+        if self.block_alignment == "subsequence":
+            return self.subsequence_threshold
+        return self.confidence_threshold
+
     def process_recognition_result(
         self, 
         audio_chunk: torch.Tensor, 
@@ -61,6 +108,14 @@ class EvaluationController:
         Returns:
             Dict[str, Any]: 평가 결과 및 상태 정보
         """
+        with telemetry.span("evaluate_chunk"):
+            return self._process_recognition_result(audio_chunk, metadata)
+    
+    def _process_recognition_result(
+        self, 
+        audio_chunk: torch.Tensor, 
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
         # 활성 윈도우 내 블록 ID 목록 가져오기
         active_window = self.progress_tracker.get_active_window()
         
@@ -68,6 +123,24 @@ class EvaluationController:
         if audio_chunk is None:
             return self._create_result_format()
         
+        # 메모리 예산 단계에 맞게 설정 조정
+        if self.memory is not None:
+            self._apply_policy(self.memory.policy())
+        
+        # 청크당 인코더는 한 번만 실행하고 모든 후보 블록이 결과를 공유
+        # 추적 모델이 있으면 후보 매칭은 추적 모델로 하고, 채점 모델은 블록이 확정될 때만 실행
+        chunk_span = (metadata.get("start_time"), metadata.get("end_time"))
+        tracking = self.tracking_engine
+        features = None
+        if tracking is not None:
+            match_features = tracking.encode(audio_chunk)
+        else:
+            features = self._encode_primary(audio_chunk, chunk_span)
+            match_features = features
+        
+        # 부분열 정렬은 일치 구간을 초 단위로도 돌려주도록 프레임 시각을 넘김
+        match_times = self._frame_times(chunk_span, match_features[0].shape[0])
+        
         # 활성 윈도우 내 모든 블록에 대해 매칭 시도
         best_match_id = None
         best_match_score = -float('inf')
@@ -81,36 +154,11 @@ class EvaluationController:
             if block.status == BlockStatus.EVALUATED:
                 continue
             
-            # 현재 블록의 컨텍스트 수집
-            context_before = ""
-            context_after = ""
-            
-            # 이전 블록들을 context_before로 수집 (최대 2개)
-            prev_blocks = []
-            for i in range(max(0, block_id-2), block_id):
-                prev_block = self.sentence_manager.get_block(i)
-                if prev_block:
-                    prev_blocks.append(prev_block.text)
-            context_before = " ".join(prev_blocks)
-            
-            # 다음 블록들을 context_after로 수집 (최대 2개)
-            next_blocks = []
-            for i in range(block_id+1, min(block_id+3, len(self.sentence_manager.blocks))):
-                next_block = self.sentence_manager.get_block(i)
-                if next_block:
-                    next_blocks.append(next_block.text)
-            context_after = " ".join(next_blocks)
-            
-            # 블록 텍스트로 GOP 계산 (컨텍스트 포함)
+            # 블록 텍스트로 GOP 계산 (컨텍스트 포함 또는 부분열 정렬)
             try:
-                gop_result = self.recognition_engine.calculate_gop_with_context(
-                    audio_chunk, 
-                    block.text,
-                    context_before,
-                    context_after,
-                    # 컨텍스트 내 위치는 항상 0 (단독 블록 평가 시)
-                    target_index=0 if not context_before else None
-                )
+                gop_result = self._score_block(block_id, match_features,
+                                               low_res=self.low_res_search and tracking is None,
+                                               frame_times=match_times, engine=tracking)
                 
                 # 전체 발음 점수 추출
                 overall_score = gop_result.get("overall", 0.0)
@@ -124,22 +172,65 @@ class EvaluationController:
                 self.cached_results[block_id] = {
                     "gop_score": overall_score,
                     "details": gop_result,
-                    "timestamp": time.time()
+                    "timestamp": time.time(),
+                    "start_time": chunk_span[0],
+                    "end_time": chunk_span[1]
                 }
                 
             except Exception as e:
                 logger.error(f"블록 {block_id} GOP 계산 중 오류: {e}")
+        
+        # 저해상도로 고른 최적 블록은 전체 해상도로 다시 채점 (임계값 판단과 최종 점수는 전체 해상도 기준)
+        if (self.low_res_search and self.block_alignment == "context" and tracking is None
+                and best_match_id is not None):
+            try:
+                gop_result = self._score_block(best_match_id, features)
+                best_match_score = gop_result.get("overall", 0.0)
+                self.cached_results[best_match_id].update({
+                    "gop_score": best_match_score,
+                    "details": gop_result
+                })
+            except Exception as e:
+                logger.error(f"블록 {best_match_id} 전체 해상도 재채점 중 오류: {e}")
+        
+        # 일부 청크는 채점 모델로도 후보를 골라 추적 모델과 비교
+        if tracking is not None and self.agreement is not None and self.agreement.should_audit():
+            if features is None:
+                features = self._encode_primary(audio_chunk, chunk_span)
+            primary_best, primary_score = None, -float('inf')
+            for block_id in active_window:
+                block = self.sentence_manager.get_block(block_id)
+                if not block or block.status == BlockStatus.EVALUATED:
+                    continue
+                try:
+                    score = self._score_block(block_id, features).get("overall", 0.0)
+                except Exception as e:
+                    logger.error(f"블록 {block_id} 감사 채점 중 오류: {e}")
+                    continue
+                if score > primary_score:
+                    primary_best, primary_score = block_id, score
+            self.agreement.record_audit(best_match_id, primary_best)
+        
         # 최적 매치 블록을 찾았으면 해당 블록 평가 진행
-        if best_match_id is not None and best_match_score >= self.confidence_threshold:
+        if best_match_id is not None and best_match_score >= self.match_threshold:
             # 평가 가능한 시점인지 확인
             current_time = time.time()
             if (self.last_eval_time is None or 
                 current_time - self.last_eval_time >= self.min_time_between_evals):
                 
+                # 추적 모델로 확정한 블록의 점수는 채점 모델로 계산
+                if tracking is not None:
+                    if features is None:
+                        features = self._encode_primary(audio_chunk, chunk_span)
+                    self._score_confirmed_block(best_match_id, best_match_score, features, chunk_span)
+                
                 # 어떤 블록이든 매치된 블록 평가
                 self._evaluate_block(best_match_id, self.cached_results[best_match_id])
                 self.last_eval_time = current_time
                 
+                # 발화 속도 학습 (다음 청크 길이 계산용)
+                self.progress_tracker.record_block_timing(best_match_id, self._block_end_time(best_match_id))
+                
                 # 활성 블록 업데이트 (케이스별 처리)
                 if best_match_id == self.sentence_manager.active_block_id:
                     # 1. 현재 활성 블록이 인식된 경우 - 다음 블록으로 진행
@@ -177,9 +268,235 @@ class EvaluationController:
                     # ProgressTracker 업데이트
                     self.progress_tracker.set_current_index(self.sentence_manager.active_block_id)
         
+        if tracking is not None and self.agreement is not None:
+            self.agreement.record_chunk(primary_encoded=features is not None)
+        
+        # 이번 청크에서 정렬 한 번이 잡은 최대 행렬 메모리 (실제 참조 길이/대역/백엔드 기준)
+        dtw_bytes = self.recognition_engine.take_dtw_bytes()
+        if tracking is not None:
+            dtw_bytes = max(dtw_bytes, tracking.take_dtw_bytes())
+        if self.memory is not None:
+            # 보관되는 것은 채점 모델 출력뿐 (추적 모델 출력은 청크 처리 후 버림),
+            # 채점 모델을 돌리지 않은 청크는 0. 타임라인은 이번 청크를 추가한 뒤 크기
+            hidden, logits = features if features is not None else (None, None)
+            self.memory.update(
+                hidden=hidden.nbytes if hidden is not None else 0,
+                probs=logits.nbytes if logits is not None else 0,
+                timeline=self.timeline.memory_usage()["ram_bytes"] if self.timeline is not None else 0,
+                dtw=dtw_bytes
+            )
+        
         # 새 형식으로 결과 반환
         return self._create_result_format()
     
+    def _apply_policy(self, policy: DegradationPolicy) -> None:
+        """
+        메모리 단계별 설정 적용 (DTW 대역, hidden 보관, 컨텍스트 길이)
+        
+        Args:
+            policy: 현재 단계의 설정
+        """
+        self.dtw_band = policy.dtw_band
+        self.context_blocks = policy.context_blocks
+        if self.timeline is not None and self.timeline.keep_hidden and not policy.keep_hidden:
+            freed = self.timeline.drop_hidden()
+            logger.warning(f"메모리 예산 초과 위험: 타임라인 hidden state 보관 중단 ({freed} bytes 해제)")
+    
+    def _collect_context(self, block_id: int) -> Tuple[str, str]:
+        """
+        블록 앞뒤의 컨텍스트 텍스트 수집 (각각 최대 context_blocks개 블록)
+        
+        Args:
+            block_id: 대상 블록 ID
+            
+        Returns:
+            Tuple[str, str]: (context_before, context_after)
+        """
+        n = self.context_blocks
+        
+        # 이전 블록들을 context_before로 수집
+        prev_blocks = []
+        for i in range(max(0, block_id-n), block_id):
+            prev_block = self.sentence_manager.get_block(i)
+            if prev_block:
+                prev_blocks.append(prev_block.text)
+        context_before = " ".join(prev_blocks)
+        
+        # 다음 블록들을 context_after로 수집
+        next_blocks = []
+        for i in range(block_id+1, min(block_id+1+n, len(self.sentence_manager.blocks))):
+            next_block = self.sentence_manager.get_block(i)
+            if next_block:
+                next_blocks.append(next_block.text)
+        context_after = " ".join(next_blocks)
+        
+        return context_before, context_after
+    
+    def _block_end_time(self, block_id: int) -> Optional[float]:
+        """
+        확정된 블록이 끝난 오디오 시각 (부분열 정렬의 일치 구간이 있으면 그 끝, 없으면 청크 끝)
+        """
+        cached = self.cached_results.get(block_id, {})
+        span = cached.get("details", {}).get("span") or {}
+        return span.get("end", cached.get("end_time"))
+    
+    def _encode_primary(self, audio_chunk: torch.Tensor,
+                        chunk_span: Tuple[Optional[float], Optional[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """채점 모델 인코더 실행 (타임라인에는 채점 모델 출력만 보관)"""
+        features = self.recognition_engine.encode(audio_chunk)
+        if self.timeline is not None and chunk_span[0] is not None and chunk_span[1] is not None:
+            self.timeline.append(chunk_span[0], chunk_span[1], features[0], features[1])
+        return features
+    
+    def _frame_times(self, chunk_span: Tuple[Optional[float], Optional[float]],
+                     num_frames: int) -> Optional[np.ndarray]:
+        """부분열 방식에서 청크 프레임별 시각 (초), 그 외에는 None"""
+        if self.block_alignment != "subsequence" or chunk_span[0] is None or chunk_span[1] is None:
+            return None
+        return chunk_span[0] + np.arange(num_frames) * (chunk_span[1] - chunk_span[0]) / max(1, num_frames)
+    
+    def _score_confirmed_block(self, block_id: int, tracking_score: float,
+                               features: Tuple[np.ndarray, np.ndarray],
+                               chunk_span: Tuple[Optional[float], Optional[float]]) -> None:
+        """
+        추적 모델이 확정한 블록을 채점 모델로 채점해 캐시 결과의 점수를 교체
+        
+        Args:
+            block_id: 확정된 블록 ID
+            tracking_score: 추적 모델 점수 (일치도 기록용)
+            features: 채점 모델 (hidden, logits)
+            chunk_span: 청크 구간 (초)
+        """
+        try:
+            gop_result = self._score_block(block_id, features,
+                                           frame_times=self._frame_times(chunk_span, features[0].shape[0]))
+        except Exception as e:
+            logger.error(f"블록 {block_id} 채점 모델 채점 중 오류 (추적 점수 유지): {e}")
+            return
+        primary_score = gop_result.get("overall", 0.0)
+        self.cached_results[block_id].update({
+            "gop_score": primary_score,
+            "details": gop_result,
+            "tracking_score": tracking_score
+        })
+        if self.agreement is not None:
+            self.agreement.record_confirmation(tracking_score, primary_score, self.match_threshold)
+    
+    def _score_block(self, block_id: int, features: Tuple[np.ndarray, np.ndarray],
+                     low_res: bool = False, frame_times: Optional[np.ndarray] = None,
+                     engine: Optional[Wav2VecCTCOnnxCore] = None) -> Dict[str, Any]:
+        """
+        인코더 출력으로 블록 하나 채점 (block_alignment 방식에 따라)
+        
+        Args:
+            block_id: 블록 ID
+            features: (hidden, logits)
+            low_res: 저해상도 정렬 사용 (컨텍스트 방식의 후보 탐색용)
+            frame_times: 프레임별 시각 (초, 부분열 방식에서 일치 구간/단어 시각 계산용)
+            engine: 채점에 쓸 엔진 (없으면 채점 모델, 추적 모델이면 팩의 prototype 행은 쓰지 않음)
+            
+        Returns:
+            Dict[str, Any]: GOP 결과
+        """
+        block = self.sentence_manager.get_block(block_id)
+        engine = engine or self.recognition_engine
+        # 팩의 prototype 행은 채점 모델 것이므로 다른 엔진에는 토큰 ID만 넘김
+        packed_rows = engine is self.recognition_engine
+        if self.block_alignment == "subsequence":
+            hidden, logits = features
+            tokens = None
+            if self.packed is not None:
+                ids, rows = self.packed.window(block_id, block_id)
+                tokens = (ids, rows if packed_rows else None)
+            return engine.calculate_block_gop(hidden, logits, block.text, frame_times=frame_times, tokens=tokens)
+        
+        context_before, context_after = self._collect_context(block_id)
+        return engine.calculate_gop_with_context(
+            None,
+            block.text,
+            context_before,
+            context_after,
+            # 컨텍스트 내 위치는 항상 0 (단독 블록 평가 시)
+            target_index=0 if not context_before else None,
+            features=features,
+            dtw_band=self.dtw_band,
+            low_res=low_res,
+            **self._packed_tokens(block_id, rows=packed_rows)
+        )
+    
+    def _packed_tokens(self, block_id: int, rows: bool = True) -> Dict[str, Any]:
+        """
+        팩에서 컨텍스트 창(_collect_context와 같은 범위)과 대상 블록의 토큰을 꺼냄
+        
+        Args:
+            block_id: 대상 블록 ID
+            rows: 미리 모은 prototype 행도 넘길지 여부 (채점 모델일 때만)
+        
+        Returns:
+            Dict[str, Any]: calculate_gop_with_context에 넘길 tokens/target_tokens (팩이 없으면 빈 dict)
+        """
+        if self.packed is None:
+            return {}
+        n = self.context_blocks
+        first = max(0, block_id - n)
+        last = min(len(self.sentence_manager.blocks) - 1, block_id + n)
+        window, target = self.packed.window(first, last), self.packed.window(block_id, block_id)
+        if not rows:
+            window, target = (window[0], None), (target[0], None)
+        return {"tokens": window, "target_tokens": target}
+    
+    def rescore_block(
+        self,
+        block_id: int,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        타임라인에 남아 있는 인코더 출력으로 블록을 다시 정렬/채점 (인코더 재실행 없음)
+        
+        Args:
+            block_id: 다시 채점할 블록 ID
+            start_time: 구간 시작 (초). 없으면 마지막으로 채점된 청크의 구간 사용
+            end_time: 구간 종료 (초)
+            
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 형식의 결과, 구간에 프레임이 없으면 None
+        """
+        block = self.sentence_manager.get_block(block_id)
+        if not block or self.timeline is None:
+            return None
+        
+        cached = self.cached_results.get(block_id, {})
+        if start_time is None:
+            start_time = cached.get("start_time")
+        if end_time is None:
+            end_time = cached.get("end_time")
+        if start_time is None or end_time is None:
+            return None
+        
+        hidden, logits, frame_times = self.timeline.get_range(start_time, end_time)
+        if hidden is None or logits is None:
+            telemetry.inc("cache_misses_total", labels={"cache": "timeline"})
+            return None
+        telemetry.inc("cache_hits_total", labels={"cache": "timeline"})
+        
+        gop_result = self._score_block(block_id, (hidden, logits), frame_times=frame_times)
+        
+        result = {
+            "gop_score": gop_result.get("overall", 0.0),
+            "details": gop_result,
+            "timestamp": time.time(),
+            "start_time": start_time,
+            "end_time": end_time
+        }
+        self.cached_results[block_id] = result
+        
+        # 이미 평가된 블록이면 점수 갱신
+        if block.status == BlockStatus.EVALUATED:
+            self.sentence_manager.set_block_score(block_id, result["gop_score"])
+        
+        return result
+    
     def _create_result_format(self) -> Dict[str, Any]:
         """
         요청된 형식에 맞게 결과 생성
@@ -315,3 +632,5 @@ class EvaluationController:
         self.last_eval_time = None
         self.pending_evaluations.clear()
         self.cached_results.clear()
+        self.context_blocks = 2
+        self.dtw_band = None
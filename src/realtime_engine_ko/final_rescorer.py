@@ -0,0 +1,278 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.result_cache import ResultCache, fingerprint
+
+logger = logging.getLogger("FinalRescorer")
+
+# 프로세스 전역 재채점 인코딩 풀 (모든 코디네이터/세션이 공유, 처음 쓸 때 생성)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_rescore_executor() -> ThreadPoolExecutor:
+    """프로세스 전역 재채점 인코딩 스레드 풀 반환 (스레드 수는 CPU 코어 수)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="final-rescore")
+        return _executor
+
+
+def _reset_executor_after_fork() -> None:
+    # 자식 프로세스에는 부모의 작업 스레드가 없으므로 새로 만들도록 비움
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor_after_fork)
+
+
+class FinalRescorer:
+    """
+    녹음 종료 시 전체 녹음을 전체 문장에 대해 한 번에 다시 채점하는 클래스
+
+    긴 녹음은 VAD 휴지 구간에서 나누고 각 구간을 병렬로 인코딩한 뒤,
+    이어 붙인 출력을 문장 전체와 정렬해 단어별 점수와 타임스탬프를 만든다.
+    인코딩은 프로세스 전역 풀에서 실행하므로 여러 세션이 재채점기 하나를 공유해도 된다
+    (모델은 호출마다 recognition_engine으로 지정 가능).
+    """
+
+    def __init__(
+        self,
+        recognition_engine: Wav2VecCTCOnnxCore,
+        sample_rate: int = 16000,
+        latency_budget: float = 3.0,
+        min_pause_duration: float = 0.3,
+        max_segment_duration: float = 10.0,
+        energy_threshold: float = 0.0005,
+        result_cache: Optional[ResultCache] = None
+    ):
+        """
+        최종 재채점기 초기화
+
+        Args:
+            recognition_engine: 기본 음성 인식 엔진 (호출 시 다른 엔진을 주지 않으면 사용)
+            sample_rate: 샘플링 레이트 (Hz)
+            latency_budget: 재채점에 허용할 최대 시간 (초). 인코딩이 넘기면 정렬 전에 중단
+            min_pause_duration: 구간 분할 기준이 되는 최소 휴지 길이 (초)
+            max_segment_duration: 구간 최대 길이 (초)
+            energy_threshold: 휴지로 판단할 프레임 에너지 임계값
+            result_cache: 주어지면 같은 녹음/문장/모델/설정의 결과를 다시 계산하지 않고 돌려줌
+        """
+        self.recognition_engine = recognition_engine
+        self.sample_rate = sample_rate
+        self.latency_budget = latency_budget
+        self.min_pause_duration = min_pause_duration
+        self.max_segment_duration = max_segment_duration
+        self.energy_threshold = energy_threshold
+        self.result_cache = result_cache
+
+        # 아직 끝나지 않은 인코딩 작업 (shutdown에서 대기 중인 작업 취소)
+        self._pending: set = set()
+        self._pending_lock = threading.Lock()
+
+    def _submit(self, engine: Wav2VecCTCOnnxCore, tensor: torch.Tensor) -> Future:
+        """전역 풀에 구간 인코딩 제출 (한 스레드가 여러 구간을 맡으므로 재사용 출력 버퍼는 쓰지 않음)"""
+        future = get_rescore_executor().submit(engine.encode, tensor, reuse_outputs=False)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def split_at_pauses(self, audio: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        휴지 구간 중앙에서 오디오를 나눔
+
+        Args:
+            audio: 모노 오디오
+
+        Returns:
+            List[Tuple[int, int]]: (시작 샘플, 끝 샘플) 구간 목록 (전체를 빈틈없이 덮음)
+        """
+        n = len(audio)
+        max_len = int(self.max_segment_duration * self.sample_rate)
+        if n <= max_len:
+            return [(0, n)] if n > 0 else []
+
+        # 10ms 프레임 에너지
+        frame_size = int(self.sample_rate * 0.01)
+        num_frames = n // frame_size
+        energies = np.mean(audio[:num_frames * frame_size].reshape(num_frames, frame_size) ** 2, axis=1)
+        silent = energies <= self.energy_threshold
+
+        # 충분히 긴 휴지 구간의 중앙을 분할 후보로 사용
+        min_pause_frames = max(1, int(self.min_pause_duration / 0.01))
+        candidates = []
+        run_start = None
+        for i, is_silent in enumerate(np.append(silent, False)):
+            if is_silent and run_start is None:
+                run_start = i
+            elif not is_silent and run_start is not None:
+                if i - run_start >= min_pause_frames:
+                    candidates.append(((run_start + i) // 2) * frame_size)
+                run_start = None
+
+        # 최대 길이를 넘지 않도록 후보 중에서 가능한 멀리 있는 지점을 골라 분할
+        segments = []
+        start = 0
+        while n - start > max_len:
+            limit = start + max_len
+            cut = max((c for c in candidates if start < c <= limit), default=limit)
+            segments.append((start, cut))
+            start = cut
+        segments.append((start, n))
+        return segments
+
+    def _prepare_tensor(self, segment: np.ndarray) -> torch.Tensor:
+        """AudioProcessor._preprocess_chunk와 동일한 정규화 (VAD 제외)"""
+        m = segment.mean()
+        s = segment.std()
+        segment = ((segment - m) / (s + 1e-8)).astype(np.float32)
+        return torch.from_numpy(segment).unsqueeze(0)
+
+    def scoring_config(self, recognition_engine: Optional[Wav2VecCTCOnnxCore] = None) -> Dict[str, Any]:
+        """결과에 영향을 주는 설정 (결과 캐시 키에 포함)"""
+        engine = recognition_engine or self.recognition_engine
+        return {
+            "sample_rate": self.sample_rate,
+            "min_pause_duration": self.min_pause_duration,
+            "max_segment_duration": self.max_segment_duration,
+            "energy_threshold": self.energy_threshold,
+            "alignment_backend": engine.aligner.name,
+            "weight_norm": [engine.weight_norm_mid, engine.weight_norm_steepness]
+        }
+
+    def cache_key(self, audio: np.ndarray, sentence: str,
+                  recognition_engine: Optional[Wav2VecCTCOnnxCore] = None) -> Optional[Tuple[str, str]]:
+        """
+        결과 캐시 키와 모델 해시 (캐시가 없거나 모델 파일을 알 수 없으면 None)
+
+        Returns:
+            Optional[Tuple[str, str]]: (키, 모델 해시)
+        """
+        engine = recognition_engine or self.recognition_engine
+        if self.result_cache is None or not engine.onnx_model_path:
+            return None
+        model_hash = self.result_cache.model_hash(engine.onnx_model_path)
+        return fingerprint(audio, sentence, model_hash, self.scoring_config(engine)), model_hash
+
+    def lookup(self, audio: np.ndarray, sentence: str,
+               recognition_engine: Optional[Wav2VecCTCOnnxCore] = None) -> Optional[Dict[str, Any]]:
+        """
+        저장된 재채점 결과 조회 (계산하지 않음)
+
+        Returns:
+            Optional[Dict[str, Any]]: rescore()와 같은 형식의 결과 (없으면 None)
+        """
+        cached = self.cache_key(audio, sentence, recognition_engine)
+        if cached is None:
+            return None
+        key, model_hash = cached
+        result = self.result_cache.get(key, model_hash)
+        if result is not None:
+            result["cached"] = True
+        return result
+
+    def rescore(self, audio: np.ndarray, sentence: str,
+                recognition_engine: Optional[Wav2VecCTCOnnxCore] = None) -> Optional[Dict[str, Any]]:
+        """
+        전체 녹음을 전체 문장에 대해 채점
+
+        Args:
+            audio: 전체 녹음 (모노)
+            sentence: 평가 문장
+            recognition_engine: 이 녹음에 쓸 엔진 (없으면 기본 엔진)
+
+        Returns:
+            Optional[Dict[str, Any]]: 단어별 점수/타임스탬프를 포함한 결과. 예산 초과나 실패 시 None
+        """
+        engine = recognition_engine or self.recognition_engine
+        started = time.time()
+        cached = self.cache_key(audio, sentence, engine)
+        if cached is not None:
+            result = self.result_cache.get(*cached)
+            if result is not None:
+                result["cached"] = True
+                result["latency"] = round(time.time() - started, 3)
+                return result
+
+        segments = self.split_at_pauses(audio)
+        # 인코더 입력으로 쓰기 어려운 아주 짧은 구간은 제외
+        min_samples = int(0.1 * self.sample_rate)
+        segments = [(s, e) for s, e in segments if e - s >= min_samples]
+        if not segments:
+            return None
+
+        # 1) 구간별 병렬 인코딩
+        futures = [self._submit(engine, self._prepare_tensor(audio[s:e])) for s, e in segments]
+        _, not_done = wait(futures, timeout=max(0.0, self.latency_budget - (time.time() - started)))
+        if not_done:
+            for f in not_done:
+                f.cancel()
+            logger.warning(f"최종 재채점 인코딩이 지연 예산({self.latency_budget}s)을 초과하여 건너뜁니다.")
+            return None
+
+        hiddens, logits_list, times = [], [], []
+        for (s, e), future in zip(segments, futures):
+            try:
+                hidden, logits = future.result()
+            except Exception as ex:
+                logger.error(f"최종 재채점 인코딩 오류: {ex}")
+                return None
+            num_frames = logits.shape[0]
+            if num_frames == 0:
+                continue
+            frame_dur = (e - s) / self.sample_rate / num_frames
+            hiddens.append(hidden)
+            logits_list.append(logits)
+            times.append(s / self.sample_rate + np.arange(num_frames) * frame_dur)
+
+        if not logits_list:
+            return None
+
+        # 인코딩이 예산을 다 썼으면 정렬을 시작하지 않음 (끝난 뒤 버리는 대신)
+        if time.time() - started > self.latency_budget:
+            logger.warning(f"최종 재채점 인코딩이 지연 예산({self.latency_budget}s)을 다 써서 정렬을 건너뜁니다.")
+            return None
+
+        # 2) 전체 문장과 한 번에 정렬 및 채점
+        result = engine.calculate_gop_from_features(
+            np.concatenate(hiddens, axis=0),
+            np.concatenate(logits_list, axis=0),
+            sentence,
+            frame_times=np.concatenate(times)
+        )
+
+        elapsed = time.time() - started
+        if elapsed > self.latency_budget:
+            logger.warning(f"최종 재채점이 지연 예산을 초과했습니다: {elapsed:.2f}s > {self.latency_budget}s")
+            return None
+
+        result["latency"] = round(elapsed, 3)
+        result["segments"] = len(segments)
+        logger.info(f"최종 재채점 완료: {len(segments)}개 구간, {elapsed:.2f}s")
+        if cached is not None:
+            self.result_cache.put(cached[0], cached[1], result)
+        return result
+
+    def shutdown(self) -> None:
+        """아직 시작하지 않은 이 재채점기의 인코딩 작업 취소 (전역 풀은 다른 세션이 계속 사용)"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,175 @@
+import threading
+import logging
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("LatencyAccounting")
+
+PERCENTILES = (50, 95, 99)
+
+
+def _summarize(latencies: List[float], audio_seconds: float, compute_seconds: float,
+               chunks: int) -> Dict[str, Any]:
+    """지연 목록과 누적 시간으로 요약 통계 생성"""
+    summary: Dict[str, Any] = {
+        "count": len(latencies),
+        "chunks": chunks,
+        "audio_seconds": round(audio_seconds, 4),
+        "compute_seconds": round(compute_seconds, 4),
+        # 실시간 계수: 처리에 걸린 시간 / 처리한 오디오 길이 (1보다 작아야 실시간)
+        "rtf": round(compute_seconds / audio_seconds, 4) if audio_seconds > 0 else None
+    }
+    if latencies:
+        values = np.asarray(latencies, dtype=np.float64)
+        for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            summary[f"p{p}"] = round(float(v), 4)
+        summary["mean"] = round(float(values.mean()), 4)
+        summary["max"] = round(float(values.max()), 4)
+    else:
+        for p in PERCENTILES:
+            summary[f"p{p}"] = None
+        summary["mean"] = None
+        summary["max"] = None
+    return summary
+
+
+class LatencyStats:
+    """
+    세션 하나의 도착-점수 지연 및 실시간 계수(RTF) 집계
+
+    도착 시각은 AudioProcessor가 샘플 묶음을 읽어 들인 시각(ingest_time)이고,
+    점수 시각은 on_score 콜백 직전 시각이다.
+    """
+
+    def __init__(self, session_id: str, max_samples: int = 4096):
+        """
+        Args:
+            session_id: 세션 식별자
+            max_samples: 백분위 계산에 유지할 최근 지연 샘플 수
+        """
+        self.session_id = session_id
+        self.latencies: deque = deque(maxlen=max_samples)
+        self.audio_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.chunks = 0
+        self._lock = threading.Lock()
+
+    def record(self, arrival_time: Optional[float], score_time: float,
+               audio_duration: float = 0.0, compute_time: float = 0.0) -> Optional[float]:
+        """
+        채점된 청크 하나 기록
+
+        Args:
+            arrival_time: 청크 마지막 샘플의 도착 시각 (없으면 지연은 기록하지 않음)
+            score_time: 점수를 내보낸 시각
+            audio_duration: 청크 오디오 길이 (초)
+            compute_time: 추론 + 평가에 걸린 시간 (초)
+
+        Returns:
+            Optional[float]: 도착-점수 지연 (초)
+        """
+        latency = None
+        with self._lock:
+            self.chunks += 1
+            self.audio_seconds += max(0.0, audio_duration)
+            self.compute_seconds += max(0.0, compute_time)
+            if arrival_time is not None:
+                latency = max(0.0, score_time - arrival_time)
+                self.latencies.append(latency)
+        if latency is not None:
+            telemetry.observe("arrival_to_score_seconds", latency)
+        return latency
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self.latencies.clear()
+            self.audio_seconds = 0.0
+            self.compute_seconds = 0.0
+            self.chunks = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """p50/p95/p99 지연 및 RTF 요약"""
+        with self._lock:
+            latencies = list(self.latencies)
+            audio_seconds, compute_seconds, chunks = self.audio_seconds, self.compute_seconds, self.chunks
+        result = _summarize(latencies, audio_seconds, compute_seconds, chunks)
+        result["session_id"] = self.session_id
+        return result
+
+
+class LatencyRegistry:
+    """
+    프로세스 내 모든 세션의 LatencyStats 보관 및 전체 집계
+
+    종료된 세션도 최근 max_sessions개까지 남겨 두어 전체 집계에 포함한다.
+    """
+
+    def __init__(self, max_sessions: int = 256):
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, LatencyStats]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, stats: LatencyStats) -> LatencyStats:
+        """세션 통계 등록 (오래된 세션부터 제거)"""
+        with self._lock:
+            self._sessions[stats.session_id] = stats
+            self._sessions.move_to_end(stats.session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return stats
+
+    def get(self, session_id: str) -> Optional[LatencyStats]:
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def session_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """세션 하나의 요약 (없으면 None)"""
+        stats = self.get(session_id)
+        return stats.summary() if stats else None
+
+    def aggregate(self) -> Dict[str, Any]:
+        """모든 세션의 지연 샘플을 합친 전체 요약"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        latencies: List[float] = []
+        audio_seconds = compute_seconds = 0.0
+        chunks = 0
+        for stats in sessions:
+            with stats._lock:
+                latencies.extend(stats.latencies)
+                audio_seconds += stats.audio_seconds
+                compute_seconds += stats.compute_seconds
+                chunks += stats.chunks
+
+        result = _summarize(latencies, audio_seconds, compute_seconds, chunks)
+        result["sessions"] = len(sessions)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+
+# 프로세스 전역 레지스트리
+latency_registry = LatencyRegistry()
+
+
+def get_latency_stats(session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    지연 통계 조회
+
+    Args:
+        session_id: 세션 ID (없으면 전체 세션 집계)
+
+    Returns:
+        Optional[Dict[str, Any]]: 요약 통계 (해당 세션이 없으면 None)
+    """
+    if session_id is None:
+        return latency_registry.aggregate()
+    return latency_registry.session_stats(session_id)
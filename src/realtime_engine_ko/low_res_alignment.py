@@ -0,0 +1,176 @@
+import os
+import logging
+from typing import Dict, Any, Tuple, List
+
+import numpy as np
+
+logger = logging.getLogger("LowResAlignment")
+
+
+def pool_frames(X: np.ndarray, factor: int) -> np.ndarray:
+    """
+    연속 프레임을 factor개씩 평균 (마지막 묶음은 남은 프레임만 평균)
+
+    Args:
+        X: (T, D)
+        factor: 묶을 프레임 수
+
+    Returns:
+        np.ndarray: (ceil(T / factor), D)
+    """
+    if factor <= 1 or X.shape[0] == 0:
+        return X
+    T = X.shape[0]
+    starts = np.arange(0, T, factor)
+    sums = np.add.reduceat(X.astype(np.float32, copy=False), starts, axis=0)
+    counts = np.diff(np.append(starts, T)).astype(np.float32)
+    return sums / counts[:, None]
+
+
+def expand_pooled_path(pX: np.ndarray, pY: np.ndarray, factor: int, num_frames: int
+                       ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    묶음 프레임 단위 경로를 원래 프레임 단위로 펼침 (묶음 안의 모든 프레임이 같은 토큰)
+
+    Args:
+        pX: 묶음 프레임 인덱스
+        pY: 토큰 인덱스
+        factor: 묶음 크기
+        num_frames: 원래 프레임 수 T
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (프레임 인덱스, 토큰 인덱스)
+    """
+    if factor <= 1:
+        return pX, pY
+    offsets = np.arange(factor)
+    frames = (pX[:, None] * factor + offsets[None, :]).ravel()
+    tokens = np.repeat(pY, factor)
+    valid = frames < num_frames
+    return frames[valid], tokens[valid]
+
+
+class LowResAligner:
+    """
+    후보 탐색용 저해상도 정렬 설정
+
+    prototype 행렬 (V, D)의 주성분으로 만든 투영 행렬 (D, k)로 hidden state와 prototype을 같이 줄이고,
+    시간 축은 pool_factor 프레임씩 평균한다. 투영은 로드 시 한 번 계산해 모델 옆에 캐시한다.
+    """
+
+    def __init__(self, projection: np.ndarray, prototypes: np.ndarray, pool_factor: int = 2):
+        """
+        Args:
+            projection: 투영 행렬 (D, k)
+            prototypes: 투영된 prototype 행렬 (V, k)
+            pool_factor: 시간 축 묶음 크기
+        """
+        self.projection = np.ascontiguousarray(projection, dtype=np.float32)
+        self.prototypes = np.ascontiguousarray(prototypes, dtype=np.float32)
+        self.pool_factor = max(1, int(pool_factor))
+
+    @property
+    def dim(self) -> int:
+        return self.projection.shape[1]
+
+    def project_frames(self, X: np.ndarray) -> np.ndarray:
+        """hidden (T, D) -> 묶고 투영한 (ceil(T / pool), k)"""
+        return pool_frames(X, self.pool_factor) @ self.projection
+
+    @staticmethod
+    def compute_projection(prototype_matrix: np.ndarray, dim: int) -> np.ndarray:
+        """prototype 행의 주성분 dim개 (D, dim)"""
+        P = np.asarray(prototype_matrix, dtype=np.float64)
+        centered = P - P.mean(axis=0, keepdims=True)
+        # 오른쪽 특이벡터가 prototype 공간의 주성분
+        _, _, vt = np.linalg.svd(centered, full_matrices=False)
+        dim = min(dim, vt.shape[0])
+        return vt[:dim].T.astype(np.float32)
+
+    @staticmethod
+    def cache_path(onnx_model_path: str, dim: int) -> str:
+        base, _ = os.path.splitext(onnx_model_path)
+        return f"{base}.lowres{dim}.npz"
+
+    @classmethod
+    def load_or_build(cls, onnx_model_path: str, prototype_matrix: np.ndarray,
+                      dim: int = 64, pool_factor: int = 2) -> "LowResAligner":
+        """
+        모델 옆 캐시에서 투영을 읽거나, 없거나 모델이 바뀌었으면 새로 계산해 저장
+
+        Args:
+            onnx_model_path: 모델 파일 경로 (캐시 위치 및 변경 감지용)
+            prototype_matrix: (V, D) prototype 행렬
+            dim: 투영 차원
+            pool_factor: 시간 축 묶음 크기
+        """
+        path = cls.cache_path(onnx_model_path, dim)
+        stat = os.stat(onnx_model_path)
+        signature = np.array([stat.st_size, int(stat.st_mtime)], dtype=np.int64)
+
+        projection = None
+        if os.path.exists(path):
+            try:
+                with np.load(path) as cached:
+                    if (np.array_equal(cached["signature"], signature)
+                            and cached["projection"].shape[0] == prototype_matrix.shape[1]):
+                        projection = cached["projection"]
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"저해상도 투영 캐시를 읽지 못했습니다 ({path}): {e}")
+
+        if projection is None:
+            projection = cls.compute_projection(prototype_matrix, dim)
+            try:
+                np.savez(path, projection=projection, signature=signature)
+                logger.info(f"저해상도 투영 캐시 저장: {path} ({projection.shape[0]} -> {projection.shape[1]})")
+            except OSError as e:
+                logger.warning(f"저해상도 투영 캐시를 저장하지 못했습니다 ({path}): {e}")
+
+        prototypes = np.asarray(prototype_matrix, dtype=np.float32) @ projection
+        return cls(projection, prototypes, pool_factor)
+
+
+def calibration_report(core, samples: List[Tuple[np.ndarray, np.ndarray, str]],
+                       tolerance: float = 5.0) -> Dict[str, Any]:
+    """
+    저해상도 정렬 점수가 전체 해상도 점수와 얼마나 다른지 보고
+
+    Args:
+        core: low_res가 설정된 Wav2VecCTCOnnxCore
+        samples: (hidden (T, D), logits (T, V), 문장) 목록
+        tolerance: 허용할 단어 점수 차이
+
+    Returns:
+        Dict[str, Any]: 단어/문장 점수 편차 통계 및 정렬 시간 비율
+    """
+    import time
+
+    word_diffs, overall_diffs = [], []
+    full_ms = low_ms = 0.0
+    for X, logits, text in samples:
+        started = time.perf_counter()
+        full = core.calculate_gop_from_features(X, logits, text)
+        full_ms += (time.perf_counter() - started) * 1000.0
+        started = time.perf_counter()
+        low = core.calculate_gop_from_features(X, logits, text, low_res=True)
+        low_ms += (time.perf_counter() - started) * 1000.0
+
+        overall_diffs.append(abs(full["overall"] - low["overall"]))
+        for fw, lw in zip(full["words"], low["words"]):
+            word_diffs.append(abs(fw["scores"]["pronunciation"] - lw["scores"]["pronunciation"]))
+
+    diffs = np.asarray(word_diffs, dtype=np.float64)
+    return {
+        "samples": len(samples),
+        "words": int(diffs.size),
+        "dim": core.low_res.dim if core.low_res else None,
+        "pool_factor": core.low_res.pool_factor if core.low_res else None,
+        "word_mean_abs_diff": round(float(diffs.mean()), 3) if diffs.size else None,
+        "word_p95_abs_diff": round(float(np.percentile(diffs, 95)), 3) if diffs.size else None,
+        "word_max_abs_diff": round(float(diffs.max()), 3) if diffs.size else None,
+        "within_tolerance": round(float(np.mean(diffs <= tolerance)), 4) if diffs.size else None,
+        "overall_mean_abs_diff": round(float(np.mean(overall_diffs)), 3) if overall_diffs else None,
+        "full_ms": round(full_ms, 3),
+        "low_res_ms": round(low_ms, 3),
+        "speedup": round(full_ms / low_ms, 2) if low_ms > 0 else None
+    }
@@ -0,0 +1,217 @@
+import threading
+import logging
+from enum import IntEnum
+from typing import Dict, Any, Optional, Tuple
+
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("MemoryGovernor")
+
+# 세션이 보고하는 구조 (바이트)
+TRACKED_STRUCTURES = ("hidden", "probs", "dtw", "audio_buffer", "timeline")
+
+
+class DegradationLevel(IntEnum):
+    """
+    예산에 가까워질수록 올라가는 단계 (각 단계는 이전 단계의 조치를 포함)
+
+    첫 단계는 어떤 정렬 백엔드에서든 바로 메모리를 돌려주는 조치다. 대역 제한은 numpy/native
+    백엔드에서는 방향 행렬을 (T, 2w+1)로 줄이지만 dtw-python은 (T, N) 전체를 잡으므로 계산량만 줄인다.
+    """
+    NORMAL = 0
+    DROP_HIDDEN = 1      # 타임라인에 hidden state 보관 중단 (logits만 유지)
+    NARROW_BAND = 2      # DTW를 Sakoe-Chiba 대역으로 제한
+    SHORT_CONTEXT = 3    # 블록 채점 시 앞뒤 컨텍스트 축소
+
+
+class DegradationPolicy:
+    """단계별로 적용할 설정"""
+
+    def __init__(self, level: DegradationLevel, dtw_band: Optional[float],
+                 keep_hidden: bool, context_blocks: int):
+        self.level = level
+        self.dtw_band = dtw_band
+        self.keep_hidden = keep_hidden
+        self.context_blocks = context_blocks
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "level": self.level.name,
+            "dtw_band": self.dtw_band,
+            "keep_hidden": self.keep_hidden,
+            "context_blocks": self.context_blocks
+        }
+
+
+class SessionMemory:
+    """세션 하나의 구조별 메모리 사용량"""
+
+    def __init__(self, governor: "MemoryGovernor", session_id: str, budget_bytes: Optional[int] = None):
+        self.governor = governor
+        self.session_id = session_id
+        self.budget_bytes = budget_bytes
+        self.usage: Dict[str, int] = {name: 0 for name in TRACKED_STRUCTURES}
+        self.peak_bytes = 0
+
+    def update(self, **sizes: int) -> None:
+        """
+        구조별 현재 바이트 수 갱신 (hidden, probs, dtw, audio_buffer, timeline)
+
+        hidden/probs/dtw는 가장 최근 청크 처리 중 사용량, audio_buffer/timeline은 누적 보관량이다.
+        """
+        with self.governor._lock:
+            for name, size in sizes.items():
+                if name in self.usage:
+                    self.usage[name] = int(size)
+            self.peak_bytes = max(self.peak_bytes, sum(self.usage.values()))
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.usage.values())
+
+    def level(self) -> DegradationLevel:
+        """세션 예산과 프로세스 예산 중 더 높은 단계"""
+        return self.governor.level_for(self)
+
+    def policy(self) -> DegradationPolicy:
+        return self.governor.policy_for(self.level())
+
+    def summary(self) -> Dict[str, Any]:
+        with self.governor._lock:
+            usage = dict(self.usage)
+            peak = self.peak_bytes
+        return {
+            "session_id": self.session_id,
+            "usage": usage,
+            "total_bytes": sum(usage.values()),
+            "peak_bytes": peak,
+            "budget_bytes": self.budget_bytes,
+            "level": self.level().name
+        }
+
+
+class MemoryGovernor:
+    """
+    세션/프로세스 단위 메모리 예산 관리
+
+    세션들이 보고한 구조별 사용량을 합산해 예산 대비 비율을 계산하고,
+    비율이 thresholds를 넘을 때마다 한 단계씩 품질을 낮춘 설정을 내어준다.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = 512 * 1024 * 1024,
+        session_budget_bytes: Optional[int] = None,
+        thresholds: Tuple[float, float, float] = (0.6, 0.75, 0.9),
+        narrow_band: float = 0.15,
+        normal_context_blocks: int = 2,
+        short_context_blocks: int = 0
+    ):
+        """
+        Args:
+            budget_bytes: 프로세스 전체 예산 (바이트)
+            session_budget_bytes: 세션별 기본 예산 (없으면 세션 예산 없음)
+            thresholds: DROP_HIDDEN / NARROW_BAND / SHORT_CONTEXT로 올라가는 사용 비율
+            narrow_band: 대역 제한 시 허용할 대각선 폭 (프레임 수 대비 비율)
+            normal_context_blocks: 평소 앞뒤 컨텍스트 블록 수
+            short_context_blocks: SHORT_CONTEXT 단계의 컨텍스트 블록 수
+        """
+        self.budget_bytes = budget_bytes
+        self.session_budget_bytes = session_budget_bytes
+        self.thresholds = thresholds
+        self.narrow_band = narrow_band
+        self.normal_context_blocks = normal_context_blocks
+        self.short_context_blocks = short_context_blocks
+
+        self._sessions: Dict[str, SessionMemory] = {}
+        self._lock = threading.Lock()
+        self._last_level = DegradationLevel.NORMAL
+
+    def configure(self, budget_bytes: Optional[int] = None,
+                  session_budget_bytes: Optional[int] = None) -> None:
+        """예산 변경"""
+        if budget_bytes is not None:
+            self.budget_bytes = budget_bytes
+        if session_budget_bytes is not None:
+            self.session_budget_bytes = session_budget_bytes
+
+    # --- 세션 관리 ---
+
+    def register(self, session_id: str, budget_bytes: Optional[int] = None) -> SessionMemory:
+        """세션 등록 (같은 ID가 있으면 교체)"""
+        session = SessionMemory(self, session_id, budget_bytes or self.session_budget_bytes)
+        with self._lock:
+            self._sessions[session_id] = session
+        return session
+
+    def unregister(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    # --- 단계 결정 ---
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(s.total_bytes for s in self._sessions.values())
+
+    def _level_from_ratio(self, ratio: float) -> DegradationLevel:
+        level = DegradationLevel.NORMAL
+        for step, threshold in enumerate(self.thresholds, start=1):
+            if ratio >= threshold:
+                level = DegradationLevel(step)
+        return level
+
+    def process_level(self) -> DegradationLevel:
+        """프로세스 전체 사용량 기준 단계"""
+        if not self.budget_bytes:
+            return DegradationLevel.NORMAL
+        level = self._level_from_ratio(self.total_bytes() / self.budget_bytes)
+        if level != self._last_level:
+            logger.warning(f"메모리 단계 변경: {self._last_level.name} -> {level.name} "
+                           f"({self.total_bytes()} / {self.budget_bytes} bytes)")
+            telemetry.inc("memory_degradations_total", labels={"level": level.name})
+            self._last_level = level
+        return level
+
+    def level_for(self, session: SessionMemory) -> DegradationLevel:
+        level = self.process_level()
+        if session.budget_bytes:
+            level = max(level, self._level_from_ratio(session.total_bytes / session.budget_bytes))
+        return level
+
+    def policy_for(self, level: DegradationLevel) -> DegradationPolicy:
+        return DegradationPolicy(
+            level=level,
+            dtw_band=self.narrow_band if level >= DegradationLevel.NARROW_BAND else None,
+            keep_hidden=level < DegradationLevel.DROP_HIDDEN,
+            context_blocks=(self.short_context_blocks if level >= DegradationLevel.SHORT_CONTEXT
+                            else self.normal_context_blocks)
+        )
+
+    # --- 조회 ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        """프로세스/세션별 사용량 요약"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+        totals = {name: 0 for name in TRACKED_STRUCTURES}
+        for session in sessions:
+            for name, size in session.usage.items():
+                totals[name] += size
+        total = sum(totals.values())
+        return {
+            "budget_bytes": self.budget_bytes,
+            "total_bytes": total,
+            "usage": totals,
+            "level": self.process_level().name,
+            "sessions": [s.summary() for s in sessions]
+        }
+
+
+# 프로세스 전역 메모리 관리자
+memory_governor = MemoryGovernor()
+
+
+def get_memory_governor() -> MemoryGovernor:
+    """프로세스 전역 MemoryGovernor 인스턴스 반환"""
+    return memory_governor
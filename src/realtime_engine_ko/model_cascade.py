@@ -0,0 +1,114 @@
+import random
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("ModelCascade")
+
+
+def check_vocab_compatible(primary, tracking) -> None:
+    """
+    추적용 작은 모델이 채점 모델과 같은 어휘를 쓰는지 확인
+
+    같은 토크나이저로 만든 토큰 ID를 두 모델의 logits에 그대로 쓰므로 어휘 크기와 구분자 ID가 같아야 한다.
+
+    Raises:
+        ValueError: 어휘가 다름
+    """
+    primary_vocab = primary.prototype_matrix.shape[0]
+    tracking_vocab = tracking.prototype_matrix.shape[0]
+    if primary_vocab != tracking_vocab:
+        raise ValueError(f"추적 모델 어휘 크기({tracking_vocab})가 채점 모델({primary_vocab})과 다릅니다")
+    if primary.blank_id != tracking.blank_id:
+        raise ValueError(f"추적 모델 구분자 ID({tracking.blank_id})가 채점 모델({primary.blank_id})과 다릅니다")
+
+
+class TrackingAgreement:
+    """
+    추적 모델과 채점 모델의 일치도 집계
+
+    - 확정: 추적 모델이 임계값을 넘겨 확정한 블록을 채점 모델도 임계값 이상으로 보는지, 두 점수 차이
+    - 감사(audit): 일부 청크에서 채점 모델로도 후보 블록을 모두 채점해 고른 블록이 같은지
+    - 청크별 채점 모델 실행 비율 (추적 모델 덕분에 줄어든 인코더 실행)
+    """
+
+    def __init__(self, audit_rate: float = 0.0):
+        """
+        Args:
+            audit_rate: 채점 모델로 후보 탐색을 다시 해 볼 청크 비율 (0이면 감사 안 함)
+        """
+        self.audit_rate = audit_rate
+        self._lock = threading.Lock()
+        self.reset()
+
+    def configure(self, audit_rate: Optional[float] = None) -> None:
+        """감사 비율 변경"""
+        if audit_rate is not None:
+            self.audit_rate = max(0.0, min(1.0, audit_rate))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.chunks = 0
+            self.primary_encodes = 0
+            self.confirmations = 0
+            self.confirm_agreements = 0
+            self.score_diff_total = 0.0
+            self.audits = 0
+            self.audit_agreements = 0
+
+    def should_audit(self) -> bool:
+        return self.audit_rate > 0.0 and random.random() < self.audit_rate
+
+    def record_chunk(self, primary_encoded: bool) -> None:
+        """청크 하나 처리 (채점 모델 인코더를 실행했는지)"""
+        with self._lock:
+            self.chunks += 1
+            self.primary_encodes += int(primary_encoded)
+        telemetry.inc("encoder_runs_total", labels={"model": "tracking"})
+        if primary_encoded:
+            telemetry.inc("encoder_runs_total", labels={"model": "primary"})
+
+    def record_confirmation(self, tracking_score: float, primary_score: float, threshold: float) -> None:
+        """추적 모델이 확정한 블록의 두 점수 기록"""
+        agree = primary_score >= threshold
+        with self._lock:
+            self.confirmations += 1
+            self.confirm_agreements += int(agree)
+            self.score_diff_total += abs(primary_score - tracking_score)
+        telemetry.inc("tracking_confirmations_total", labels={"agree": str(agree).lower()})
+        telemetry.observe("tracking_score_diff", abs(primary_score - tracking_score))
+
+    def record_audit(self, tracking_block: Optional[int], primary_block: Optional[int]) -> None:
+        """같은 청크에서 두 모델이 고른 최적 블록 비교"""
+        agree = tracking_block == primary_block
+        with self._lock:
+            self.audits += 1
+            self.audit_agreements += int(agree)
+        telemetry.inc("tracking_audits_total", labels={"agree": str(agree).lower()})
+
+    def summary(self) -> Dict[str, Any]:
+        """일치도 요약"""
+        with self._lock:
+            return {
+                "chunks": self.chunks,
+                "primary_encodes": self.primary_encodes,
+                "primary_encode_ratio": round(self.primary_encodes / self.chunks, 4) if self.chunks else None,
+                "confirmations": self.confirmations,
+                "confirm_agreement": (round(self.confirm_agreements / self.confirmations, 4)
+                                      if self.confirmations else None),
+                "mean_abs_score_diff": (round(self.score_diff_total / self.confirmations, 2)
+                                        if self.confirmations else None),
+                "audits": self.audits,
+                "block_agreement": round(self.audit_agreements / self.audits, 4) if self.audits else None
+            }
+
+
+# 프로세스 전역 일치도 집계 (모든 세션 합산)
+tracking_agreement = TrackingAgreement()
+
+
+def get_tracking_agreement() -> TrackingAgreement:
+    """프로세스 전역 TrackingAgreement 인스턴스 반환"""
+    return tracking_agreement
@@ -0,0 +1,347 @@
+import os
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.session_pool import SessionComponentPool
+from realtime_engine_ko.model_cascade import check_vocab_compatible
+from realtime_engine_ko.quantization import resolve_variant
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("ModelRegistry")
+
+
+class ModelSpec:
+    """키 하나에 대응하는 모델 파일과 로드 옵션"""
+
+    def __init__(
+        self,
+        onnx_model_path: str,
+        tokenizer_path: str,
+        device: str = "CPU",
+        alignment_backend: str = "python-dtw",
+        low_res_dim: Optional[int] = None,
+        low_res_pool: int = 2,
+        warmup: bool = True,
+        max_idle_sessions: int = 4,
+        tracking_model_path: Optional[str] = None,
+        precision: Optional[str] = None
+    ):
+        """
+        Args:
+            onnx_model_path: ONNX 모델 파일 경로
+            tokenizer_path: 토크나이저 파일 경로
+            device: 추론 장치 ("CPU" 또는 "CUDA")
+            alignment_backend: DTW 정렬 백엔드
+            low_res_dim: 저해상도 후보 탐색 투영 차원 (없으면 사용 안 함)
+            low_res_pool: 저해상도 정렬 시 평균할 연속 프레임 수
+            warmup: 로드 직후 워밍업 실행 여부
+            max_idle_sessions: 모델별 세션 컴포넌트 풀에 보관할 유휴 묶음 수
+            tracking_model_path: 청크마다 블록 추적에 쓸 작은 ONNX CTC 모델 (같은 토크나이저/어휘).
+                주어지면 큰 모델은 확정된 블록의 점수를 낼 때만 실행
+            precision: 정밀도 변형 정책 ("float", "fastest", "smallest" 또는 변형 이름, 두 모델 모두 적용)
+        """
+        self.onnx_model_path = onnx_model_path
+        self.tokenizer_path = tokenizer_path
+        self.device = device
+        self.alignment_backend = alignment_backend
+        self.low_res_dim = low_res_dim
+        self.low_res_pool = low_res_pool
+        self.warmup = warmup
+        self.max_idle_sessions = max_idle_sessions
+        self.tracking_model_path = tracking_model_path
+        self.precision = precision
+
+    def estimate_bytes(self) -> int:
+        """로드 전 메모리 추정 (ORT 세션 가중치, 추적 모델 포함)"""
+        size = 0
+        for path in (self.onnx_model_path, self.tracking_model_path):
+            if not path:
+                continue
+            try:
+                size += os.path.getsize(resolve_variant(path, self.precision))
+            except OSError:
+                pass
+        return size
+
+    def load_engines(self) -> Tuple[Wav2VecCTCOnnxCore, Optional[Wav2VecCTCOnnxCore]]:
+        """
+        채점 모델과 (설정되어 있으면) 추적 모델 로드
+
+        Returns:
+            Tuple: (채점 엔진, 추적 엔진 또는 None)
+
+        Raises:
+            ValueError: 추적 모델 어휘가 채점 모델과 다름
+        """
+        engine = Wav2VecCTCOnnxCore(
+            onnx_model_path=self.onnx_model_path,
+            tokenizer_path=self.tokenizer_path,
+            device=self.device,
+            alignment_backend=self.alignment_backend,
+            low_res_dim=self.low_res_dim,
+            low_res_pool=self.low_res_pool,
+            precision=self.precision
+        )
+        tracking = None
+        if self.tracking_model_path:
+            tracking = Wav2VecCTCOnnxCore(
+                onnx_model_path=self.tracking_model_path,
+                tokenizer_path=self.tokenizer_path,
+                device=self.device,
+                alignment_backend=self.alignment_backend,
+                precision=self.precision
+            )
+            check_vocab_compatible(engine, tracking)
+        if self.warmup:
+            engine.warmup()
+            if tracking is not None:
+                tracking.warmup()
+        return engine, tracking
+
+
+class LoadedModel:
+    """메모리에 올라간 모델 하나 (세션들이 공유)"""
+
+    def __init__(self, key: str, spec: ModelSpec, engine: Wav2VecCTCOnnxCore, load_seconds: float,
+                 tracking_engine: Optional[Wav2VecCTCOnnxCore] = None):
+        self.key = key
+        self.spec = spec
+        self.engine = engine
+        self.tracking_engine = tracking_engine
+        # 같은 모델을 쓰는 세션끼리 컴포넌트 묶음도 재사용
+        self.component_pool = SessionComponentPool(engine, max_idle=spec.max_idle_sessions)
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.refcount = 0
+        self.size_bytes = self._measure(engine)
+        if tracking_engine is not None:
+            self.size_bytes += self._measure(tracking_engine)
+
+    @staticmethod
+    def _measure(engine: Wav2VecCTCOnnxCore) -> int:
+        """로드된 모델의 메모리 추정 (실제 로드한 변형 파일 크기 + prototype 행렬)"""
+        try:
+            size = os.path.getsize(engine.onnx_model_path)
+        except OSError:
+            size = 0
+        size += engine.prototype_matrix.nbytes
+        return int(size)
+
+
+class ModelRegistry:
+    """
+    여러 음향 모델(아동, 성인, 억양별 등)을 키로 관리
+
+    모델은 처음 요청될 때 로드되어 같은 키를 쓰는 모든 세션이 공유한다.
+    적재된 모델의 추정 메모리 합이 memory_cap_bytes를 넘으면 사용 중이 아닌 모델부터 LRU 순서로 내린다.
+    """
+
+    def __init__(self, memory_cap_bytes: int = 2 * 1024 * 1024 * 1024):
+        """
+        Args:
+            memory_cap_bytes: 적재된 모델들의 메모리 상한 (바이트)
+        """
+        self.memory_cap_bytes = memory_cap_bytes
+
+        self._specs: Dict[str, ModelSpec] = {}
+        self._loaded: "OrderedDict[str, LoadedModel]" = OrderedDict()  # 오래 안 쓴 순서
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        # 키별 누적 통계
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    # --- 등록 ---
+
+    def register(self, key: str, onnx_model_path: str, tokenizer_path: str, **options) -> ModelSpec:
+        """
+        모델 키 등록 (로드는 첫 acquire 시점)
+
+        Args:
+            key: 모델 키 (예: "adult", "child")
+            onnx_model_path: ONNX 모델 파일 경로
+            tokenizer_path: 토크나이저 파일 경로
+            **options: ModelSpec 옵션 (device, alignment_backend, low_res_dim, ...)
+
+        Returns:
+            ModelSpec: 등록된 설정
+        """
+        spec = ModelSpec(onnx_model_path, tokenizer_path, **options)
+        with self._lock:
+            self._specs[key] = spec
+            self._stats.setdefault(key, {"loads": 0, "hits": 0, "evictions": 0,
+                                         "load_seconds_total": 0.0, "last_load_seconds": 0.0,
+                                         "resident_seconds": 0.0})
+        return spec
+
+    def unregister(self, key: str) -> None:
+        """등록 해제 (사용 중이 아니면 바로 내림)"""
+        with self._lock:
+            self._specs.pop(key, None)
+        self.evict(key)
+
+    def keys(self):
+        with self._lock:
+            return list(self._specs)
+
+    # --- 사용 ---
+
+    def acquire(self, key: str) -> LoadedModel:
+        """
+        모델 사용 시작 (필요하면 로드). 사용이 끝나면 release(key) 호출
+
+        Args:
+            key: 모델 키
+
+        Returns:
+            LoadedModel: 공유 모델 (engine, component_pool)
+
+        Raises:
+            KeyError: 등록되지 않은 키
+        """
+        with self._lock:
+            if key not in self._specs:
+                raise KeyError(f"등록되지 않은 모델 키: {key} (등록됨: {', '.join(self._specs)})")
+            entry = self._take(key)
+            if entry is not None:
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+            spec = self._specs[key]
+
+        # 같은 키를 동시에 요청하면 한 번만 로드
+        with load_lock:
+            with self._lock:
+                entry = self._take(key)
+                if entry is not None:
+                    return entry
+
+            self._make_room(spec.estimate_bytes())
+
+            started = time.perf_counter()
+            engine, tracking_engine = spec.load_engines()
+            load_seconds = time.perf_counter() - started
+
+            entry = LoadedModel(key, spec, engine, load_seconds, tracking_engine)
+            entry.refcount = 1
+            with self._lock:
+                self._loaded[key] = entry
+                stats = self._stats[key]
+                stats["loads"] += 1
+                stats["load_seconds_total"] += load_seconds
+                stats["last_load_seconds"] = load_seconds
+
+        telemetry.inc("model_loads_total", labels={"model": key})
+        telemetry.observe("model_load_seconds", load_seconds, labels={"model": key})
+        logger.info(f"모델 로드: {key} ({load_seconds:.2f}s, ~{entry.size_bytes / 1e6:.1f}MB)")
+
+        # 실제 크기가 추정보다 클 수 있으므로 로드 후 다시 확인
+        self._make_room(0)
+        return entry
+
+    def _take(self, key: str) -> Optional[LoadedModel]:
+        """적재된 모델 사용 표시 (self._lock 보유 상태에서 호출)"""
+        entry = self._loaded.get(key)
+        if entry is None:
+            return None
+        entry.refcount += 1
+        entry.last_used = time.time()
+        self._loaded.move_to_end(key)
+        self._stats[key]["hits"] += 1
+        telemetry.inc("cache_hits_total", labels={"cache": "model_registry"})
+        return entry
+
+    def release(self, key: str) -> None:
+        """모델 사용 종료 (모델은 상한을 넘기 전까지 메모리에 남음)"""
+        with self._lock:
+            entry = self._loaded.get(key)
+            if entry is None:
+                return
+            entry.refcount = max(0, entry.refcount - 1)
+            entry.last_used = time.time()
+        self._make_room(0)
+
+    # --- 퇴출 ---
+
+    def resident_bytes(self) -> int:
+        with self._lock:
+            return sum(e.size_bytes for e in self._loaded.values())
+
+    def _make_room(self, incoming_bytes: int) -> None:
+        """상한을 넘으면 유휴 모델을 LRU 순서로 내림"""
+        while True:
+            with self._lock:
+                total = sum(e.size_bytes for e in self._loaded.values()) + incoming_bytes
+                if total <= self.memory_cap_bytes:
+                    return
+                victim = next((k for k, e in self._loaded.items() if e.refcount == 0), None)
+                if victim is None:
+                    logger.warning(f"모델 메모리 상한 초과 ({total} / {self.memory_cap_bytes} bytes), "
+                                   "모든 모델이 사용 중이라 내릴 수 없습니다")
+                    return
+            self.evict(victim)
+
+    def evict(self, key: str) -> bool:
+        """
+        유휴 모델 내리기
+
+        Returns:
+            bool: 내렸으면 True (사용 중이거나 적재되지 않았으면 False)
+        """
+        with self._lock:
+            entry = self._loaded.get(key)
+            if entry is None or entry.refcount > 0:
+                return False
+            del self._loaded[key]
+            if key in self._stats:
+                self._stats[key]["evictions"] += 1
+                self._stats[key]["resident_seconds"] += time.time() - entry.loaded_at
+        entry.component_pool.clear()
+        telemetry.inc("model_evictions_total", labels={"model": key})
+        logger.info(f"모델 내림: {key} (~{entry.size_bytes / 1e6:.1f}MB)")
+        return True
+
+    # --- 조회 ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모델별 적재 상태, 로드 시간, 상주 시간"""
+        now = time.time()
+        with self._lock:
+            models = {}
+            for key in self._specs:
+                stats = dict(self._stats.get(key, {}))
+                entry = self._loaded.get(key)
+                resident = stats.get("resident_seconds", 0.0)
+                if entry is not None:
+                    resident += now - entry.loaded_at
+                models[key] = {
+                    "loaded": entry is not None,
+                    "sessions": entry.refcount if entry else 0,
+                    "size_bytes": entry.size_bytes if entry else 0,
+                    "idle_seconds": round(now - entry.last_used, 3) if entry and entry.refcount == 0 else 0.0,
+                    "loads": int(stats.get("loads", 0)),
+                    "hits": int(stats.get("hits", 0)),
+                    "evictions": int(stats.get("evictions", 0)),
+                    "last_load_seconds": round(stats.get("last_load_seconds", 0.0), 4),
+                    "load_seconds_total": round(stats.get("load_seconds_total", 0.0), 4),
+                    "resident_seconds": round(resident, 3)
+                }
+            resident_bytes = sum(e.size_bytes for e in self._loaded.values())
+        return {
+            "memory_cap_bytes": self.memory_cap_bytes,
+            "resident_bytes": resident_bytes,
+            "models": models
+        }
+
+
+# 프로세스 전역 모델 레지스트리
+model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """프로세스 전역 ModelRegistry 인스턴스 반환"""
+    return model_registry
@@ -0,0 +1,258 @@
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+import logging
+from typing import List, Optional, Tuple, Dict
+
+import numpy as np
+
+logger = logging.getLogger("PosteriorTimeline")
+
+
+class TimelineSegment:
+    """청크 하나에 해당하는 인코더 출력 구간"""
+
+    def __init__(self, start_time: float, end_time: float,
+                 hidden: Optional[np.ndarray], logits: np.ndarray):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.hidden = hidden
+        self.logits = logits
+        self.spill_paths: List[str] = []  # memmap으로 내려간 경우 파일 경로
+
+    @property
+    def num_frames(self) -> int:
+        return self.logits.shape[0]
+
+    @property
+    def is_spilled(self) -> bool:
+        return bool(self.spill_paths)
+
+    @property
+    def nbytes(self) -> int:
+        size = self.logits.nbytes
+        if self.hidden is not None:
+            size += self.hidden.nbytes
+        return size
+
+    def frame_times(self) -> np.ndarray:
+        """세그먼트 내 각 프레임의 시작 시각 (절대 오디오 시간, 초)"""
+        if self.num_frames == 0:
+            return np.zeros(0, dtype=np.float64)
+        frame_dur = (self.end_time - self.start_time) / self.num_frames
+        return self.start_time + np.arange(self.num_frames) * frame_dur
+
+
+class PosteriorTimeline:
+    """
+    세션 단위 프레임 posterior 타임라인
+
+    청크마다 인코더가 만든 logits (T, V)와 hidden state (T, D)를 절대 오디오 시간 기준으로 보관한다.
+    블록을 다른 시간 구간으로 다시 정렬/채점할 때 인코더를 다시 실행하지 않도록 하기 위한 것.
+    전체 길이는 max_duration으로 제한되고, RAM 예산을 넘는 오래된 구간은 memmap 파일로 내려간다.
+    """
+
+    def __init__(
+        self,
+        max_duration: float = 120.0,
+        ram_budget_bytes: int = 64 * 1024 * 1024,
+        spill_dir: Optional[str] = None,
+        keep_hidden: bool = True
+    ):
+        """
+        타임라인 초기화
+
+        Args:
+            max_duration: 보관할 최대 오디오 길이 (초). 이보다 오래된 구간은 버림
+            ram_budget_bytes: 메모리에 유지할 최대 바이트 수. 초과분은 디스크로 내려감
+            spill_dir: memmap 파일을 둘 디렉토리 (없으면 필요할 때 임시 디렉토리 생성)
+            keep_hidden: hidden state 보관 여부 (False면 logits만 보관)
+        """
+        self.max_duration = max_duration
+        self.ram_budget_bytes = ram_budget_bytes
+        self.keep_hidden = keep_hidden
+
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = False
+        # 직접 만든 임시 디렉토리는 clear() 없이 버려져도 GC/인터프리터 종료 시 삭제
+        self._spill_cleanup: Optional[weakref.finalize] = None
+        self._spill_counter = 0
+        self._segments: List[TimelineSegment] = []
+        self._lock = threading.Lock()
+
+    # --- 기록 ---
+
+    def append(self, start_time: float, end_time: float,
+               hidden: Optional[np.ndarray], logits: np.ndarray) -> None:
+        """
+        청크 하나의 인코더 출력을 타임라인에 추가
+
+        Args:
+            start_time: 청크 시작 시각 (절대 오디오 시간, 초)
+            end_time: 청크 종료 시각 (초)
+            hidden: hidden state (T, D)
+            logits: logits (T, V)
+        """
+        if logits is None or logits.shape[0] == 0 or end_time <= start_time:
+            return
+
+        # 호출자가 버퍼를 재사용할 수 있으므로 항상 복사해서 보관
+        kept_hidden = np.array(hidden, dtype=np.float32) if (self.keep_hidden and hidden is not None) else None
+        segment = TimelineSegment(start_time, end_time, kept_hidden, np.array(logits, dtype=np.float32))
+
+        with self._lock:
+            self._segments.append(segment)
+            self._evict_expired()
+            self._enforce_ram_budget()
+
+    def _evict_expired(self) -> None:
+        """max_duration보다 오래된 구간 제거"""
+        if not self._segments:
+            return
+        horizon = self._segments[-1].end_time - self.max_duration
+        while self._segments and self._segments[0].end_time <= horizon:
+            self._drop_segment(self._segments.pop(0))
+
+    def _enforce_ram_budget(self) -> None:
+        """RAM 사용량이 예산을 넘으면 오래된 구간부터 memmap으로 내려보냄"""
+        ram_bytes = sum(s.nbytes for s in self._segments if not s.is_spilled)
+        for segment in self._segments[:-1]:  # 가장 최근 구간은 항상 메모리에 유지
+            if ram_bytes <= self.ram_budget_bytes:
+                break
+            if segment.is_spilled:
+                continue
+            ram_bytes -= segment.nbytes
+            self._spill_segment(segment)
+
+    def _spill_segment(self, segment: TimelineSegment) -> None:
+        spill_dir = self._ensure_spill_dir()
+        try:
+            logits_path = os.path.join(spill_dir, f"seg{self._spill_counter}_logits.npy")
+            np.save(logits_path, segment.logits)
+            segment.spill_paths.append(logits_path)
+            segment.logits = np.load(logits_path, mmap_mode="r")
+
+            if segment.hidden is not None:
+                hidden_path = os.path.join(spill_dir, f"seg{self._spill_counter}_hidden.npy")
+                np.save(hidden_path, segment.hidden)
+                segment.spill_paths.append(hidden_path)
+                segment.hidden = np.load(hidden_path, mmap_mode="r")
+            self._spill_counter += 1
+        except OSError as e:
+            logger.error(f"타임라인 구간을 디스크로 내리지 못했습니다: {e}")
+
+    def _drop_segment(self, segment: TimelineSegment) -> None:
+        segment.hidden = None
+        segment.logits = np.zeros((0, 0), dtype=np.float32)
+        for path in segment.spill_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        segment.spill_paths = []
+
+    def _ensure_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="posterior_timeline_")
+            self._owns_spill_dir = True
+            self._spill_cleanup = weakref.finalize(self, shutil.rmtree, self._spill_dir, ignore_errors=True)
+        elif not os.path.isdir(self._spill_dir):
+            os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def drop_hidden(self) -> int:
+        """
+        보관 중인 hidden state를 모두 버리고 이후에도 logits만 보관 (메모리 절약용)
+
+        Returns:
+            int: 해제된 RAM 바이트 수
+        """
+        freed = 0
+        with self._lock:
+            self.keep_hidden = False
+            for segment in self._segments:
+                if segment.hidden is None:
+                    continue
+                if not segment.is_spilled:
+                    freed += segment.hidden.nbytes
+                segment.hidden = None
+                for path in [p for p in segment.spill_paths if p.endswith("_hidden.npy")]:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    segment.spill_paths.remove(path)
+        return freed
+
+    # --- 조회 ---
+
+    @property
+    def start_time(self) -> float:
+        with self._lock:
+            return self._segments[0].start_time if self._segments else 0.0
+
+    @property
+    def end_time(self) -> float:
+        with self._lock:
+            return self._segments[-1].end_time if self._segments else 0.0
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._segments
+
+    def get_range(self, start_time: float, end_time: float
+                  ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], np.ndarray]:
+        """
+        주어진 시간 구간의 프레임들을 이어 붙여 반환
+
+        Args:
+            start_time: 구간 시작 (초)
+            end_time: 구간 종료 (초)
+
+        Returns:
+            Tuple: (hidden (N, D) 또는 None, logits (N, V) 또는 None, 프레임 시작 시각 (N,))
+        """
+        hiddens, logits_list, times = [], [], []
+        with self._lock:
+            for segment in self._segments:
+                if segment.end_time <= start_time or segment.start_time >= end_time:
+                    continue
+                ft = segment.frame_times()
+                mask = (ft >= start_time) & (ft < end_time)
+                if not mask.any():
+                    continue
+                lo = int(np.argmax(mask))
+                hi = lo + int(mask.sum())
+                logits_list.append(np.asarray(segment.logits[lo:hi]))
+                hiddens.append(np.asarray(segment.hidden[lo:hi]) if segment.hidden is not None else None)
+                times.append(ft[lo:hi])
+
+        if not logits_list:
+            return None, None, np.zeros(0, dtype=np.float64)
+
+        logits = np.concatenate(logits_list, axis=0)
+        hidden = None if any(h is None for h in hiddens) else np.concatenate(hiddens, axis=0)
+        return hidden, logits, np.concatenate(times)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """메모리/디스크 사용량 (바이트)"""
+        with self._lock:
+            ram = sum(s.nbytes for s in self._segments if not s.is_spilled)
+            disk = sum(s.nbytes for s in self._segments if s.is_spilled)
+            return {"ram_bytes": ram, "disk_bytes": disk, "segments": len(self._segments)}
+
+    # --- 정리 ---
+
+    def clear(self) -> None:
+        """모든 구간 제거 및 memmap 파일 삭제"""
+        with self._lock:
+            for segment in self._segments:
+                self._drop_segment(segment)
+            self._segments = []
+            if self._owns_spill_dir and self._spill_dir:
+                self._spill_cleanup()
+                self._spill_cleanup = None
+                self._spill_dir = None
+                self._owns_spill_dir = False
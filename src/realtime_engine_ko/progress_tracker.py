@@ -7,7 +7,13 @@ class ProgressTracker:
     음성 인식 진행 상황과 허용 인식 범위를 관리하는 클래스
     """
     
-    def __init__(self, total_blocks: int, window_size: int = 3, time_based_advance: bool = True):
+    # 발화 속도 기본값과 허용 범위 (음절당 초)
+    DEFAULT_SECONDS_PER_SYLLABLE = 0.3
+    MIN_SECONDS_PER_SYLLABLE = 0.08
+    MAX_SECONDS_PER_SYLLABLE = 1.0
+    
+    def __init__(self, total_blocks: int, window_size: int = 3, time_based_advance: bool = True,
+                 block_syllables: Optional[List[int]] = None, rate_smoothing: float = 0.3):
         """
         진행 추적기 초기화
         
@@ -15,10 +21,14 @@ class ProgressTracker:
             total_blocks: 전체 블록 수
             window_size: 인식 윈도우 크기 (현재 블록 + 이전 N개 블록)
             time_based_advance: 시간 기반 자동 진행 활성화 여부
+            block_syllables: 블록별 음절 수 (발화 속도 학습과 블록 예상 길이 계산용)
+            rate_smoothing: 발화 속도 지수 이동 평균 계수 (0~1)
         """
         self.total_blocks = total_blocks
         self.window_size = window_size
         self.time_based_advance = time_based_advance
+        self.block_syllables = list(block_syllables) if block_syllables else [1] * total_blocks
+        self.rate_smoothing = rate_smoothing
         
         self.current_index = 0
         self.start_time: Optional[float] = None
@@ -29,6 +39,11 @@ class ProgressTracker:
         
         # 블록 자동 진행 최소 시간 (초)
         self.min_time_for_advance = 1.5
+        
+        # 이번 세션의 발화 속도 (확정된 블록의 오디오 시각으로 학습)
+        self.seconds_per_syllable = self.DEFAULT_SECONDS_PER_SYLLABLE
+        self.last_timed_index: Optional[int] = None
+        self.last_timed_end: Optional[float] = None
     
     def start(self) -> None:
         """진행 추적 시작"""
@@ -135,11 +150,71 @@ class ProgressTracker:
             return True
         return False
     
-    def reset(self) -> None:
-        """진행 상태 초기화"""
+    def configure(self, total_blocks: int, block_syllables: Optional[List[int]] = None) -> None:
+        """
+        새 문장에 맞게 전체 블록 수 재설정 (추적기 객체 재사용 시 사용)
+        
+        Args:
+            total_blocks: 전체 블록 수
+            block_syllables: 블록별 음절 수
+        """
+        self.total_blocks = total_blocks
+        self.block_syllables = list(block_syllables) if block_syllables else [1] * total_blocks
+        self.reset()
+    
+    def reset(self, keep_rate: bool = False) -> None:
+        """
+        진행 상태 초기화 (학습한 발화 속도도 세션 기본값으로)
+        
+        Args:
+            keep_rate: 학습한 발화 속도 유지 (같은 문장 재시도 시 직전 시도의 속도를 출발점으로)
+        """
         self.current_index = 0
         self.start_time = None
         self.last_advance_time = None
+        if not keep_rate:
+            self.seconds_per_syllable = self.DEFAULT_SECONDS_PER_SYLLABLE
+        self.last_timed_index = None
+        self.last_timed_end = None
+    
+    def record_block_timing(self, block_index: int, audio_end: Optional[float]) -> None:
+        """
+        확정된 블록이 끝난 오디오 시각으로 발화 속도 갱신
+        
+        직전에 확정된 블록 이후의 블록들(건너뛴 블록 포함)의 음절 수를
+        두 확정 시각 사이의 오디오 길이로 나눠 음절당 시간을 지수 이동 평균한다.
+        
+        Args:
+            block_index: 확정된 블록 인덱스
+            audio_end: 블록이 끝난 오디오 시각 (초, 녹음 시작 기준)
+        """
+        if audio_end is None:
+            return
+        if (self.last_timed_index is not None and self.last_timed_end is not None
+                and block_index > self.last_timed_index and audio_end > self.last_timed_end):
+            syllables = sum(self.block_syllables[self.last_timed_index + 1:block_index + 1])
+            elapsed = audio_end - self.last_timed_end
+            rate = min(self.MAX_SECONDS_PER_SYLLABLE, max(self.MIN_SECONDS_PER_SYLLABLE, elapsed / max(1, syllables)))
+            a = self.rate_smoothing
+            self.seconds_per_syllable = (1 - a) * self.seconds_per_syllable + a * rate
+            # 시간 기반 진행에도 같은 속도 반영
+            blocks = block_index - self.last_timed_index
+            self.avg_time_per_block = (1 - a) * self.avg_time_per_block + a * (elapsed / blocks)
+        if self.last_timed_index is None or block_index >= self.last_timed_index:
+            self.last_timed_index = block_index
+            self.last_timed_end = audio_end
+    
+    def expected_duration(self, block_index: int) -> float:
+        """
+        블록 하나를 발화하는 데 걸릴 예상 시간 (초, 학습한 발화 속도 기준)
+        
+        Args:
+            block_index: 블록 인덱스 (범위를 벗어나면 마지막 블록)
+        """
+        if not self.block_syllables:
+            return self.seconds_per_syllable
+        index = min(max(0, block_index), len(self.block_syllables) - 1)
+        return self.block_syllables[index] * self.seconds_per_syllable
     
     def adjust_time_parameters(self, avg_time_per_block: float, min_time_for_advance: float) -> None:
         """
@@ -0,0 +1,370 @@
+"""
+float ONNX 모델의 저정밀 변형(동적 int8 등) 생성, 점수 편차 검사, 정책에 따른 변형 선택
+
+변형은 원본 옆에 `<모델>.<변형>.onnx`로 두고, 원본 해시/편차/추론 시간은 `<모델>.variants.json` 매니페스트에 기록한다.
+
+    PYTHONPATH=src python -m realtime_engine_ko.quantization build --model m.onnx --tokenizer tokenizer.json \\
+        --calibration calib.jsonl --variants int8,int8-matmul,fp16
+    PYTHONPATH=src python -m realtime_engine_ko.quantization show --model m.onnx --policy fastest
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from realtime_engine_ko.result_cache import model_fingerprint
+
+logger = logging.getLogger("Quantization")
+
+# 변형 이름 -> 생성 방법
+VARIANTS: Dict[str, Dict[str, Any]] = {
+    # 모든 가중치 연산 동적 int8 (채널별 scale)
+    "int8": {"kind": "dynamic", "weight_type": "QInt8", "per_channel": True, "op_types": None},
+    # 트랜스포머 MatMul/Gemm만 int8, 합성곱 특징 추출기는 float 유지 (편차가 작음)
+    "int8-matmul": {"kind": "dynamic", "weight_type": "QInt8", "per_channel": True, "op_types": ["MatMul", "Gemm"]},
+    # 텐서별 uint8 (가장 작지만 편차가 큼)
+    "uint8": {"kind": "dynamic", "weight_type": "QUInt8", "per_channel": False, "op_types": None},
+    # 가중치/연산 float16, 입출력은 float32 유지 (CPU보다는 GPU용)
+    "fp16": {"kind": "fp16"}
+}
+
+# 변형 대신 원본을 쓰는 정책 이름
+FLOAT_POLICY = "float"
+POLICIES = (FLOAT_POLICY, "fastest", "smallest") + tuple(VARIANTS)
+
+
+def variant_path(onnx_model_path: str, variant: str) -> str:
+    """변형 모델 경로 (원본 옆)"""
+    base, _ = os.path.splitext(onnx_model_path)
+    return f"{base}.{variant}.onnx"
+
+
+def manifest_path(onnx_model_path: str) -> str:
+    """변형 매니페스트 경로 (원본 옆)"""
+    base, _ = os.path.splitext(onnx_model_path)
+    return f"{base}.variants.json"
+
+
+def read_manifest(onnx_model_path: str) -> Optional[Dict[str, Any]]:
+    """매니페스트 읽기 (없거나 읽을 수 없으면 None)"""
+    path = manifest_path(onnx_model_path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"변형 매니페스트를 읽지 못했습니다 ({path}): {e}")
+        return None
+
+
+def _write_manifest(onnx_model_path: str, manifest: Dict[str, Any]) -> None:
+    path = manifest_path(onnx_model_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def quantize_variant(onnx_model_path: str, variant: str, out_path: Optional[str] = None) -> str:
+    """
+    변형 모델 파일 생성
+
+    Args:
+        onnx_model_path: float 원본 모델
+        variant: VARIANTS의 이름
+        out_path: 저장 경로 (없으면 variant_path())
+
+    Returns:
+        str: 저장한 경로
+
+    Raises:
+        ValueError: 알 수 없는 변형
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"알 수 없는 변형: {variant} (가능: {', '.join(VARIANTS)})")
+    spec = VARIANTS[variant]
+    out_path = out_path or variant_path(onnx_model_path, variant)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+
+    started = time.perf_counter()
+    try:
+        if spec["kind"] == "dynamic":
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            quantize_dynamic(
+                onnx_model_path,
+                tmp_path,
+                weight_type=getattr(QuantType, spec["weight_type"]),
+                per_channel=spec["per_channel"],
+                op_types_to_quantize=spec["op_types"]
+            )
+        else:
+            import onnx
+            from onnxruntime.transformers.float16 import convert_float_to_float16
+            model = convert_float_to_float16(onnx.load(onnx_model_path), keep_io_types=True)
+            onnx.save(model, tmp_path)
+        # 다른 프로세스가 반쯤 쓴 모델을 읽지 않도록 이름 바꾸기로 교체
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    logger.info(f"변형 생성: {variant} -> {out_path} ({time.perf_counter() - started:.1f}초)")
+    return out_path
+
+
+def read_calibration(path: str) -> List[Tuple[str, str]]:
+    """
+    보정 세트 읽기: .jsonl ({"audio": 경로, "sentence": 문장}) 또는 `오디오경로<TAB>문장` 줄
+
+    상대 경로는 보정 파일 위치 기준으로 해석한다.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            if path.endswith(".jsonl"):
+                item = json.loads(line)
+                audio, sentence = item["audio"], item["sentence"]
+            else:
+                audio, sentence = line.split("\t", 1)
+            samples.append((os.path.join(base_dir, audio), sentence))
+    return samples
+
+
+def prepare_audio(audio_path: str):
+    """녹음 파일을 청크 전처리와 같은 방식(평균/표준편차 정규화)의 [1, T] 텐서로"""
+    import torch
+    from realtime_engine_ko.audio_processor import AudioProcessor
+
+    audio = AudioProcessor.read_file(audio_path)
+    if audio is None:
+        raise ValueError(f"오디오를 읽지 못했습니다: {audio_path}")
+    audio = (audio - audio.mean()) / (audio.std() + 1e-8)
+    return torch.from_numpy(audio.astype(np.float32)).unsqueeze(0)
+
+
+def drift_report(reference, candidate, samples: Sequence[Tuple[Any, str]],
+                 tolerance: float = 5.0) -> Dict[str, Any]:
+    """
+    변형 모델 점수가 float 모델 점수와 얼마나 다른지 보고
+
+    Args:
+        reference: float 모델 엔진
+        candidate: 변형 모델 엔진
+        samples: ([1, T] 오디오 텐서, 문장) 목록
+        tolerance: 허용할 단어 점수 차이
+
+    Returns:
+        Dict[str, Any]: 단어/문장 점수 편차, 프레임 최대 확률 토큰 일치율, 인코더 시간
+    """
+    word_diffs, overall_diffs, agreements = [], [], []
+    reference_ms = candidate_ms = 0.0
+    for tensor, text in samples:
+        started = time.perf_counter()
+        X_ref, logits_ref = reference.encode(tensor)
+        reference_ms += (time.perf_counter() - started) * 1000.0
+        started = time.perf_counter()
+        X_var, logits_var = candidate.encode(tensor)
+        candidate_ms += (time.perf_counter() - started) * 1000.0
+
+        ref = reference.calculate_gop_from_features(X_ref, logits_ref, text)
+        var = candidate.calculate_gop_from_features(X_var, logits_var, text)
+        overall_diffs.append(abs(ref["overall"] - var["overall"]))
+        for rw, vw in zip(ref["words"], var["words"]):
+            word_diffs.append(abs(rw["scores"]["pronunciation"] - vw["scores"]["pronunciation"]))
+        frames = min(len(logits_ref), len(logits_var))
+        agreements.append(float(np.mean(logits_ref[:frames].argmax(-1) == logits_var[:frames].argmax(-1))))
+
+    diffs = np.asarray(word_diffs, dtype=np.float64)
+    return {
+        "samples": len(samples),
+        "words": int(diffs.size),
+        "word_mean_abs_diff": round(float(diffs.mean()), 3) if diffs.size else None,
+        "word_p95_abs_diff": round(float(np.percentile(diffs, 95)), 3) if diffs.size else None,
+        "word_max_abs_diff": round(float(diffs.max()), 3) if diffs.size else None,
+        "within_tolerance": round(float(np.mean(diffs <= tolerance)), 4) if diffs.size else None,
+        "overall_mean_abs_diff": round(float(np.mean(overall_diffs)), 3) if overall_diffs else None,
+        "greedy_agreement": round(float(np.mean(agreements)), 4) if agreements else None,
+        "reference_ms": round(reference_ms, 3),
+        "variant_ms": round(candidate_ms, 3),
+        "speedup": round(reference_ms / candidate_ms, 2) if candidate_ms > 0 else None
+    }
+
+
+def build_variants(
+    onnx_model_path: str,
+    tokenizer_path: str,
+    calibration: Sequence[Tuple[str, str]],
+    variants: Optional[Sequence[str]] = None,
+    tolerance: float = 5.0,
+    force: bool = False,
+    device: str = "CPU"
+) -> Dict[str, Any]:
+    """
+    변형을 만들고 보정 세트로 편차를 측정해 매니페스트에 기록
+
+    원본 해시가 매니페스트와 같고 변형 파일이 남아 있으면 (force가 아닌 한) 다시 만들지 않는다.
+    단어 점수 편차 p95가 tolerance 이하인 변형만 정책 선택 대상(accepted)이 된다.
+
+    Args:
+        onnx_model_path: float 원본 모델
+        tokenizer_path: tokenizer.json 경로
+        calibration: (오디오 경로, 문장) 목록
+        variants: 만들 변형 이름 (없으면 전부)
+        tolerance: 허용할 단어 점수 차이 (p95 기준)
+        force: 캐시된 변형도 다시 생성
+        device: 편차 측정용 추론 장치
+
+    Returns:
+        Dict[str, Any]: 매니페스트
+    """
+    from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+    variants = list(variants or VARIANTS)
+    for name in variants:
+        if name not in VARIANTS:
+            raise ValueError(f"알 수 없는 변형: {name} (가능: {', '.join(VARIANTS)})")
+    if not calibration:
+        raise ValueError("보정 세트가 비어 있습니다")
+
+    source_hash = model_fingerprint(onnx_model_path)
+    manifest = read_manifest(onnx_model_path)
+    if manifest is None or manifest.get("source_hash") != source_hash:
+        if manifest is not None:
+            logger.info("원본 모델이 바뀌어 기존 변형을 모두 다시 만듭니다")
+        manifest = {"source": os.path.basename(onnx_model_path), "source_hash": source_hash, "variants": {}}
+    manifest["tolerance"] = tolerance
+    manifest["source_bytes"] = os.path.getsize(onnx_model_path)
+
+    reference = Wav2VecCTCOnnxCore(onnx_model_path, tokenizer_path, device=device)
+    reference.warmup()
+    samples = [(prepare_audio(audio), sentence) for audio, sentence in calibration]
+
+    for name in variants:
+        path = variant_path(onnx_model_path, name)
+        entry = manifest["variants"].get(name)
+        if (not force and entry is not None and "error" not in entry and os.path.exists(path)
+                and os.path.getsize(path) == entry.get("bytes")):
+            logger.info(f"캐시된 변형 사용: {name}")
+            continue
+        try:
+            quantize_variant(onnx_model_path, name, path)
+            candidate = Wav2VecCTCOnnxCore(path, tokenizer_path, device=device)
+            candidate.warmup()
+            drift = drift_report(reference, candidate, samples, tolerance=tolerance)
+        except Exception as e:
+            logger.warning(f"변형 {name} 생성/검사 실패: {e}")
+            manifest["variants"][name] = {"error": str(e), "accepted": False}
+            continue
+        accepted = drift["word_p95_abs_diff"] is not None and drift["word_p95_abs_diff"] <= tolerance
+        manifest["variants"][name] = {
+            "path": os.path.basename(path),
+            "bytes": os.path.getsize(path),
+            "drift": drift,
+            "accepted": accepted,
+            "created_at": time.time()
+        }
+        logger.info(f"변형 {name}: 단어 편차 p95 {drift['word_p95_abs_diff']}, "
+                    f"속도 {drift['speedup']}배, {'채택' if accepted else '기각'}")
+
+    _write_manifest(onnx_model_path, manifest)
+    return manifest
+
+
+def resolve_variant(onnx_model_path: str, policy: Optional[str] = None) -> str:
+    """
+    정책에 맞는 변형 모델 경로 반환 (쓸 변형이 없으면 원본 경로)
+
+    Args:
+        onnx_model_path: float 원본 모델
+        policy: "float"/None (원본), "fastest" (채택된 변형 중 인코더가 가장 빠른 것, 원본보다 빠를 때만),
+            "smallest" (채택된 변형 중 가장 작은 파일), 또는 변형 이름 (편차 기각이어도 사용, 경고만)
+
+    Raises:
+        ValueError: 알 수 없는 정책
+    """
+    if policy is None or policy == FLOAT_POLICY:
+        return onnx_model_path
+    if policy not in POLICIES:
+        raise ValueError(f"알 수 없는 정밀도 정책: {policy} (가능: {', '.join(POLICIES)})")
+
+    manifest = read_manifest(onnx_model_path)
+    if manifest is None:
+        logger.warning(f"변형 매니페스트가 없어 원본 모델을 사용합니다: {onnx_model_path}")
+        return onnx_model_path
+    if manifest.get("source_hash") != model_fingerprint(onnx_model_path):
+        logger.warning(f"원본 모델이 매니페스트 이후 바뀌어 원본을 사용합니다 (다시 build 필요): {onnx_model_path}")
+        return onnx_model_path
+
+    model_dir = os.path.dirname(onnx_model_path)
+    available = {
+        name: entry for name, entry in manifest.get("variants", {}).items()
+        if "path" in entry and os.path.exists(os.path.join(model_dir, entry["path"]))
+    }
+
+    if policy in VARIANTS:
+        entry = available.get(policy)
+        if entry is None:
+            logger.warning(f"변형 {policy}이(가) 없어 원본 모델을 사용합니다")
+            return onnx_model_path
+        if not entry.get("accepted"):
+            logger.warning(f"변형 {policy}은(는) 편차 허용치를 넘었지만 지정되어 사용합니다")
+        return os.path.join(model_dir, entry["path"])
+
+    accepted = {name: entry for name, entry in available.items() if entry.get("accepted")}
+    if policy == "fastest":
+        # 원본보다 빠른 변형만 (CPU에서 fp16은 보통 더 느림)
+        accepted = {name: entry for name, entry in accepted.items() if (entry["drift"]["speedup"] or 0) > 1.0}
+        chosen = min(accepted, key=lambda name: accepted[name]["drift"]["variant_ms"], default=None)
+    else:
+        chosen = min(accepted, key=lambda name: accepted[name]["bytes"], default=None)
+    if chosen is None:
+        logger.info(f"정책 {policy}에 맞는 변형이 없어 원본 모델을 사용합니다")
+        return onnx_model_path
+    logger.info(f"정밀도 정책 {policy}: 변형 {chosen} 사용")
+    return os.path.join(model_dir, available[chosen]["path"])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="모델 저정밀 변형 생성/조회")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="변형 생성 및 편차 검사")
+    build.add_argument("--model", required=True, help="float ONNX 모델 경로")
+    build.add_argument("--tokenizer", required=True, help="tokenizer.json 경로")
+    build.add_argument("--calibration", required=True, help="보정 세트 (.jsonl 또는 오디오<TAB>문장)")
+    build.add_argument("--variants", default=",".join(VARIANTS), help="쉼표로 구분한 변형 이름")
+    build.add_argument("--tolerance", type=float, default=5.0, help="허용할 단어 점수 차이 (p95)")
+    build.add_argument("--force", action="store_true", help="캐시된 변형도 다시 생성")
+    show = sub.add_parser("show", help="매니페스트와 정책 선택 결과 출력")
+    show.add_argument("--model", required=True)
+    show.add_argument("--policy", default=None, choices=POLICIES)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    if args.command == "build":
+        manifest = build_variants(args.model, args.tokenizer, read_calibration(args.calibration),
+                                  variants=[v for v in args.variants.split(",") if v],
+                                  tolerance=args.tolerance, force=args.force)
+        print(json.dumps(manifest, ensure_ascii=False, indent=2))
+        return 0 if any(e.get("accepted") for e in manifest["variants"].values()) else 1
+
+    manifest = read_manifest(args.model)
+    if manifest is None:
+        print(f"매니페스트 없음: {manifest_path(args.model)}")
+        return 1
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+    if args.policy:
+        print(f"{args.policy} -> {resolve_variant(args.model, args.policy)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
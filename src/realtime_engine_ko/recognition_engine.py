@@ -1,14 +1,26 @@
 import time
 import logging
-import threading
 import json
-from typing import Dict, Any, List, Optional, Callable, Union
+import uuid
+from typing import Dict, Any, List, Optional, Callable, Union, Tuple
 
 from realtime_engine_ko.sentence_block import SentenceBlockManager, BlockStatus
 from realtime_engine_ko.progress_tracker import ProgressTracker
 from realtime_engine_ko.audio_processor import AudioProcessor
 from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
 from realtime_engine_ko.eval_manager import EvaluationController
+from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+from realtime_engine_ko.final_rescorer import FinalRescorer
+from realtime_engine_ko.cadence_controller import AdaptiveCadenceController
+from realtime_engine_ko.session_pool import SessionComponentPool, SessionComponents
+from realtime_engine_ko.telemetry import telemetry
+from realtime_engine_ko.latency_accounting import LatencyStats, latency_registry
+from realtime_engine_ko.memory_governor import SessionMemory, memory_governor
+from realtime_engine_ko.model_registry import ModelRegistry, ModelSpec
+from realtime_engine_ko.model_cascade import tracking_agreement
+from realtime_engine_ko.result_cache import ResultCache
+from realtime_engine_ko.curriculum_pack import CurriculumPack
+from realtime_engine_ko.scheduler import Scheduler, Handle, get_scheduler
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -38,11 +50,39 @@ class EngineCoordinator:
     
     def __init__(
         self,
-        onnx_model_path: str,
-        tokenizer_path: str,
+        onnx_model_path: Optional[str] = None,
+        tokenizer_path: Optional[str] = None,
         device: str = "CPU",
         update_interval: float = 0.3,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        subsequence_threshold: float = 20.0,
+        timeline_duration: float = 120.0,
+        timeline_ram_budget: int = 64 * 1024 * 1024,
+        final_rescoring: bool = False,
+        final_latency_budget: float = 3.0,
+        final_rescorer: Optional[FinalRescorer] = None,
+        adaptive_cadence: bool = False,
+        target_latency: float = 1.0,
+        warmup: bool = True,
+        component_pool: Optional[SessionComponentPool] = None,
+        memory_budget: Optional[int] = None,
+        session_memory_budget: Optional[int] = None,
+        alignment_backend: str = "python-dtw",
+        low_res_dim: Optional[int] = None,
+        low_res_pool: int = 2,
+        recognition_engine: Optional[Wav2VecCTCOnnxCore] = None,
+        model_registry: Optional[ModelRegistry] = None,
+        model_key: Optional[str] = None,
+        result_cache: Optional[ResultCache] = None,
+        curriculum_pack: Optional[CurriculumPack] = None,
+        block_alignment: str = "context",
+        tracking_model_path: Optional[str] = None,
+        tracking_engine: Optional[Wav2VecCTCOnnxCore] = None,
+        tracking_audit_rate: Optional[float] = None,
+        scheduler: Optional[Scheduler] = None,
+        precision: Optional[str] = None,
+        crop_padding: Optional[float] = 0.2,
+        chunk_bounds: Optional[Tuple[float, float]] = (0.8, 4.0)
     ):
         """
         엔진 코디네이터 초기화
@@ -53,27 +93,139 @@ class EngineCoordinator:
             device: 추론 장치 ("CPU" 또는 "CUDA")
             update_interval: 결과 업데이트 간격 (초)
             confidence_threshold: 인식 신뢰도 임계값
+            subsequence_threshold: block_alignment="subsequence"일 때 쓰는 인식 임계값. 이 모드의 점수는
+                어휘 크기 기준 절대 척도라 confidence_threshold와 따로 둠 (기본 20은 EvaluationController 참고)
+            timeline_duration: 재채점용으로 보관할 인코더 출력 길이 (초, 0이면 보관 안 함)
+            timeline_ram_budget: 타임라인이 메모리에 유지할 최대 바이트 수 (초과분은 memmap)
+            final_rescoring: 녹음 종료(stop_evaluation 또는 EOF) 시 전체 녹음 재채점 여부
+            final_latency_budget: 최종 재채점에 허용할 최대 시간 (초)
+            final_rescorer: 여러 코디네이터가 공유하는 재채점기 (주어지면 final_rescoring 대신 사용하고
+                close()에서 정리하지 않음)
+            adaptive_cadence: 부하에 따라 채점 간격/청크 길이를 조정할지 여부
+            target_latency: 적응형 주기 사용 시 목표 종단 지연 (초)
+            warmup: 로드 직후 대표 입력 길이로 더미 추론을 실행할지 여부
+            component_pool: 세션 컴포넌트 재사용 풀 (없으면 이 코디네이터 전용 풀 생성)
+            memory_budget: 프로세스 전체 메모리 예산 (바이트, 없으면 기존 설정 유지).
+                프로세스 전역 설정이므로 세션마다 만드는 코디네이터(서버)에서는 넘기지 않음
+            session_memory_budget: 세션별 메모리 예산 (바이트, 없으면 프로세스 예산만 적용)
+            alignment_backend: DTW 정렬 백엔드 ("python-dtw", "numpy", "native")
+            low_res_dim: 주어지면 후보 블록 탐색을 이 차원으로 투영한 저해상도 정렬로 수행 (최종 점수는 전체 해상도)
+            low_res_pool: 저해상도 정렬 시 평균할 연속 프레임 수
+            recognition_engine: 이미 로드된 공유 인식 엔진 (주어지면 모델 경로 대신 사용)
+            model_registry: 모델 레지스트리 (주어지면 세션마다 키로 모델을 빌려 씀)
+            model_key: 레지스트리 사용 시 기본 모델 키 (initialize에서 세션별로 바꿀 수 있음)
+            result_cache: 최종 재채점 결과 캐시 (final_rescoring 필요). 같은 녹음이 다시 제출되면
+                evaluate_speech가 파일을 모니터링하지 않고 저장된 단어별 결과를 바로 돌려줌
+            curriculum_pack: 미리 컴파일된 문장 팩 (initialize(sentence_id=...)로 문장을 조회)
+            block_alignment: 청크 채점 방식. "context"는 앞뒤 블록을 붙여 청크 전체와 정렬,
+                "subsequence"는 블록만 청크 안에서 찾아 한 번에 채점 (subsequence_threshold로 판정)
+            tracking_model_path: 청크마다 블록 추적에 쓸 작은 ONNX CTC 모델 (같은 토크나이저/어휘).
+                주어지면 큰 모델은 확정된 블록의 점수를 낼 때만 실행 (레지스트리 사용 시에는 ModelSpec에 지정)
+            tracking_engine: 이미 로드된 추적 엔진 (recognition_engine과 함께 사용)
+            tracking_audit_rate: 채점 모델로도 후보를 골라 추적 결과와 비교할 청크 비율 (없으면 기존 설정 유지).
+                memory_budget과 마찬가지로 프로세스 전역 설정
+            scheduler: 틱 타이머를 등록할 스케줄러 (없으면 프로세스 전역 스케줄러, 파일 감시도 같은 전역 스케줄러 사용)
+            precision: 정밀도 변형 정책 ("float", "fastest", "smallest" 또는 "int8" 등 변형 이름,
+                quantization build로 모델 옆에 만든 변형 중 선택. 레지스트리 사용 시에는 ModelSpec에 지정)
+            crop_padding: 인코더에 넣기 전 청크 앞뒤 무음을 자를 때 음성 바깥에 남길 여유 (초, None이면 자르지 않음)
+            chunk_bounds: 활성 블록 음절 수 x 세션 발화 속도로 정하는 청크 길이의 (최소, 최대) 초.
+                None이면 고정 길이(base_chunk_duration) 사용
         """
-        # 인식 엔진 초기화
-        self.recognition_engine = Wav2VecCTCOnnxCore(
-            onnx_model_path=onnx_model_path,
-            tokenizer_path=tokenizer_path,
-            device=device
-        )
-        logger.info("RecognitionEngine 초기화 완료")
+        # 모델 레지스트리 (세션마다 initialize에서 모델과 컴포넌트 풀을 빌림)
+        self.model_registry = model_registry
+        self.model_key = model_key
+        self.active_model_key: Optional[str] = None
+        self.recognition_engine: Optional[Wav2VecCTCOnnxCore] = None
+        self.tracking_engine: Optional[Wav2VecCTCOnnxCore] = None
+        self.component_pool: Optional[SessionComponentPool] = None
+        
+        if model_registry is None:
+            if recognition_engine is not None:
+                self.recognition_engine = recognition_engine
+                self.tracking_engine = tracking_engine
+            else:
+                # 인식 엔진 (+ 추적 엔진) 초기화. 첫 청크도 백 번째 청크만큼 빠르도록 미리 워밍업
+                spec = ModelSpec(
+                    onnx_model_path,
+                    tokenizer_path,
+                    device=device,
+                    alignment_backend=alignment_backend,
+                    low_res_dim=low_res_dim,
+                    low_res_pool=low_res_pool,
+                    warmup=warmup,
+                    tracking_model_path=tracking_model_path,
+                    precision=precision
+                )
+                self.recognition_engine, self.tracking_engine = spec.load_engines()
+                logger.info("RecognitionEngine 초기화 완료")
+            
+            # 세션 컴포넌트 풀
+            self.component_pool = component_pool or SessionComponentPool(self.recognition_engine, max_idle=1)
+        self.components: Optional[SessionComponents] = None
         
         # 나머지 컴포넌트는 필요시 초기화
         self.sentence_manager: Optional[SentenceBlockManager] = None
         self.progress_tracker: Optional[ProgressTracker] = None
         self.audio_processor: Optional[AudioProcessor] = None
         self.eval_controller: Optional[EvaluationController] = None
+        self.timeline: Optional[PosteriorTimeline] = None
+        self.timeline_duration = timeline_duration
+        self.timeline_ram_budget = timeline_ram_budget
+        # 같은 문장 재시도 시 직전 시도의 타임라인/블록 결과 (시도 간 비교용)
+        self.previous_timeline: Optional[PosteriorTimeline] = None
+        self.previous_results: Dict[int, Dict[str, Any]] = {}
+        self.attempt = 0
+        if block_alignment not in ("context", "subsequence"):
+            raise ValueError(f"알 수 없는 블록 정렬 방식: {block_alignment}")
+        self.block_alignment = block_alignment
+        
+        # 최종 재채점 (선택)
+        self.final_rescorer: Optional[FinalRescorer] = final_rescorer
+        self._owns_rescorer = False
+        if final_rescorer is None and final_rescoring:
+            self.final_rescorer = FinalRescorer(
+                recognition_engine=self.recognition_engine,
+                latency_budget=final_latency_budget,
+                result_cache=result_cache
+            )
+            self._owns_rescorer = True
+        # 부하 적응형 평가 주기 (선택)
+        self.cadence: Optional[AdaptiveCadenceController] = None
+        if adaptive_cadence:
+            self.cadence = AdaptiveCadenceController(target_latency=target_latency)
+        self.base_chunk_duration = 2.0
+        # 블록 예상 길이에 더할 여유 (발화 시작 지연, 앞뒤 컨텍스트)
+        self.chunk_bounds = chunk_bounds
+        self.chunk_margin = 0.5
+        
+        # 커리큘럼 팩 (문장 ID -> 블록 분할/토큰/prototype 행)
+        self.curriculum_pack = curriculum_pack
+        self.sentence_id: Optional[str] = None
+        
+        self.sentence: Optional[str] = None
+        self.final_result: Optional[Dict[str, Any]] = None
+        
+        # 세션별 도착-점수 지연 / RTF 집계
+        self.session_id: Optional[str] = None
+        self.latency_stats: Optional[LatencyStats] = None
+        
+        # 추적/채점 모델 일치도 (프로세스 전역 집계)
+        tracking_agreement.configure(audit_rate=tracking_audit_rate)
+        
+        # 메모리 예산 (프로세스 전역 관리자에 세션 단위로 보고)
+        memory_governor.configure(budget_bytes=memory_budget)
+        self.session_memory_budget = session_memory_budget
+        self.memory: Optional[SessionMemory] = None
         
         # 상태 관리
         self.is_initialized = False
         self.is_running = False
         self.update_interval = update_interval
+        self.crop_padding = crop_padding
         self.confidence_threshold = confidence_threshold
-        self.timer_thread: Optional[threading.Thread] = None
+        self.subsequence_threshold = subsequence_threshold
+        self.scheduler = scheduler or get_scheduler()
+        self.tick_handle: Optional[Handle] = None
         
         # RecordListener 관련
         self.record_listener: Optional[RecordListener] = None
@@ -89,42 +241,95 @@ class EngineCoordinator:
         """
         self.record_listener = record_listener
     
-    def initialize(self, sentence: str, audio_polling_interval: float = 0.03, min_time_between_evals: float = 0.5) -> bool:
+    def initialize(self, sentence: Optional[str] = None, audio_polling_interval: float = 0.03,
+                   min_time_between_evals: float = 0.5, model_key: Optional[str] = None,
+                   sentence_id: Optional[str] = None) -> bool:
         """
         주어진 문장으로 시스템 초기화
         
         Args:
-            sentence: 평가할 문장
+            sentence: 평가할 문장 (sentence_id를 주면 생략)
+            model_key: 이 세션에 쓸 모델 키 (레지스트리 사용 시, 없으면 기본 키)
+            sentence_id: 커리큘럼 팩의 문장 ID (주어지면 블록 분할과 토큰을 팩에서 조회)
             
         Returns:
             bool: 초기화 성공 여부
         """
         try:
-            # 문장 블록 관리자 초기화
-            self.sentence_manager = SentenceBlockManager(sentence)
-            
-            # 진행 추적기 초기화
-            self.progress_tracker = ProgressTracker(
-                total_blocks=len(self.sentence_manager.blocks),
-                window_size=3,
-                time_based_advance=True
-            )
+            # 이전 세션 컴포넌트는 풀에 반납하고 (가능하면) 재사용
+            if self.is_running:
+                self.stop_evaluation()
+            # 현재 시도는 직전 시도 자리로 옮겨 두고, 문장이나 모델이 바뀌었으면 아래에서 버림
+            previous_sentence, previous_model_key = self.sentence, self.active_model_key
+            if self.is_initialized:
+                self._rotate_attempt()
+            self._release_components()
             
-            # 오디오 프로세서 초기화
-            self.audio_processor = AudioProcessor(
-                sample_rate=16000,
-                chunk_duration=2.0,
-                polling_interval=audio_polling_interval
-            )
+            if self.model_registry is not None:
+                key = model_key or self.model_key
+                if key is None:
+                    raise ValueError("모델 레지스트리를 쓰려면 model_key가 필요합니다")
+                loaded = self.model_registry.acquire(key)
+                self.active_model_key = key
+                self.recognition_engine = loaded.engine
+                self.tracking_engine = loaded.tracking_engine
+                self.component_pool = loaded.component_pool
             
-            # 평가 컨트롤러 초기화
-            self.eval_controller = EvaluationController(
-                recognition_engine=self.recognition_engine,
-                sentence_manager=self.sentence_manager,
-                progress_tracker=self.progress_tracker,
+            packed = None
+            if sentence_id is not None:
+                if self.curriculum_pack is None:
+                    raise ValueError("sentence_id를 쓰려면 curriculum_pack이 필요합니다")
+                packed = self.curriculum_pack.get(sentence_id)
+                sentence = packed.sentence
+                # 다른 모델로 만든 팩이면 블록 분할만 쓰고 토큰/prototype 행은 런타임에 계산
+                if not self.curriculum_pack.matches(self.recognition_engine.onnx_model_path):
+                    logger.warning(f"커리큘럼 팩이 현재 모델과 맞지 않아 토큰을 다시 계산합니다: {sentence_id}")
+                    packed = None
+            if not sentence:
+                raise ValueError("평가할 문장이 없습니다")
+            
+            if sentence != previous_sentence or self.active_model_key != previous_model_key:
+                self._drop_previous_attempt()
+                self.attempt = 1
+            else:
+                self.attempt += 1
+            self.sentence = sentence
+            self.sentence_id = sentence_id
+            self.final_result = None
+            self.session_id = uuid.uuid4().hex
+            self.latency_stats = latency_registry.register(LatencyStats(self.session_id))
+            
+            self.components = self.component_pool.acquire(
+                sentence,
+                chunk_duration=self.base_chunk_duration,
+                polling_interval=audio_polling_interval,
                 confidence_threshold=self.confidence_threshold,
-                min_time_between_evals=min_time_between_evals
+                subsequence_threshold=self.subsequence_threshold,
+                min_time_between_evals=min_time_between_evals,
+                keep_recording=self.final_rescorer is not None,
+                timeline_duration=self.timeline_duration,
+                timeline_ram_budget=self.timeline_ram_budget,
+                packed=packed,
+                crop_padding=self.crop_padding
             )
+            self.sentence_manager = self.components.sentence_manager
+            self.progress_tracker = self.components.progress_tracker
+            self.audio_processor = self.components.audio_processor
+            self.eval_controller = self.components.eval_controller
+            self.timeline = self.components.timeline
+            
+            self.memory = memory_governor.register(self.session_id, self.session_memory_budget)
+            self.eval_controller.memory = self.memory
+            self.eval_controller.low_res_search = self.recognition_engine.low_res is not None
+            self.eval_controller.block_alignment = self.block_alignment
+            self.eval_controller.tracking_engine = self.tracking_engine
+            self.eval_controller.agreement = tracking_agreement if self.tracking_engine is not None else None
+            
+            if self.cadence:
+                self.cadence.reset()
+            
+            # 첫 청크 길이는 첫 블록 기준 (발화 속도는 기본값)
+            self.audio_processor.chunk_duration = self._plan_chunk_duration()
             
             # 오디오 처리 이벤트 등록
             self.audio_processor.add_chunk_callback(self._on_new_chunk)
@@ -138,6 +343,89 @@ class EngineCoordinator:
             logger.error(f"초기화 오류: {e}")
             return False
     
+    def retry(self) -> bool:
+        """
+        같은 문장 재시도 준비 (빠른 경로)
+        
+        블록 분할, 팩 토큰, 세션 컴포넌트, 모델 참조와 학습한 발화 속도는 그대로 두고
+        시도별 상태(녹음/버퍼, 블록 상태와 점수, 최종 결과)만 비운다. 직전 시도의 타임라인과
+        블록 결과는 previous_timeline/previous_results로 옮겨 다음 시도와 비교할 수 있게 한다.
+        
+        Returns:
+            bool: 재시도 준비 성공 여부 (초기화되지 않았으면 False)
+        """
+        if not self.is_initialized:
+            return False
+        self._start_new_attempt()
+        self.attempt += 1
+        telemetry.inc("retries_total")
+        logger.info(f"재시도 준비 완료: '{self.sentence}' ({self.attempt}번째 시도)")
+        return True
+    
+    def _start_new_attempt(self) -> None:
+        """현재 시도를 직전 시도 자리로 옮기고 시도별 상태를 비움 (문장에서 만든 구조와 발화 속도는 유지)"""
+        if self.is_running:
+            self.stop_evaluation()
+        self._rotate_attempt()
+        
+        self.sentence_manager.reset()
+        self.progress_tracker.reset(keep_rate=True)
+        self.eval_controller.reset()
+        self.audio_processor.reset()
+        self.final_result = None
+        if self.memory:
+            self.memory.update(hidden=0, probs=0, dtw=0, audio_buffer=0, timeline=self._timeline_ram_bytes())
+        
+        if self.cadence:
+            self.cadence.reset()
+        self.audio_processor.chunk_duration = self._plan_chunk_duration()
+    
+    def _rotate_attempt(self) -> None:
+        """
+        현재 시도의 타임라인/블록 결과를 직전 시도 자리로 옮김 (두 번 전 시도의 타임라인은 비워서 재사용)
+        
+        아직 아무것도 채점하지 않은 시도는 옮기지 않으므로 reset() 뒤의 재시도에도 직전 시도가 남는다.
+        """
+        if not self.eval_controller.cached_results and (self.timeline is None or self.timeline.is_empty()):
+            return
+        self.previous_results = dict(self.eval_controller.cached_results)
+        if self.timeline is not None:
+            recycled = self.previous_timeline
+            self.previous_timeline = self.timeline
+            if recycled is not None:
+                recycled.clear()
+                recycled.keep_hidden = True
+            else:
+                recycled = PosteriorTimeline(max_duration=self.timeline.max_duration,
+                                             ram_budget_bytes=self.timeline.ram_budget_bytes)
+            self.timeline = recycled
+            self.components.timeline = recycled
+            self.eval_controller.timeline = recycled
+    
+    def _drop_previous_attempt(self) -> None:
+        """보관 중인 직전 시도 타임라인/결과 해제"""
+        if self.previous_timeline is not None:
+            self.previous_timeline.clear()
+            self.previous_timeline = None
+        self.previous_results = {}
+    
+    def _timeline_ram_bytes(self) -> int:
+        """현재 시도와 직전 시도 타임라인의 RAM 사용량 합"""
+        return sum(t.memory_usage()["ram_bytes"] for t in (self.timeline, self.previous_timeline) if t is not None)
+    
+    def _release_components(self) -> None:
+        """현재 세션 컴포넌트를 풀에 반납 (레지스트리 모델도 반납)"""
+        if self.components is not None:
+            if self.memory:
+                memory_governor.unregister(self.memory.session_id)
+                self.memory = None
+            self.component_pool.release(self.components)
+            self.components = None
+            self.is_initialized = False
+        if self.active_model_key is not None:
+            self.model_registry.release(self.active_model_key)
+            self.active_model_key = None
+    
     def start_evaluation(self, audio_file_path: str) -> bool:
         """
         평가 시작
@@ -176,22 +464,7 @@ class EngineCoordinator:
                     self.record_listener.on_start_record_fail(error_msg)
                 return False
                 
-            # 진행 추적 시작
-            self.progress_tracker.start()
-            
-            # 타이머 스레드 시작 (주기적 틱 이벤트용)
-            self.is_running = True
-            self.timer_thread = threading.Thread(
-                target=self._timer_loop,
-                daemon=True
-            )
-            self.timer_thread.start()
-            
-            # 시작 이벤트 호출
-            if self.record_listener and self.record_listener.on_start:
-                self.record_listener.on_start()
-            
-            logger.info("평가 시작")
+            self._begin_evaluation()
             return True
             
         except Exception as e:
@@ -201,18 +474,87 @@ class EngineCoordinator:
                 self.record_listener.on_start_record_fail(error_msg)
             return False
     
+    def start_stream(self, tick: bool = True) -> bool:
+        """
+        파일 대신 push_audio로 오디오를 받는 평가 시작 (스트리밍 서버용)
+        
+        Args:
+            tick: 주기적 on_tick 이벤트용 타이머 스레드를 띄울지 여부
+            
+        Returns:
+            bool: 시작 성공 여부
+        """
+        if not self.is_initialized:
+            logger.error("초기화되지 않은 상태에서 평가를 시작할 수 없습니다.")
+            return False
+        if self.is_running:
+            logger.warning("이미 평가가 진행 중입니다.")
+            return False
+        
+        self.audio_processor.start_stream()
+        self._begin_evaluation(tick=tick)
+        return True
+    
+    def push_audio(self, samples, ingest_time: Optional[float] = None) -> None:
+        """
+        스트림 샘플 전달 (float32 모노 16kHz). 청크가 차면 이 호출 안에서 채점되고 on_score가 불린다
+        
+        Args:
+            samples: 오디오 샘플 ([-1, 1] 범위)
+            ingest_time: 수신 시각 (지연 계산용, 없으면 현재 시각)
+        """
+        if not self.is_running:
+            return
+        self.audio_processor.push_audio(samples, ingest_time)
+    
+    def end_stream(self) -> Dict[str, Any]:
+        """
+        스트림 종료: 남은 샘플을 채점하고 평가 중지 (최종 재채점 포함)
+        
+        Returns:
+            Dict[str, Any]: 최종 상태
+        """
+        if self.is_running:
+            self.audio_processor.end_stream()
+            self.stop_evaluation()
+        return self.get_results()
+    
+    def _begin_evaluation(self, tick: bool = True) -> None:
+        """진행 추적, 틱 타이머 시작 및 시작 이벤트 전달"""
+        # 진행 추적 시작
+        self.progress_tracker.start()
+        
+        # 주기적 틱 이벤트는 공용 스케줄러의 타이머 휠에 등록 (세션별 스레드 없음)
+        self.is_running = True
+        if tick:
+            self.tick_handle = self.scheduler.call_every(self.update_interval, self._tick, name="tick")
+        
+        # 시작 이벤트 호출
+        if self.record_listener and self.record_listener.on_start:
+            self.record_listener.on_start()
+        
+        logger.info("평가 시작")
+    
     def stop_evaluation(self) -> None:
         """평가 중지"""
         if not self.is_running:
             return
             
-        self.is_running = False
-        
-        if self.timer_thread and self.timer_thread.is_alive():
-            self.timer_thread.join(timeout=1.0)
+        if self.tick_handle is not None:
+            self.tick_handle.cancel(timeout=1.0)
+            self.tick_handle = None
             
+        # 파일에 남은 데이터와 청크 길이에 못 미친 마지막 샘플까지 채점
+        # (is_running을 내리기 전에 읽어야 _on_new_chunk가 마지막 청크를 버리지 않음)
         if self.audio_processor:
             self.audio_processor.stop_monitoring()
+            self.audio_processor.read_remaining()
+            
+        self.is_running = False
+        
+        # 전체 녹음 최종 재채점
+        if self.final_rescorer and self.final_result is None:
+            self._run_final_rescoring()
             
         # 종료 이벤트 호출
         if self.record_listener and self.record_listener.on_record_end:
@@ -220,24 +562,20 @@ class EngineCoordinator:
             
         logger.info("평가 중지")
     
-    def _timer_loop(self) -> None:
+    def _tick(self) -> None:
         """
-        주기적 틱 이벤트 생성 (내부 스레드에서 실행)
+        주기적 틱 이벤트 전달 (스케줄러 작업자 스레드에서 update_interval마다 실행)
         """
-        while self.is_running:
-            try:
-                # 진행 상태 확인
-                if self.sentence_manager and self.record_listener and self.record_listener.on_tick:
-                    current = self.sentence_manager.active_block_id + 1
-                    total = len(self.sentence_manager.blocks)
-                    self.record_listener.on_tick(current, total)
-                
-                # 다음 틱까지 대기
-                time.sleep(self.update_interval)
-                
-            except Exception as e:
-                logger.error(f"타이머 루프 오류: {e}")
-                time.sleep(self.update_interval)
+        if not self.is_running:
+            return
+        try:
+            # 진행 상태 확인
+            if self.sentence_manager and self.record_listener and self.record_listener.on_tick:
+                current = self.sentence_manager.active_block_id + 1
+                total = len(self.sentence_manager.blocks)
+                self.record_listener.on_tick(current, total)
+        except Exception as e:
+            logger.error(f"틱 이벤트 오류: {e}")
     
     def _on_new_chunk(self, audio_chunk, metadata):
         """새 오디오 청크 이벤트 핸들러"""
@@ -253,10 +591,45 @@ class EngineCoordinator:
             
             # 인식 결과 처리
             if audio_chunk is not None:
+                # 부하가 높으면 이번 청크 채점 건너뜀
+                if self.cadence and not self.cadence.should_score(metadata):
+                    telemetry.inc("dropped_windows_total", labels={"reason": "cadence"})
+                    return
+                
+                started = time.time()
                 result = self.eval_controller.process_recognition_result(
                     audio_chunk=audio_chunk,
                     metadata=metadata
                 )
+                compute_time = time.time() - started
+                if self.memory:
+                    self.memory.update(audio_buffer=self.audio_processor.buffered_bytes(),
+                                       timeline=self._timeline_ram_bytes())
+                    # 메모리 단계가 hidden 보관을 끄면 직전 시도 타임라인도 logits만 남김
+                    if (self.previous_timeline is not None and self.previous_timeline.keep_hidden
+                            and not self.memory.policy().keep_hidden):
+                        self.previous_timeline.drop_hidden()
+                # 지연/부하 계산은 무음을 잘라내기 전 청크 길이 기준 (오디오가 도착하는 속도)
+                audio_duration = (metadata.get("chunk_end_time", metadata.get("end_time", 0.0))
+                                  - metadata.get("chunk_start_time", metadata.get("start_time", 0.0)))
+                
+                if self.cadence:
+                    self.cadence.record(compute_time, audio_duration)
+                # 다음 청크는 (새) 활성 블록 길이에 맞춤
+                self.audio_processor.chunk_duration = self._plan_chunk_duration()
+                
+                # 도착 시각부터 점수 전달까지의 지연 기록
+                scored_at = time.time()
+                ingest_time = metadata.get("ingest_time")
+                latency = None
+                if self.latency_stats:
+                    latency = self.latency_stats.record(ingest_time, scored_at, audio_duration, compute_time)
+                result.setdefault("result", {})["timing"] = {
+                    "ingest_time": ingest_time,
+                    "scored_at": scored_at,
+                    "arrival_to_score": latency,
+                    "compute": compute_time
+                }
                 
                 # 결과 스코어 이벤트 호출
                 if self.record_listener and self.record_listener.on_score:
@@ -264,9 +637,84 @@ class EngineCoordinator:
                     result_json = json.dumps(result)
                     self.record_listener.on_score(result_json)
                 
+                # 모든 블록 평가 완료(EOF) 시 최종 재채점
+                if (self.final_rescorer and self.final_result is None
+                        and result.get("result", {}).get("eof")):
+                    self._run_final_rescoring()
+                
         except Exception as e:
             logger.error(f"청크 처리 오류: {e}")
     
+    def _plan_chunk_duration(self) -> float:
+        """
+        다음 청크 길이 (초)
+        
+        활성 블록의 음절 수 x 이번 세션에서 학습한 음절당 시간 + 여유를 chunk_bounds로 제한하고,
+        부하 적응이 켜져 있으면 그 배율을 곱한다. chunk_bounds가 없으면 base_chunk_duration 기준.
+        """
+        duration = self.base_chunk_duration
+        if self.chunk_bounds is not None and self.progress_tracker is not None:
+            expected = self.progress_tracker.expected_duration(self.sentence_manager.active_block_id)
+            duration = min(self.chunk_bounds[1], max(self.chunk_bounds[0], expected + self.chunk_margin))
+        if self.cadence:
+            duration = self.cadence.chunk_duration(duration)
+        return duration
+    
+    def _run_final_rescoring(self) -> Optional[Dict[str, Any]]:
+        """
+        전체 녹음을 전체 문장에 대해 다시 채점하고 on_score로 최종 결과 전달
+        
+        Returns:
+            Optional[Dict[str, Any]]: 최종 결과 (예산 초과/실패 시 None, 청크 점수 유지)
+        """
+        if not self.final_rescorer or not self.audio_processor or not self.sentence:
+            return None
+        
+        try:
+            refined = self.final_rescorer.rescore(self.audio_processor.get_recording(), self.sentence,
+                                                  recognition_engine=self.recognition_engine)
+        except Exception as e:
+            logger.error(f"최종 재채점 오류: {e}")
+            return None
+        if refined is None:
+            return None
+        return self._publish_final_result(refined)
+    
+    def _publish_final_result(self, refined: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        재채점 결과(또는 캐시된 결과)를 블록 점수에 반영하고 on_score로 최종 결과 전달
+        
+        Args:
+            refined: FinalRescorer.rescore() 형식의 결과
+            
+        Returns:
+            Dict[str, Any]: 최종 결과
+        """
+        # 단어 수가 블록 수와 같으면 블록 점수를 최종 점수로 교체
+        if self.sentence_manager and len(refined["words"]) == len(self.sentence_manager.blocks):
+            for block, word in zip(self.sentence_manager.blocks, refined["words"]):
+                self.sentence_manager.set_block_score(block.block_id, word["scores"]["pronunciation"])
+                self.sentence_manager.update_block_status(block.block_id, BlockStatus.EVALUATED)
+        
+        self.final_result = {
+            "result": {
+                "overall": refined["overall"],
+                "pronunciation": refined["pronunciation"],
+                "resource_version": "1.0.0",
+                "words": refined["words"],
+                "eof": True,
+                "final": True,
+                "final_score": refined["overall"],
+                "latency": refined["latency"],
+                "cached": refined.get("cached", False)
+            }
+        }
+        
+        if self.record_listener and self.record_listener.on_score:
+            self.record_listener.on_score(json.dumps(self.final_result))
+        
+        return self.final_result
+    
     def get_current_state(self) -> Dict[str, Any]:
         """
         현재 시스템 상태 정보 반환
@@ -289,26 +737,164 @@ class EngineCoordinator:
         if self.eval_controller:
             result.update(self.eval_controller.get_evaluation_summary())
             
+        if self.final_result:
+            result["final_result"] = self.final_result["result"]
+            
+        if self.cadence:
+            result["cadence"] = self.cadence.get_stats()
+            
+        if self.audio_processor:
+            result["chunking"] = {
+                "chunk_duration": round(self.audio_processor.chunk_duration, 3),
+                "seconds_per_syllable": round(self.progress_tracker.seconds_per_syllable, 3)
+            }
+            
+        if self.latency_stats:
+            result["latency"] = self.latency_stats.summary()
+            
+        if self.memory:
+            result["memory"] = self.memory.summary()
+            
+        if self.active_model_key:
+            result["model"] = self.active_model_key
+            
+        if self.sentence_id:
+            result["sentence_id"] = self.sentence_id
+            
+        if self.attempt > 1:
+            result["attempt"] = self.attempt
+            
         return result
     
+    def close(self) -> None:
+        """세션 종료: 컴포넌트를 풀에, 레지스트리 모델을 레지스트리에 반납 (전용 재채점기 작업도 정리)"""
+        if self.is_running:
+            self.stop_evaluation()
+        self._drop_previous_attempt()
+        self._release_components()
+        if self.final_rescorer and self._owns_rescorer:
+            self.final_rescorer.shutdown()
+
     def reset(self) -> None:
-        """시스템 상태 초기화"""
-        self.stop_evaluation()
+        """
+        시스템 상태 초기화
         
-        if self.sentence_manager:
-            self.sentence_manager.reset()
-            
-        if self.progress_tracker:
-            self.progress_tracker.reset()
-            
-        if self.eval_controller:
-            self.eval_controller.reset()
-            
-        if self.audio_processor:
-            self.audio_processor.reset()
+        retry()처럼 현재 시도를 직전 시도 자리로 옮기고 시도별 상태만 비운다 (시도 번호는 그대로).
+        직전 시도는 다른 문장으로 initialize할 때만 버린다.
+        """
+        if not self.is_initialized:
+            self.stop_evaluation()
+            return
+        self._start_new_attempt()
             
         logger.info("시스템 초기화됨")
     
+    def rescore_block(self, block_id: int, start_time: Optional[float] = None,
+                      end_time: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        보관된 인코더 출력으로 블록 재채점 (모델 재실행 없음)
+        
+        Args:
+            block_id: 블록 ID
+            start_time: 구간 시작 (초, 녹음 시작 기준)
+            end_time: 구간 종료 (초)
+            
+        Returns:
+            Optional[Dict[str, Any]]: 재채점 결과 (구간 데이터가 없으면 None)
+        """
+        if not self.eval_controller:
+            return None
+        return self.eval_controller.rescore_block(block_id, start_time, end_time)
+    
+    def compare_attempts(self) -> Optional[Dict[str, Any]]:
+        """
+        직전 시도와 현재 시도의 블록별 점수/구간 비교
+        
+        프레임 단위 비교가 필요하면 previous_timeline.get_range(start_time, end_time)로
+        직전 시도의 hidden/logits를 꺼낼 수 있다.
+        
+        Returns:
+            Optional[Dict[str, Any]]: 블록별 비교 (직전 시도가 없으면 None)
+        """
+        if self.attempt < 2 or not self.sentence_manager:
+            return None
+        current_results = self.eval_controller.cached_results
+        blocks = []
+        for block in self.sentence_manager.blocks:
+            previous = self.previous_results.get(block.block_id)
+            current = current_results.get(block.block_id)
+            entry = {"block_id": block.block_id, "text": block.text, "previous": None, "current": None, "delta": None}
+            for key, cached in (("previous", previous), ("current", current)):
+                if cached is not None:
+                    entry[key] = {
+                        "score": round(cached["gop_score"], 1),
+                        "start_time": cached.get("start_time"),
+                        "end_time": cached.get("end_time")
+                    }
+            if previous is not None and current is not None:
+                entry["delta"] = round(current["gop_score"] - previous["gop_score"], 1)
+            blocks.append(entry)
+        return {"attempt": self.attempt, "blocks": blocks}
+    
+    def get_latency_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        현재 세션의 도착-점수 지연(p50/p95/p99)과 실시간 계수
+        
+        Returns:
+            Optional[Dict[str, Any]]: 요약 통계 (초기화 전이면 None)
+        """
+        return self.latency_stats.summary() if self.latency_stats else None
+    
+    @staticmethod
+    def get_aggregate_latency_stats() -> Dict[str, Any]:
+        """
+        프로세스 내 모든 세션을 합친 지연/실시간 계수 통계
+        
+        Returns:
+            Dict[str, Any]: 요약 통계
+        """
+        return latency_registry.aggregate()
+    
+    @staticmethod
+    def get_memory_stats() -> Dict[str, Any]:
+        """
+        프로세스 전체 메모리 사용량(구조별, 세션별)과 현재 품질 저하 단계
+        
+        Returns:
+            Dict[str, Any]: 메모리 요약
+        """
+        return memory_governor.snapshot()
+    
+    def get_model_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        모델 레지스트리의 모델별 적재 상태, 로드 시간, 상주 시간
+        
+        Returns:
+            Optional[Dict[str, Any]]: 레지스트리 요약 (레지스트리를 쓰지 않으면 None)
+        """
+        return self.model_registry.snapshot() if self.model_registry else None
+    
+    @staticmethod
+    def get_tracking_stats() -> Dict[str, Any]:
+        """
+        추적 모델과 채점 모델의 일치도 (확정 블록 점수, 감사 청크의 블록 선택, 채점 모델 실행 비율)
+        
+        Returns:
+            Dict[str, Any]: 일치도 요약 (프로세스 전체)
+        """
+        return tracking_agreement.summary()
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        결과 캐시 적중률(메모리/디스크)과 항목 수
+        
+        Returns:
+            Optional[Dict[str, Any]]: 캐시 요약 (결과 캐시를 쓰지 않으면 None)
+        """
+        if not self.final_rescorer or self.final_rescorer.result_cache is None:
+            return None
+        return self.final_rescorer.result_cache.stats()
+    
     # --- 외부 API 메서드 ---
     
     def evaluate_speech(self, sentence: str, audio_file_path: str, record_listener: Optional[RecordListener] = None) -> Dict[str, Any]:
@@ -326,10 +912,25 @@ class EngineCoordinator:
         if record_listener:
             self.set_record_listener(record_listener)
             
-        if not self.initialize(sentence):
+        # 같은 문장 재시도면 문장에서 만든 구조를 그대로 두고 시도별 상태만 비움
+        retrying = (self.is_initialized and sentence == self.sentence
+                    and (self.model_registry is None or self.active_model_key == self.model_key))
+        if retrying:
+            self.retry()
+        elif not self.initialize(sentence):
             if self.record_listener and self.record_listener.on_start_record_fail:
                 self.record_listener.on_start_record_fail("초기화 실패")
             return {"status": "initialization_failed"}
+        
+        # 이미 채점한 녹음이면 모니터링 없이 저장된 결과를 바로 전달
+        if self.final_rescorer and self.final_rescorer.result_cache is not None:
+            cached = self._lookup_cached_result(audio_file_path)
+            if cached is not None:
+                self._publish_final_result(cached)
+                if self.record_listener and self.record_listener.on_record_end:
+                    self.record_listener.on_record_end()
+                logger.info(f"결과 캐시 적중: '{sentence}'")
+                return self.get_current_state()
             
         if not self.start_evaluation(audio_file_path):
             if self.record_listener and self.record_listener.on_start_record_fail:
@@ -338,6 +939,17 @@ class EngineCoordinator:
             
         return self.get_current_state()
     
+    def _lookup_cached_result(self, audio_file_path: str) -> Optional[Dict[str, Any]]:
+        """완성된 녹음 파일에 대해 저장된 최종 결과 조회 (파일을 읽을 수 없으면 None)"""
+        audio = AudioProcessor.read_file(audio_file_path)
+        if audio is None or len(audio) == 0:
+            return None
+        try:
+            return self.final_rescorer.lookup(audio, self.sentence, recognition_engine=self.recognition_engine)
+        except Exception as e:
+            logger.warning(f"결과 캐시 조회 오류: {e}")
+            return None
+    
     def get_results(self) -> Dict[str, Any]:
         """
         현재 평가 결과 반환
@@ -0,0 +1,316 @@
+import os
+import json
+import copy
+import shutil
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import onnx
+
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("ResultCache")
+
+# (경로, 크기, 수정 시각, 외부 데이터 파일별 (경로, 크기, 수정 시각)) -> 모델 해시
+_model_hashes: Dict[Tuple, str] = {}
+# (경로, 크기, 수정 시각) -> 외부 데이터 파일 이름 (그래프 파싱은 모델 파일이 바뀔 때만)
+_external_locations: Dict[Tuple[str, int, int], Tuple[str, ...]] = {}
+_model_hashes_lock = threading.Lock()
+
+
+def _file_stamp(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def external_data_files(onnx_model_path: str) -> List[str]:
+    """
+    모델 초기값이 가리키는 외부 데이터 파일 경로 (initializer의 external_data location 기준, 없으면 빈 목록)
+
+    Args:
+        onnx_model_path: ONNX 모델 경로
+    """
+    stamp = _file_stamp(os.path.abspath(onnx_model_path))
+    with _model_hashes_lock:
+        locations = _external_locations.get(stamp)
+    if locations is None:
+        try:
+            graph = onnx.load(stamp[0], load_external_data=False).graph
+        except Exception as e:
+            # 파싱할 수 없는 파일은 파일 내용만으로 식별
+            logger.debug(f"모델 그래프를 읽지 못해 외부 데이터 없이 해시: {e}")
+            locations = ()
+        else:
+            locations = tuple(sorted({
+                entry.value
+                for init in graph.initializer if init.data_location == onnx.TensorProto.EXTERNAL
+                for entry in init.external_data if entry.key == "location"
+            }))
+        with _model_hashes_lock:
+            _external_locations[stamp] = locations
+    model_dir = os.path.dirname(stamp[0])
+    return [os.path.join(model_dir, location) for location in locations]
+
+
+def model_fingerprint(onnx_model_path: str) -> str:
+    """
+    모델 파일과 외부 데이터 파일 내용의 sha256 (파일 크기/수정 시각이 모두 같으면 다시 읽지 않음)
+
+    가중치를 .onnx.data 같은 외부 파일에 둔 모델은 그래프 파일이 그대로여도 가중치가 바뀔 수 있으므로
+    initializer가 가리키는 외부 파일도 함께 해시한다.
+
+    Args:
+        onnx_model_path: ONNX 모델 경로
+
+    Returns:
+        str: 16진 해시
+    """
+    path = os.path.abspath(onnx_model_path)
+    externals = [_file_stamp(external) for external in external_data_files(path)]
+    memo_key = (_file_stamp(path), tuple(externals))
+    with _model_hashes_lock:
+        cached = _model_hashes.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    for file_path in [path] + [external[0] for external in externals]:
+        digest.update(os.path.basename(file_path).encode("utf-8") + b"\0")
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    value = digest.hexdigest()
+    with _model_hashes_lock:
+        _model_hashes[memo_key] = value
+    return value
+
+
+def fingerprint(pcm: np.ndarray, sentence: str, model_hash: str,
+                config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    결과 캐시 키: 오디오 PCM(float32 모노), 문장, 모델 해시, 채점 설정의 sha256
+
+    Args:
+        pcm: 전체 녹음
+        sentence: 평가 문장
+        model_hash: model_fingerprint() 값
+        config: 결과에 영향을 주는 채점 설정 (JSON으로 직렬화 가능해야 함)
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(pcm, dtype=np.float32).tobytes())
+    for part in (sentence, model_hash, json.dumps(config or {}, sort_keys=True)):
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    다시 제출된 녹음의 단어별 결과를 돌려주는 내용 주소 캐시
+
+    1단은 메모리 LRU, 2단은 (cache_dir가 있으면) 디스크의 JSON 파일이다.
+    디스크 항목은 `<cache_dir>/<모델 해시>/<키>.json`에 두어 모델이 바뀌면 디렉터리째 지운다.
+
+    캐시는 FinalRescorer(와 이를 통해 결과를 조회하는 EngineCoordinator)만 사용한다.
+    Wav2VecCTCOnnxCore.calculate_gop* 같은 오프라인 직접 호출은 캐시를 거치지 않고 매번 계산한다.
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: Optional[str] = None):
+        """
+        Args:
+            max_entries: 메모리에 보관할 최대 결과 수
+            cache_dir: 디스크 저장 디렉터리 (없으면 메모리만 사용)
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        # 키 -> (모델 해시, 결과)
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        # 모델 경로 -> 마지막으로 본 모델 해시 (바뀌면 이전 해시 결과를 지움)
+        self._model_paths: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = {"memory": 0, "disk": 0}
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(self, max_entries: Optional[int] = None, cache_dir: Optional[str] = None) -> None:
+        """용량/디스크 경로 변경"""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+                self._trim()
+            if cache_dir is not None:
+                self.cache_dir = cache_dir
+
+    # --- 모델 ---
+
+    def model_hash(self, onnx_model_path: str) -> str:
+        """
+        모델 해시 반환. 같은 경로의 파일 내용이 바뀌었으면 이전 모델의 결과를 모두 무효화
+
+        Args:
+            onnx_model_path: ONNX 모델 경로
+        """
+        current = model_fingerprint(onnx_model_path)
+        path = os.path.abspath(onnx_model_path)
+        with self._lock:
+            previous = self._model_paths.get(path)
+            self._model_paths[path] = current
+        if previous is not None and previous != current:
+            removed = self.invalidate_model(previous)
+            logger.info(f"모델 변경 감지 ({os.path.basename(path)}): 이전 결과 {removed}개 무효화")
+        return current
+
+    def invalidate_model(self, model_hash: str) -> int:
+        """
+        특정 모델로 만든 결과를 메모리/디스크에서 삭제
+
+        Returns:
+            int: 삭제한 메모리 항목 수 (+ 디스크 파일 수)
+        """
+        with self._lock:
+            stale = [key for key, (owner, _) in self._entries.items() if owner == model_hash]
+            for key in stale:
+                del self._entries[key]
+            removed = len(stale)
+            model_dir = self._model_dir(model_hash)
+            if model_dir and os.path.isdir(model_dir):
+                removed += sum(len(files) for _, _, files in os.walk(model_dir))
+                shutil.rmtree(model_dir, ignore_errors=True)
+            self.invalidations += removed
+        if removed:
+            telemetry.inc("cache_invalidations_total", removed, labels={"cache": "result"})
+        return removed
+
+    # --- 조회/저장 ---
+
+    def get(self, key: str, model_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        결과 조회 (메모리 -> 디스크 순서, 디스크 적중은 메모리로 올림)
+
+        Args:
+            key: fingerprint() 값
+            model_hash: 결과를 만든 모델 해시 (디스크 위치)
+
+        Returns:
+            Optional[Dict[str, Any]]: 저장된 결과의 사본 (없으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits["memory"] += 1
+                tier = "memory"
+                result = entry[1]
+            else:
+                result = self._read_disk(key, model_hash)
+                if result is not None:
+                    self._store_memory(key, model_hash, result)
+                    self.hits["disk"] += 1
+                    tier = "disk"
+                else:
+                    self.misses += 1
+                    tier = None
+        if tier is None:
+            telemetry.inc("cache_misses_total", labels={"cache": "result"})
+            return None
+        telemetry.inc("cache_hits_total", labels={"cache": "result", "tier": tier})
+        return copy.deepcopy(result)
+
+    def put(self, key: str, model_hash: str, result: Dict[str, Any]) -> None:
+        """
+        결과 저장
+
+        Args:
+            key: fingerprint() 값
+            model_hash: 결과를 만든 모델 해시
+            result: JSON으로 직렬화 가능한 결과
+        """
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._store_memory(key, model_hash, result)
+            self._write_disk(key, model_hash, result)
+
+    def clear(self) -> None:
+        """메모리 항목과 디스크 저장소를 모두 삭제"""
+        with self._lock:
+            self._entries.clear()
+            if self.cache_dir and os.path.isdir(self.cache_dir):
+                shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률과 항목 수"""
+        with self._lock:
+            hits = self.hits["memory"] + self.hits["disk"]
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "cache_dir": self.cache_dir,
+                "hits": dict(self.hits),
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else None,
+                "invalidations": self.invalidations
+            }
+
+    # --- 내부 ---
+
+    def _store_memory(self, key: str, model_hash: str, result: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (model_hash, result)
+        self._entries.move_to_end(key)
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self._entries) > max(0, self.max_entries):
+            self._entries.popitem(last=False)
+
+    def _model_dir(self, model_hash: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, model_hash[:16])
+
+    def _read_disk(self, key: str, model_hash: str) -> Optional[Dict[str, Any]]:
+        model_dir = self._model_dir(model_hash)
+        if model_dir is None:
+            return None
+        try:
+            with open(os.path.join(model_dir, f"{key}.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"디스크 캐시 항목을 읽지 못했습니다 ({key[:12]}): {e}")
+            return None
+
+    def _write_disk(self, key: str, model_hash: str, result: Dict[str, Any]) -> None:
+        model_dir = self._model_dir(model_hash)
+        if model_dir is None:
+            return
+        path = os.path.join(model_dir, f"{key}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(model_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 이름 바꾸기로 교체
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"디스크 캐시 저장 실패 ({key[:12]}): {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# 프로세스 전역 결과 캐시 (기본은 메모리만, configure(cache_dir=...)로 디스크 단 추가)
+result_cache = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전역 ResultCache 인스턴스 반환"""
+    return result_cache
@@ -0,0 +1,533 @@
+import os
+import math
+import time
+import errno
+import struct
+import logging
+import selectors
+import threading
+import ctypes
+import ctypes.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Set
+
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("Scheduler")
+
+
+class Handle:
+    """
+    call_every()/watch_file()로 등록한 작업 하나
+
+    콜백은 작업자 풀에서 실행되며 같은 핸들의 콜백은 겹쳐 실행되지 않는다.
+    실행 중에 다시 깨어나면 한 번으로 합쳐 끝난 뒤 다시 실행한다 (틱/파일 변경이 밀려 쌓이지 않음).
+    """
+
+    kind = "timer"
+
+    def __init__(self, scheduler: "Scheduler", callback: Callable[[], None], name: str):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.name = name
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = False
+        self._owner: Optional[int] = None
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def _submit(self) -> None:
+        """콜백 실행 요청 (실행 중이면 끝난 뒤 한 번 더)"""
+        if self.cancelled:
+            return
+        with self._lock:
+            if self._running:
+                self._pending = True
+                telemetry.inc("scheduler_coalesced_total", labels={"kind": self.kind})
+                return
+            self._running = True
+            self._idle.clear()
+        self.scheduler._dispatch(self._run)
+
+    def _run(self) -> None:
+        while True:
+            self._owner = threading.get_ident()
+            if not self.cancelled:
+                try:
+                    self.callback()
+                except Exception as e:
+                    logger.error(f"{self.name} 콜백 오류: {e}")
+            with self._lock:
+                if self._pending and not self.cancelled:
+                    self._pending = False
+                    continue
+                self._pending = False
+                self._running = False
+                self._owner = None
+                self._idle.set()
+                return
+
+    def cancel(self, timeout: Optional[float] = 1.0) -> bool:
+        """
+        등록 해제 후 실행 중인 콜백이 끝날 때까지 대기 (콜백 안에서 부르면 기다리지 않음)
+
+        Returns:
+            bool: 실행 중인 콜백 없이 끝났는지 여부
+        """
+        self.cancelled = True
+        self.scheduler._remove(self)
+        if self._owner == threading.get_ident():
+            return True
+        return self._idle.wait(timeout)
+
+
+class FileWatch(Handle):
+    """
+    파일 변경 감시 핸들
+
+    inotify 이벤트(또는 폴링으로 감지한 크기/수정 시각 변화)마다 콜백을 실행하되
+    min_interval보다 자주 실행하지 않는다 (녹음기가 10ms마다 써도 읽기는 묶어서).
+    """
+
+    kind = "watch"
+
+    def __init__(self, scheduler: "Scheduler", path: str, callback: Callable[[], None],
+                 min_interval: float, name: str):
+        super().__init__(scheduler, callback, name)
+        self.path = path
+        self.min_interval = min_interval
+        self.wd: Optional[int] = None
+        self._last_fire = 0.0
+        self._deferred = False
+        self._last_stat = None
+
+    def _notify(self) -> None:
+        """변경 알림 (min_interval 안이면 남은 시간 뒤로 미룸)"""
+        if self.cancelled:
+            return
+        with self._lock:
+            if self._deferred:
+                return
+            remaining = self._last_fire + self.min_interval - time.monotonic()
+            if remaining > 0:
+                self._deferred = True
+        if remaining > 0:
+            self.scheduler._wheel.add(remaining, self._fire_deferred)
+            return
+        self._last_fire = time.monotonic()
+        self._submit()
+
+    def _fire_deferred(self) -> None:
+        with self._lock:
+            self._deferred = False
+        self._notify()
+
+    def _poll(self) -> None:
+        """폴링 방식: 크기/수정 시각이 바뀌었으면 알림"""
+        try:
+            stat = os.stat(self.path)
+            current = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            current = None
+        if current != self._last_stat:
+            self._last_stat = current
+            self._notify()
+
+
+class _Timer:
+    """타이머 휠 항목"""
+
+    __slots__ = ("fire", "deadline", "interval", "owner", "rounds")
+
+    def __init__(self, fire: Callable[[], None], deadline: float, interval: Optional[float],
+                 owner: Optional[Handle]):
+        self.fire = fire
+        self.deadline = deadline
+        self.interval = interval
+        self.owner = owner
+        self.rounds = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.owner is not None and self.owner.cancelled
+
+
+class TimerWheel:
+    """
+    해시 타이머 휠 (스레드 하나가 모든 세션의 틱/폴링/지연 호출을 처리)
+
+    tick 해상도로 슬롯을 돌며 만료된 항목을 실행한다. 항목 실행은 가벼워야 하며
+    (Handle._submit은 작업자 풀로 넘기기만 함), 등록된 항목이 없으면 스레드는 잠든다.
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 512):
+        self.tick = tick
+        self.num_slots = slots
+        self._slots: List[List[_Timer]] = [[] for _ in range(slots)]
+        self._cursor = 0
+        self._cursor_time = time.monotonic()
+        self._count = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, delay: float, fire: Callable[[], None], interval: Optional[float] = None,
+            owner: Optional[Handle] = None) -> None:
+        """
+        delay초 뒤 fire 실행 (interval이 있으면 그 간격으로 반복, owner가 취소되면 중단)
+        """
+        timer = _Timer(fire, time.monotonic() + max(0.0, delay), interval, owner)
+        with self._cond:
+            self._insert(timer)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="gop-timer-wheel", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _insert(self, timer: _Timer) -> None:
+        if self._count == 0:
+            # 비어 있던 동안 지나간 시간은 건너뜀 (빈 슬롯을 몰아서 돌지 않음)
+            self._cursor_time = time.monotonic()
+        ticks = max(1, math.ceil((timer.deadline - self._cursor_time) / self.tick))
+        timer.rounds = (ticks - 1) // self.num_slots
+        self._slots[(self._cursor + ticks) % self.num_slots].append(timer)
+        self._count += 1
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._count == 0 and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+            delay = self._cursor_time + self.tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            due = self._advance(time.monotonic())
+            for timer in due:
+                telemetry.observe("scheduler_lag_seconds", max(0.0, time.monotonic() - timer.deadline))
+                try:
+                    timer.fire()
+                except Exception as e:
+                    logger.error(f"타이머 항목 실행 오류: {e}")
+            self._reschedule(due)
+
+    def _advance(self, now: float) -> List[_Timer]:
+        """현재 시각까지의 슬롯을 돌며 만료된 항목 수집"""
+        due = []
+        with self._cond:
+            while self._cursor_time + self.tick <= now:
+                self._cursor = (self._cursor + 1) % self.num_slots
+                self._cursor_time += self.tick
+                keep = []
+                for timer in self._slots[self._cursor]:
+                    if timer.cancelled:
+                        self._count -= 1
+                    elif timer.rounds > 0:
+                        timer.rounds -= 1
+                        keep.append(timer)
+                    else:
+                        self._count -= 1
+                        due.append(timer)
+                self._slots[self._cursor] = keep
+        return due
+
+    def _reschedule(self, due: List[_Timer]) -> None:
+        now = time.monotonic()
+        with self._cond:
+            for timer in due:
+                if timer.interval is None or timer.cancelled:
+                    continue
+                # 밀린 주기는 건너뛰고 다음 주기에 맞춤
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    timer.deadline += math.ceil((now - timer.deadline) / timer.interval) * timer.interval
+                self._insert(timer)
+
+
+class _Inotify:
+    """ctypes로 부르는 리눅스 inotify"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_IGNORED = 0x00008000
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_DELETE_SELF | IN_MOVE_SELF
+    GONE_MASK = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add(self, path: str) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(self.WATCH_MASK))
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def remove(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self) -> List[tuple]:
+        """대기 중인 이벤트 [(wd, mask), ...]"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+            offset = 0
+            while offset + self._EVENT.size <= len(data):
+                wd, mask, _, name_len = self._EVENT.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += self._EVENT.size + name_len
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Scheduler:
+    """
+    프로세스 전역 스케줄러: 타이머 휠 하나 + 파일 감시 리액터 하나 + CPU 코어 수만큼의 작업자 풀
+
+    세션마다 틱 스레드와 파일 폴링 스레드를 두는 대신 모든 세션이 이 스케줄러에 등록한다.
+    스레드 수는 세션 수와 무관하게 (휠 1 + 리액터 1 + 작업자 workers개)로 고정된다.
+    파일 감시는 리눅스에서 inotify를 쓰고, 쓸 수 없으면 타이머 휠에서 stat 폴링으로 대신한다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, tick: float = 0.01, slots: int = 512,
+                 use_inotify: Optional[bool] = None):
+        """
+        Args:
+            workers: 콜백 작업자 스레드 수 (기본: CPU 코어 수)
+            tick: 타이머 휠 해상도 (초)
+            slots: 타이머 휠 슬롯 수
+            use_inotify: 파일 감시에 inotify 사용 (None이면 가능할 때 사용, False면 항상 폴링)
+        """
+        self.workers = workers or os.cpu_count() or 4
+        self.tick = tick
+        self.slots = slots
+        self.use_inotify = use_inotify
+        self._reset()
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._wheel = TimerWheel(self.tick, self.slots)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._handles: Set[Handle] = set()
+        self._inotify: Optional[_Inotify] = None
+        self._inotify_failed = self.use_inotify is False
+        self._watches: Dict[int, Set[FileWatch]] = {}
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_fds: Optional[tuple] = None
+        self._reactor: Optional[threading.Thread] = None
+
+    def configure(self, workers: Optional[int] = None, use_inotify: Optional[bool] = None) -> None:
+        """작업자 수/감시 방식 변경 (이미 시작된 구성 요소에는 다음 재시작부터 적용)"""
+        if workers is not None:
+            self.workers = workers
+        if use_inotify is not None:
+            self.use_inotify = use_inotify
+            self._inotify_failed = use_inotify is False
+
+    @property
+    def backend(self) -> str:
+        """파일 감시 방식 ("inotify" 또는 "poll")"""
+        return "poll" if self._inotify_failed else "inotify"
+
+    # --- 등록 ---
+
+    def call_every(self, interval: float, callback: Callable[[], None], name: str = "timer",
+                   first_delay: Optional[float] = None) -> Handle:
+        """
+        interval초마다 callback 실행
+
+        Args:
+            interval: 실행 간격 (초)
+            callback: 작업자 풀에서 실행할 함수 (같은 핸들끼리는 겹치지 않음)
+            name: 로그용 이름
+            first_delay: 첫 실행까지 대기 (없으면 바로 실행)
+
+        Returns:
+            Handle: cancel()로 해제
+        """
+        handle = Handle(self, callback, name)
+        with self._lock:
+            self._handles.add(handle)
+        self._wheel.add(0.0 if first_delay is None else first_delay, handle._submit, interval, handle)
+        return handle
+
+    def watch_file(self, path: str, callback: Callable[[], None], min_interval: float = 0.03,
+                   name: str = "watch") -> FileWatch:
+        """
+        파일이 바뀔 때마다 callback 실행 (등록 직후 한 번 실행해 이미 쓰인 데이터도 처리)
+
+        Args:
+            path: 감시할 파일
+            callback: 작업자 풀에서 실행할 함수
+            min_interval: 콜백 최소 간격 (초, 폴링 방식에서는 폴링 간격)
+            name: 로그용 이름
+
+        Returns:
+            FileWatch: cancel()로 해제
+        """
+        watch = FileWatch(self, path, callback, min_interval, name)
+        with self._lock:
+            self._handles.add(watch)
+            inotify = self._ensure_reactor()
+            if inotify is not None:
+                try:
+                    watch.wd = inotify.add(path)
+                    self._watches.setdefault(watch.wd, set()).add(watch)
+                except OSError as e:
+                    logger.warning(f"inotify 감시 실패, 폴링으로 대체 ({path}): {e}")
+        if watch.wd is None:
+            self._poll(watch)
+        watch._notify()
+        return watch
+
+    def _poll(self, watch: FileWatch) -> None:
+        self._wheel.add(watch.min_interval, watch._poll, watch.min_interval, watch)
+
+    def _remove(self, handle: Handle) -> None:
+        with self._lock:
+            self._handles.discard(handle)
+            wd = getattr(handle, "wd", None)
+            if wd is None:
+                return
+            handle.wd = None
+            watchers = self._watches.get(wd)
+            if watchers is None:
+                return
+            watchers.discard(handle)
+            if not watchers:
+                del self._watches[wd]
+                # 같은 파일(inode)을 보는 다른 세션이 없을 때만 커널 감시 해제
+                if self._inotify is not None:
+                    self._inotify.remove(wd)
+
+    def _dispatch(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="gop-sched")
+            executor = self._executor
+        executor.submit(fn)
+
+    # --- inotify 리액터 ---
+
+    def _ensure_reactor(self) -> Optional[_Inotify]:
+        """inotify와 리액터 스레드 준비 (self._lock 보유 상태에서 호출, 쓸 수 없으면 None)"""
+        if self._inotify is not None or self._inotify_failed:
+            return self._inotify
+        try:
+            self._inotify = _Inotify()
+        except (OSError, AttributeError) as e:
+            logger.info(f"inotify를 쓸 수 없어 파일 감시를 폴링으로 합니다: {e}")
+            self._inotify_failed = True
+            return None
+        self._wake_fds = os.pipe()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._inotify.fd, selectors.EVENT_READ, "inotify")
+        self._selector.register(self._wake_fds[0], selectors.EVENT_READ, "wake")
+        self._reactor = threading.Thread(target=self._reactor_loop, name="gop-file-reactor", daemon=True)
+        self._reactor.start()
+        return self._inotify
+
+    def _reactor_loop(self) -> None:
+        while True:
+            for key, _ in self._selector.select():
+                if key.data == "wake":
+                    return
+                for wd, mask in self._inotify.read():
+                    with self._lock:
+                        watchers = list(self._watches.get(wd, ()))
+                    if mask & _Inotify.GONE_MASK:
+                        self._drop_wd(wd)
+                    for watch in watchers:
+                        if mask & _Inotify.GONE_MASK:
+                            # 파일이 지워지거나 옮겨지면 경로 기준 폴링으로 전환
+                            watch.wd = None
+                            self._poll(watch)
+                        watch._notify()
+
+    def _drop_wd(self, wd: int) -> None:
+        with self._lock:
+            if self._watches.pop(wd, None) is not None and self._inotify is not None:
+                self._inotify.remove(wd)
+
+    # --- 관리 ---
+
+    def stats(self) -> Dict[str, Any]:
+        """등록 현황과 스레드 수"""
+        with self._lock:
+            handles = list(self._handles)
+            workers = len(self._executor._threads) if self._executor is not None else 0
+        return {
+            "backend": self.backend,
+            "timers": sum(1 for h in handles if h.kind == "timer"),
+            "watches": sum(1 for h in handles if h.kind == "watch"),
+            "wheel_entries": len(self._wheel),
+            "threads": {
+                "wheel": int(self._wheel._thread is not None),
+                "reactor": int(self._reactor is not None),
+                "workers": workers,
+                "max_workers": self.workers
+            }
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """모든 등록 해제 후 스레드 종료 (이후 등록하면 다시 시작)"""
+        with self._lock:
+            handles = list(self._handles)
+        for handle in handles:
+            handle.cancelled = True
+            self._remove(handle)
+        self._wheel.stop()
+        if self._wake_fds is not None:
+            os.write(self._wake_fds[1], b"x")
+            if wait and self._reactor is not None:
+                self._reactor.join(timeout=1.0)
+            self._selector.close()
+            self._inotify.close()
+            for fd in self._wake_fds:
+                os.close(fd)
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        self._reset()
+
+    def _after_fork(self) -> None:
+        # fork된 자식에는 스레드가 따라오지 않으므로 부모의 등록을 버리고 새로 시작
+        self._reset()
+
+
+# 프로세스 전역 스케줄러 (스레드는 첫 등록 때 시작)
+scheduler = Scheduler()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=scheduler._after_fork)
+
+
+def get_scheduler() -> Scheduler:
+    """프로세스 전역 Scheduler 인스턴스 반환"""
+    return scheduler
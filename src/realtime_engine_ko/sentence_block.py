@@ -2,6 +2,17 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 import time
 
+def count_syllables(text: str) -> int:
+    """
+    한글 음절 수 (한글이 없으면 공백을 뺀 글자 수, 최소 1)
+    
+    Args:
+        text: 블록 텍스트
+    """
+    hangul = sum(1 for ch in text if "\uac00" <= ch <= "\ud7a3")
+    return max(1, hangul or len(text.replace(" ", "")))
+
+
 class BlockStatus(Enum):
     """블록의 상태를 나타내는 열거형"""
     PENDING = "pending"       # 아직 처리되지 않음
@@ -16,6 +27,7 @@ class SentenceBlock:
     def __init__(self, text: str, block_id: int):
         self.text = text
         self.block_id = block_id
+        self.syllables = count_syllables(text)
         self.status = BlockStatus.PENDING
         self.gop_score: Optional[float] = None
         self.confidence: Optional[float] = None
@@ -50,22 +62,41 @@ class SentenceBlock:
 class SentenceBlockManager:
     """문장 블록을 관리하는 클래스"""
     
-    def __init__(self, sentence: str, delimiter: str = " "):
+    def __init__(self, sentence: str, delimiter: str = " ", blocks: Optional[List[str]] = None):
         """
         문장을 받아 블록으로 분할하여 초기화
         
         Args:
             sentence: 분할할 전체 문장
             delimiter: 블록 분할 기준 (기본값: 공백)
+            blocks: 미리 분할된 블록 텍스트 (커리큘럼 팩)
         """
         self.blocks: List[SentenceBlock] = []
         self.active_block_id: int = 0
+        self.load_sentence(sentence, delimiter, blocks)
+    
+    def load_sentence(self, sentence: str, delimiter: str = " ",
+                      blocks: Optional[List[str]] = None) -> None:
+        """
+        새 문장으로 블록 구성 (관리자 객체 재사용 시 사용)
+        
+        Args:
+            sentence: 분할할 전체 문장
+            delimiter: 블록 분할 기준 (기본값: 공백)
+            blocks: 미리 분할된 블록 텍스트 (커리큘럼 팩, 주어지면 분할하지 않음)
+        """
+        self.sentence = sentence
+        self.blocks = []
+        self.active_block_id = 0
         
-        # 문장을 블록으로 분할
-        blocks_text = sentence.split(delimiter)
-        for i, block_text in enumerate(blocks_text):
-            if block_text.strip():  # 빈 블록 제외
-                self.blocks.append(SentenceBlock(block_text.strip(), i))
+        if blocks is not None:
+            self.blocks = [SentenceBlock(text, i) for i, text in enumerate(blocks)]
+        else:
+            # 문장을 블록으로 분할
+            blocks_text = sentence.split(delimiter)
+            for i, block_text in enumerate(blocks_text):
+                if block_text.strip():  # 빈 블록 제외
+                    self.blocks.append(SentenceBlock(block_text.strip(), i))
         
         # 첫 번째 블록은 기본적으로 ACTIVE 상태로 설정
         if self.blocks:
@@ -0,0 +1,547 @@
+"""
+로컬 스트리밍 평가 서버 (HTTP/1.1 chunked transfer)
+
+세션 하나 = 요청 하나. 클라이언트는 PCM을 chunked 본문으로 보내고, 서버는 같은 연결로
+점수 이벤트를 NDJSON chunked 응답으로 흘려보낸다.
+
+    POST /stream?sentence=<문장>[&model=<키>]
+    POST /stream?sentence_id=<커리큘럼 팩 문장 ID>[&model=<키>]
+        요청 본문: s16le 모노 16kHz PCM (Transfer-Encoding: chunked 또는 Content-Length)
+        응답: application/x-ndjson, 한 줄에 이벤트 하나
+            {"event": "started", "session_id": ...}
+            {"event": "score", "data": {...}}        청크마다 (on_score와 같은 내용)
+            {"event": "end", "data": {...}}          본문이 끝나면 최종 상태
+            {"event": "error", "reason": ...}        유휴 시간 초과, 드레인 등
+    GET /healthz    상태 및 활성 세션 수
+    GET /stats      세션/지연/메모리/모델 통계 (JSON)
+    GET /metrics    Prometheus 텍스트
+
+    PYTHONPATH=src python -m realtime_engine_ko.server --model models/model.onnx --tokenizer models/tokenizer.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from realtime_engine_ko.recognition_engine import EngineCoordinator, RecordListener
+from realtime_engine_ko.final_rescorer import FinalRescorer
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.session_pool import SessionComponentPool
+from realtime_engine_ko.model_registry import ModelRegistry, ModelSpec
+from realtime_engine_ko.curriculum_pack import load_pack
+from realtime_engine_ko.quantization import POLICIES
+from realtime_engine_ko.model_cascade import tracking_agreement
+from realtime_engine_ko.latency_accounting import latency_registry
+from realtime_engine_ko.memory_governor import memory_governor
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("StreamingServer")
+
+MAX_HEADER_BYTES = 64 * 1024
+SAMPLE_RATE = 16000
+
+# 프로세스 전역 상태를 바꾸는 코디네이터 옵션 (세션마다 넘기면 다른 세션 설정까지 바뀜)
+PROCESS_OPTIONS = ("memory_budget", "tracking_audit_rate", "final_rescoring", "final_latency_budget",
+                   "result_cache", "final_rescorer")
+
+
+class HttpError(Exception):
+    """요청을 거절할 때 (상태 코드와 메시지)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class StreamSession:
+    """스트리밍 세션 하나 (코디네이터 + 오디오 큐 + 이벤트 큐)"""
+
+    def __init__(self, session_id: str, coordinator: EngineCoordinator, max_pending_frames: int):
+        self.session_id = session_id
+        self.coordinator = coordinator
+        # 수신한 PCM 프레임 (가득 차면 소켓 읽기를 멈춰 TCP로 역압)
+        self.audio: "asyncio.Queue[Optional[Tuple[np.ndarray, float]]]" = asyncio.Queue(maxsize=max_pending_frames)
+        # 워커 스레드에서 나온 이벤트 (None이면 끝)
+        self.events: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        self.started_at = time.time()
+        self.last_activity = self.started_at
+        self.received_bytes = 0
+        # 드레인 시간 초과 시 취소할 요청 처리 태스크
+        self.task: Optional[asyncio.Task] = None
+
+
+class StreamingServer:
+    """
+    여러 스트리밍 세션을 공유 인식 엔진 위에서 처리하는 asyncio 서버
+
+    추론은 스레드 풀에서 실행하고 세션마다 한 번에 한 청크만 처리한다 (세션 내 순서 보장).
+    """
+
+    def __init__(
+        self,
+        recognition_engine: Optional[Wav2VecCTCOnnxCore] = None,
+        model_registry: Optional[ModelRegistry] = None,
+        default_model: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_sessions: int = 64,
+        workers: Optional[int] = None,
+        idle_timeout: float = 10.0,
+        max_pending_seconds: float = 4.0,
+        frame_seconds: float = 0.1,
+        coordinator_options: Optional[Dict[str, Any]] = None,
+        memory_budget: Optional[int] = None,
+        tracking_audit_rate: Optional[float] = None,
+        final_rescorer: Optional[FinalRescorer] = None
+    ):
+        """
+        Args:
+            recognition_engine: 모든 세션이 공유할 인식 엔진
+            model_registry: 모델 레지스트리 (주어지면 요청의 model 파라미터로 모델 선택)
+            default_model: 레지스트리 사용 시 기본 모델 키
+            host: 바인드 주소 (기본은 로컬만)
+            port: 포트 (0이면 임의 포트)
+            max_sessions: 동시 세션 상한 (넘으면 503)
+            workers: 추론 스레드 수 (없으면 CPU 코어 수)
+            idle_timeout: 오디오가 이 시간(초) 동안 오지 않으면 세션 종료
+            max_pending_seconds: 세션별로 처리 대기할 수 있는 최대 오디오 길이 (초)
+            frame_seconds: 처리 대기 큐의 프레임 단위 (초)
+            coordinator_options: 세션별 EngineCoordinator 옵션 (confidence_threshold 등).
+                프로세스 전역 설정(PROCESS_OPTIONS)은 넣을 수 없고 아래 인자로 한 번만 지정
+            memory_budget: 프로세스 전체 메모리 예산 (바이트, 없으면 기존 설정 유지)
+            tracking_audit_rate: 추적 모델 감사 비율 (없으면 기존 설정 유지)
+            final_rescorer: 모든 세션이 공유할 최종 재채점기 (없으면 최종 재채점 안 함)
+        """
+        if recognition_engine is None and model_registry is None:
+            raise ValueError("recognition_engine 또는 model_registry가 필요합니다")
+        process_options = sorted(set(coordinator_options or {}) & set(PROCESS_OPTIONS))
+        if process_options:
+            raise ValueError(f"프로세스 전역 옵션은 coordinator_options 대신 서버 인자로 지정하세요: {process_options}")
+        self.recognition_engine = recognition_engine
+        self.model_registry = model_registry
+        self.default_model = default_model
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.frame_bytes = max(2, int(frame_seconds * SAMPLE_RATE) * 2)
+        self.max_pending_frames = max(1, int(round(max_pending_seconds / frame_seconds)))
+        self.coordinator_options = dict(coordinator_options or {})
+        self.final_rescorer = final_rescorer
+        
+        # 프로세스 전역 설정은 서버 시작 시 한 번만
+        memory_governor.configure(budget_bytes=memory_budget)
+        tracking_agreement.configure(audit_rate=tracking_audit_rate)
+
+        self.executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 4,
+                                           thread_name_prefix="gop-infer")
+        self.component_pool: Optional[SessionComponentPool] = None
+        if recognition_engine is not None:
+            self.component_pool = SessionComponentPool(recognition_engine, max_idle=max_sessions)
+
+        self.sessions: Dict[str, StreamSession] = {}
+        self.draining = False
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._idle: Optional[asyncio.Event] = None
+
+        # 통계
+        self.accepted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    # --- 서버 수명 ---
+
+    async def start(self) -> int:
+        """리스닝 시작, 실제 포트 반환"""
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"스트리밍 서버 시작: http://{self.host}:{self.port}")
+        return self.port
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """
+        정상 종료: 새 세션을 거절하고 진행 중인 세션이 끝나길 기다린 뒤 닫음
+
+        Args:
+            timeout: 진행 중 세션을 기다릴 최대 시간 (초), 넘으면 남은 세션에 오류 이벤트를 보내고 끊음
+        """
+        self.draining = True
+        if self._server is not None:
+            self._server.close()
+        logger.info(f"드레인 시작: 활성 세션 {len(self.sessions)}개")
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"드레인 시간 초과: 세션 {len(self.sessions)}개 강제 종료")
+            for session in list(self.sessions.values()):
+                if session is None or session.task is None:
+                    continue
+                self._emit(session, {"event": "error", "reason": "server_shutdown"})
+                session.task.cancel()
+            try:
+                await asyncio.wait_for(self._idle.wait(), 5.0)
+            except asyncio.TimeoutError:
+                logger.warning("강제 종료한 세션 정리가 끝나지 않았습니다")
+        if self._server is not None:
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=True)
+        logger.info("스트리밍 서버 종료")
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, target, headers = await self._read_head(reader)
+            url = urlsplit(target)
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+            if url.path == "/stream":
+                if method != "POST":
+                    raise HttpError(405, "POST만 지원합니다")
+                await self._handle_stream(reader, writer, headers, query)
+            elif url.path == "/healthz" and method == "GET":
+                await self._send_json(writer, 200 if not self.draining else 503, {
+                    "status": "draining" if self.draining else "ok",
+                    "sessions": len(self.sessions)
+                })
+            elif url.path == "/stats" and method == "GET":
+                await self._send_json(writer, 200, self.get_stats())
+            elif url.path == "/metrics" and method == "GET":
+                await self._send(writer, 200, telemetry.to_prometheus().encode(),
+                                 "text/plain; version=0.0.4")
+            else:
+                raise HttpError(404, f"알 수 없는 경로: {url.path}")
+        except HttpError as e:
+            await self._send_json(writer, e.status, {"error": e.message})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"요청 처리 오류: {e}")
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+        """요청 줄과 헤더 읽기"""
+        try:
+            raw = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "헤더가 너무 큽니다")
+        if len(raw) > MAX_HEADER_BYTES:
+            raise HttpError(413, "헤더가 너무 큽니다")
+        lines = raw.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "잘못된 요청 줄")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), target, headers
+
+    @staticmethod
+    async def _body_chunks(reader: asyncio.StreamReader, headers: Dict[str, str]):
+        """요청 본문을 도착하는 대로 내어줌 (chunked 또는 Content-Length)"""
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size_line = await reader.readline()
+                if not size_line:
+                    raise asyncio.IncompleteReadError(b"", None)
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # 트레일러 무시
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)
+                yield data
+        else:
+            remaining = int(headers.get("content-length", "0"))
+            while remaining > 0:
+                data = await reader.read(min(remaining, 64 * 1024))
+                if not data:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                remaining -= len(data)
+                yield data
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str) -> None:
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+            .encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]) -> None:
+        await self._send(writer, status, json.dumps(payload, ensure_ascii=False).encode(), "application/json")
+
+    # --- 스트리밍 세션 ---
+
+    def _create_coordinator(self, model_key: Optional[str]) -> EngineCoordinator:
+        options = dict(self.coordinator_options)
+        options.setdefault("warmup", False)
+        options["final_rescorer"] = self.final_rescorer
+        if self.model_registry is not None:
+            return EngineCoordinator(model_registry=self.model_registry,
+                                     model_key=model_key or self.default_model, **options)
+        return EngineCoordinator(recognition_engine=self.recognition_engine,
+                                 component_pool=self.component_pool, **options)
+
+    def _emit(self, session: StreamSession, event: Dict[str, Any]) -> None:
+        session.events.put_nowait((json.dumps(event, ensure_ascii=False, default=str) + "\n").encode())
+
+    async def _handle_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                             headers: Dict[str, str], query: Dict[str, str]) -> None:
+        sentence = query.get("sentence", "").strip()
+        sentence_id = query.get("sentence_id") or None
+        if not sentence and not sentence_id:
+            raise HttpError(400, "sentence 또는 sentence_id 파라미터가 필요합니다")
+        pack = self.coordinator_options.get("curriculum_pack")
+        if sentence_id and (pack is None or sentence_id not in pack):
+            raise HttpError(404, f"알 수 없는 sentence_id: {sentence_id}")
+        if self.draining:
+            self.rejected += 1
+            raise HttpError(503, "서버가 종료 중입니다")
+        if len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            raise HttpError(503, f"동시 세션 상한({self.max_sessions})에 도달했습니다")
+
+        loop = asyncio.get_running_loop()
+        session_id = uuid.uuid4().hex
+        # 슬롯을 먼저 잡고 (await 사이에 상한을 넘지 않도록) 초기화는 스레드 풀에서
+        self.sessions[session_id] = None
+        self._idle.clear()
+        try:
+            coordinator = await loop.run_in_executor(self.executor, self._create_coordinator, query.get("model"))
+            session = StreamSession(session_id, coordinator, self.max_pending_frames)
+
+            def on_score(result_json: str) -> None:
+                data = f'{{"event": "score", "session_id": "{session_id}", "data": {result_json}}}\n'
+                loop.call_soon_threadsafe(session.events.put_nowait, data.encode())
+
+            coordinator.set_record_listener(RecordListener(on_score=on_score))
+            ok = await loop.run_in_executor(
+                self.executor, lambda: coordinator.initialize(sentence or None, sentence_id=sentence_id)
+            )
+            if not ok or not coordinator.start_stream(tick=False):
+                await loop.run_in_executor(self.executor, coordinator.close)
+                raise HttpError(400, "세션 초기화 실패")
+            session.task = asyncio.current_task()
+            self.sessions[session_id] = session
+        except BaseException:
+            self.sessions.pop(session_id, None)
+            if not self.sessions:
+                self._idle.set()
+            raise
+
+        self.accepted += 1
+        telemetry.inc("stream_sessions_total")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n"
+                     + f"X-Session-Id: {session_id}\r\n\r\n".encode("latin-1"))
+        self._emit(session, {"event": "started", "session_id": session_id})
+
+        sender = asyncio.ensure_future(self._send_events(session, writer))
+        scorer = asyncio.ensure_future(self._score_loop(session))
+        try:
+            await self._receive_audio(session, reader, headers)
+        finally:
+            # 수신이 끝났거나 끊겼으면 남은 프레임을 채점하고 최종 상태 전송
+            await session.audio.put(None)
+            await scorer
+            session.events.put_nowait(None)
+            await sender
+            await loop.run_in_executor(self.executor, session.coordinator.close)
+            self.sessions.pop(session_id, None)
+            if not self.sessions:
+                self._idle.set()
+
+    async def _receive_audio(self, session: StreamSession, reader: asyncio.StreamReader,
+                             headers: Dict[str, str]) -> None:
+        """PCM 수신 -> frame_bytes 단위로 큐에 넣음 (큐가 차면 대기 = 역압)"""
+        pending = b""
+        chunks = self._body_chunks(reader, headers).__aiter__()
+        while True:
+            try:
+                data = await asyncio.wait_for(chunks.__anext__(), self.idle_timeout)
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                telemetry.inc("stream_idle_timeouts_total")
+                self._emit(session, {"event": "error", "reason": "idle_timeout"})
+                logger.info(f"세션 {session.session_id} 유휴 시간 초과")
+                return
+            except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                self._emit(session, {"event": "error", "reason": "bad_body"})
+                return
+            now = time.time()
+            session.last_activity = now
+            session.received_bytes += len(data)
+            pending += data
+            while len(pending) >= self.frame_bytes:
+                frame, pending = pending[:self.frame_bytes], pending[self.frame_bytes:]
+                await session.audio.put((self._to_float(frame), now))
+        # 홀수 바이트는 버림
+        usable = len(pending) - len(pending) % 2
+        if usable:
+            await session.audio.put((self._to_float(pending[:usable]), time.time()))
+
+    @staticmethod
+    def _to_float(pcm: bytes) -> np.ndarray:
+        return np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+
+    async def _score_loop(self, session: StreamSession) -> None:
+        """세션 프레임을 순서대로 스레드 풀에 넘겨 채점 (세션 안에서는 한 번에 하나)"""
+        loop = asyncio.get_running_loop()
+        coordinator = session.coordinator
+        while True:
+            item = await session.audio.get()
+            if item is None:
+                break
+            samples, ingest_time = item
+            # 큐에 쌓인 프레임은 한 번에 넘겨 스레드 전환을 줄임
+            batch = [samples]
+            while not session.audio.empty():
+                nxt = session.audio.get_nowait()
+                if nxt is None:
+                    session.audio.put_nowait(None)
+                    break
+                batch.append(nxt[0])
+                ingest_time = nxt[1]
+            await loop.run_in_executor(self.executor, coordinator.push_audio,
+                                       np.concatenate(batch) if len(batch) > 1 else samples, ingest_time)
+        result = await loop.run_in_executor(self.executor, coordinator.end_stream)
+        self._emit(session, {"event": "end", "session_id": session.session_id, "data": result})
+
+    async def _send_events(self, session: StreamSession, writer: asyncio.StreamWriter) -> None:
+        """이벤트를 chunked 응답으로 전송 (클라이언트가 느리면 drain에서 대기)"""
+        connected = True
+        while True:
+            data = await session.events.get()
+            if data is None:
+                break
+            if not connected:
+                continue
+            try:
+                writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                await writer.drain()
+            except (ConnectionError, OSError):
+                connected = False
+        if connected:
+            try:
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+            except (ConnectionError, OSError):
+                pass
+
+    # --- 조회 ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        sessions = [s for s in self.sessions.values() if s is not None]
+        stats = {
+            "sessions": {
+                "active": len(self.sessions),
+                "max": self.max_sessions,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "idle_timeouts": self.timed_out,
+                "pending_frames": sum(s.audio.qsize() for s in sessions),
+                "oldest_seconds": round(max((now - s.started_at for s in sessions), default=0.0), 3)
+            },
+            "draining": self.draining,
+            "latency": latency_registry.aggregate(),
+            "memory": memory_governor.snapshot()
+        }
+        if self.model_registry is not None:
+            stats["models"] = self.model_registry.snapshot()
+        if self.final_rescorer is not None and self.final_rescorer.result_cache is not None:
+            stats["result_cache"] = self.final_rescorer.result_cache.stats()
+        if self.coordinator_options.get("tracking_engine") is not None:
+            stats["tracking"] = tracking_agreement.summary()
+        return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로컬 스트리밍 발음 평가 서버")
+    parser.add_argument("--model", required=True, help="ONNX 모델 경로")
+    parser.add_argument("--tokenizer", required=True, help="tokenizer.json 경로")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-sessions", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None, help="추론 스레드 수 (기본: CPU 코어 수)")
+    parser.add_argument("--idle-timeout", type=float, default=10.0)
+    parser.add_argument("--max-pending-seconds", type=float, default=4.0)
+    parser.add_argument("--backend", default="python-dtw", help="DTW 정렬 백엔드")
+    parser.add_argument("--confidence-threshold", type=float, default=30.0)
+    parser.add_argument("--drain-timeout", type=float, default=30.0)
+    parser.add_argument("--pack", default=None, help="커리큘럼 팩 경로 (sentence_id 요청 허용)")
+    parser.add_argument("--tracking-model", default=None, help="블록 추적용 작은 ONNX 모델 (같은 어휘)")
+    parser.add_argument("--tracking-audit-rate", type=float, default=0.0,
+                        help="채점 모델로도 블록을 골라 비교할 청크 비율")
+    parser.add_argument("--precision", default=None, choices=POLICIES,
+                        help="정밀도 변형 정책 (quantization build로 만든 변형 중 선택)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    engine, tracking_engine = ModelSpec(args.model, args.tokenizer, alignment_backend=args.backend,
+                                        tracking_model_path=args.tracking_model,
+                                        precision=args.precision).load_engines()
+    server = StreamingServer(
+        recognition_engine=engine,
+        host=args.host,
+        port=args.port,
+        max_sessions=args.max_sessions,
+        workers=args.workers,
+        idle_timeout=args.idle_timeout,
+        max_pending_seconds=args.max_pending_seconds,
+        coordinator_options={
+            "confidence_threshold": args.confidence_threshold,
+            "curriculum_pack": load_pack(args.pack) if args.pack else None,
+            "tracking_engine": tracking_engine
+        },
+        tracking_audit_rate=args.tracking_audit_rate
+    )
+
+    async def run() -> None:
+        await server.start()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass
+        await stop.wait()
+        await server.drain(args.drain_timeout)
+
+    asyncio.run(run())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,190 @@
+import threading
+import logging
+from typing import List, Optional
+
+from realtime_engine_ko.sentence_block import SentenceBlockManager
+from realtime_engine_ko.progress_tracker import ProgressTracker
+from realtime_engine_ko.audio_processor import AudioProcessor
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+from realtime_engine_ko.eval_manager import EvaluationController
+from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+from realtime_engine_ko.curriculum_pack import PackedSentence
+from realtime_engine_ko.telemetry import telemetry
+
+logger = logging.getLogger("SessionPool")
+
+
+class SessionComponents:
+    """한 평가 세션이 사용하는 컴포넌트 묶음"""
+
+    def __init__(
+        self,
+        sentence_manager: SentenceBlockManager,
+        progress_tracker: ProgressTracker,
+        audio_processor: AudioProcessor,
+        eval_controller: EvaluationController,
+        timeline: Optional[PosteriorTimeline] = None
+    ):
+        self.sentence_manager = sentence_manager
+        self.progress_tracker = progress_tracker
+        self.audio_processor = audio_processor
+        self.eval_controller = eval_controller
+        self.timeline = timeline
+
+
+class SessionComponentPool:
+    """
+    세션 컴포넌트 재사용 풀
+
+    문장마다 SentenceBlockManager / ProgressTracker / AudioProcessor / EvaluationController를
+    새로 만드는 대신, 반납된 묶음을 초기화해서 다시 내어준다.
+    """
+
+    def __init__(
+        self,
+        recognition_engine: Wav2VecCTCOnnxCore,
+        max_idle: int = 4,
+        sample_rate: int = 16000
+    ):
+        """
+        풀 초기화
+
+        Args:
+            recognition_engine: 모든 세션이 공유하는 인식 엔진
+            max_idle: 보관할 유휴 묶음 최대 개수
+            sample_rate: 오디오 샘플링 레이트 (Hz)
+        """
+        self.recognition_engine = recognition_engine
+        self.max_idle = max_idle
+        self.sample_rate = sample_rate
+
+        self._idle: List[SessionComponents] = []
+        self._lock = threading.Lock()
+
+        # 통계
+        self.created = 0
+        self.reused = 0
+
+    def acquire(
+        self,
+        sentence: str,
+        chunk_duration: float = 2.0,
+        polling_interval: float = 0.03,
+        confidence_threshold: float = 0.7,
+        subsequence_threshold: float = 20.0,
+        min_time_between_evals: float = 0.5,
+        keep_recording: bool = False,
+        timeline_duration: float = 120.0,
+        timeline_ram_budget: int = 64 * 1024 * 1024,
+        packed: Optional[PackedSentence] = None,
+        crop_padding: Optional[float] = 0.2
+    ) -> SessionComponents:
+        """
+        문장에 맞게 구성된 컴포넌트 묶음 반환 (유휴 묶음이 있으면 재사용)
+
+        Args:
+            sentence: 평가할 문장
+            chunk_duration: 청크 길이 (초)
+            polling_interval: 파일 변경 확인 간격 (초)
+            confidence_threshold: 인식 신뢰도 임계값
+            subsequence_threshold: "subsequence" 블록 정렬에서 쓰는 인식 임계값 (절대 점수 척도)
+            min_time_between_evals: 블록 간 최소 평가 간격 (초)
+            keep_recording: 전체 녹음 보관 여부
+            timeline_duration: 타임라인 보관 길이 (초, 0이면 보관 안 함)
+            timeline_ram_budget: 타임라인 RAM 예산 (바이트)
+            packed: 커리큘럼 팩 문장 (블록 분할과 토큰을 팩에서 가져옴)
+            crop_padding: 청크 앞뒤 무음을 자를 때 남길 여유 (초, None이면 자르지 않음)
+
+        Returns:
+            SessionComponents: 초기화된 컴포넌트 묶음
+        """
+        with self._lock:
+            components = self._idle.pop() if self._idle else None
+
+        if components is None:
+            self.created += 1
+            telemetry.inc("cache_misses_total", labels={"cache": "session_pool"})
+            sentence_manager = SentenceBlockManager(sentence, blocks=packed.blocks if packed else None)
+            progress_tracker = ProgressTracker(
+                total_blocks=len(sentence_manager.blocks),
+                window_size=3,
+                time_based_advance=True,
+                block_syllables=[block.syllables for block in sentence_manager.blocks]
+            )
+            audio_processor = AudioProcessor(
+                sample_rate=self.sample_rate,
+                chunk_duration=chunk_duration,
+                polling_interval=polling_interval,
+                keep_recording=keep_recording,
+                crop_padding=crop_padding
+            )
+            eval_controller = EvaluationController(
+                recognition_engine=self.recognition_engine,
+                sentence_manager=sentence_manager,
+                progress_tracker=progress_tracker,
+                confidence_threshold=confidence_threshold,
+                subsequence_threshold=subsequence_threshold,
+                min_time_between_evals=min_time_between_evals
+            )
+            components = SessionComponents(sentence_manager, progress_tracker, audio_processor, eval_controller)
+        else:
+            self.reused += 1
+            telemetry.inc("cache_hits_total", labels={"cache": "session_pool"})
+            components.sentence_manager.load_sentence(sentence, blocks=packed.blocks if packed else None)
+            components.progress_tracker.configure(
+                len(components.sentence_manager.blocks),
+                block_syllables=[block.syllables for block in components.sentence_manager.blocks]
+            )
+            components.audio_processor.chunk_duration = chunk_duration
+            components.audio_processor.polling_interval = polling_interval
+            components.audio_processor.keep_recording = keep_recording
+            components.audio_processor.crop_padding = crop_padding
+            components.eval_controller.confidence_threshold = confidence_threshold
+            components.eval_controller.subsequence_threshold = subsequence_threshold
+            components.eval_controller.min_time_between_evals = min_time_between_evals
+
+        # 타임라인은 설정이 같으면 비워서 재사용
+        timeline = components.timeline
+        if timeline_duration <= 0:
+            timeline = None
+        elif (timeline is None or timeline.max_duration != timeline_duration
+                or timeline.ram_budget_bytes != timeline_ram_budget):
+            timeline = PosteriorTimeline(max_duration=timeline_duration, ram_budget_bytes=timeline_ram_budget)
+        components.timeline = timeline
+        components.eval_controller.timeline = timeline
+        components.eval_controller.packed = packed
+
+        return components
+
+    def release(self, components: SessionComponents) -> None:
+        """
+        사용이 끝난 묶음을 초기화하여 풀에 반납
+
+        Args:
+            components: 반납할 컴포넌트 묶음
+        """
+        components.audio_processor.reset()
+        components.audio_processor.chunk_callbacks = []
+        components.eval_controller.reset()
+        components.eval_controller.memory = None
+        components.eval_controller.packed = None
+        components.progress_tracker.reset()
+        components.sentence_manager.reset()
+        if components.timeline:
+            components.timeline.clear()
+            components.timeline.keep_hidden = True
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(components)
+
+    def clear(self) -> None:
+        """유휴 묶음 모두 버림 (모델을 내릴 때)"""
+        with self._lock:
+            self._idle.clear()
+
+    def get_stats(self) -> dict:
+        """풀 사용 통계"""
+        with self._lock:
+            idle = len(self._idle)
+        return {"created": self.created, "reused": self.reused, "idle": idle}
@@ -0,0 +1,218 @@
+import os
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, Any, Callable, List, Optional
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+from onnx import numpy_helper
+from tokenizers import Tokenizer
+
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore, extract_prototype_matrix
+
+logger = logging.getLogger("SharedModel")
+
+
+def external_data_path(onnx_model_path: str) -> str:
+    """외부 데이터 형식으로 변환한 모델 경로 (원본 옆)"""
+    base, _ = os.path.splitext(onnx_model_path)
+    return f"{base}.external.onnx"
+
+
+def export_external_data(onnx_model_path: str, size_threshold: int = 1024) -> str:
+    """
+    가중치를 별도 파일(.onnx.data)로 뺀 모델을 원본 옆에 만든다 (원본이 바뀌지 않았으면 재사용)
+
+    Args:
+        onnx_model_path: 원본 ONNX 모델 경로
+        size_threshold: 이 크기(바이트) 이상의 초기값만 외부 파일로 저장
+
+    Returns:
+        str: 외부 데이터 형식 모델 경로
+    """
+    out_path = external_data_path(onnx_model_path)
+    data_name = os.path.basename(out_path) + ".data"
+    data_path = os.path.join(os.path.dirname(out_path), data_name)
+    if (os.path.exists(out_path) and os.path.exists(data_path)
+            and os.path.getmtime(out_path) >= os.path.getmtime(onnx_model_path)):
+        return out_path
+
+    model = onnx.load(onnx_model_path)
+    onnx.save_model(model, out_path, save_as_external_data=True, all_tensors_to_one_file=True,
+                    location=data_name, size_threshold=size_threshold)
+    logger.info(f"외부 데이터 형식 모델 저장: {out_path}")
+    return out_path
+
+
+def _map_external_initializers(graph: onnx.GraphProto, model_dir: str) -> Dict[str, np.ndarray]:
+    """외부 데이터 초기값을 읽기 전용 memmap으로 연결 (파일 페이지는 모든 프로세스가 공유)"""
+    arrays: Dict[str, np.ndarray] = {}
+    for init in graph.initializer:
+        if init.data_location != onnx.TensorProto.EXTERNAL:
+            continue
+        info = {entry.key: entry.value for entry in init.external_data}
+        dtype = onnx.helper.tensor_dtype_to_np_dtype(init.data_type)
+        arrays[init.name] = np.memmap(
+            os.path.join(model_dir, info["location"]),
+            dtype=dtype,
+            mode="r",
+            offset=int(info.get("offset", 0)),
+            shape=tuple(init.dims)
+        )
+    return arrays
+
+
+def process_memory(pid: Optional[int] = None) -> Optional[Dict[str, int]]:
+    """
+    프로세스 메모리 (Linux /proc/<pid>/smaps_rollup, 바이트)
+
+    rss는 공유 페이지를 프로세스마다 모두 세고, pss는 공유 페이지를 공유하는 프로세스 수로 나눠 센다.
+    워커들의 pss 합이 실제 사용량에 가깝다.
+    """
+    path = f"/proc/{pid or os.getpid()}/smaps_rollup"
+    try:
+        with open(path) as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    fields = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared_clean", "Private_Dirty": "private_dirty"}
+    result = {}
+    for line in lines:
+        parts = line.split()
+        if parts and parts[0].rstrip(":") in fields:
+            result[fields[parts[0].rstrip(":")]] = int(parts[1]) * 1024
+    return result
+
+
+class SharedModel:
+    """
+    부모 프로세스에서 한 번 로드해 fork한 워커들과 복사 없이 공유하는 모델
+
+    - ORT 가중치: 외부 데이터 파일을 읽기 전용 memmap으로 열어 세션에 외부 초기값으로 넘김 (파일 페이지 공유)
+    - prototype 행렬: 공유 메모리 세그먼트에 한 번 기록
+    - 토크나이저: 부모에서 로드 (fork 후 copy-on-write)
+
+    ORT 세션 자체는 스레드 풀이 fork를 견디지 못하므로 워커마다 create_engine()으로 만든다.
+    가중치는 memmap을 그대로 가리키므로 세션을 만들어도 가중치 사본은 생기지 않는다.
+    """
+
+    def __init__(self, onnx_model_path: str, tokenizer_path: str):
+        """
+        Args:
+            onnx_model_path: 원본 ONNX 모델 경로 (외부 데이터 형식 사본은 옆에 자동 생성)
+            tokenizer_path: tokenizer.json 경로
+        """
+        self.onnx_model_path = onnx_model_path
+        self.tokenizer_path = tokenizer_path
+
+        self.external_path = export_external_data(onnx_model_path)
+        # 가중치 없이 그래프만 파싱
+        model = onnx.load(self.external_path, load_external_data=False)
+        self.graph = model.graph
+        self.model_bytes = model.SerializeToString()
+        self.initializers = _map_external_initializers(self.graph, os.path.dirname(self.external_path))
+        # OrtValue는 memmap을 가리키기만 하므로 세션들보다 오래 살아 있어야 함
+        self._ort_names = list(self.initializers)
+        self._ort_values = [ort.OrtValue.ortvalue_from_numpy(self.initializers[name]) for name in self._ort_names]
+
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+
+        proto = self._build_prototype_matrix()
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, proto.nbytes))
+        self.prototype_matrix = np.ndarray(proto.shape, dtype=np.float32, buffer=self._shm.buf)
+        self.prototype_matrix[...] = proto
+        self.prototype_matrix.flags.writeable = False
+        self._owner_pid = os.getpid()
+
+        logger.info(f"공유 모델 준비: {len(self.initializers)}개 외부 초기값 "
+                    f"({sum(a.nbytes for a in self.initializers.values()) / 1e6:.1f}MB memmap), "
+                    f"prototype {proto.shape} 공유 메모리 '{self._shm.name}'")
+
+    def _build_prototype_matrix(self) -> np.ndarray:
+        """출력 shape에서 D, V를 읽고 lm_head 가중치를 찾아 float32 (V, D)로"""
+        # 부모에서는 ORT 세션을 만들지 않음 (출력 순서는 세션과 같음: hidden, logits)
+        if len(self.graph.output) < 2:
+            raise RuntimeError("Could not determine hidden_dim or vocab_size from model outputs.")
+        hidden_dim = self.graph.output[0].type.tensor_type.shape.dim[2].dim_value
+        vocab_size = self.graph.output[1].type.tensor_type.shape.dim[2].dim_value
+
+        by_name = {init.name: init for init in self.graph.initializer}
+
+        def load(name: str) -> np.ndarray:
+            if name in self.initializers:
+                return np.asarray(self.initializers[name])
+            return numpy_helper.to_array(by_name[name])
+
+        proto = extract_prototype_matrix(
+            {name: tuple(init.dims) for name, init in by_name.items()}, load, hidden_dim, vocab_size
+        )
+        return np.ascontiguousarray(proto, dtype=np.float32)
+
+    def _session_options(self) -> "ort.SessionOptions":
+        options = ort.SessionOptions()
+        # 가중치를 재배치(prepack)하면 워커마다 사본이 생기므로 끔
+        # (양자화된 lm_head의 DequantizeLinear+MatMul 융합도 빠지므로 logits가 기본 세션과 양자화 오차만큼 다를 수 있음)
+        options.add_session_config_entry("session.disable_prepacking", "1")
+        options.add_external_initializers(self._ort_names, self._ort_values)
+        return options
+
+    def create_session(self, providers: List[str]) -> "ort.InferenceSession":
+        """memmap 가중치를 그대로 쓰는 ORT 세션 생성"""
+        return ort.InferenceSession(self.model_bytes, sess_options=self._session_options(), providers=providers)
+
+    def create_engine(self, **kwargs) -> Wav2VecCTCOnnxCore:
+        """
+        이 공유 모델을 쓰는 인식 엔진 생성 (워커 프로세스에서 호출)
+
+        Args:
+            **kwargs: Wav2VecCTCOnnxCore 옵션 (device, alignment_backend, low_res_dim, ...)
+        """
+        return Wav2VecCTCOnnxCore(shared_model=self, **kwargs)
+
+    def close(self) -> None:
+        """공유 메모리 해제 (세그먼트 삭제는 만든 프로세스에서만)"""
+        self.prototype_matrix = None
+        try:
+            self._shm.close()
+        except BufferError:
+            logger.warning("prototype 행렬을 참조하는 배열이 남아 있어 공유 메모리를 닫지 못했습니다")
+            return
+        if os.getpid() == self._owner_pid:
+            self._shm.unlink()
+
+
+def _worker_main(shared: SharedModel, target: Callable, index: int, engine_kwargs: Dict[str, Any]) -> None:
+    engine = shared.create_engine(**engine_kwargs)
+    target(engine, index)
+
+
+def start_workers(
+    shared: SharedModel,
+    target: Callable[[Wav2VecCTCOnnxCore, int], None],
+    num_workers: int,
+    **engine_kwargs
+) -> List[multiprocessing.Process]:
+    """
+    공유 모델을 쓰는 워커 프로세스를 fork로 시작
+
+    Args:
+        shared: 부모에서 준비한 공유 모델
+        target: 워커 본문 target(engine, worker_index)
+        num_workers: 워커 수
+        **engine_kwargs: 워커별 엔진 옵션
+
+    Returns:
+        List[multiprocessing.Process]: 시작된 워커 (join은 호출자가)
+    """
+    # spawn은 인자를 pickle로 복사하므로 공유가 깨짐
+    context = multiprocessing.get_context("fork")
+    workers = []
+    for index in range(num_workers):
+        process = context.Process(target=_worker_main, args=(shared, target, index, engine_kwargs),
+                                  name=f"gop-worker-{index}", daemon=True)
+        process.start()
+        workers.append(process)
+    logger.info(f"워커 {num_workers}개 시작 (공유 모델: {os.path.basename(shared.onnx_model_path)})")
+    return workers
@@ -0,0 +1,247 @@
+import json
+import random
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger("Telemetry")
+
+# 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus 형식)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        cumulative, running = {}, 0
+        for bound, c in zip(list(self.buckets) + ["+Inf"], self.counts):
+            running += c
+            cumulative[str(bound)] = running
+        return {"count": self.count, "sum": self.total, "buckets": cumulative}
+
+
+class _NoopSpan:
+    """샘플링되지 않은 구간용 빈 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """구간 시간을 측정해 `<name>_seconds` 히스토그램에 기록"""
+
+    __slots__ = ("telemetry", "name", "labels", "started")
+
+    def __init__(self, telemetry: "Telemetry", name: str, labels: Optional[Dict[str, str]]):
+        self.telemetry = telemetry
+        self.name = name
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.telemetry.observe(f"{self.name}_seconds", time.perf_counter() - self.started, self.labels)
+        return False
+
+
+class Telemetry:
+    """
+    핫패스 계측 레이어
+
+    - span(): 단계별 소요 시간 (샘플링, 샘플되지 않으면 비용이 거의 없음)
+    - inc(): 카운터 (청크, 인코더 실행, 캐시 적중, 버려진 윈도우 등)
+    - observe(): 히스토그램
+    스냅샷(dict) 또는 로컬 HTTP 포트의 Prometheus 텍스트로 내보낸다.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, namespace: str = "gop_engine"):
+        """
+        Args:
+            sample_rate: span을 기록할 확률 (0이면 span 기록 안 함, 1이면 전부 기록)
+            namespace: 메트릭 이름 접두어
+        """
+        self.sample_rate = sample_rate
+        self.namespace = namespace
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+    def configure(self, sample_rate: Optional[float] = None) -> None:
+        """샘플링 비율 변경"""
+        if sample_rate is not None:
+            self.sample_rate = max(0.0, min(1.0, sample_rate))
+
+    # --- 기록 ---
+
+    def span(self, name: str, labels: Optional[Dict[str, str]] = None):
+        """
+        단계 소요 시간 측정 컨텍스트
+
+        Args:
+            name: 단계 이름 (`<name>_seconds` 히스토그램으로 기록)
+            labels: 선택 레이블
+        """
+        if self.sample_rate <= 0.0 or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            return _NOOP_SPAN
+        return _Span(self, name, labels)
+
+    def inc(self, name: str, value: float = 1, labels: Optional[Dict[str, str]] = None) -> None:
+        """카운터 증가"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        """히스토그램에 값 기록"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram()
+            hist.observe(value)
+
+    # --- 내보내기 ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 메트릭의 프로세스 내 스냅샷"""
+        with self._lock:
+            counters = {
+                name: {_format_labels(k) or "": v for k, v in series.items()}
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: {_format_labels(k) or "": h.to_dict() for k, h in series.items()}
+                for name, series in self._histograms.items()
+            }
+        return {"sample_rate": self.sample_rate, "counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in series.items():
+                    lines.append(f"{metric}{_format_labels(key)} {value}")
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, hist in series.items():
+                    running = 0
+                    for bound, c in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+                        running += c
+                        lines.append(f"{metric}_bucket{_format_labels(key, ('le', str(bound)))} {running}")
+                    lines.append(f"{metric}_sum{_format_labels(key)} {hist.total}")
+                    lines.append(f"{metric}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 메트릭 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def start_http_server(self, port: int = 9464, host: str = "127.0.0.1") -> int:
+        """
+        로컬 메트릭 엔드포인트 시작 (GET /metrics: Prometheus, GET /snapshot: JSON)
+
+        Args:
+            port: 포트 (0이면 임의 포트)
+            host: 바인딩 주소 (기본값은 로컬 전용)
+
+        Returns:
+            int: 실제 바인딩된 포트
+        """
+        if self._server is not None:
+            return self._server.server_address[1]
+
+        telemetry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/metrics"):
+                    body = telemetry.to_prometheus().encode("utf-8")
+                    content_type = "text/plain; version=0.0.4"
+                elif self.path.startswith("/snapshot"):
+                    body = json.dumps(telemetry.snapshot()).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server_thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._server_thread.start()
+        bound_port = self._server.server_address[1]
+        logger.info(f"메트릭 엔드포인트 시작: http://{host}:{bound_port}/metrics")
+        return bound_port
+
+    def stop_http_server(self) -> None:
+        """메트릭 엔드포인트 중지"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._server_thread = None
+
+
+# 프로세스 전역 계측 인스턴스
+telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """프로세스 전역 Telemetry 인스턴스 반환"""
+    return telemetry
@@ -2,19 +2,98 @@ import numpy as np
 import soundfile as sf
 import onnx
 import onnxruntime as ort
-from onnx import numpy_helper
+from onnx import numpy_helper, helper
 from tokenizers import Tokenizer
-from collections import defaultdict
 import logging
 import torch
-from dtw import dtw
 import math
+import time
+import threading
+from typing import Optional, Tuple, Dict, Callable
+
+from realtime_engine_ko.telemetry import telemetry
+from realtime_engine_ko.alignment_backends import create_backend, band_window
+from realtime_engine_ko.low_res_alignment import LowResAligner, expand_pooled_path
+from realtime_engine_ko.quantization import resolve_variant
 
-# Configure logging for debugging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+def extract_prototype_matrix(
+    shapes: Dict[str, Tuple[int, ...]],
+    load: Callable[[str], np.ndarray],
+    hidden_dim: int,
+    vocab_size: int
+) -> np.ndarray:
+    """
+    Find the lm_head weight among the initializers and return it as (vocab_size, hidden_dim).
+
+    Prefers a quantized weight (`*_quantized` + `_scale` + `_zero_point`, per-channel or
+    per-tensor) and falls back to a float (fp32/fp16) weight in either orientation. The
+    result is always float32. Only matching initializers are materialized; `shapes` is
+    used to pick them.
+
+    Args:
+        shapes: initializer name -> shape (in graph order)
+        load: initializer name -> array
+        hidden_dim: D
+        vocab_size: V
+    """
+    # try to find quantized weight + scale + zero_point
+    quant_name = next(
+        (name for name, shape in shapes.items()
+         if shape == (hidden_dim, vocab_size) and name.endswith("_quantized")),
+        None
+    )
+    if quant_name is not None:
+        base = quant_name[:-len("_quantized")]
+        quant_arr = load(quant_name).astype(np.float32)
+        # scale and zero_point of shape (vocab_size,)
+        scale_arr = load(base + "_scale").astype(np.float32)
+        zp_arr = load(base + "_zero_point").astype(np.float32)
+        # dequantize: (Q - zp) * scale, transpose => (vocab_size, hidden_dim)
+        return np.ascontiguousarray(((quant_arr - zp_arr) * scale_arr).T)
+
+    # fallback: scan initializers for exact or transposed orientation
+    for name, shape in shapes.items():
+        if shape == (vocab_size, hidden_dim):
+            return np.ascontiguousarray(load(name), dtype=np.float32)
+    for name, shape in shapes.items():
+        if shape == (hidden_dim, vocab_size):
+            return np.ascontiguousarray(load(name).T, dtype=np.float32)
+    raise RuntimeError("Prototype matrix (lm_head weight) not found in any initializer.")
+
+
+def conv_frame_geometry(graph) -> Optional[Tuple[int, int]]:
+    """
+    Receptive field and hop (in samples) of the convolutional feature encoder.
+
+    Walks the leading unpadded, ungrouped Conv nodes (plain or quantized) in graph order; the
+    positional conv embedding (padded, grouped) ends the stack. Output frames for n input
+    samples are then (n - receptive) // hop + 1, since nested floor((L - k) / s) + 1 layers
+    compose exactly.
+
+    Returns:
+        (receptive, hop), or None if no such conv stack is found.
+    """
+    receptive, hop = 1, 1
+    for node in graph.node:
+        if node.op_type not in ("Conv", "ConvInteger", "QLinearConv"):
+            continue
+        attrs = {a.name: helper.get_attribute_value(a) for a in node.attribute}
+        if any(attrs.get("pads", ())) or attrs.get("group", 1) != 1 or "kernel_shape" not in attrs:
+            break
+        receptive += (attrs["kernel_shape"][0] - 1) * hop
+        hop *= attrs.get("strides", [1])[0]
+    if hop == 1:
+        return None
+    return receptive, hop
+
+
+# ORT 출력 타입 -> numpy dtype (이 밖의 타입이면 출력 버퍼 바인딩을 쓰지 않음)
+_OUTPUT_DTYPES = {"tensor(float)": np.float32, "tensor(float16)": np.float16}
+
+
 class Wav2VecCTCOnnxCore:
     """
     ONNX Runtime based Wav2Vec2 CTC inference engine using a quantized ONNX model.
@@ -23,19 +102,59 @@ class Wav2VecCTCOnnxCore:
 
     def __init__(
         self,
-        onnx_model_path: str,
-        tokenizer_path: str,
-        device: str = "CPU"
+        onnx_model_path: Optional[str] = None,
+        tokenizer_path: Optional[str] = None,
+        device: str = "CPU",
+        alignment_backend: str = "python-dtw",
+        low_res_dim: Optional[int] = None,
+        low_res_pool: int = 2,
+        shared_model=None,
+        precision: Optional[str] = None,
+        io_binding: bool = True,
+        max_bound_frames: int = 1024
     ):
+        """
+        Args:
+            onnx_model_path: ONNX model path
+            tokenizer_path: tokenizer.json path
+            device: "CPU" or "CUDA"
+            alignment_backend: DTW backend ("python-dtw", "numpy", "native")
+            low_res_dim: projection dim for low-res candidate alignment (None = off)
+            low_res_pool: frames averaged per step in low-res alignment
+            shared_model: SharedModel prepared in a parent process. When given, weights, prototype
+                matrix and tokenizer come from it and the paths are ignored.
+            precision: variant policy ("float", "fastest", "smallest" or a variant name such as
+                "int8"); picks a reduced-precision file built by `quantization build` next to
+                onnx_model_path. Ignored with shared_model.
+            io_binding: run the encoder through IOBinding, reading the input in place and writing
+                into per-thread output buffers reused across calls (one pair per length bucket)
+            max_bound_frames: longest output (frames) served from reusable buffers; longer
+                inputs (e.g. whole recordings) get freshly allocated outputs
+        """
         self.weight_norm_mid = 50
         self.weight_norm_steepness = 0.2
+        # 부분열 정렬에서 토큰 하나를 펼칠 prototype 행 수 (토큰당 0~2배 프레임까지 허용)
+        self.subsequence_frames_per_token = 6
         # 1) session & model load
         providers = ["CPUExecutionProvider"] if device.upper() == "CPU" else ["CUDAExecutionProvider", "CPUExecutionProvider"]
-        self.session = ort.InferenceSession(onnx_model_path, providers=providers)
-        self.onnx_model = onnx.load(onnx_model_path)
+        if shared_model is not None:
+            onnx_model_path = shared_model.onnx_model_path
+            self.session = shared_model.create_session(providers)
+            graph = shared_model.graph
+            # 2) tokenizer (loaded once in the parent)
+            self.tokenizer = shared_model.tokenizer
+        else:
+            onnx_model_path = resolve_variant(onnx_model_path, precision)
+            self.session = ort.InferenceSession(onnx_model_path, providers=providers)
+            graph = onnx.load(onnx_model_path).graph
+            # 2) tokenizer
+            self.tokenizer = Tokenizer.from_file(tokenizer_path)
 
-        # 2) tokenizer
-        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.onnx_model_path = onnx_model_path
+
+        # DTW 정렬 백엔드 ("python-dtw", "numpy", "native")
+        self.aligner = create_backend(alignment_backend)
+        logger.debug("Alignment backend: %s", self.aligner.name)
 
         # 3) I/O names
         inputs = self.session.get_inputs()
@@ -49,7 +168,7 @@ class Wav2VecCTCOnnxCore:
         # 4) infer hidden_dim & vocab_size from output shapes
         hidden_dim = None
         vocab_size = None
-        for output in self.onnx_model.graph.output:
+        for output in graph.output:
             dims = output.type.tensor_type.shape.dim
             if output.name == self.hidden_name:
                 hidden_dim = dims[2].dim_value
@@ -59,53 +178,108 @@ class Wav2VecCTCOnnxCore:
             raise RuntimeError("Could not determine hidden_dim or vocab_size from model outputs.")
 
         # 5) load & dequantize lm_head weight (prototype matrix)
-        proto = None
-        # try to find quantized weight + scale + zero_point
-        quant_init = None
-        for init in self.onnx_model.graph.initializer:
-            arr = numpy_helper.to_array(init)
-            # look for (hidden_dim, vocab_size) quantized weight
-            if arr.ndim == 2 and arr.shape == (hidden_dim, vocab_size) and init.name.endswith("_quantized"):
-                quant_init = init
-                quant_arr = arr.astype(np.float32)
-                break
-
-        if quant_init is not None:
-            base = quant_init.name[:-len("_quantized")]
-            # find scale and zero_point of shape (vocab_size,)
-            scale_arr = numpy_helper.to_array(
-                next(i for i in self.onnx_model.graph.initializer if i.name == base + "_scale")
-            ).astype(np.float32)
-            zp_arr = numpy_helper.to_array(
-                next(i for i in self.onnx_model.graph.initializer if i.name == base + "_zero_point")
-            ).astype(np.float32)
-            # dequantize: (Q - zp) * scale
-            dequant = (quant_arr - zp_arr) * scale_arr
-            # transpose => (vocab_size, hidden_dim)
-            proto = dequant.T
+        if shared_model is not None:
+            self.prototype_matrix = shared_model.prototype_matrix
         else:
-            # fallback: scan initializers for exact or transposed orientation
-            for init in self.onnx_model.graph.initializer:
-                arr = numpy_helper.to_array(init)
-                if arr.ndim == 2 and arr.shape == (vocab_size, hidden_dim):
-                    proto = arr
-                    break
-            if proto is None:
-                for init in self.onnx_model.graph.initializer:
-                    arr = numpy_helper.to_array(init)
-                    if arr.ndim == 2 and arr.shape == (hidden_dim, vocab_size):
-                        proto = arr.T
-                        break
-
-        if proto is None:
-            raise RuntimeError("Prototype matrix (lm_head weight) not found in any initializer.")
-        self.prototype_matrix = proto
+            by_name = {init.name: init for init in graph.initializer}
+            self.prototype_matrix = extract_prototype_matrix(
+                {name: tuple(init.dims) for name, init in by_name.items()},
+                lambda name: numpy_helper.to_array(by_name[name]),
+                hidden_dim, vocab_size
+            )
+        # IOBinding: output frame count must be known before the run to bind preallocated buffers
+        self._bound_geometry = None
+        if io_binding:
+            dtypes = tuple(_OUTPUT_DTYPES.get(o.type) for o in outputs[:2])
+            geometry = conv_frame_geometry(graph)
+            if geometry is None or None in dtypes:
+                logger.info("IOBinding disabled: conv geometry %s, output types %s",
+                            geometry, [o.type for o in outputs[:2]])
+            else:
+                self._bound_geometry = geometry
+                self._output_dtypes = dtypes
+                self._output_dims = (hidden_dim, vocab_size)
+        self.max_bound_frames = max_bound_frames
+        self._local = threading.local()
+        # the parsed model is only needed during load (ORT keeps its own copy of the weights)
+        del graph
+
+        # 토큰 ID -> 문자열 조회 배열 (채점 시 토큰마다 id_to_token을 부르지 않도록)
+        vocab = self.tokenizer.get_vocab()
+        self._id_to_token = np.empty(max(max(vocab.values(), default=-1) + 1, vocab_size), dtype=object)
+        for tok, tid in vocab.items():
+            self._id_to_token[tid] = tok
+        self.blank_id = self.tokenizer.token_to_id("|")
 
         logger.debug("Loaded prototype_matrix of shape %s", self.prototype_matrix.shape)
 
-    def dtw_align(self, X, Y):
-        alignment = dtw(X, Y, keep_internals=True, step_pattern="asymmetricP1")
-        return alignment.index1, alignment.index2
+        # 후보 탐색용 저해상도 정렬 (프레임 평균 + prototype 주성분 투영, 투영은 모델 옆에 캐시)
+        self.low_res = None
+        if low_res_dim:
+            self.low_res = LowResAligner.load_or_build(
+                onnx_model_path, self.prototype_matrix, dim=low_res_dim, pool_factor=low_res_pool
+            )
+            logger.debug("Low-res alignment: dim=%d, pool=%d", self.low_res.dim, self.low_res.pool_factor)
+
+    def warmup(self, durations=(1.0, 2.0, 2.5), sample_rate: int = 16000) -> dict:
+        """
+        대표 입력 길이로 더미 추론을 실행해 ORT의 지연 할당/커널 선택 비용을 미리 지불
+        
+        Args:
+            durations: 워밍업할 입력 길이 목록 (초)
+            sample_rate: 샘플링 레이트 (Hz)
+            
+        Returns:
+            dict: 길이(초) -> 소요 시간(초)
+        """
+        timings = {}
+        rng = np.random.default_rng(0)
+        # 점수 계산 경로(토크나이저, DTW)도 함께 데움
+        warm_text = next((tok for tok in self.tokenizer.get_vocab() if tok not in ("|", "[PAD]", "[UNK]")), "|")
+        for duration in durations:
+            audio = rng.standard_normal(int(duration * sample_rate)).astype(np.float32)
+            started = time.time()
+            try:
+                self.calculate_gop_from_tensor(torch.from_numpy(audio).unsqueeze(0), warm_text)
+            except Exception as e:
+                logger.warning("Warm-up failed for %.1fs input: %s", duration, e)
+                continue
+            timings[duration] = time.time() - started
+        logger.info("Warm-up done: %s", {k: round(v, 3) for k, v in timings.items()})
+        return timings
+
+    def dtw_align(self, X, Y, band: Optional[float] = None):
+        """
+        DTW 정렬 경로 계산
+        
+        Args:
+            X: 쿼리 (T, D)
+            Y: 참조 (N, D)
+            band: 주어지면 Sakoe-Chiba 대역 폭 (T 대비 비율)으로 탐색 범위 제한
+        """
+        window = band_window(len(X), len(Y), band)
+        if window is not None:
+            self._note_dtw_bytes(self.aligner.matrix_bytes(len(X), len(Y), window))
+            try:
+                return self.aligner.align(X, Y, window)
+            except ValueError:
+                logger.debug("No path within band %d, falling back to full DTW", window)
+        self._note_dtw_bytes(self.aligner.matrix_bytes(len(X), len(Y)))
+        return self.aligner.align(X, Y)
+
+    def _note_dtw_bytes(self, size: int) -> None:
+        """이 스레드에서 정렬이 잡은 행렬 메모리의 최댓값 기록 (take_dtw_bytes로 회수)"""
+        self._local.dtw_bytes = max(getattr(self._local, "dtw_bytes", 0), int(size))
+
+    def take_dtw_bytes(self) -> int:
+        """
+        이 스레드에서 마지막 호출 이후 정렬 한 번이 잡은 최대 행렬 메모리 (바이트) 반환 후 초기화
+
+        정렬 백엔드별 추정치 (실제 참조 길이와 대역 기준)이며 메모리 예산 보고에 쓴다.
+        """
+        size = getattr(self._local, "dtw_bytes", 0)
+        self._local.dtw_bytes = 0
+        return size
 
     def transcribe(self, audio_path: str, raw_ids: list) -> str:
         # logger.debug("Transcribing %s", audio_path)
@@ -114,7 +288,7 @@ class Wav2VecCTCOnnxCore:
         # logits.shape == (T, V) 이어야 함
 
         # raw_ids = logits.argmax(axis=1).tolist()
-        logger.debug("Raw Greedy IDs: %s", raw_ids)
+        logger.debug("Raw Greedy IDs: %d frames", len(raw_ids))
 
         # special tokens 문자열로 직접 지정
         blank_token = "|"      # CTC blank
@@ -141,7 +315,7 @@ class Wav2VecCTCOnnxCore:
             dedup_ids.append(idx)
             prev = idx
 
-        logger.debug("CTC‑decoded IDs: %s", dedup_ids)
+        logger.debug("CTC‑decoded IDs: %d tokens", len(dedup_ids))
 
         # 최종 디코딩
         text = self.tokenizer.decode(dedup_ids)
@@ -166,105 +340,360 @@ class Wav2VecCTCOnnxCore:
         raw_score = total_weighted_score / total_weight if total_weight > 0 else 0
         return min(raw_score, 100)
 
-    def group_words_sigmoid(self, syllable_scores):
-        words = []
-        current_word = []
-        
-        for i, (syl, score) in enumerate(syllable_scores):
-            if syl == '|':
-                if current_word:
-                    word_text = ''.join(s[0] for s in current_word)
-                    word_score = round(self.weighted_avg_with_sigmoid(current_word, self.weight_norm_mid, self.weight_norm_steepness))
-                    words.append({"word": word_text, "scores": {"pronunciation": word_score}})
-                    current_word = []
-            else:
-                current_word.append((syl, score))
-        
-        # 마지막 단어 처리
-        if current_word:
-            word_text = ''.join(s[0] for s in current_word)
-            word_score = round(self.weighted_avg_with_sigmoid(current_word, self.weight_norm_mid, self.weight_norm_steepness))
-            words.append({"word": word_text, "scores": {"pronunciation": word_score}})
-        
-        return words
-
-    def calculate_gop_from_tensor(self, audio_tensor: torch.Tensor, text: str, eps: float = 1e-8) -> dict:
+    def encode(self, audio_tensor: torch.Tensor, reuse_outputs: bool = True) -> Tuple[np.ndarray, np.ndarray]:
         """
-        전처리된 오디오 텐서에서 직접 GOP 계산
+        전처리된 오디오 텐서를 인코더에 통과시켜 hidden state와 logits 반환
+        
+        IOBinding이 켜져 있으면 입력은 복사 없이 바인딩하고, 출력은 스레드별로 길이 구간마다
+        미리 잡아 둔 버퍼에 바로 쓴다. 이때 반환 배열은 그 버퍼의 뷰이므로 같은 스레드에서
+        다음 encode를 부르기 전까지만 유효하다 (보관하려면 복사).
         
         Args:
             audio_tensor: 전처리된 오디오 텐서 [1, T]
-            text: 평가할 텍스트
-            eps: 수치 안정성을 위한 작은 값
+            reuse_outputs: 재사용 출력 버퍼에 쓸지 여부 (False면 호출마다 새 배열)
             
         Returns:
-            dict: GOP 평가 결과
+            Tuple[np.ndarray, np.ndarray]: (hidden (T, D), logits (T, V))
         """
-        # 텐서를 numpy 배열로 변환
-        input_np = audio_tensor.numpy()
+        # 텐서를 numpy 배열로 변환 (메모리 공유)
+        input_np = np.ascontiguousarray(audio_tensor.numpy(), dtype=np.float32)
         
-        # 2) run ONNX to get hidden & logits
-        hidden_np, logits_np = self.session.run(
-            [self.hidden_name, self.logits_name],
-            {self.input_name: input_np}
-        )
+        if reuse_outputs and self._bound_geometry is not None:
+            features = self._encode_bound(input_np)
+            if features is not None:
+                return features
+        
+        # run ONNX to get hidden & logits
+        with telemetry.span("encoder"):
+            hidden_np, logits_np = self.session.run(
+                [self.hidden_name, self.logits_name],
+                {self.input_name: input_np}
+            )
+        telemetry.inc("encoder_runs_total")
         
         # remove batch dim
-        X      = hidden_np[0]   # shape (T, D)
-        logits = logits_np[0]   # shape (T, V)
+        return hidden_np[0], logits_np[0]
+    
+    def _encode_bound(self, input_np: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        IOBinding으로 인코더 실행 (출력 길이가 재사용 범위를 넘거나 바인딩이 실패하면 None)
+        """
+        receptive, hop = self._bound_geometry
+        num_samples = input_np.shape[-1]
+        if num_samples < receptive:
+            return None
+        frames = (num_samples - receptive) // hop + 1
+        if frames > self.max_bound_frames:
+            return None
+        
+        hidden_buf, logits_buf = self._output_buffers(frames)
+        binding = getattr(self._local, "binding", None)
+        if binding is None:
+            binding = self._local.binding = self.session.io_binding()
+        binding.bind_cpu_input(self.input_name, input_np)
+        for name, buf in ((self.hidden_name, hidden_buf), (self.logits_name, logits_buf)):
+            binding.bind_output(name, "cpu", 0, buf.dtype.type, [1, frames, buf.shape[1]], buf.ctypes.data)
+        try:
+            with telemetry.span("encoder"):
+                self.session.run_with_iobinding(binding)
+        except Exception as e:
+            # 프레임 수 계산이 모델과 맞지 않는 등 - 이후로는 일반 실행만 사용
+            logger.warning("IOBinding run failed, falling back to session.run: %s", e)
+            self._bound_geometry = None
+            return None
+        finally:
+            binding.clear_binding_inputs()
+            binding.clear_binding_outputs()
+        telemetry.inc("encoder_runs_total")
+        return hidden_buf[:frames], logits_buf[:frames]
+    
+    def _output_buffers(self, frames: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        이 스레드의 출력 버퍼 (프레임 수를 2의 거듭제곱 길이 구간으로 올려 구간마다 한 벌)
+        """
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        bucket = max(64, 1 << (frames - 1).bit_length())
+        pair = buffers.get(bucket)
+        if pair is None:
+            pair = tuple(np.empty((bucket, dim), dtype=dtype)
+                         for dim, dtype in zip(self._output_dims, self._output_dtypes))
+            buffers[bucket] = pair
+            telemetry.inc("encoder_output_buffers_total")
+            logger.debug("Allocated encoder output buffers for %d frames", bucket)
+        return pair
+    
+    def output_buffer_bytes(self) -> int:
+        """이 스레드가 잡아 둔 출력 버퍼 크기 (바이트)"""
+        buffers = getattr(self._local, "buffers", None) or {}
+        return sum(buf.nbytes for pair in buffers.values() for buf in pair)
 
-        # 3) temperature‐scaled softmax → probs
-        scaled     = logits
-        exp_logits = np.exp(scaled - scaled.max(axis=1, keepdims=True))
-        probs      = exp_logits / exp_logits.sum(axis=1, keepdims=True)
+    # --- GOP 계산 단계 (calculate_gop_from_features가 순서대로 호출, 벤치마크에서 단계별 측정) ---
 
-        # 4) tokenize
+    def softmax_stats(self, logits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        프레임별 softmax 정규화 값만 계산 (전체 확률 행렬은 만들지 않음)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (행 최댓값 (T,), exp 합 (T,))
+        """
+        row_max = logits.max(axis=1, keepdims=True)
+        # 임시 (T, V) 배열 하나에서 제자리 exp
+        shifted = np.subtract(logits, row_max)
+        np.exp(shifted, out=shifted)
+        return row_max[:, 0], shifted.sum(axis=1)
+
+    def tokenize(self, text: str) -> np.ndarray:
+        """텍스트 -> 모델 어휘 범위로 보정된 토큰 ID 배열 (공백은 '|')"""
         text = text.replace(" ", "|")
-        token_ids = self.tokenizer.encode(text).ids
+        token_ids = np.asarray(self.tokenizer.encode(text).ids, dtype=np.int64)
 
         V = self.prototype_matrix.shape[0]
-        blank_id = self.tokenizer.token_to_id("|")
-        safe_ids = [tid if 0 <= tid < V else blank_id for tid in token_ids]
+        return np.where((token_ids >= 0) & (token_ids < V), token_ids, self.blank_id)
 
-        # 5) expand prototypes & DTW
-        proto = self.prototype_matrix[safe_ids]  # (M, D)
+    def align_tokens(self, X: np.ndarray, safe_ids: np.ndarray, band: Optional[float] = None,
+                     low_res: bool = False, proto: Optional[np.ndarray] = None):
+        """
+        hidden (T, D)와 토큰 prototype을 DTW 정렬 -> (프레임 인덱스, 토큰 인덱스)
+
+        low_res가 True이고 저해상도 설정이 있으면 묶고 투영한 특징으로 정렬한 뒤 경로를 원래 프레임으로 펼친다.
+        proto는 미리 모아 둔 prototype 행 (M, D)로, 주어지면 행렬에서 다시 모으지 않는다 (전체 해상도 전용).
+        """
+        if low_res and self.low_res is not None:
+            Xl = self.low_res.project_frames(X)
+            proto = self.low_res.prototypes[safe_ids]  # (M, k)
+            T, M = Xl.shape[0], len(safe_ids)
+            avg = max(1, T // M)
+            pX, pYexp = self.dtw_align(Xl, np.repeat(proto, avg, axis=0), band=band)
+            return expand_pooled_path(np.asarray(pX, dtype=np.int64),
+                                      np.asarray(pYexp, dtype=np.int64) // avg,
+                                      self.low_res.pool_factor, X.shape[0])
+
+        if proto is None:
+            proto = self.prototype_matrix[safe_ids]  # (M, D)
         T, M   = X.shape[0], len(safe_ids)
         avg    = max(1, T // M)
         Yexp   = np.repeat(proto, avg, axis=0)  # (M*avg, D)
-        pX, pYexp = self.dtw_align(X, Yexp)
-        pY    = [y // avg for y in pYexp]
-
-        # 6) collect frames per token
-        frames = defaultdict(list)
-        for f, t in zip(pX, pY):
-            frames[t].append(f)
-
-        # 7) per‐token log‐prob scores
-        tok_scores = []
-        for idx, tid in enumerate(safe_ids):
-            tok = self.tokenizer.id_to_token(tid)
-            frs = frames.get(idx, [])
-            if frs:
-                ps    = probs[frs, tid]
-                score = float(np.mean(np.log(ps + eps)))
-            else:
-                score = float(-np.inf)
-            tok_scores.append((tok, score))
+        pX, pYexp = self.dtw_align(X, Yexp, band=band)
+        return np.asarray(pX, dtype=np.int64), np.asarray(pYexp, dtype=np.int64) // avg
+
+    def subsequence_align_tokens(self, X: np.ndarray, safe_ids: np.ndarray,
+                                 proto: Optional[np.ndarray] = None,
+                                 frames_per_token: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        토큰 prototype 전체가 hidden (T, D)의 어느 구간에 맞는지 부분열 DTW로 찾음 (열린 시작/끝)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, float]: (프레임 인덱스, 토큰 인덱스, 길이 정규화 비용)
+        """
+        if proto is None:
+            proto = self.prototype_matrix[safe_ids]  # (M, D)
+        r = frames_per_token or self.subsequence_frames_per_token
+        self._note_dtw_bytes(self.aligner.subsequence_bytes(len(X), len(safe_ids) * r))
+        pX, pYexp, cost = self.aligner.subsequence_align(X, np.repeat(proto, r, axis=0))
+        return pX, pYexp // r, cost
+
+    def token_scores(self, logits: np.ndarray, stats: Tuple[np.ndarray, np.ndarray],
+                     pX: np.ndarray, pY: np.ndarray, safe_ids: np.ndarray,
+                     eps: float = 1e-8) -> np.ndarray:
+        """
+        토큰별 평균 로그 확률 (정렬 경로 위의 (프레임, 토큰) 칸만 계산)
+
+        확률은 softmax와 같은 방식으로 구한 뒤 log(p + eps)를 취하고, 토큰별 평균은 bincount로 계산한다.
 
-        # 8) normalize to [0,100]
-        raw  = np.array([s for _, s in tok_scores], dtype=np.float32)
+        Returns:
+            np.ndarray: 토큰별 점수 (M,), 정렬된 프레임이 없는 토큰은 -inf
+        """
+        row_max, row_sum = stats
+        M = len(safe_ids)
+        p = np.exp(logits[pX, safe_ids[pY]] - row_max[pX]) / row_sum[pX]
+        log_p = np.log(p + eps)
+        sums = np.bincount(pY, weights=log_p, minlength=M)
+        counts = np.bincount(pY, minlength=M)
+        scores = np.full(M, -np.inf)
+        np.divide(sums, counts, out=scores, where=counts > 0)
+        return scores
+
+    def normalize_scores(self, raw: np.ndarray, eps: float = 1e-8) -> np.ndarray:
+        """토큰 점수를 [0, 100] 범위로 정규화 (유한하지 않은 점수는 0)"""
+        raw  = np.asarray(raw, dtype=np.float32)
+        mask = np.isfinite(raw)
+        if not mask.any():
+            return np.zeros(len(raw), dtype=np.float64)
+        mn   = raw[mask].min()
+        mx   = raw[mask].max()
+        span = mx - mn if mx > mn else eps
+        norm = np.zeros(len(raw), dtype=np.float64)
+        norm[mask] = (raw[mask] - mn) / span * 100.0
+        return norm
+
+    def absolute_scores(self, raw: np.ndarray) -> np.ndarray:
+        """
+        토큰 점수를 고정 척도로 [0, 100] 변환 (평균 로그 확률 0 -> 100, 균등 분포 수준 이하 -> 0)
+
+        블록 하나만 채점할 때는 토큰 수가 적어 min-max 정규화가 무의미하므로 이 척도를 쓴다.
+        """
+        raw = np.asarray(raw, dtype=np.float64)
+        floor = np.log(1.0 / self.prototype_matrix.shape[0])
+        norm = np.zeros(len(raw), dtype=np.float64)
         mask = np.isfinite(raw)
-        if mask.any():
-            mn   = raw[mask].min()
-            mx   = raw[mask].max()
-            span = mx - mn if mx > mn else eps
-            norm = [(t, (s - mn) / span * 100.0 if np.isfinite(s) else 0.0)
-                    for t, s in tok_scores]
+        norm[mask] = np.clip(1.0 - raw[mask] / floor, 0.0, 1.0) * 100.0
+        return norm
+
+    def token_strings(self, safe_ids: np.ndarray) -> list:
+        """토큰 ID -> 토큰 문자열 (미리 만든 조회 배열 사용)"""
+        return self._id_to_token[safe_ids].tolist()
+
+    def group_words(self, tokens: list, scores: np.ndarray) -> Tuple[list, np.ndarray]:
+        """
+        토큰 점수를 단어별 시그모이드 가중 평균으로 묶음 ('|' 구분, 빈 단어 제외)
+
+        Args:
+            tokens: 토큰 문자열 목록 (M,)
+            scores: 정규화된 토큰 점수 (M,)
+
+        Returns:
+            Tuple[list, np.ndarray]: (단어 결과 목록, 토큰별 단어 인덱스 (구분자는 -1))
+        """
+        tokens_arr = np.asarray(tokens, dtype=object)
+        is_sep = tokens_arr == '|'
+        # 구분자마다 증가하는 번호를 단어 키로 쓰고, 빈 단어가 없도록 다시 번호를 매김
+        keys = np.cumsum(is_sep)[~is_sep]
+        word_of_token = np.full(len(tokens_arr), -1, dtype=np.int64)
+        if keys.size == 0:
+            return [], word_of_token
+        _, word_idx = np.unique(keys, return_inverse=True)
+        word_of_token[~is_sep] = word_idx
+        num_words = int(word_idx.max()) + 1
+
+        s = np.asarray(scores, dtype=np.float64)[~is_sep]
+        weights = 0.5 + 1.0 / (1 + np.exp(-self.weight_norm_steepness * (s - self.weight_norm_mid)))
+        weighted = np.bincount(word_idx, weights=s * weights, minlength=num_words)
+        total = np.bincount(word_idx, weights=weights, minlength=num_words)
+        word_scores = np.minimum(weighted / total, 100)
+
+        # 단어 경계 (구분자를 뺀 토큰 순서 기준)
+        syllables = tokens_arr[~is_sep].tolist()
+        bounds = np.flatnonzero(np.diff(word_idx)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(syllables)]))
+        words = [
+            {"word": ''.join(syllables[a:b]), "scores": {"pronunciation": round(float(score))}}
+            for a, b, score in zip(starts, ends, word_scores)
+        ]
+        return words, word_of_token
+
+    def group_words_sigmoid(self, syllable_scores):
+        """[(토큰, 점수)] -> 단어별 결과 (group_words의 목록 입력용)"""
+        if not syllable_scores:
+            return []
+        tokens = [t for t, _ in syllable_scores]
+        scores = np.array([s for _, s in syllable_scores], dtype=np.float64)
+        return self.group_words(tokens, scores)[0]
+
+    def calculate_gop_from_tensor(self, audio_tensor: torch.Tensor, text: str, eps: float = 1e-8) -> dict:
+        """
+        전처리된 오디오 텐서에서 직접 GOP 계산
+        
+        Args:
+            audio_tensor: 전처리된 오디오 텐서 [1, T]
+            text: 평가할 텍스트
+            eps: 수치 안정성을 위한 작은 값
+            
+        Returns:
+            dict: GOP 평가 결과
+        """
+        X, logits = self.encode(audio_tensor)
+        return self.calculate_gop_from_features(X, logits, text, eps)
+
+    def word_time_spans(self, word_of_token: np.ndarray, num_words: int, pX: np.ndarray, pY: np.ndarray,
+                        frame_times: np.ndarray):
+        """
+        정렬 결과로부터 단어별 (시작, 종료) 시각 계산
+        
+        Args:
+            word_of_token: 토큰별 단어 인덱스 (구분자는 -1, group_words 결과)
+            num_words: 단어 수
+            pX: 정렬 경로의 프레임 인덱스
+            pY: 정렬 경로의 토큰 인덱스
+            frame_times: 프레임별 시작 시각 (초)
+            
+        Returns:
+            list: 단어별 (start, end) 또는 정렬된 프레임이 없으면 (None, None)
+        """
+        if len(frame_times) > 1:
+            frame_dur = float(np.median(np.diff(frame_times)))
         else:
-            norm = [(t, 0.0) for t, _ in tok_scores]
+            frame_dur = 0.0
+        
+        path_words = word_of_token[pY]
+        on_word = path_words >= 0
+        first = np.full(num_words, np.iinfo(np.int64).max)
+        last = np.full(num_words, -1)
+        np.minimum.at(first, path_words[on_word], pX[on_word])
+        np.maximum.at(last, path_words[on_word], pX[on_word])
+        
+        spans = []
+        for lo, hi in zip(first, last):
+            if hi < 0:
+                spans.append((None, None))
+            else:
+                spans.append((float(frame_times[lo]), float(frame_times[hi]) + frame_dur))
+        return spans
 
-        # 9) group into words
-        words = self.group_words_sigmoid(norm)
+    def calculate_gop_from_features(self, X: np.ndarray, logits: np.ndarray, text: str, eps: float = 1e-8,
+                                    frame_times: Optional[np.ndarray] = None,
+                                    dtw_band: Optional[float] = None, low_res: bool = False,
+                                    tokens: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None) -> dict:
+        """
+        이미 계산된 인코더 출력에서 GOP 계산 (인코더 재실행 없음)
+        
+        Args:
+            X: hidden state (T, D)
+            logits: 프레임별 logits (T, V)
+            text: 평가할 텍스트
+            eps: 수치 안정성을 위한 작은 값
+            frame_times: 프레임별 절대 시각 (초). 주어지면 단어별 start/end 포함
+            dtw_band: DTW Sakoe-Chiba 대역 폭 (프레임 수 대비 비율, 없으면 제한 없음)
+            low_res: 저해상도 정렬 사용 (후보 탐색용, 최종 점수에는 사용하지 않음)
+            tokens: 미리 컴파일된 (토큰 ID, prototype 행). 주어지면 text를 토큰화하지 않음
+            
+        Returns:
+            dict: GOP 평가 결과
+        """
+        # 3) softmax 정규화 값 (확률 행렬 전체는 만들지 않음)
+        with telemetry.span("softmax"):
+            stats = self.softmax_stats(logits)
+
+        # 4) tokenize
+        proto = None
+        if tokens is not None:
+            safe_ids, proto = tokens
+        else:
+            with telemetry.span("tokenize"):
+                safe_ids = self.tokenize(text)
+
+        # 5) expand prototypes & DTW
+        with telemetry.span("dtw"):
+            pX, pY = self.align_tokens(X, safe_ids, band=dtw_band, low_res=low_res, proto=proto)
+
+        # 6) per‐token log‐prob scores (경로 위 칸만 모아서 토큰별 평균)
+        # 7) normalize to [0,100]
+        with telemetry.span("token_scores"):
+            raw = self.token_scores(logits, stats, pX, pY, safe_ids, eps)
+            norm = self.normalize_scores(raw, eps)
+
+        # 8) group into words
+        with telemetry.span("word_grouping"):
+            words, word_of_token = self.group_words(self.token_strings(safe_ids), norm)
+        
+        # 9) (선택) 단어별 타임스탬프
+        if frame_times is not None:
+            spans = self.word_time_spans(word_of_token, len(words), pX, pY, frame_times)
+            for word, (start, end) in zip(words, spans):
+                word["start"] = start
+                word["end"] = end
 
         overall = (
             round(sum(w["scores"]["pronunciation"] for w in words) / len(words), 1)
@@ -272,9 +701,75 @@ class Wav2VecCTCOnnxCore:
         )
         return {"overall": overall, "pronunciation": overall, "words": words}
 
+    def calculate_block_gop(self, X: np.ndarray, logits: np.ndarray, text: str, eps: float = 1e-8,
+                            frame_times: Optional[np.ndarray] = None,
+                            tokens: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None,
+                            frames_per_token: Optional[int] = None) -> dict:
+        """
+        블록 하나를 청크 안에서 찾아 한 번에 채점 (컨텍스트 패딩/대체 재실행 없음)
+        
+        부분열 DTW로 블록 토큰이 가장 잘 맞는 프레임 구간만 정렬하고, 토큰 점수는 고정 척도
+        (absolute_scores)로 변환한다. 점수 척도가 컨텍스트 방식(min-max)과 다르므로 블록 인식 판정에는
+        EvaluationController.subsequence_threshold를 쓴다.
+        
+        Args:
+            X: hidden state (T, D)
+            logits: 프레임별 logits (T, V)
+            text: 블록 텍스트
+            eps: 수치 안정성을 위한 작은 값
+            frame_times: 프레임별 절대 시각 (초). 주어지면 일치 구간과 단어별 start/end를 초로 포함
+            tokens: 미리 컴파일된 (토큰 ID, prototype 행)
+            frames_per_token: 토큰당 prototype 행 수 (없으면 엔진 기본값)
+            
+        Returns:
+            dict: GOP 결과 + "span" (일치 구간 프레임) + "cost" (길이 정규화 정렬 비용)
+        """
+        with telemetry.span("softmax"):
+            stats = self.softmax_stats(logits)
+        
+        proto = None
+        if tokens is not None:
+            safe_ids, proto = tokens
+        else:
+            with telemetry.span("tokenize"):
+                safe_ids = self.tokenize(text)
+        if len(safe_ids) == 0 or X.shape[0] == 0:
+            return {"overall": 0.0, "pronunciation": 0.0, "words": [], "span": None, "cost": None}
+        
+        with telemetry.span("dtw"):
+            pX, pY, cost = self.subsequence_align_tokens(X, safe_ids, proto, frames_per_token)
+        
+        with telemetry.span("token_scores"):
+            norm = self.absolute_scores(self.token_scores(logits, stats, pX, pY, safe_ids, eps))
+        
+        with telemetry.span("word_grouping"):
+            words, word_of_token = self.group_words(self.token_strings(safe_ids), norm)
+        
+        span = {"start_frame": int(pX[0]), "end_frame": int(pX[-1])}
+        if frame_times is not None:
+            spans = self.word_time_spans(word_of_token, len(words), pX, pY, frame_times)
+            for word, (start, end) in zip(words, spans):
+                word["start"] = start
+                word["end"] = end
+            frame_dur = float(np.median(np.diff(frame_times))) if len(frame_times) > 1 else 0.0
+            span["start"] = float(frame_times[pX[0]])
+            span["end"] = float(frame_times[pX[-1]]) + frame_dur
+        
+        overall = (
+            round(sum(w["scores"]["pronunciation"] for w in words) / len(words), 1)
+            if words else 0.0
+        )
+        return {"overall": overall, "pronunciation": overall, "words": words, "span": span,
+                "cost": round(cost, 4)}
+
     def calculate_gop_with_context(self, audio_tensor: torch.Tensor, target_text: str, 
                                    context_before: str = "", context_after: str = "", 
-                                   target_index: int = None) -> dict:
+                                   target_index: int = None,
+                                   features: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                                   dtw_band: Optional[float] = None,
+                                   low_res: bool = False,
+                                   tokens: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None,
+                                   target_tokens: Optional[Tuple[np.ndarray, Optional[np.ndarray]]] = None) -> dict:
         """
         컨텍스트를 고려하여 특정 블록의 GOP 계산
         
@@ -284,6 +779,11 @@ class Wav2VecCTCOnnxCore:
             context_before: 대상 전의 컨텍스트
             context_after: 대상 후의 컨텍스트
             target_index: 전체 텍스트에서 대상의 인덱스 (없으면 자동 계산)
+            features: 미리 계산된 (hidden, logits). 주어지면 인코더를 다시 실행하지 않음
+            dtw_band: DTW 대역 폭 (메모리 압박 시 탐색 범위 제한)
+            low_res: 저해상도 정렬 사용 (후보 탐색용)
+            tokens: 컨텍스트 포함 전체 텍스트의 미리 컴파일된 (토큰 ID, prototype 행)
+            target_tokens: 대상 텍스트만의 미리 컴파일된 토큰 (대체 경로용)
             
         Returns:
             dict: 대상 블록에 대한 GOP 평가 결과
@@ -300,13 +800,20 @@ class Wav2VecCTCOnnxCore:
         # 대상 텍스트의 단어 수 계산
         target_word_count = len([w for w in target_text.split() if w])
         
+        # 인코더는 한 번만 실행
+        if features is None:
+            features = self.encode(audio_tensor)
+        X, logits = features
+        
         # 전체 텍스트로 GOP 계산
-        result = self.calculate_gop_from_tensor(audio_tensor, full_text)
+        result = self.calculate_gop_from_features(X, logits, full_text, dtw_band=dtw_band,
+                                                  low_res=low_res, tokens=tokens)
         
         # 모든 단어가 있는지 확인
         if not result["words"] or len(result["words"]) <= target_index:
             # 전체 텍스트 처리에 실패한 경우, 대상 텍스트만으로 시도
-            fallback_result = self.calculate_gop_from_tensor(audio_tensor, target_text)
+            fallback_result = self.calculate_gop_from_features(X, logits, target_text, dtw_band=dtw_band,
+                                                               low_res=low_res, tokens=target_tokens)
             return fallback_result
         
         # target_index 위치의 단어들에 해당하는 결과 추출
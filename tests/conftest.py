@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# 설치하지 않고도 src 아래 패키지와 benchmarks를 불러오도록 경로 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, ROOT)
+
+TOKENIZER = os.path.join(ROOT, "models", "tokenizer.json")
+
+
+@pytest.fixture(scope="session")
+def tiny_model_path(tmp_path_factory):
+    """실제 토크나이저 어휘 크기에 맞춘 작은 합성 CTC 모델 (프레임 투영, hidden 16)"""
+    pytest.importorskip("onnx")
+    from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+    path = str(tmp_path_factory.mktemp("tiny_model") / "tiny.onnx")
+    return build_tiny_model(path, vocab_size=tokenizer_vocab_size(TOKENIZER), hidden_dim=16)
+
+
+@pytest.fixture(scope="session")
+def tiny_engine(tiny_model_path):
+    """numpy DTW 백엔드를 쓰는 합성 모델 엔진 (테스트 간 공유하므로 설정을 바꾸지 말 것)"""
+    for module in ("torch", "onnxruntime", "tokenizers"):
+        pytest.importorskip(module)
+    from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+    return Wav2VecCTCOnnxCore(tiny_model_path, TOKENIZER, alignment_backend="numpy")
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from realtime_engine_ko import alignment_backends
+from realtime_engine_ko.alignment_backends import (
+    AlignmentBackend, NumpyDtwBackend, available_backends, band_window, create_backend, register_backend
+)
+
+
+def _cases(count, seed=0):
+    rng = np.random.default_rng(seed)
+    for k in range(count):
+        n, m = int(rng.integers(2, 60)), int(rng.integers(2, 60))
+        X, Y = rng.standard_normal((n, 3)), rng.standard_normal((m, 3))
+        window = band_window(n, m, float(rng.choice([0.05, 0.1, 0.3, 1.0]))) if k % 3 else None
+        yield X, Y, window
+
+
+def _align_or_error(backend, X, Y, window):
+    try:
+        return backend.align(X, Y, window)
+    except ValueError:
+        return None
+
+
+def _assert_same_paths(backend, reference):
+    for X, Y, window in _cases(150):
+        expected = _align_or_error(reference, X, Y, window)
+        got = _align_or_error(backend, X, Y, window)
+        if expected is None:
+            assert got is None
+            continue
+        assert got is not None
+        np.testing.assert_array_equal(got[0], expected[0])
+        np.testing.assert_array_equal(got[1], expected[1])
+
+
+def test_numpy_backend_matches_dtw_python():
+    pytest.importorskip("dtw")
+    _assert_same_paths(create_backend("numpy"), create_backend("python-dtw"))
+
+
+def test_native_backend_matches_numpy():
+    if not available_backends()["native"]:
+        pytest.skip("pyrealtime 바인딩이 빌드되지 않음")
+    _assert_same_paths(create_backend("native"), create_backend("numpy"))
+
+
+def test_path_is_anchored_and_monotonic():
+    rng = np.random.default_rng(1)
+    X, Y = rng.standard_normal((40, 4)), rng.standard_normal((30, 4))
+    idx1, idx2 = NumpyDtwBackend().align(X, Y)
+    assert (idx1[0], idx2[0]) == (0, 0)
+    assert (idx1[-1], idx2[-1]) == (39, 29)
+    assert np.all(np.diff(idx1) >= 0) and np.all(np.diff(idx2) >= 0)
+
+
+def test_no_path_inside_band_raises_value_error():
+    rng = np.random.default_rng(2)
+    with pytest.raises(ValueError):
+        NumpyDtwBackend().align(rng.standard_normal((50, 2)), rng.standard_normal((10, 2)))
+
+
+def test_unknown_backend_name_and_registration(monkeypatch):
+    with pytest.raises(ValueError):
+        create_backend("no-such-backend")
+
+    class Custom(NumpyDtwBackend):
+        name = "custom"
+
+    monkeypatch.setattr(alignment_backends, "_BACKENDS", dict(alignment_backends._BACKENDS))
+    register_backend(Custom.name, Custom)
+    assert isinstance(create_backend("custom"), Custom)
+    assert available_backends()["custom"]
+    assert isinstance(create_backend("numpy"), AlignmentBackend)
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("soundfile")
+
+from realtime_engine_ko.audio_processor import AudioProcessor
+
+
+def _noise(n, seed=0):
+    return (np.random.default_rng(seed).standard_normal(n) * 0.1).astype(np.float32)
+
+
+def _collect(processor):
+    chunks = []
+    processor.add_chunk_callback(lambda chunk, metadata: chunks.append(metadata))
+    return chunks
+
+
+def test_push_audio_emits_chunks_with_absolute_spans():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=0.5, crop_padding=None)
+    chunks = _collect(processor)
+    processor.start_stream()
+
+    for i in range(5):
+        processor.push_audio(_noise(4000, seed=i), ingest_time=float(i))
+
+    assert [(m["chunk_start_time"], m["chunk_end_time"]) for m in chunks] == [(0.0, 0.5), (0.5, 1.0)]
+    assert chunks[0]["first_ingest_time"] == 0.0
+    assert chunks[0]["ingest_time"] == 1.0
+
+
+def test_reset_then_push_audio_starts_from_zero():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=0.5, crop_padding=None)
+    chunks = _collect(processor)
+    processor.start_stream()
+    processor.push_audio(_noise(6000), ingest_time=100.0)
+
+    processor.reset()
+    assert processor.received_samples == 0
+    assert processor.processed_samples == 0
+    assert processor.ingest_marks == []
+    assert processor.latest_chunk_ingest == (None, None)
+
+    # 남은 샘플 수가 이전 시도에서 넘어오면 청크 길이에 못 미쳐도 청크가 나오거나 구간이 어긋남
+    processor.push_audio(_noise(4000, seed=1), ingest_time=200.0)
+    assert chunks == []
+    processor.push_audio(_noise(4000, seed=2), ingest_time=201.0)
+    assert len(chunks) == 1
+    assert (chunks[0]["chunk_start_time"], chunks[0]["chunk_end_time"]) == (0.0, 0.5)
+    assert (chunks[0]["first_ingest_time"], chunks[0]["ingest_time"]) == (200.0, 201.0)
+
+
+def test_chunk_matches_pushed_samples_across_ring_compaction():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=0.25, crop_padding=None)
+    processor.buffer = type(processor.buffer)(5000)
+    received = []
+    processor.add_chunk_callback(lambda chunk, metadata: received.append(chunk.numpy().copy()))
+    processor.start_stream()
+
+    audio = _noise(4000 * 6, seed=3)
+    for start in range(0, len(audio), 3000):
+        processor.push_audio(audio[start:start + 3000])
+
+    expected = audio[:4000 * len(received)].reshape(len(received), 4000)
+    for got, want in zip(received, expected):
+        want = (want - want.mean()) / np.sqrt(want.var() + 1e-7)
+        np.testing.assert_allclose(got.reshape(-1), want, atol=1e-4)
+
+
+def _padded_speech(lead, speech, tail, sample_rate=16000):
+    """무음 lead초 + 잡음 speech초 + 무음 tail초"""
+    return np.concatenate([np.zeros(int(lead * sample_rate), dtype=np.float32),
+                           _noise(int(speech * sample_rate)),
+                           np.zeros(int(tail * sample_rate), dtype=np.float32)])
+
+
+def _single_chunk(processor, audio):
+    received = []
+    processor.add_chunk_callback(lambda chunk, metadata: received.append((chunk.numpy().copy(), metadata)))
+    processor.start_stream()
+    processor.push_audio(audio)
+    return received
+
+
+def test_crop_trims_silence_and_shifts_metadata():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=1.0, crop_padding=0.05)
+    (chunk, metadata), = _single_chunk(processor, _padded_speech(0.3, 0.4, 0.3))
+
+    assert chunk.shape == (1, int(0.5 * 16000))
+    assert metadata["crop_offset"] == pytest.approx(0.25)
+    assert (metadata["start_time"], metadata["end_time"]) == pytest.approx((0.25, 0.75))
+    assert (metadata["chunk_start_time"], metadata["chunk_end_time"]) == (0.0, 1.0)
+
+
+def test_crop_keeps_speech_that_runs_to_the_chunk_edge():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=1.0, crop_padding=0.05)
+    (chunk, metadata), = _single_chunk(processor, _padded_speech(0.5, 0.5, 0.0))
+
+    assert chunk.shape == (1, int(0.55 * 16000))
+    assert (metadata["start_time"], metadata["end_time"]) == pytest.approx((0.45, 1.0))
+
+
+def test_crop_disabled_keeps_the_whole_chunk():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=1.0, crop_padding=None)
+    (chunk, metadata), = _single_chunk(processor, _padded_speech(0.3, 0.4, 0.3))
+
+    assert chunk.shape == (1, 16000)
+    assert metadata["crop_offset"] == 0.0
+    assert (metadata["start_time"], metadata["end_time"]) == (0.0, 1.0)
+
+
+def test_silent_chunk_is_dropped_before_the_encoder():
+    processor = AudioProcessor(sample_rate=16000, chunk_duration=1.0, crop_padding=0.05)
+    assert _single_chunk(processor, np.zeros(16000, dtype=np.float32)) == []
+    assert processor.processed_samples == 16000
@@ -0,0 +1,61 @@
+import numpy as np
+
+from realtime_engine_ko.audio_ring import AudioRingBuffer
+
+
+def test_read_returns_samples_in_order_as_a_view():
+    ring = AudioRingBuffer(8)
+    ring.write(np.arange(5, dtype=np.float32))
+    view = ring.read(3)
+    np.testing.assert_array_equal(view, [0, 1, 2])
+    assert view.base is ring._data
+    assert len(ring) == 2
+    np.testing.assert_array_equal(ring.read(10), [3, 4])
+    assert len(ring) == 0
+
+
+def test_write_past_the_end_compacts_unread_samples_without_growing():
+    ring = AudioRingBuffer(8)
+    ring.write(np.arange(6, dtype=np.float32))
+    ring.read(4)
+    ring.write(np.arange(6, 11, dtype=np.float32))
+    assert len(ring._data) == 8
+    assert len(ring) == 7
+    np.testing.assert_array_equal(ring.read(7), np.arange(4, 11))
+
+
+def test_write_larger_than_capacity_grows_and_keeps_pending():
+    ring = AudioRingBuffer(4)
+    ring.write(np.arange(3, dtype=np.float32))
+    ring.read(1)
+    ring.write(np.arange(3, 12, dtype=np.float32))
+    assert len(ring._data) == 16
+    assert ring.nbytes == 16 * 4
+    np.testing.assert_array_equal(ring.read(100), np.arange(1, 12))
+
+
+def test_streaming_wraparound_matches_concatenation():
+    rng = np.random.default_rng(0)
+    ring = AudioRingBuffer(1000)
+    written, read = [], []
+    peak = 0
+    for _ in range(200):
+        block = rng.standard_normal(int(rng.integers(0, 400))).astype(np.float32)
+        ring.write(block)
+        written.append(block)
+        peak = max(peak, len(ring))
+        read.append(ring.read(int(rng.integers(0, 400))).copy())
+    read.append(ring.read(len(ring)).copy())
+    np.testing.assert_array_equal(np.concatenate(read), np.concatenate(written))
+    # 용량은 최대 대기 샘플 수를 담을 만큼만 늘어남
+    assert len(ring._data) < 2 * max(1000, peak)
+
+
+def test_clear_keeps_allocation():
+    ring = AudioRingBuffer(8)
+    ring.write(np.ones(6, dtype=np.float32))
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.nbytes == 8 * 4
+    ring.write(np.full(3, 2.0, dtype=np.float32))
+    np.testing.assert_array_equal(ring.read(3), [2, 2, 2])
@@ -0,0 +1,61 @@
+import pytest
+
+from realtime_engine_ko.cadence_controller import AdaptiveCadenceController
+
+
+def _chunk(end_time, total_duration=None):
+    return {"chunk_end_time": end_time, "total_duration": end_time if total_duration is None else total_duration}
+
+
+def test_first_chunk_is_scored():
+    controller = AdaptiveCadenceController(target_latency=1.0)
+    assert controller.should_score(_chunk(2.0), now=0.0)
+
+
+def test_backlog_past_target_latency_skips_chunk():
+    controller = AdaptiveCadenceController(target_latency=1.0)
+    assert not controller.should_score(_chunk(2.0, total_duration=3.5), now=0.0)
+    assert controller.should_score(_chunk(2.0, total_duration=2.9), now=0.0)
+    assert controller.get_stats()["skipped_chunks"] == 1
+
+
+def test_slow_scoring_backs_off_interval_and_grows_chunks():
+    controller = AdaptiveCadenceController(target_latency=1.0, max_interval=2.0, max_chunk_scale=2.0)
+    controller.record(inference_latency=1.5, audio_duration=2.0, now=10.0)
+    assert controller.eval_interval == pytest.approx(1.5)
+    assert controller.chunk_scale == pytest.approx(1.25)
+    assert controller.chunk_duration(2.0) == pytest.approx(2.5)
+
+    # 간격 안에 들어온 청크는 건너뜀
+    assert not controller.should_score(_chunk(4.0), now=11.0)
+    assert controller.should_score(_chunk(4.0), now=11.5)
+
+    for i in range(10):
+        controller.record(inference_latency=3.0, audio_duration=2.0, now=12.0 + i)
+    assert controller.eval_interval == 2.0
+    assert controller.chunk_scale == 2.0
+
+
+def test_real_time_factor_above_one_backs_off_even_under_latency_target():
+    controller = AdaptiveCadenceController(target_latency=5.0)
+    controller.record(inference_latency=0.6, audio_duration=0.5, now=0.0)
+    assert controller.chunk_scale == pytest.approx(1.25)
+
+
+def test_fast_scoring_tightens_back_to_bounds():
+    controller = AdaptiveCadenceController(target_latency=1.0, min_interval=0.1, min_chunk_scale=0.5)
+    controller.record(inference_latency=1.5, audio_duration=2.0, now=0.0)
+    for i in range(100):
+        controller.record(inference_latency=0.01, audio_duration=2.0, now=1.0 + i)
+    assert controller.eval_interval == pytest.approx(0.1)
+    assert controller.chunk_scale == pytest.approx(0.5)
+
+
+def test_reset_clears_measurements():
+    controller = AdaptiveCadenceController()
+    controller.record(inference_latency=2.0, audio_duration=1.0, now=0.0)
+    controller.reset()
+    assert controller.get_stats() == {
+        "eval_interval": 0.0, "chunk_scale": 1.0, "avg_latency": None, "avg_rtf": None,
+        "scored_chunks": 0, "skipped_chunks": 0
+    }
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from realtime_engine_ko.curriculum_pack import CurriculumPack, build_pack, read_catalog, split_blocks
+
+SENTENCES = [
+    ("s1", "나는 학교에 갑니다"),
+    ("s2", "오늘은  날씨가 정말 좋네요"),
+    ("s3", "안녕하세요"),
+    ("empty", ""),
+]
+
+
+@pytest.fixture(scope="module")
+def pack_path(tiny_engine, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("pack") / "curriculum.pack")
+    summary = build_pack(SENTENCES, tiny_engine, path)
+    assert summary["sentences"] == len(SENTENCES)
+    assert summary["blocks"] == sum(len(split_blocks(s)) for _, s in SENTENCES)
+    return path
+
+
+def test_round_trip_restores_sentences_and_tokens(tiny_engine, pack_path):
+    pack = CurriculumPack(pack_path)
+    assert len(pack) == len(SENTENCES)
+    assert pack.ids() == [sentence_id for sentence_id, _ in SENTENCES]
+    assert "s2" in pack and "missing" not in pack
+    assert pack.matches(tiny_engine.onnx_model_path)
+    assert pack.hidden_dim == tiny_engine.prototype_matrix.shape[1]
+
+    for sentence_id, sentence in SENTENCES:
+        packed = pack.get(sentence_id)
+        assert packed.blocks == split_blocks(sentence)
+        assert packed.sentence == " ".join(split_blocks(sentence))
+        np.testing.assert_array_equal(packed.token_ids, tiny_engine.tokenize(packed.sentence))
+        np.testing.assert_array_equal(packed.prototype_rows, tiny_engine.prototype_matrix[packed.token_ids])
+
+    with pytest.raises(KeyError):
+        pack.get("missing")
+
+
+def test_every_window_matches_runtime_tokenization(tiny_engine, pack_path):
+    pack = CurriculumPack(pack_path)
+    for sentence_id, _ in SENTENCES:
+        packed = pack.get(sentence_id)
+        blocks = packed.blocks
+        for first in range(len(blocks)):
+            for last in range(first, len(blocks)):
+                ids, rows = packed.window(first, last)
+                expected = tiny_engine.tokenize(" ".join(blocks[first:last + 1]))
+                np.testing.assert_array_equal(ids, expected)
+                np.testing.assert_array_equal(rows, tiny_engine.prototype_matrix[expected])
+
+
+def test_controller_context_window_uses_pack_tokens(tiny_engine, pack_path):
+    pytest.importorskip("torch")
+    from realtime_engine_ko.eval_manager import EvaluationController
+    from realtime_engine_ko.progress_tracker import ProgressTracker
+    from realtime_engine_ko.sentence_block import SentenceBlockManager
+
+    packed = CurriculumPack(pack_path).get("s2")
+    manager = SentenceBlockManager(packed.sentence, blocks=packed.blocks)
+    controller = EvaluationController(tiny_engine, manager, ProgressTracker(len(manager.blocks)), packed=packed)
+    for context_blocks in (0, 1, 2):
+        controller.context_blocks = context_blocks
+        for block_id in range(len(packed.blocks)):
+            before, after = controller._collect_context(block_id)
+            window = " ".join(part for part in (before, packed.blocks[block_id], after) if part)
+            tokens = controller._packed_tokens(block_id)
+            np.testing.assert_array_equal(tokens["tokens"][0], tiny_engine.tokenize(window))
+            np.testing.assert_array_equal(tokens["target_tokens"][0], tiny_engine.tokenize(packed.blocks[block_id]))
+
+
+def test_pack_from_other_model_does_not_match(tiny_engine, pack_path, tmp_path):
+    other = tmp_path / "other.onnx"
+    other.write_bytes(b"other model")
+    assert not CurriculumPack(pack_path).matches(str(other))
+
+
+def test_rebuild_without_rows(tiny_engine, tmp_path):
+    path = str(tmp_path / "no_rows.pack")
+    build_pack(SENTENCES[:1], tiny_engine, path, include_rows=False)
+    packed = CurriculumPack(path).get("s1")
+    ids, rows = packed.window(0, 1)
+    assert rows is None
+    np.testing.assert_array_equal(ids, tiny_engine.tokenize("나는 학교에"))
+
+
+def test_duplicate_ids_and_bad_files_are_rejected(tiny_engine, tmp_path):
+    with pytest.raises(ValueError):
+        build_pack([("a", "하나"), ("a", "둘")], tiny_engine, str(tmp_path / "dup.pack"))
+    bad = tmp_path / "bad.pack"
+    bad.write_bytes(b"not a pack" * 10)
+    with pytest.raises(ValueError):
+        CurriculumPack(str(bad))
+
+
+def test_read_catalog_accepts_jsonl_and_tsv(tmp_path):
+    jsonl = tmp_path / "catalog.jsonl"
+    jsonl.write_text('{"id": 1, "sentence": "나는 학교에 갑니다"}\n# 주석\n\n', encoding="utf-8")
+    tsv = tmp_path / "catalog.tsv"
+    tsv.write_text("s1\t안녕하세요\n", encoding="utf-8")
+    assert read_catalog(str(jsonl)) == [("1", "나는 학교에 갑니다")]
+    assert read_catalog(str(tsv)) == [("s1", "안녕하세요")]
+
+    tsv.write_text("no tab here\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_catalog(str(tsv))
@@ -0,0 +1,85 @@
+import numpy as np
+
+from realtime_engine_ko.final_rescorer import FinalRescorer, get_rescore_executor
+from realtime_engine_ko.result_cache import ResultCache
+
+SENTENCE = "나는 학교에 갑니다"
+
+
+def _speech_with_pauses(seconds, pause_every, sample_rate=16000, seed=0):
+    """pause_every초마다 0.5초 무음을 넣은 잡음 녹음"""
+    rng = np.random.default_rng(seed)
+    audio = (0.3 * rng.standard_normal(int(seconds * sample_rate))).astype(np.float32)
+    pause = int(0.5 * sample_rate)
+    for start in range(int(pause_every * sample_rate), len(audio) - pause, int(pause_every * sample_rate)):
+        audio[start:start + pause] = 0.0
+    return audio
+
+
+def test_split_covers_recording_and_cuts_in_pauses():
+    rescorer = FinalRescorer(recognition_engine=None, max_segment_duration=4.0)
+    audio = _speech_with_pauses(13.0, pause_every=3.0)
+    segments = rescorer.split_at_pauses(audio)
+
+    assert segments[0][0] == 0 and segments[-1][1] == len(audio)
+    assert all(a[1] == b[0] for a, b in zip(segments, segments[1:]))
+    assert all(e - s <= 4.0 * 16000 for s, e in segments)
+    # 경계는 모두 무음 안쪽
+    assert all(audio[cut] == 0.0 for _, cut in segments[:-1])
+
+
+def test_split_without_pauses_cuts_at_max_length():
+    rescorer = FinalRescorer(recognition_engine=None, max_segment_duration=2.0)
+    audio = _speech_with_pauses(5.0, pause_every=100.0)
+    assert rescorer.split_at_pauses(audio) == [(0, 32000), (32000, 64000), (64000, 80000)]
+    assert rescorer.split_at_pauses(audio[:1000]) == [(0, 1000)]
+    assert rescorer.split_at_pauses(audio[:0]) == []
+
+
+def test_rescore_segments_share_one_timeline(tiny_engine):
+    rescorer = FinalRescorer(tiny_engine, max_segment_duration=2.0, latency_budget=30.0)
+    audio = _speech_with_pauses(5.0, pause_every=1.5)
+    result = rescorer.rescore(audio, SENTENCE)
+
+    assert result is not None
+    assert result["segments"] == len(rescorer.split_at_pauses(audio)) > 1
+    assert len(result["words"]) == len(SENTENCE.split())
+    starts = [w["start"] for w in result["words"]]
+    assert starts == sorted(starts)
+    assert 0.0 <= starts[0] and result["words"][-1]["end"] <= 5.0 + 1e-6
+
+
+def test_rescore_over_budget_returns_none(tiny_engine):
+    rescorer = FinalRescorer(tiny_engine, latency_budget=0.0)
+    assert rescorer.rescore(_speech_with_pauses(2.0, pause_every=100.0), SENTENCE) is None
+
+
+def test_rescore_result_is_cached(tiny_engine):
+    rescorer = FinalRescorer(tiny_engine, latency_budget=30.0, result_cache=ResultCache())
+    audio = _speech_with_pauses(2.0, pause_every=100.0)
+    assert rescorer.lookup(audio, SENTENCE) is None
+
+    first = rescorer.rescore(audio, SENTENCE)
+    assert "cached" not in first
+    again = rescorer.rescore(audio, SENTENCE)
+    assert again["cached"] is True
+    assert again["overall"] == first["overall"]
+    assert rescorer.lookup(audio, SENTENCE)["overall"] == first["overall"]
+
+
+def test_rescorers_share_the_process_pool(tiny_engine):
+    assert get_rescore_executor() is get_rescore_executor()
+    first, second = FinalRescorer(tiny_engine), FinalRescorer(tiny_engine)
+    audio = _speech_with_pauses(1.0, pause_every=100.0)
+    futures = [r._submit(tiny_engine, r._prepare_tensor(audio)) for r in (first, second)]
+    hidden_a, _ = futures[0].result()
+    hidden_b, _ = futures[1].result()
+    # 재사용 버퍼를 쓰지 않으므로 두 결과가 서로 덮어쓰지 않음
+    assert hidden_a is not hidden_b
+    np.testing.assert_array_equal(hidden_a, hidden_b)
+    assert not first._pending and not second._pending
+
+
+def test_rescore_too_short_returns_none(tiny_engine):
+    rescorer = FinalRescorer(tiny_engine)
+    assert rescorer.rescore(np.zeros(800, dtype=np.float32), SENTENCE) is None
@@ -0,0 +1,92 @@
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+
+def _softmax(logits):
+    e = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return e / e.sum(axis=1, keepdims=True)
+
+
+def _loop_token_scores(logits, pX, pY, safe_ids, eps=1e-8):
+    """전체 확률 행렬과 토큰별 프레임 목록으로 계산하는 참조 구현"""
+    probs = _softmax(logits)
+    frames = defaultdict(list)
+    for f, t in zip(pX, pY):
+        frames[t].append(np.log(probs[f, safe_ids[t]] + eps))
+    return np.array([np.mean(frames[t]) if frames[t] else -np.inf for t in range(len(safe_ids))])
+
+
+def _loop_words(engine, tokens, scores):
+    """구분자마다 단어를 끊어 weighted_avg_with_sigmoid로 묶는 참조 구현"""
+    words, current = [], []
+    for token, score in list(zip(tokens, scores)) + [("|", 0.0)]:
+        if token == "|":
+            if current:
+                words.append(("".join(t for t, _ in current), round(engine.weighted_avg_with_sigmoid(
+                    current, engine.weight_norm_mid, engine.weight_norm_steepness))))
+            current = []
+        else:
+            current.append((token, score))
+    return words
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_token_scores_match_full_softmax(tiny_engine, seed):
+    rng = np.random.default_rng(seed)
+    T, V, M = 80, tiny_engine.prototype_matrix.shape[0], 12
+    logits = (rng.standard_normal((T, V)) * 4).astype(np.float32)
+    safe_ids = rng.integers(0, V, M)
+    # 일부 토큰에는 프레임이 배정되지 않도록 경로를 구성
+    pY = np.sort(rng.choice(np.arange(M - 2), T))
+    pX = np.arange(T)
+
+    row_max, row_sum = tiny_engine.softmax_stats(logits)
+    np.testing.assert_allclose(row_max, logits.max(axis=1))
+    np.testing.assert_allclose(row_sum, np.exp(logits - logits.max(axis=1, keepdims=True)).sum(axis=1), rtol=1e-5)
+
+    scores = tiny_engine.token_scores(logits, (row_max, row_sum), pX, pY, safe_ids)
+    expected = _loop_token_scores(logits, pX, pY, safe_ids)
+    assert np.array_equal(np.isinf(scores), np.isinf(expected))
+    finite = np.isfinite(expected)
+    np.testing.assert_allclose(scores[finite], expected[finite], rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("tokens", [
+    ["나", "는", "|", "학", "교", "에", "|", "갑", "니", "다"],
+    ["|", "나", "는", "|", "|", "학", "교", "|"],
+    ["나"],
+    ["|", "|"],
+    []
+])
+def test_group_words_matches_loop_grouping(tiny_engine, tokens):
+    scores = np.random.default_rng(len(tokens)).uniform(0, 100, len(tokens))
+    words, word_of_token = tiny_engine.group_words(tokens, scores)
+
+    assert [(w["word"], w["scores"]["pronunciation"]) for w in words] == _loop_words(tiny_engine, tokens, scores)
+    assert all((w < 0) == (t == "|") for w, t in zip(word_of_token, tokens))
+    assert tiny_engine.group_words_sigmoid(list(zip(tokens, scores))) == words
+
+
+def test_word_time_spans_cover_each_words_frames(tiny_engine):
+    word_of_token = np.array([0, 0, -1, 1, 1, -1, 2])
+    pX = np.arange(10)
+    pY = np.array([0, 0, 1, 2, 3, 3, 4, 5, 5, 5])
+    frame_times = np.arange(10) * 0.02 + 1.0
+
+    spans = tiny_engine.word_time_spans(word_of_token, 3, pX, pY, frame_times)
+    assert spans[0] == pytest.approx((1.0, 1.06))
+    assert spans[1] == pytest.approx((1.08, 1.14))
+    # 마지막 단어 토큰(6)에는 정렬된 프레임이 없음
+    assert spans[2] == (None, None)
+
+
+def test_normalize_and_absolute_scores(tiny_engine):
+    raw = np.array([-1.0, -3.0, -np.inf, -2.0])
+    np.testing.assert_allclose(tiny_engine.normalize_scores(raw), [100.0, 0.0, 0.0, 50.0])
+    assert not tiny_engine.normalize_scores(np.array([-np.inf])).any()
+
+    floor = np.log(1.0 / tiny_engine.prototype_matrix.shape[0])
+    absolute = tiny_engine.absolute_scores(np.array([0.0, floor / 2, floor * 2, -np.inf]))
+    np.testing.assert_allclose(absolute, [100.0, 50.0, 0.0, 0.0])
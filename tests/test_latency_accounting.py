@@ -0,0 +1,59 @@
+import pytest
+
+from realtime_engine_ko.latency_accounting import LatencyRegistry, LatencyStats
+
+
+def test_record_tracks_latency_and_rtf():
+    stats = LatencyStats("s1")
+    assert stats.record(10.0, 10.25, audio_duration=2.0, compute_time=0.5) == 0.25
+    assert stats.record(20.0, 20.75, audio_duration=2.0, compute_time=0.3) == 0.75
+    # 도착 시각이 없으면 지연은 빼고 처리 시간만 누적
+    assert stats.record(None, 30.0, audio_duration=1.0, compute_time=0.2) is None
+
+    summary = stats.summary()
+    assert summary["session_id"] == "s1"
+    assert summary["count"] == 2 and summary["chunks"] == 3
+    assert summary["audio_seconds"] == 5.0
+    assert summary["rtf"] == pytest.approx(1.0 / 5.0)
+    assert summary["p50"] == 0.5 and summary["max"] == 0.75
+
+
+def test_clock_skew_never_gives_negative_latency():
+    stats = LatencyStats("skew")
+    assert stats.record(5.0, 4.0) == 0.0
+
+
+def test_empty_summary_has_no_percentiles():
+    summary = LatencyStats("empty").summary()
+    assert summary["count"] == 0 and summary["rtf"] is None
+    assert summary["p50"] is None and summary["p99"] is None and summary["mean"] is None
+
+
+def test_latency_window_keeps_recent_samples():
+    stats = LatencyStats("window", max_samples=3)
+    for latency in (10.0, 1.0, 2.0, 3.0):
+        stats.record(0.0, latency)
+    summary = stats.summary()
+    assert summary["count"] == 3 and summary["chunks"] == 4
+    assert summary["max"] == 3.0
+
+    stats.reset()
+    assert stats.summary()["chunks"] == 0
+
+
+def test_registry_aggregates_sessions_and_evicts_oldest():
+    registry = LatencyRegistry(max_sessions=2)
+    for session_id, latency in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+        registry.register(LatencyStats(session_id)).record(0.0, latency, audio_duration=1.0, compute_time=0.1)
+
+    assert registry.get("a") is None
+    assert registry.session_stats("a") is None
+    assert registry.session_stats("c")["p50"] == 0.3
+
+    total = registry.aggregate()
+    assert total["sessions"] == 2 and total["count"] == 2
+    assert total["p50"] == pytest.approx(0.25)
+    assert total["rtf"] == pytest.approx(0.1)
+
+    registry.clear()
+    assert registry.aggregate()["sessions"] == 0
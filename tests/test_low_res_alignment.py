@@ -0,0 +1,81 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from realtime_engine_ko.low_res_alignment import LowResAligner, expand_pooled_path, pool_frames
+
+from conftest import TOKENIZER
+
+
+def test_pool_frames_averages_groups_and_tail():
+    X = np.arange(14, dtype=np.float32).reshape(7, 2)
+    pooled = pool_frames(X, 3)
+    np.testing.assert_allclose(pooled, [[2, 3], [8, 9], [12, 13]])
+    assert pool_frames(X, 1) is X
+
+
+def test_expand_pooled_path_drops_frames_past_the_end():
+    frames, tokens = expand_pooled_path(np.array([0, 1, 2]), np.array([0, 0, 1]), 3, 7)
+    assert frames.tolist() == [0, 1, 2, 3, 4, 5, 6]
+    assert tokens.tolist() == [0, 0, 0, 0, 0, 0, 1]
+
+
+def test_projection_keeps_the_leading_components():
+    rng = np.random.default_rng(0)
+    # 두 방향에만 큰 분산이 있는 prototype
+    basis = np.linalg.qr(rng.standard_normal((16, 16)))[0]
+    P = rng.standard_normal((200, 16)) * np.array([10.0, 5.0] + [0.01] * 14) @ basis.T
+    projection = LowResAligner.compute_projection(P, 2)
+
+    assert projection.shape == (16, 2)
+    np.testing.assert_allclose(projection.T @ projection, np.eye(2), atol=1e-5)
+    captured = np.linalg.norm((P - P.mean(0)) @ projection) ** 2 / np.linalg.norm(P - P.mean(0)) ** 2
+    assert captured > 0.99
+
+
+def test_projection_is_cached_next_to_the_model(tmp_path):
+    model = str(tmp_path / "m.onnx")
+    with open(model, "wb") as f:
+        f.write(b"model")
+    P = np.random.default_rng(0).standard_normal((30, 8)).astype(np.float32)
+
+    first = LowResAligner.load_or_build(model, P, dim=4, pool_factor=3)
+    assert os.path.exists(LowResAligner.cache_path(model, 4))
+    assert first.dim == 4 and first.pool_factor == 3
+    np.testing.assert_allclose(first.prototypes, P @ first.projection, rtol=1e-5)
+
+    # 캐시가 있으면 (prototype이 달라도) 저장된 투영을 그대로 읽음
+    cached = LowResAligner.load_or_build(model, P * 2.0, dim=4)
+    np.testing.assert_array_equal(cached.projection, first.projection)
+
+    # 모델 파일이 바뀌면 다시 계산
+    with open(model, "ab") as f:
+        f.write(b" changed")
+    rebuilt = LowResAligner.load_or_build(model, np.flip(P, axis=1).copy(), dim=4)
+    assert not np.array_equal(rebuilt.projection, first.projection)
+
+
+def test_low_res_scoring_covers_every_frame(tmp_path, tiny_model_path):
+    for module in ("torch", "onnxruntime", "tokenizers"):
+        pytest.importorskip(module)
+    from realtime_engine_ko.low_res_alignment import calibration_report
+    from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+    model = str(tmp_path / "tiny.onnx")
+    shutil.copy(tiny_model_path, model)
+    core = Wav2VecCTCOnnxCore(model, TOKENIZER, alignment_backend="numpy", low_res_dim=4, low_res_pool=2)
+    assert core.low_res.dim == 4
+
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((61, 16)).astype(np.float32)
+    logits = rng.standard_normal((61, core.prototype_matrix.shape[0])).astype(np.float32)
+    safe_ids = core.tokenize("나는 학교에")
+    pX, pY = core.align_tokens(X, safe_ids, low_res=True)
+    assert np.unique(pX).tolist() == list(range(61))
+    assert np.all(np.diff(pY) >= 0) and pY[0] == 0 and pY[-1] == len(safe_ids) - 1
+
+    report = calibration_report(core, [(X, logits, "나는 학교에")])
+    assert report["samples"] == 1 and report["words"] == 2
+    assert report["dim"] == 4 and report["pool_factor"] == 2
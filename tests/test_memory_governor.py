@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from realtime_engine_ko.alignment_backends import band_window, create_backend
+from realtime_engine_ko.memory_governor import DegradationLevel, MemoryGovernor
+
+MB = 1024 * 1024
+
+
+def test_levels_follow_thresholds_with_drop_hidden_first():
+    governor = MemoryGovernor(budget_bytes=100 * MB, thresholds=(0.6, 0.75, 0.9))
+    session = governor.register("s")
+    expected = [
+        (10, DegradationLevel.NORMAL),
+        (60, DegradationLevel.DROP_HIDDEN),
+        (75, DegradationLevel.NARROW_BAND),
+        (95, DegradationLevel.SHORT_CONTEXT),
+        (20, DegradationLevel.NORMAL),
+    ]
+    for used_mb, level in expected:
+        session.update(timeline=used_mb * MB)
+        assert session.level() == level
+    assert session.summary()["peak_bytes"] == 95 * MB
+
+
+def test_policy_actions_are_cumulative():
+    governor = MemoryGovernor(narrow_band=0.15, normal_context_blocks=2, short_context_blocks=0)
+    policies = {level: governor.policy_for(level) for level in DegradationLevel}
+
+    assert policies[DegradationLevel.NORMAL].to_dict() == {
+        "level": "NORMAL", "dtw_band": None, "keep_hidden": True, "context_blocks": 2
+    }
+    assert not policies[DegradationLevel.DROP_HIDDEN].keep_hidden
+    assert policies[DegradationLevel.DROP_HIDDEN].dtw_band is None
+    assert policies[DegradationLevel.NARROW_BAND].dtw_band == 0.15
+    assert policies[DegradationLevel.NARROW_BAND].context_blocks == 2
+    short = policies[DegradationLevel.SHORT_CONTEXT]
+    assert (short.keep_hidden, short.dtw_band, short.context_blocks) == (False, 0.15, 0)
+
+
+def test_session_budget_can_raise_level_above_process_level():
+    governor = MemoryGovernor(budget_bytes=1000 * MB)
+    small = governor.register("small", budget_bytes=10 * MB)
+    other = governor.register("other")
+    small.update(hidden=8 * MB)
+    assert small.level() == DegradationLevel.NARROW_BAND
+    assert other.level() == DegradationLevel.NORMAL
+
+    governor.unregister("small")
+    assert governor.total_bytes() == 0
+
+
+def test_process_level_sums_sessions():
+    governor = MemoryGovernor(budget_bytes=100 * MB)
+    for i in range(3):
+        governor.register(str(i)).update(audio_buffer=25 * MB)
+    assert governor.process_level() == DegradationLevel.NARROW_BAND
+    snapshot = governor.snapshot()
+    assert snapshot["usage"]["audio_buffer"] == 75 * MB
+    assert len(snapshot["sessions"]) == 3
+
+
+def test_numpy_dtw_bytes_shrink_with_band():
+    backend = create_backend("numpy")
+    full = backend.matrix_bytes(400, 60)
+    window = band_window(400, 60, 0.15)
+    assert backend.matrix_bytes(400, 60, window) == full
+    assert backend.matrix_bytes(400, 30, 10) < backend.matrix_bytes(400, 30)
+    assert backend.matrix_bytes(400, 30, 10) == 400 * 21 + 48 * 30
+
+
+def test_engine_reports_dtw_bytes_for_real_reference_length(tiny_engine):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((120, 16)).astype(np.float32)
+    Y = rng.standard_normal((100, 16)).astype(np.float32)
+
+    # 공유 엔진이라 앞선 테스트의 정렬 기록이 남아 있을 수 있음
+    tiny_engine.take_dtw_bytes()
+    tiny_engine.dtw_align(X, Y)
+    assert tiny_engine.take_dtw_bytes() == tiny_engine.aligner.matrix_bytes(120, 100)
+    assert tiny_engine.take_dtw_bytes() == 0
+
+    window = band_window(120, 100, 0.3)
+    assert 2 * window + 1 < 100
+    tiny_engine.dtw_align(X, Y, band=0.3)
+    assert tiny_engine.take_dtw_bytes() == tiny_engine.aligner.matrix_bytes(120, 100, window)
+    assert tiny_engine.aligner.matrix_bytes(120, 100, window) < tiny_engine.aligner.matrix_bytes(120, 100)
+
+
+def test_first_degradation_step_frees_timeline_hidden():
+    pytest.importorskip("torch")
+    from realtime_engine_ko.eval_manager import EvaluationController
+    from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+    from realtime_engine_ko.progress_tracker import ProgressTracker
+    from realtime_engine_ko.sentence_block import SentenceBlockManager
+
+    sentence_manager = SentenceBlockManager("나는 학교에 갑니다")
+    timeline = PosteriorTimeline()
+    hidden = np.ones((50, 16), dtype=np.float32)
+    timeline.append(0.0, 1.0, hidden, np.ones((50, 8), dtype=np.float32))
+    controller = EvaluationController(None, sentence_manager, ProgressTracker(len(sentence_manager.blocks)),
+                                      timeline=timeline)
+
+    governor = MemoryGovernor(budget_bytes=100 * MB)
+    ram_before = timeline.memory_usage()["ram_bytes"]
+    controller._apply_policy(governor.policy_for(DegradationLevel.DROP_HIDDEN))
+    assert not timeline.keep_hidden
+    assert timeline.memory_usage()["ram_bytes"] == ram_before - hidden.nbytes
+    assert controller.dtw_band is None
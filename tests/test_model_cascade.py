@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from realtime_engine_ko.model_cascade import TrackingAgreement, check_vocab_compatible
+
+from conftest import TOKENIZER
+
+SENTENCE = "나는 학교에 갑니다"
+
+
+def test_vocab_mismatch_is_rejected():
+    primary = SimpleNamespace(prototype_matrix=np.zeros((10, 4)), blank_id=4)
+    check_vocab_compatible(primary, SimpleNamespace(prototype_matrix=np.zeros((10, 2)), blank_id=4))
+    with pytest.raises(ValueError):
+        check_vocab_compatible(primary, SimpleNamespace(prototype_matrix=np.zeros((11, 4)), blank_id=4))
+    with pytest.raises(ValueError):
+        check_vocab_compatible(primary, SimpleNamespace(prototype_matrix=np.zeros((10, 4)), blank_id=3))
+
+
+def test_agreement_summary():
+    agreement = TrackingAgreement()
+    assert agreement.summary()["primary_encode_ratio"] is None
+    for encoded in (True, False, False, False):
+        agreement.record_chunk(primary_encoded=encoded)
+    agreement.record_confirmation(tracking_score=40.0, primary_score=30.0, threshold=20.0)
+    agreement.record_confirmation(tracking_score=40.0, primary_score=10.0, threshold=20.0)
+    agreement.record_audit(1, 1)
+    agreement.record_audit(1, 2)
+    agreement.record_audit(None, None)
+
+    assert agreement.summary() == {
+        "chunks": 4, "primary_encodes": 1, "primary_encode_ratio": 0.25,
+        "confirmations": 2, "confirm_agreement": 0.5, "mean_abs_score_diff": 20.0,
+        "audits": 3, "block_agreement": 0.6667
+    }
+    agreement.reset()
+    assert agreement.summary()["chunks"] == 0
+
+
+def test_audit_rate_is_clamped():
+    agreement = TrackingAgreement()
+    assert not agreement.should_audit()
+    agreement.configure(audit_rate=5.0)
+    assert agreement.audit_rate == 1.0 and agreement.should_audit()
+    agreement.configure()
+    assert agreement.audit_rate == 1.0
+
+
+@pytest.fixture(scope="module")
+def tracking_engine(tmp_path_factory):
+    for module in ("torch", "onnx", "onnxruntime", "tokenizers"):
+        pytest.importorskip(module)
+    from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+    from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+    path = build_tiny_model(str(tmp_path_factory.mktemp("tracking") / "tracking.onnx"),
+                            vocab_size=tokenizer_vocab_size(TOKENIZER), hidden_dim=8, seed=1)
+    return Wav2VecCTCOnnxCore(path, TOKENIZER, alignment_backend="numpy")
+
+
+def _controller(primary, tracking, agreement, threshold):
+    from realtime_engine_ko.eval_manager import EvaluationController
+    from realtime_engine_ko.progress_tracker import ProgressTracker
+    from realtime_engine_ko.sentence_block import SentenceBlockManager
+
+    sentence_manager = SentenceBlockManager(SENTENCE)
+    return EvaluationController(primary, sentence_manager, ProgressTracker(len(sentence_manager.blocks)),
+                                confidence_threshold=threshold, min_time_between_evals=0.0,
+                                tracking_engine=tracking, agreement=agreement)
+
+
+def _chunks(count):
+    import torch
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        yield torch.from_numpy(rng.standard_normal((1, 16000)).astype(np.float32)), \
+            {"start_time": float(i), "end_time": float(i + 1)}
+
+
+def test_primary_model_runs_only_for_confirmed_blocks(tiny_engine, tracking_engine, monkeypatch):
+    calls = []
+    original = tiny_engine.encode
+    monkeypatch.setattr(tiny_engine, "encode", lambda *a, **k: calls.append(1) or original(*a, **k))
+    check_vocab_compatible(tiny_engine, tracking_engine)
+
+    agreement = TrackingAgreement()
+    controller = _controller(tiny_engine, tracking_engine, agreement, threshold=1000.0)
+    for chunk, metadata in _chunks(3):
+        controller.process_recognition_result(chunk, metadata)
+    assert calls == []
+    assert agreement.summary()["primary_encode_ratio"] == 0.0
+
+    # 임계값이 낮으면 청크마다 블록이 확정되고 확정 점수는 채점 모델로 계산
+    agreement = TrackingAgreement()
+    controller = _controller(tiny_engine, tracking_engine, agreement, threshold=-1.0)
+    for chunk, metadata in _chunks(2):
+        controller.process_recognition_result(chunk, metadata)
+    summary = agreement.summary()
+    assert len(calls) == 2
+    assert summary["primary_encode_ratio"] == 1.0 and summary["confirmations"] == 2
+    confirmed = [r for r in controller.cached_results.values() if "tracking_score" in r]
+    assert len(confirmed) == 2
+
+
+def test_audits_rerun_candidate_search_on_the_primary_model(tiny_engine, tracking_engine):
+    agreement = TrackingAgreement(audit_rate=1.0)
+    controller = _controller(tiny_engine, tracking_engine, agreement, threshold=1000.0)
+    for chunk, metadata in _chunks(2):
+        controller.process_recognition_result(chunk, metadata)
+    summary = agreement.summary()
+    assert summary["audits"] == 2 and summary["primary_encodes"] == 2
+    assert summary["block_agreement"] is not None
+
+
+def test_memory_is_charged_for_the_primary_outputs_that_are_kept(tiny_engine, tracking_engine):
+    from realtime_engine_ko.memory_governor import MemoryGovernor
+    from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+
+    # 확정이 없으면 채점 모델 출력이 없으므로 추적 모델 출력 크기를 세지 않음
+    controller = _controller(tiny_engine, tracking_engine, TrackingAgreement(), threshold=1000.0)
+    controller.memory = MemoryGovernor().register("tracking-only")
+    for chunk, metadata in _chunks(1):
+        controller.process_recognition_result(chunk, metadata)
+    assert controller.memory.usage["hidden"] == 0 and controller.memory.usage["probs"] == 0
+
+    # 확정된 청크는 채점 모델 출력 크기와 그 출력을 추가한 뒤의 타임라인 크기
+    controller = _controller(tiny_engine, tracking_engine, TrackingAgreement(), threshold=-1.0)
+    controller.memory = MemoryGovernor().register("confirmed")
+    controller.timeline = PosteriorTimeline()
+    for chunk, metadata in _chunks(1):
+        controller.process_recognition_result(chunk, metadata)
+        hidden, logits = tiny_engine.encode(chunk, reuse_outputs=False)
+    assert controller.memory.usage["hidden"] == hidden.nbytes
+    assert controller.memory.usage["probs"] == logits.nbytes
+    assert controller.memory.usage["timeline"] == controller.timeline.memory_usage()["ram_bytes"] > 0
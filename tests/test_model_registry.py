@@ -0,0 +1,114 @@
+import threading
+
+import numpy as np
+import pytest
+
+for module in ("torch", "onnx", "onnxruntime", "tokenizers"):
+    pytest.importorskip(module)
+
+from realtime_engine_ko import model_registry as registry_module
+from realtime_engine_ko.model_registry import ModelRegistry
+
+FILE_BYTES = 1000
+PROTO_BYTES = 10 * 10 * 4
+
+
+class FakeCore:
+    """파일 크기와 prototype 행렬만 가진 엔진 (로드 횟수 기록)"""
+    loads = []
+
+    def __init__(self, onnx_model_path, **kwargs):
+        self.onnx_model_path = onnx_model_path
+        self.prototype_matrix = np.zeros((10, 10), dtype=np.float32)
+        self.low_res = None
+        FakeCore.loads.append(onnx_model_path)
+
+    def warmup(self):
+        pass
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry_module, "Wav2VecCTCOnnxCore", FakeCore)
+    FakeCore.loads = []
+    # 모델 두 개까지만 올라가는 상한
+    registry = ModelRegistry(memory_cap_bytes=2 * (FILE_BYTES + PROTO_BYTES) + 100)
+    for key in "abc":
+        path = tmp_path / f"{key}.onnx"
+        path.write_bytes(b"x" * FILE_BYTES)
+        registry.register(key, str(path), "tokenizer.json")
+    return registry
+
+
+def _state(registry):
+    return {key: (m["loaded"], m["sessions"]) for key, m in registry.snapshot()["models"].items()}
+
+
+def test_model_is_loaded_once_and_shared(registry):
+    first = registry.acquire("a")
+    second = registry.acquire("a")
+    assert first is second
+    assert len(FakeCore.loads) == 1
+    assert registry.snapshot()["models"]["a"]["hits"] == 1
+    assert _state(registry)["a"] == (True, 2)
+    assert first.size_bytes == FILE_BYTES + PROTO_BYTES
+
+
+def test_least_recently_used_idle_model_is_evicted(registry):
+    registry.acquire("a")
+    registry.release("a")
+    registry.acquire("b")
+    registry.release("b")
+    registry.acquire("a")
+    registry.release("a")
+
+    registry.acquire("c")
+    assert _state(registry) == {"a": (True, 0), "b": (False, 0), "c": (True, 1)}
+    assert registry.snapshot()["models"]["b"]["evictions"] == 1
+    assert registry.resident_bytes() == 2 * (FILE_BYTES + PROTO_BYTES)
+
+
+def test_models_in_use_are_never_evicted(registry):
+    registry.acquire("a")
+    registry.acquire("b")
+    registry.acquire("c")
+    assert _state(registry) == {"a": (True, 1), "b": (True, 1), "c": (True, 1)}
+    assert not registry.evict("a")
+
+    # 사용이 끝나면 상한 안으로 돌아올 때까지 LRU 순서로 내림
+    registry.release("a")
+    assert _state(registry)["a"] == (False, 0)
+
+
+def test_evicted_model_reloads_on_next_acquire(registry):
+    registry.acquire("a")
+    registry.release("a")
+    assert registry.evict("a")
+    registry.acquire("a")
+    assert FakeCore.loads.count(registry._specs["a"].onnx_model_path) == 2
+    assert registry.snapshot()["models"]["a"]["loads"] == 2
+
+
+def test_concurrent_acquire_loads_once(registry):
+    entries = []
+    threads = [threading.Thread(target=lambda: entries.append(registry.acquire("a"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(FakeCore.loads) == 1
+    assert all(entry is entries[0] for entry in entries)
+    assert _state(registry)["a"] == (True, 8)
+
+
+def test_unknown_key_raises(registry):
+    with pytest.raises(KeyError):
+        registry.acquire("missing")
+
+
+def test_unregister_drops_idle_model(registry):
+    registry.acquire("a")
+    registry.release("a")
+    registry.unregister("a")
+    assert "a" not in registry.keys()
+    assert registry.resident_bytes() == 0
@@ -0,0 +1,80 @@
+import sys
+import types
+
+import pytest
+
+for module in ("torch", "onnx", "onnxruntime", "tokenizers", "dtw"):
+    pytest.importorskip(module)
+
+import torch
+
+from benchmarks import parity
+from realtime_engine_ko.alignment_backends import create_backend
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+from conftest import TOKENIZER
+
+
+def _fake_native():
+    """pyrealtime과 같은 인터페이스를 Python 코어로 흉내 내는 모듈 (하네스 배선만 확인)"""
+
+    class NativeCore:
+        def __init__(self, model_path, tokenizer_path):
+            self.core = Wav2VecCTCOnnxCore(model_path, tokenizer_path)
+
+        def set_prototype_matrix(self, matrix):
+            self.core.prototype_matrix = matrix
+
+        def encode(self, audio):
+            return self.core.encode(torch.from_numpy(audio).unsqueeze(0), reuse_outputs=False)
+
+        def calculate_gop_from_features(self, X, logits, text):
+            return self.core.calculate_gop_from_features(X, logits, text)
+
+        def calculate_gop_from_tensor(self, audio, text):
+            return self.core.calculate_gop_from_tensor(torch.from_numpy(audio).unsqueeze(0), text)
+
+    aligner = create_backend("python-dtw")
+
+    def dtw_align(X, Y):
+        path_x, path_y = aligner.align(X, Y)
+        return list(map(int, path_x)), list(map(int, path_y))
+
+    module = types.ModuleType("fake_native")
+    module.Wav2VecCTCOnnxCore = NativeCore
+    module.dtw_align = dtw_align
+    return module
+
+
+def test_missing_native_module_is_reported():
+    assert parity.load_native("no_such_native_module") is None
+    with pytest.raises(RuntimeError):
+        parity.run_parity(TOKENIZER, native_module="no_such_native_module")
+
+
+def test_compare_words_pads_missing_words():
+    python_words = [{"word": "나는", "scores": {"pronunciation": 80.0}},
+                    {"word": "학교에", "scores": {"pronunciation": 60.0}}]
+    native_words = [{"word": "나는", "scores": {"pronunciation": 78.5}}]
+    rows = parity.compare_words(python_words, native_words)
+    assert rows[0] == {"word": "나는", "python": 80.0, "native": 78.5, "diff": 1.5}
+    assert rows[1] == {"word": "학교에", "python": 60.0, "native": None, "diff": None}
+
+
+def test_identical_implementations_report_exact_parity(monkeypatch, tiny_model_path):
+    monkeypatch.setitem(sys.modules, "fake_native", _fake_native())
+    result = parity.run_parity(TOKENIZER, model_path=tiny_model_path, audio_seconds=(1.0,),
+                               sentence_words=(2, 4), repeats=1, native_module="fake_native")
+
+    assert result["meta"]["prototype"] == "python"
+    assert len(result["results"]) == 2
+    for row in result["results"]:
+        stages = row["stages"]
+        assert stages["encoder"]["hidden_max_abs_diff"] == 0.0
+        assert stages["encoder"]["logits_max_abs_diff"] == 0.0
+        assert stages["dtw"]["path_identical"]
+        assert stages["dtw"]["frame_token_agreement"] == 1.0
+        for stage in ("scoring", "end_to_end"):
+            assert stages[stage]["word_count_match"]
+            assert stages[stage]["max_word_diff"] == 0.0
+    assert result["throughput"]["python_x_realtime"] > 0
@@ -0,0 +1,105 @@
+import gc
+import os
+
+import numpy as np
+
+from realtime_engine_ko.posterior_timeline import PosteriorTimeline
+
+
+def _segment(frames, seed=0, dim=8, vocab=5):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((frames, dim)).astype(np.float32), rng.standard_normal((frames, vocab)).astype(np.float32)
+
+
+def test_get_range_returns_frames_at_absolute_times():
+    timeline = PosteriorTimeline()
+    hidden0, logits0 = _segment(10, seed=0)
+    hidden1, logits1 = _segment(10, seed=1)
+    timeline.append(0.0, 1.0, hidden0, logits0)
+    timeline.append(1.0, 2.0, hidden1, logits1)
+
+    hidden, logits, times = timeline.get_range(0.5, 1.5)
+    np.testing.assert_array_equal(logits, np.concatenate([logits0[5:], logits1[:5]]))
+    np.testing.assert_array_equal(hidden, np.concatenate([hidden0[5:], hidden1[:5]]))
+    np.testing.assert_allclose(times, np.arange(5, 15) * 0.1)
+
+
+def test_append_copies_caller_buffers():
+    timeline = PosteriorTimeline()
+    hidden, logits = _segment(4)
+    timeline.append(0.0, 0.4, hidden, logits)
+    expected = logits.copy()
+    logits[:] = 0.0
+    np.testing.assert_array_equal(timeline.get_range(0.0, 0.4)[1], expected)
+
+
+def test_segments_older_than_max_duration_are_evicted():
+    timeline = PosteriorTimeline(max_duration=2.0)
+    for i in range(5):
+        timeline.append(float(i), float(i + 1), *_segment(10, seed=i))
+
+    assert timeline.memory_usage()["segments"] == 2
+    assert timeline.start_time == 3.0
+    assert timeline.get_range(0.0, 3.0)[1] is None
+
+
+def test_over_budget_segments_spill_to_memmap_and_read_back():
+    hidden, logits = _segment(10)
+    timeline = PosteriorTimeline(ram_budget_bytes=hidden.nbytes + logits.nbytes)
+    segments = [_segment(10, seed=i) for i in range(3)]
+    for i, (h, l) in enumerate(segments):
+        timeline.append(float(i), float(i + 1), h, l)
+
+    usage = timeline.memory_usage()
+    assert usage["ram_bytes"] == hidden.nbytes + logits.nbytes
+    assert usage["disk_bytes"] == 2 * (hidden.nbytes + logits.nbytes)
+    spill_dir = timeline._spill_dir
+    assert len(os.listdir(spill_dir)) == 4
+
+    got_hidden, got_logits, _ = timeline.get_range(0.0, 3.0)
+    np.testing.assert_array_equal(got_logits, np.concatenate([l for _, l in segments]))
+    np.testing.assert_array_equal(got_hidden, np.concatenate([h for h, _ in segments]))
+
+    timeline.clear()
+    assert not os.path.exists(spill_dir)
+    assert timeline.memory_usage()["segments"] == 0
+
+
+def test_drop_hidden_frees_ram_and_removes_spilled_hidden_files():
+    hidden, logits = _segment(10)
+    timeline = PosteriorTimeline(ram_budget_bytes=hidden.nbytes + logits.nbytes)
+    timeline.append(0.0, 1.0, hidden, logits)
+    timeline.append(1.0, 2.0, hidden, logits)
+
+    assert timeline.drop_hidden() == hidden.nbytes
+    assert os.listdir(timeline._spill_dir) == ["seg0_logits.npy"]
+    got_hidden, got_logits, _ = timeline.get_range(0.0, 2.0)
+    assert got_hidden is None
+    assert got_logits.shape == (20, logits.shape[1])
+
+    timeline.append(2.0, 3.0, hidden, logits)
+    assert timeline.memory_usage()["ram_bytes"] == logits.nbytes * 2
+    timeline.clear()
+
+
+def test_abandoned_timeline_removes_its_spill_dir():
+    hidden, logits = _segment(10)
+    timeline = PosteriorTimeline(ram_budget_bytes=0)
+    timeline.append(0.0, 1.0, hidden, logits)
+    timeline.append(1.0, 2.0, hidden, logits)
+    spill_dir = timeline._spill_dir
+    assert os.path.isdir(spill_dir)
+
+    del timeline
+    gc.collect()
+    assert not os.path.exists(spill_dir)
+
+
+def test_caller_spill_dir_is_kept(tmp_path):
+    hidden, logits = _segment(10)
+    timeline = PosteriorTimeline(ram_budget_bytes=0, spill_dir=str(tmp_path / "spill"))
+    timeline.append(0.0, 1.0, hidden, logits)
+    timeline.append(1.0, 2.0, hidden, logits)
+    timeline.clear()
+    assert (tmp_path / "spill").is_dir()
+    assert list((tmp_path / "spill").iterdir()) == []
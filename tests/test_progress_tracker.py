@@ -0,0 +1,57 @@
+import pytest
+
+from realtime_engine_ko.progress_tracker import ProgressTracker
+from realtime_engine_ko.sentence_block import count_syllables
+
+DEFAULT = ProgressTracker.DEFAULT_SECONDS_PER_SYLLABLE
+
+
+def test_count_syllables():
+    assert count_syllables("학교에 갑니다") == 6
+    assert count_syllables("abc de") == 5
+    assert count_syllables("  ") == 1
+
+
+def test_expected_duration_scales_with_block_syllables():
+    tracker = ProgressTracker(3, block_syllables=[2, 3, 5])
+    assert tracker.expected_duration(0) == pytest.approx(2 * DEFAULT)
+    assert tracker.expected_duration(2) == pytest.approx(5 * DEFAULT)
+    # 범위를 벗어나면 양 끝 블록
+    assert tracker.expected_duration(9) == tracker.expected_duration(2)
+    assert tracker.expected_duration(-1) == tracker.expected_duration(0)
+
+
+def test_rate_is_learned_from_confirmed_block_times():
+    tracker = ProgressTracker(4, block_syllables=[2, 3, 3, 4], rate_smoothing=0.5)
+    tracker.record_block_timing(0, 1.0)
+    assert tracker.seconds_per_syllable == DEFAULT
+
+    # 블록 1, 2 (6음절)를 1.2초에 말함 -> 0.2초/음절, 계수 0.5로 평균
+    tracker.record_block_timing(2, 2.2)
+    assert tracker.seconds_per_syllable == pytest.approx(0.5 * DEFAULT + 0.5 * 0.2)
+    assert tracker.expected_duration(3) == pytest.approx(4 * tracker.seconds_per_syllable)
+
+    # 되돌아간 블록이나 시간이 거꾸로 간 기록은 무시
+    learned = tracker.seconds_per_syllable
+    tracker.record_block_timing(1, 3.0)
+    tracker.record_block_timing(3, 2.0)
+    tracker.record_block_timing(3, None)
+    assert tracker.seconds_per_syllable == learned
+
+
+def test_learned_rate_is_clamped():
+    tracker = ProgressTracker(3, block_syllables=[1, 1, 1], rate_smoothing=1.0)
+    tracker.record_block_timing(0, 0.0)
+    tracker.record_block_timing(1, 0.001)
+    assert tracker.seconds_per_syllable == ProgressTracker.MIN_SECONDS_PER_SYLLABLE
+    tracker.record_block_timing(2, 30.0)
+    assert tracker.seconds_per_syllable == ProgressTracker.MAX_SECONDS_PER_SYLLABLE
+
+
+def test_reset_can_keep_the_learned_rate():
+    tracker = ProgressTracker(2, block_syllables=[1, 1])
+    tracker.seconds_per_syllable = 0.15
+    tracker.reset(keep_rate=True)
+    assert tracker.seconds_per_syllable == 0.15
+    tracker.reset()
+    assert tracker.seconds_per_syllable == DEFAULT
@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from realtime_engine_ko import quantization
+from realtime_engine_ko.quantization import manifest_path, resolve_variant, variant_path
+from realtime_engine_ko.result_cache import model_fingerprint
+
+from conftest import TOKENIZER
+
+
+@pytest.fixture
+def model_with_variants(tmp_path):
+    """가짜 원본과 변형 파일, 매니페스트 (int8 채택/빠름, uint8 기각/가장 빠름, fp16 채택/느림/큼)"""
+    model = str(tmp_path / "m.onnx")
+    with open(model, "wb") as f:
+        f.write(b"x" * 100)
+    for name, size in (("int8", 30), ("uint8", 20), ("fp16", 50)):
+        with open(variant_path(model, name), "wb") as f:
+            f.write(b"y" * size)
+    manifest = {
+        "source_hash": model_fingerprint(model),
+        "variants": {
+            "int8": {"path": "m.int8.onnx", "bytes": 30, "accepted": True,
+                     "drift": {"speedup": 2.0, "variant_ms": 10.0}},
+            "uint8": {"path": "m.uint8.onnx", "bytes": 20, "accepted": False,
+                      "drift": {"speedup": 2.5, "variant_ms": 8.0}},
+            "fp16": {"path": "m.fp16.onnx", "bytes": 50, "accepted": True,
+                     "drift": {"speedup": 0.5, "variant_ms": 40.0}},
+            "int8-matmul": {"error": "quantization failed", "accepted": False}
+        }
+    }
+    with open(manifest_path(model), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return model
+
+
+def _name(path):
+    return os.path.basename(path)
+
+
+def test_paths_sit_next_to_the_source(tmp_path):
+    model = str(tmp_path / "wav2vec.onnx")
+    assert variant_path(model, "int8") == str(tmp_path / "wav2vec.int8.onnx")
+    assert manifest_path(model) == str(tmp_path / "wav2vec.variants.json")
+
+
+def test_float_policy_and_missing_manifest_use_the_source(tmp_path, model_with_variants):
+    assert resolve_variant(model_with_variants, None) == model_with_variants
+    assert resolve_variant(model_with_variants, "float") == model_with_variants
+
+    bare = str(tmp_path / "bare.onnx")
+    with open(bare, "wb") as f:
+        f.write(b"z")
+    assert resolve_variant(bare, "fastest") == bare
+
+
+def test_fastest_skips_rejected_and_slower_variants(model_with_variants):
+    # uint8가 가장 빠르지만 기각, fp16은 원본보다 느림
+    assert _name(resolve_variant(model_with_variants, "fastest")) == "m.int8.onnx"
+
+
+def test_smallest_picks_the_smallest_accepted_file(model_with_variants):
+    assert _name(resolve_variant(model_with_variants, "smallest")) == "m.int8.onnx"
+
+
+def test_named_variant_is_used_even_if_rejected(model_with_variants):
+    assert _name(resolve_variant(model_with_variants, "uint8")) == "m.uint8.onnx"
+    assert _name(resolve_variant(model_with_variants, "fp16")) == "m.fp16.onnx"
+    # 생성에 실패해 파일이 없는 변형은 원본으로
+    assert resolve_variant(model_with_variants, "int8-matmul") == model_with_variants
+
+
+def test_missing_variant_file_is_skipped(model_with_variants):
+    os.remove(variant_path(model_with_variants, "int8"))
+    assert resolve_variant(model_with_variants, "fastest") == model_with_variants
+    assert _name(resolve_variant(model_with_variants, "smallest")) == "m.fp16.onnx"
+
+
+def test_changed_source_invalidates_the_manifest(model_with_variants):
+    with open(model_with_variants, "ab") as f:
+        f.write(b"changed")
+    assert resolve_variant(model_with_variants, "fastest") == model_with_variants
+    assert resolve_variant(model_with_variants, "uint8") == model_with_variants
+
+
+def test_unknown_policy_raises(model_with_variants):
+    with pytest.raises(ValueError):
+        resolve_variant(model_with_variants, "bogus")
+    with pytest.raises(ValueError):
+        quantization.quantize_variant(model_with_variants, "int4")
+
+
+def test_unreadable_manifest_falls_back_to_source(model_with_variants):
+    with open(manifest_path(model_with_variants), "w", encoding="utf-8") as f:
+        f.write("{not json")
+    assert quantization.read_manifest(model_with_variants) is None
+    assert resolve_variant(model_with_variants, "fastest") == model_with_variants
+
+
+def test_int8_variant_of_tiny_model_loads_through_precision(tmp_path, tiny_model_path):
+    pytest.importorskip("onnxruntime.quantization")
+    pytest.importorskip("torch")
+    import torch
+    from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+    model = str(tmp_path / "tiny.onnx")
+    shutil.copy(tiny_model_path, model)
+    path = quantization.quantize_variant(model, "int8")
+    assert path == variant_path(model, "int8")
+    quantization._write_manifest(model, {
+        "source_hash": model_fingerprint(model),
+        "variants": {"int8": {"path": os.path.basename(path), "bytes": os.path.getsize(path), "accepted": True,
+                              "drift": {"speedup": 1.5, "variant_ms": 1.0}}}
+    })
+
+    reference = Wav2VecCTCOnnxCore(model, TOKENIZER, alignment_backend="numpy")
+    candidate = Wav2VecCTCOnnxCore(model, TOKENIZER, alignment_backend="numpy", precision="fastest")
+    assert candidate.onnx_model_path == path
+
+    audio = torch.from_numpy(np.random.default_rng(0).standard_normal((1, 8000)).astype(np.float32))
+    _, logits_ref = reference.encode(audio)
+    _, logits_var = candidate.encode(audio)
+    assert logits_ref.shape == logits_var.shape
+    assert np.mean(logits_ref.argmax(-1) == logits_var.argmax(-1)) > 0.5
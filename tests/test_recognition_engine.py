@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tokenizers")
+
+from realtime_engine_ko.recognition_engine import EngineCoordinator
+from realtime_engine_ko.session_pool import SessionComponentPool
+
+
+class StubEngine:
+    """초기화/재시도 흐름에 필요한 속성만 가진 인식 엔진"""
+    low_res = None
+    onnx_model_path = "stub.onnx"
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    engine = StubEngine()
+    coordinator = EngineCoordinator(recognition_engine=engine, component_pool=SessionComponentPool(engine),
+                                    chunk_bounds=None, crop_padding=None)
+    assert coordinator.initialize("나는 학교에 갑니다")
+    coordinator.base_chunk_duration = 0.5
+    coordinator.audio_processor.chunk_duration = 0.5
+    scored = []
+
+    def process(audio_chunk, metadata):
+        scored.append(metadata)
+        return {}
+
+    monkeypatch.setattr(coordinator.eval_controller, "process_recognition_result", process)
+    coordinator.scored = scored
+    yield coordinator
+    coordinator.close()
+
+
+def _noise(n, seed=0):
+    return (np.random.default_rng(seed).standard_normal(n) * 0.1).astype(np.float32)
+
+
+def test_retry_keeps_components_and_rotates_timelines(coordinator):
+    components = coordinator.components
+    first = coordinator.timeline
+    coordinator.eval_controller.cached_results[0] = {"gop_score": 50.0, "start_time": 0.0, "end_time": 1.0}
+    coordinator.progress_tracker.seconds_per_syllable = 0.2
+
+    assert coordinator.retry()
+    assert coordinator.components is components
+    assert coordinator.attempt == 2
+    assert coordinator.previous_timeline is first
+    assert coordinator.timeline is not first
+    assert coordinator.previous_results[0]["gop_score"] == 50.0
+    assert coordinator.eval_controller.cached_results == {}
+    assert coordinator.progress_tracker.seconds_per_syllable == 0.2
+
+    coordinator.eval_controller.cached_results[0] = {"gop_score": 70.0, "start_time": 0.1, "end_time": 1.1}
+    assert coordinator.compare_attempts()["blocks"][0]["delta"] == pytest.approx(20.0)
+
+    # 세 번째 시도는 두 번 전 타임라인을 비워서 재사용
+    second = coordinator.timeline
+    assert coordinator.retry()
+    assert coordinator.previous_timeline is second
+    assert coordinator.timeline is first
+
+
+def test_retry_then_push_audio_starts_a_fresh_stream(coordinator):
+    assert coordinator.start_stream(tick=False)
+    coordinator.push_audio(_noise(12000), ingest_time=100.0)
+    assert len(coordinator.scored) == 1
+
+    assert coordinator.retry()
+    processor = coordinator.audio_processor
+    assert (processor.received_samples, processor.processed_samples) == (0, 0)
+    assert processor.ingest_marks == []
+    assert processor.latest_chunk_ingest == (None, None)
+
+    coordinator.scored.clear()
+    assert coordinator.start_stream(tick=False)
+    coordinator.push_audio(_noise(4000, seed=1), ingest_time=200.0)
+    assert coordinator.scored == []
+    coordinator.push_audio(_noise(4000, seed=2), ingest_time=201.0)
+    assert len(coordinator.scored) == 1
+    metadata = coordinator.scored[0]
+    assert (metadata["chunk_start_time"], metadata["chunk_end_time"]) == (0.0, 0.5)
+    assert (metadata["first_ingest_time"], metadata["ingest_time"]) == (200.0, 201.0)
+
+
+def test_chunk_length_follows_the_active_block(coordinator):
+    coordinator.chunk_bounds = (0.8, 4.0)
+    tracker = coordinator.progress_tracker
+    expected = tracker.expected_duration(coordinator.sentence_manager.active_block_id) + coordinator.chunk_margin
+    assert coordinator._plan_chunk_duration() == pytest.approx(min(4.0, max(0.8, expected)))
+
+    tracker.seconds_per_syllable = 0.01
+    assert coordinator._plan_chunk_duration() == 0.8
+    tracker.seconds_per_syllable = 5.0
+    assert coordinator._plan_chunk_duration() == 4.0
+
+    # 청크를 채점한 뒤 다음 청크 길이를 다시 계산
+    tracker.seconds_per_syllable = 0.01
+    assert coordinator.start_stream(tick=False)
+    coordinator.push_audio(_noise(8000))
+    assert len(coordinator.scored) == 1
+    assert coordinator.audio_processor.chunk_duration == 0.8
+
+    coordinator.chunk_bounds = None
+    assert coordinator._plan_chunk_duration() == coordinator.base_chunk_duration
+
+
+def test_stop_evaluation_scores_the_rest_of_the_file(coordinator, tmp_path):
+    import soundfile as sf
+
+    path = str(tmp_path / "speech.wav")
+    sf.write(path, _noise(3 * 16000), 16000)
+    coordinator.base_chunk_duration = 2.0
+    coordinator.audio_processor.chunk_duration = 2.0
+
+    assert coordinator.start_evaluation(path)
+    coordinator.stop_evaluation()
+
+    # 청크 길이에 못 미친 마지막 1초도 채점되어 파일 끝까지 덮음
+    assert [(m["chunk_start_time"], m["chunk_end_time"]) for m in coordinator.scored] == [(0.0, 2.0), (2.0, 3.0)]
+    assert coordinator.scored[-1]["end_time"] == pytest.approx(3.0)
+    assert not coordinator.is_running
+
+
+
+def test_reset_keeps_the_previous_attempt_for_the_same_sentence(coordinator, tmp_path):
+    import soundfile as sf
+
+    components = coordinator.components
+    sentence_manager = coordinator.sentence_manager
+    first = coordinator.timeline
+    coordinator.eval_controller.cached_results[0] = {"gop_score": 50.0, "start_time": 0.0, "end_time": 1.0}
+
+    coordinator.reset()
+    assert coordinator.previous_timeline is first
+    assert coordinator.previous_results[0]["gop_score"] == 50.0
+    assert coordinator.eval_controller.cached_results == {}
+
+    # 같은 문장이면 블록을 다시 만들지 않고, 빈 시도가 직전 시도를 덮지 않음
+    path = str(tmp_path / "speech.wav")
+    sf.write(path, _noise(16000), 16000)
+    coordinator.evaluate_speech("나는 학교에 갑니다", path)
+    coordinator.stop_evaluation()
+    assert coordinator.components is components
+    assert coordinator.sentence_manager is sentence_manager
+    assert coordinator.previous_timeline is first
+    assert coordinator.previous_results[0]["gop_score"] == 50.0
+    assert coordinator.attempt == 2
+
+    # 문장이 바뀌면 직전 시도를 버림
+    assert coordinator.initialize("오늘은 날씨가 좋습니다")
+    assert coordinator.previous_timeline is None
+    assert coordinator.previous_results == {}
+    assert coordinator.attempt == 1
@@ -0,0 +1,110 @@
+import os
+import shutil
+
+import numpy as np
+
+from realtime_engine_ko.result_cache import ResultCache, external_data_files, fingerprint, model_fingerprint
+
+AUDIO = np.linspace(-0.5, 0.5, 1600, dtype=np.float32)
+
+
+def _model(tmp_path, content=b"model-v1"):
+    path = tmp_path / "model.onnx"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_fingerprint_changes_with_every_input():
+    base = fingerprint(AUDIO, "나는 학교에 갑니다", "m1", {"band": None})
+    assert base == fingerprint(AUDIO.astype(np.float64), "나는 학교에 갑니다", "m1", {"band": None})
+    assert base != fingerprint(AUDIO * 0.9, "나는 학교에 갑니다", "m1", {"band": None})
+    assert base != fingerprint(AUDIO, "나는 학교에 가요", "m1", {"band": None})
+    assert base != fingerprint(AUDIO, "나는 학교에 갑니다", "m2", {"band": None})
+    assert base != fingerprint(AUDIO, "나는 학교에 갑니다", "m1", {"band": 0.15})
+
+
+def test_memory_tier_is_lru_and_returns_copies():
+    cache = ResultCache(max_entries=2)
+    for key in "abc":
+        cache.put(key, "m", {"words": [key]})
+    assert cache.get("a", "m") is None
+    result = cache.get("b", "m")
+    result["words"].append("changed")
+    assert cache.get("b", "m") == {"words": ["b"]}
+    stats = cache.stats()
+    assert (stats["entries"], stats["misses"], stats["hits"]["memory"]) == (2, 1, 2)
+
+
+def test_disk_tier_survives_a_new_cache_instance(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    ResultCache(cache_dir=cache_dir).put("k", "modelhash" * 4, {"overall": 71.5})
+
+    fresh = ResultCache(cache_dir=cache_dir)
+    assert fresh.get("k", "modelhash" * 4) == {"overall": 71.5}
+    assert fresh.stats()["hits"] == {"memory": 0, "disk": 1}
+    assert fresh.get("k", "modelhash" * 4) == {"overall": 71.5}
+    assert fresh.stats()["hits"] == {"memory": 1, "disk": 1}
+
+
+def test_changed_model_file_invalidates_its_results(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path / "cache"))
+    model_path = _model(tmp_path)
+    old_hash = cache.model_hash(model_path)
+    assert old_hash == model_fingerprint(model_path)
+    cache.put("k", old_hash, {"overall": 50.0})
+    assert os.path.isdir(cache._model_dir(old_hash))
+
+    # 같은 경로에 다른 모델
+    _model(tmp_path, b"model-v2-retrained")
+    new_hash = cache.model_hash(model_path)
+    assert new_hash != old_hash
+    assert cache.get("k", old_hash) is None
+    assert not os.path.exists(cache._model_dir(old_hash))
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_unchanged_model_keeps_results(tmp_path):
+    cache = ResultCache()
+    model_path = _model(tmp_path)
+    model_hash = cache.model_hash(model_path)
+    cache.put("k", model_hash, {"overall": 50.0})
+    assert cache.model_hash(model_path) == model_hash
+    assert cache.get("k", model_hash) == {"overall": 50.0}
+
+
+def test_external_weight_change_changes_the_model_hash(tmp_path, tiny_model_path):
+    from realtime_engine_ko.shared_model import export_external_data
+
+    source = str(tmp_path / "tiny.onnx")
+    shutil.copy(tiny_model_path, source)
+    model_path = export_external_data(source)
+    data_path, = external_data_files(model_path)
+    assert data_path == model_path + ".data"
+
+    cache = ResultCache()
+    old_hash = cache.model_hash(model_path)
+    cache.put("k", old_hash, {"overall": 50.0})
+
+    # 그래프 파일은 그대로 두고 가중치 파일만 바뀜
+    with open(data_path, "r+b") as f:
+        first = f.read(1)
+        f.seek(0)
+        f.write(bytes([first[0] ^ 0xFF]))
+    stat = os.stat(data_path)
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    new_hash = cache.model_hash(model_path)
+    assert new_hash != old_hash
+    assert cache.get("k", old_hash) is None
+
+
+def test_shrinking_capacity_trims_oldest(tmp_path):
+    cache = ResultCache(max_entries=3)
+    for key in "abc":
+        cache.put(key, "m", {})
+    cache.configure(max_entries=1)
+    assert cache.get("c", "m") == {}
+    assert cache.get("a", "m") is None
+
+    cache.configure(max_entries=0)
+    cache.put("d", "m", {})
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+
+import pytest
+
+from realtime_engine_ko.scheduler import Scheduler, TimerWheel
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = Scheduler(workers=4)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_call_every_ticks_at_interval(scheduler):
+    ticks = []
+    handle = scheduler.call_every(0.02, lambda: ticks.append(time.monotonic()))
+    time.sleep(0.3)
+    handle.cancel()
+    assert 8 <= len(ticks) <= 20
+    assert scheduler.stats()["timers"] == 0
+
+
+def test_many_sessions_share_fixed_threads(scheduler):
+    counts = [0] * 100
+    handles = [scheduler.call_every(0.02, lambda i=i: counts.__setitem__(i, counts[i] + 1)) for i in range(100)]
+    assert _wait_for(lambda: min(counts) >= 3)
+    threads = scheduler.stats()["threads"]
+    assert threads["wheel"] == 1
+    assert threads["workers"] <= 4
+    for handle in handles:
+        handle.cancel()
+
+
+def test_wakeups_while_running_coalesce_into_one_rerun(scheduler):
+    release = threading.Event()
+    started = threading.Event()
+    runs, active, overlap = [], [0], []
+
+    def callback():
+        active[0] += 1
+        overlap.append(active[0] > 1)
+        runs.append(1)
+        started.set()
+        if len(runs) == 1:
+            release.wait(2.0)
+        active[0] -= 1
+
+    handle = scheduler.call_every(60.0, callback)
+    assert started.wait(1.0)
+    for _ in range(5):
+        handle._submit()
+    release.set()
+    assert _wait_for(lambda: handle._idle.is_set())
+    assert len(runs) == 2
+    assert not any(overlap)
+    handle.cancel()
+
+
+def test_cancel_waits_for_running_callback_and_stops_ticks(scheduler):
+    started = threading.Event()
+    finished = []
+
+    def callback():
+        started.set()
+        time.sleep(0.1)
+        finished.append(time.monotonic())
+
+    handle = scheduler.call_every(0.01, callback)
+    assert started.wait(1.0)
+    assert handle.cancel(timeout=1.0)
+    count = len(finished)
+    assert count >= 1
+    time.sleep(0.1)
+    assert len(finished) == count
+
+
+def test_cancel_from_inside_callback_does_not_block(scheduler):
+    done = threading.Event()
+    holder = {}
+
+    def callback():
+        holder["result"] = holder["handle"].cancel(timeout=5.0)
+        done.set()
+
+    holder["handle"] = scheduler.call_every(0.01, callback, first_delay=0.05)
+    assert done.wait(1.0)
+    assert holder["result"] is True
+
+
+@pytest.mark.parametrize("use_inotify", [None, False])
+def test_watch_file_batches_writes(tmp_path, use_inotify):
+    scheduler = Scheduler(workers=2, use_inotify=use_inotify)
+    path = tmp_path / "recording.raw"
+    path.write_bytes(b"")
+    sizes = []
+    watch = scheduler.watch_file(str(path), lambda: sizes.append(os.path.getsize(path)), min_interval=0.05)
+    try:
+        for _ in range(20):
+            with open(path, "ab") as f:
+                f.write(b"x" * 100)
+            time.sleep(0.01)
+        assert _wait_for(lambda: sizes and sizes[-1] == 2000)
+        # 10ms마다 쓴 20번을 min_interval 간격으로 묶어서 읽음
+        assert len(sizes) < 15
+        assert scheduler.stats()["watches"] == 1
+        if use_inotify is False:
+            assert scheduler.backend == "poll"
+    finally:
+        watch.cancel()
+        scheduler.shutdown()
+    assert scheduler.stats()["watches"] == 0
+
+
+def test_timer_wheel_handles_delays_longer_than_one_rotation():
+    wheel = TimerWheel(tick=0.01, slots=4)
+    fired = []
+    start = time.monotonic()
+    wheel.add(0.15, lambda: fired.append(time.monotonic() - start))
+    try:
+        assert _wait_for(lambda: fired, timeout=1.0)
+        assert fired[0] >= 0.14
+        assert len(wheel) == 0
+    finally:
+        wheel.stop()
+
+
+def test_shutdown_cancels_everything_and_restarts_on_next_use(scheduler):
+    ticks = []
+    scheduler.call_every(0.01, lambda: ticks.append(1))
+    assert _wait_for(lambda: ticks)
+    scheduler.shutdown()
+    assert scheduler.stats()["timers"] == 0
+    count = len(ticks)
+    time.sleep(0.05)
+    assert len(ticks) == count
+
+    again = []
+    handle = scheduler.call_every(0.01, lambda: again.append(1))
+    assert _wait_for(lambda: again)
+    handle.cancel()
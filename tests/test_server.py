@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+for module in ("torch", "onnxruntime", "tokenizers", "soundfile"):
+    pytest.importorskip(module)
+
+from realtime_engine_ko.server import PROCESS_OPTIONS, StreamingServer
+
+SENTENCE = "나는 학교에 갑니다"
+
+
+def _pcm(seconds, seed=0):
+    audio = np.random.default_rng(seed).standard_normal(int(seconds * 16000)) * 3000
+    return audio.astype("<i2").tobytes()
+
+
+async def _request(port, method, path, body=None, chunked=False, close_body=True):
+    """요청을 보내고 (상태, 헤더, 본문) 반환. chunked 응답은 풀어서 돌려줌"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+    if body is not None and chunked:
+        head += "Transfer-Encoding: chunked\r\n\r\n"
+        writer.write(head.encode())
+        for start in range(0, len(body), 3200):
+            piece = body[start:start + 3200]
+            writer.write(f"{len(piece):x}\r\n".encode() + piece + b"\r\n")
+            await writer.drain()
+        if close_body:
+            writer.write(b"0\r\n\r\n")
+    else:
+        head += f"Content-Length: {len(body or b'')}\r\n\r\n"
+        writer.write(head.encode() + (body or b""))
+    await writer.drain()
+
+    raw = await asyncio.wait_for(reader.read(), 60)
+    writer.close()
+    head_raw, _, payload = raw.partition(b"\r\n\r\n")
+    lines = head_raw.decode("latin-1").split("\r\n")
+    headers = {k.strip().lower(): v.strip() for k, v in (line.split(":", 1) for line in lines[1:])}
+    if headers.get("transfer-encoding") == "chunked":
+        body_out = b""
+        while payload:
+            size_line, _, payload = payload.partition(b"\r\n")
+            size = int(size_line, 16)
+            if size == 0:
+                break
+            body_out += payload[:size]
+            payload = payload[size + 2:]
+        payload = body_out
+    return int(lines[0].split()[1]), headers, payload
+
+
+def _events(payload):
+    return [json.loads(line) for line in payload.decode("utf-8").splitlines() if line]
+
+
+def _run(server, scenario):
+    async def main():
+        port = await server.start()
+        try:
+            return await scenario(port)
+        finally:
+            await server.drain(timeout=10.0)
+    return asyncio.run(main())
+
+
+def test_process_wide_options_are_rejected_per_session(tiny_engine):
+    with pytest.raises(ValueError):
+        StreamingServer()
+    for option in PROCESS_OPTIONS:
+        with pytest.raises(ValueError):
+            StreamingServer(recognition_engine=tiny_engine, port=0, coordinator_options={option: None})
+
+
+def test_health_stats_and_errors(tiny_engine):
+    server = StreamingServer(recognition_engine=tiny_engine, port=0, workers=2)
+
+    async def scenario(port):
+        health = await _request(port, "GET", "/healthz")
+        stats = await _request(port, "GET", "/stats")
+        metrics = await _request(port, "GET", "/metrics")
+        missing = await _request(port, "GET", "/nope")
+        wrong_method = await _request(port, "GET", "/stream?sentence=x")
+        no_sentence = await _request(port, "POST", "/stream", body=b"")
+        return health, stats, metrics, missing, wrong_method, no_sentence
+
+    health, stats, metrics, missing, wrong_method, no_sentence = _run(server, scenario)
+    assert health[0] == 200 and json.loads(health[2]) == {"status": "ok", "sessions": 0}
+    assert stats[0] == 200 and json.loads(stats[2])["sessions"]["active"] == 0
+    assert metrics[0] == 200 and metrics[1]["content-type"].startswith("text/plain")
+    assert (missing[0], wrong_method[0], no_sentence[0]) == (404, 405, 400)
+
+
+@pytest.mark.parametrize("chunked", [True, False])
+def test_stream_session_emits_started_scores_and_end(tiny_engine, chunked):
+    server = StreamingServer(recognition_engine=tiny_engine, port=0, workers=2)
+    path = "/stream?sentence=" + SENTENCE.replace(" ", "%20")
+
+    status, headers, payload = _run(server, lambda port: _request(port, "POST", path, body=_pcm(4.5),
+                                                                  chunked=chunked))
+    events = _events(payload)
+    assert status == 200 and headers["content-type"] == "application/x-ndjson"
+    assert events[0] == {"event": "started", "session_id": headers["x-session-id"]}
+    assert events[-1]["event"] == "end" and events[-1]["session_id"] == headers["x-session-id"]
+    assert any(e["event"] == "score" for e in events[1:-1])
+    assert server.accepted == 1 and not server.sessions
+
+
+def test_session_cap_rejects_with_503_and_idle_sessions_time_out(tiny_engine):
+    server = StreamingServer(recognition_engine=tiny_engine, port=0, workers=2, max_sessions=1, idle_timeout=0.5)
+    path = "/stream?sentence=" + SENTENCE.replace(" ", "%20")
+
+    async def scenario(port):
+        # 본문을 끝내지 않는 세션이 슬롯을 차지한 동안 두 번째 세션은 거절
+        first = asyncio.ensure_future(_request(port, "POST", path, body=_pcm(0.2), chunked=True, close_body=False))
+        while server.accepted == 0:
+            await asyncio.sleep(0.01)
+        second = await _request(port, "POST", path, body=b"")
+        return await first, second
+
+    first, second = _run(server, scenario)
+    assert second[0] == 503 and server.rejected == 1
+    events = _events(first[2])
+    assert {"event": "error", "reason": "idle_timeout"} in events
+    assert events[-1]["event"] == "end"
+    assert server.timed_out == 1
+
+
+def test_drain_rejects_new_sessions(tiny_engine):
+    server = StreamingServer(recognition_engine=tiny_engine, port=0, workers=2)
+
+    async def scenario(port):
+        server.draining = True
+        health = await _request(port, "GET", "/healthz")
+        stream = await _request(port, "POST", "/stream?sentence=x", body=b"")
+        return health, stream
+
+    health, stream = _run(server, scenario)
+    assert health[0] == 503 and json.loads(health[2])["status"] == "draining"
+    assert stream[0] == 503
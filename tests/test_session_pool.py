@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from realtime_engine_ko.sentence_block import SentenceBlockManager
+from realtime_engine_ko.session_pool import SessionComponentPool
+
+
+def test_release_then_acquire_reuses_and_reconfigures():
+    pool = SessionComponentPool(recognition_engine=None, max_idle=2)
+    first = pool.acquire("나는 학교에 갑니다", chunk_duration=2.0, confidence_threshold=0.7)
+    first.progress_tracker.record_block_timing(0, 1.0)
+    first.audio_processor.received_samples = 16000
+    pool.release(first)
+
+    second = pool.acquire("오늘 날씨가 정말 좋네요 그렇죠", chunk_duration=1.5, confidence_threshold=0.5,
+                          subsequence_threshold=12.0, keep_recording=True)
+    assert second is first
+    assert pool.get_stats() == {"created": 1, "reused": 1, "idle": 0}
+    fresh = SentenceBlockManager("오늘 날씨가 정말 좋네요 그렇죠")
+    assert [b.text for b in second.sentence_manager.blocks] == [b.text for b in fresh.blocks]
+    assert second.progress_tracker.total_blocks == len(second.sentence_manager.blocks)
+    assert second.audio_processor.chunk_duration == 1.5
+    assert second.audio_processor.keep_recording is True
+    assert second.audio_processor.received_samples == 0
+    assert second.eval_controller.confidence_threshold == 0.5
+    assert second.eval_controller.subsequence_threshold == 12.0
+
+
+def test_timeline_is_kept_only_for_the_same_settings():
+    pool = SessionComponentPool(recognition_engine=None)
+    components = pool.acquire("나는 학교에 갑니다", timeline_duration=60.0)
+    timeline = components.timeline
+    assert components.eval_controller.timeline is timeline
+    pool.release(components)
+
+    components = pool.acquire("나는 학교에 갑니다", timeline_duration=60.0)
+    assert components.timeline is timeline
+    pool.release(components)
+
+    components = pool.acquire("나는 학교에 갑니다", timeline_duration=30.0)
+    assert components.timeline is not timeline
+    pool.release(components)
+
+    components = pool.acquire("나는 학교에 갑니다", timeline_duration=0)
+    assert components.timeline is None and components.eval_controller.timeline is None
+
+
+def test_idle_bundles_are_capped():
+    pool = SessionComponentPool(recognition_engine=None, max_idle=1)
+    bundles = [pool.acquire("나는 학교에 갑니다") for _ in range(3)]
+    for components in bundles:
+        pool.release(components)
+    assert pool.get_stats() == {"created": 3, "reused": 0, "idle": 1}
+    pool.clear()
+    assert pool.get_stats()["idle"] == 0
+
+
+def test_warmup_times_each_duration(tiny_engine):
+    timings = tiny_engine.warmup(durations=(0.5, 1.0))
+    assert sorted(timings) == [0.5, 1.0]
+    assert all(t >= 0.0 for t in timings.values())
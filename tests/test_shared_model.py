@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+import shutil
+import sys
+
+import numpy as np
+import pytest
+
+for module in ("torch", "onnx", "onnxruntime", "tokenizers"):
+    pytest.importorskip(module)
+
+import torch
+
+from realtime_engine_ko.shared_model import SharedModel, external_data_path, process_memory, start_workers
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+from conftest import TOKENIZER
+
+AUDIO = torch.from_numpy(np.random.default_rng(0).standard_normal((1, 8000)).astype(np.float32))
+
+
+@pytest.fixture
+def shared(tmp_path, tiny_model_path):
+    model = str(tmp_path / "tiny.onnx")
+    shutil.copy(tiny_model_path, model)
+    shared = SharedModel(model, TOKENIZER)
+    yield shared
+    shared.close()
+
+
+def test_weights_are_memory_mapped_from_external_data(shared):
+    assert os.path.exists(external_data_path(shared.onnx_model_path))
+    assert shared.initializers
+    assert all(isinstance(array, np.memmap) and not array.flags.writeable
+               for array in shared.initializers.values())
+    assert not shared.prototype_matrix.flags.writeable
+
+
+def test_shared_engine_matches_a_normally_loaded_engine(shared):
+    reference = Wav2VecCTCOnnxCore(shared.onnx_model_path, TOKENIZER, alignment_backend="numpy")
+    engine = shared.create_engine(alignment_backend="numpy")
+
+    assert engine.prototype_matrix is shared.prototype_matrix
+    np.testing.assert_array_equal(engine.prototype_matrix, reference.prototype_matrix)
+    X_ref, logits_ref = reference.encode(AUDIO, reuse_outputs=False)
+    X, logits = engine.encode(AUDIO, reuse_outputs=False)
+    np.testing.assert_allclose(X, X_ref, rtol=1e-5, atol=1e-6)
+
+    # prepacking을 끈 공유 세션은 ORT의 DequantizeLinear+MatMul 융합(int8 활성값)을 타지 않으므로
+    # 융합 전 그래프와 같은 logits를 내고, 기본 세션과는 양자화 오차만큼만 다름
+    np.testing.assert_allclose(logits, _unfused_logits(shared.onnx_model_path), rtol=1e-5, atol=1e-5)
+    assert np.abs(logits - logits_ref).max() < 0.05
+
+
+def _unfused_logits(model_path):
+    """그래프 융합 없이 (기본 최적화만) 실행한 logits"""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+    return session.run(None, {session.get_inputs()[0].name: AUDIO.numpy()})[1][0]
+
+
+def _write_outputs(engine, index, out_dir=None):
+    X, logits = engine.encode(AUDIO, reuse_outputs=False)
+    np.save(os.path.join(out_dir, f"worker{index}_hidden.npy"), X)
+    np.save(os.path.join(out_dir, f"worker{index}.npy"), logits)
+
+
+@pytest.mark.skipif(sys.platform != "linux" or "fork" not in multiprocessing.get_all_start_methods(),
+                    reason="fork가 필요함")
+def test_forked_workers_score_with_the_shared_model(tmp_path, shared):
+    out_dir = str(tmp_path)
+
+    def target(engine, index):
+        _write_outputs(engine, index, out_dir)
+
+    workers = start_workers(shared, target, 2, alignment_backend="numpy")
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+    _, expected = shared.create_engine(alignment_backend="numpy").encode(AUDIO, reuse_outputs=False)
+    # 워커 세션과 기본 세션 비교: hidden은 같고, logits는 융합 전 그래프와 같으며 기본 세션과는 양자화 오차 이내
+    reference = Wav2VecCTCOnnxCore(shared.onnx_model_path, TOKENIZER, alignment_backend="numpy")
+    X_ref, logits_ref = reference.encode(AUDIO, reuse_outputs=False)
+    unfused = _unfused_logits(shared.onnx_model_path)
+    for index in range(2):
+        logits = np.load(os.path.join(out_dir, f"worker{index}.npy"))
+        np.testing.assert_allclose(logits, expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(np.load(os.path.join(out_dir, f"worker{index}_hidden.npy")), X_ref,
+                                   rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(logits, unfused, rtol=1e-5, atol=1e-5)
+        assert np.abs(logits - logits_ref).max() < 0.05
+
+
+def test_process_memory_reads_smaps():
+    memory = process_memory()
+    if memory is None:
+        pytest.skip("/proc/<pid>/smaps_rollup 없음")
+    assert memory["rss"] >= memory["pss"] > 0
@@ -0,0 +1,84 @@
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import load_syllables, make_audio, make_sentence
+
+from conftest import TOKENIZER
+
+
+def test_synthetic_sentence_uses_vocab_syllables():
+    syllables = load_syllables(TOKENIZER)
+    assert syllables and all(len(s) == 1 and "가" <= s <= "힣" for s in syllables)
+
+    sentence = make_sentence(syllables, 5, seed=3)
+    words = sentence.split(" ")
+    assert len(words) == 5 and all(1 <= len(w) <= 4 for w in words)
+    assert set("".join(words)) <= set(syllables)
+    assert make_sentence(syllables, 5, seed=3) == sentence
+
+
+def test_synthetic_audio_is_deterministic_and_voiced():
+    audio = make_audio(1.5, seed=1)
+    assert audio.dtype == np.float32 and audio.shape == (24000,)
+    assert np.abs(audio).max() == pytest.approx(0.8)
+    np.testing.assert_array_equal(audio, make_audio(1.5, seed=1))
+    # 10ms 프레임 에너지가 VAD 임계값(0.0005)을 넘는 프레임이 대부분
+    energies = np.mean(audio[:24000].reshape(150, 160) ** 2, axis=1)
+    assert np.mean(energies > 0.0005) > 0.5
+
+
+def _result(total, encoder):
+    return {"results": [{"audio_seconds": 1.0, "num_words": 2, "total": total,
+                         "stages": {"encoder": encoder, "dtw": 0.01}}]}
+
+
+def test_compare_to_baseline_flags_slow_stages_only():
+    from benchmarks.stage_bench import compare_to_baseline
+
+    baseline = _result(total=2.0, encoder=1.0)
+    assert compare_to_baseline(_result(total=2.1, encoder=1.1), baseline) == []
+
+    regressions = compare_to_baseline(_result(total=3.0, encoder=2.0), baseline)
+    assert [(r["stage"], r["ratio"]) for r in regressions] == [("encoder", 2.0), ("total", 1.5)]
+
+    # 아주 짧은 단계(dtw 0.01ms -> 0.04ms)는 잡음으로 보고 무시
+    noisy = _result(total=2.0, encoder=1.0)
+    noisy["results"][0]["stages"]["dtw"] = 0.04
+    assert compare_to_baseline(noisy, baseline) == []
+    # 기준에 없는 조합은 비교하지 않음
+    assert compare_to_baseline({"results": [dict(_result(9.0, 9.0)["results"][0], num_words=8)]}, baseline) == []
+
+
+def test_run_benchmark_reports_every_stage():
+    for module in ("torch", "onnx", "onnxruntime", "tokenizers"):
+        pytest.importorskip(module)
+    from benchmarks.stage_bench import STAGES, run_benchmark
+
+    result = run_benchmark(TOKENIZER, audio_seconds=(1.0,), sentence_words=(2, 3), repeats=1,
+                           hidden_dim=16, alignment_backend="numpy")
+    assert result["meta"]["model"] == "synthetic"
+    assert result["meta"]["hidden_dim"] == 16
+    assert [(r["audio_seconds"], r["num_words"]) for r in result["results"]] == [(1.0, 2), (1.0, 3)]
+    for row in result["results"]:
+        assert set(row["stages"]) == set(STAGES)
+        assert row["total"] == pytest.approx(sum(row["stages"].values()), abs=1e-3)
+
+
+def test_cli_exits_nonzero_on_regression(tmp_path, capsys):
+    for module in ("torch", "onnx", "onnxruntime", "tokenizers"):
+        pytest.importorskip(module)
+    from benchmarks.__main__ import main
+
+    out = tmp_path / "bench.json"
+    args = ["--audio-seconds", "1", "--words", "2", "--repeats", "1", "--hidden-dim", "16", "--backend", "numpy"]
+    assert main(args + ["--out", str(out)]) == 0
+
+    baseline = json.loads(out.read_text(encoding="utf-8"))
+    for row in baseline["results"]:
+        row["total"] = row["total"] / 100.0
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+    assert main(args + ["--baseline", str(baseline_path)]) == 1
+    assert "성능 회귀" in capsys.readouterr().out
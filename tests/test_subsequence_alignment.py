@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from realtime_engine_ko.alignment_backends import NumpyDtwBackend
+
+
+def _planted(seed=1, start=30, noise=0.1):
+    rng = np.random.RandomState(seed)
+    protos = rng.randn(5, 8)
+    durations = [3, 5, 2, 6, 4]
+    X = rng.randn(80, 8) + 3
+    segment = np.concatenate([np.repeat(protos[[t]], d, 0) for t, d in enumerate(durations)])
+    X[start:start + len(segment)] = segment + rng.randn(len(segment), 8) * noise
+    return X, protos, start, start + len(segment)
+
+
+def test_finds_planted_block_inside_chunk():
+    X, protos, start, end = _planted()
+    pX, pY, cost = NumpyDtwBackend().subsequence_align(X, np.repeat(protos, 4, axis=0))
+    assert start <= pX[0] <= start + 1
+    assert end - 2 <= pX[-1] <= end
+    np.testing.assert_array_equal(pY, np.arange(20))
+    assert np.all(np.diff(pX) >= 0) and np.all(np.diff(pX) <= 2)
+    assert cost < 1.0
+
+
+def test_cost_is_length_normalized():
+    X, protos, _, _ = _planted()
+    Y = np.repeat(protos, 4, axis=0)
+    pX, pY, cost = NumpyDtwBackend().subsequence_align(X, Y)
+    path_cost = np.linalg.norm(X[pX] - Y[pY], axis=1).sum()
+    assert cost == pytest.approx(path_cost / len(Y))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_dtw_python_open_begin_open_end(seed):
+    dtw = pytest.importorskip("dtw").dtw
+    rng = np.random.RandomState(seed)
+    X = rng.randn(int(rng.randint(20, 80)), 4)
+    Y = rng.randn(int(rng.randint(3, 12)), 4)
+    pX, pY, cost = NumpyDtwBackend().subsequence_align(X, Y)
+    # dtw-python은 참조(Y)를 쿼리로 두고 X 안에서 열린 시작/끝으로 찾음
+    expected = dtw(Y, X, open_begin=True, open_end=True, step_pattern="asymmetric")
+    np.testing.assert_array_equal(pX, expected.index2)
+    np.testing.assert_array_equal(pY, expected.index1)
+    assert cost == pytest.approx(expected.normalizedDistance)
+
+
+def test_empty_inputs_raise():
+    with pytest.raises(ValueError):
+        NumpyDtwBackend().subsequence_align(np.zeros((0, 3)), np.zeros((2, 3)))
+
+
+def test_block_gop_reports_span_on_absolute_scale(tiny_engine):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((60, tiny_engine.prototype_matrix.shape[1])).astype(np.float32)
+    logits = rng.standard_normal((60, tiny_engine.prototype_matrix.shape[0])).astype(np.float32)
+    times = np.arange(60) * 0.02 + 1.0
+
+    result = tiny_engine.calculate_block_gop(X, logits, "학교에", frame_times=times)
+    span = result["span"]
+    assert 0 <= span["start_frame"] <= span["end_frame"] < 60
+    assert span["start"] == pytest.approx(1.0 + 0.02 * span["start_frame"])
+    assert result["cost"] >= 0
+    assert 0.0 <= result["overall"] <= 100.0
+    assert tiny_engine.take_dtw_bytes() == tiny_engine.aligner.subsequence_bytes(
+        60, len(tiny_engine.tokenize("학교에")) * tiny_engine.subsequence_frames_per_token)
+
+
+def test_absolute_scores_map_uniform_to_zero_and_certain_to_hundred(tiny_engine):
+    V = tiny_engine.prototype_matrix.shape[0]
+    raw = np.array([0.0, np.log(1.0 / V), 0.5 * np.log(1.0 / V), 2 * np.log(1.0 / V), -np.inf])
+    np.testing.assert_allclose(tiny_engine.absolute_scores(raw), [100.0, 0.0, 50.0, 0.0, 0.0])
+
+
+def test_controller_uses_subsequence_threshold_in_subsequence_mode():
+    pytest.importorskip("torch")
+    from realtime_engine_ko.session_pool import SessionComponentPool
+
+    class StubEngine:
+        low_res = None
+
+    pool = SessionComponentPool(StubEngine())
+    controller = pool.acquire("나는 학교에 갑니다", confidence_threshold=30.0,
+                              subsequence_threshold=25.0).eval_controller
+    assert controller.match_threshold == 30.0
+    controller.block_alignment = "subsequence"
+    assert controller.match_threshold == 25.0
+
+    # 재사용된 묶음도 새 임계값을 받음
+    components = pool.acquire("안녕하세요")
+    pool.release(components)
+    reused = pool.acquire("안녕하세요", subsequence_threshold=12.0).eval_controller
+    reused.block_alignment = "subsequence"
+    assert reused.match_threshold == 12.0
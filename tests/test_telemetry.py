@@ -0,0 +1,114 @@
+import json
+import os
+import subprocess
+import sys
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from realtime_engine_ko.telemetry import Histogram, Telemetry, telemetry
+
+
+def test_unsampled_spans_record_nothing():
+    metrics = Telemetry(sample_rate=0.0)
+    with metrics.span("encoder"):
+        pass
+    assert metrics.snapshot()["histograms"] == {}
+
+
+def test_sampled_spans_and_counters_land_in_snapshot():
+    metrics = Telemetry(sample_rate=1.0)
+    with metrics.span("encoder"):
+        pass
+    with metrics.span("dtw", labels={"backend": "numpy"}):
+        pass
+    metrics.inc("chunks_total")
+    metrics.inc("chunks_total", 2)
+    metrics.inc("cache_hits_total", labels={"cache": "result"})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["chunks_total"] == {"": 3}
+    assert snapshot["counters"]["cache_hits_total"] == {'{cache="result"}': 1}
+    assert snapshot["histograms"]["encoder_seconds"][""]["count"] == 1
+    assert snapshot["histograms"]["dtw_seconds"]['{backend="numpy"}']["count"] == 1
+
+    metrics.reset()
+    assert metrics.snapshot()["counters"] == {}
+
+
+def test_configure_clamps_sample_rate():
+    metrics = Telemetry()
+    metrics.configure(sample_rate=3.0)
+    assert metrics.sample_rate == 1.0
+    metrics.configure(sample_rate=-1.0)
+    assert metrics.sample_rate == 0.0
+    metrics.configure()
+    assert metrics.sample_rate == 0.0
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        hist.observe(value)
+    assert hist.to_dict() == {"count": 4, "sum": 6.05, "buckets": {"0.1": 1, "1.0": 3, "+Inf": 4}}
+
+
+def test_prometheus_text_format():
+    metrics = Telemetry(namespace="test")
+    metrics.inc("chunks_total", labels={"session": "a"})
+    metrics.observe("encoder_seconds", 0.003)
+    lines = metrics.to_prometheus().splitlines()
+
+    assert "# TYPE test_chunks_total counter" in lines
+    assert 'test_chunks_total{session="a"} 1' in lines
+    assert "# TYPE test_encoder_seconds histogram" in lines
+    assert 'test_encoder_seconds_bucket{le="0.0025"} 0' in lines
+    assert 'test_encoder_seconds_bucket{le="0.005"} 1' in lines
+    assert 'test_encoder_seconds_bucket{le="+Inf"} 1' in lines
+    assert "test_encoder_seconds_count 1" in lines
+
+
+def test_http_endpoint_serves_metrics_and_snapshot():
+    metrics = Telemetry()
+    metrics.inc("chunks_total")
+    port = metrics.start_http_server(port=0)
+    try:
+        assert metrics.start_http_server(port=0) == port
+        base = f"http://127.0.0.1:{port}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert "gop_engine_chunks_total 1" in response.read().decode("utf-8")
+        with urllib.request.urlopen(f"{base}/snapshot", timeout=5) as response:
+            assert json.load(response)["counters"]["chunks_total"] == {"": 1}
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+    finally:
+        metrics.stop_http_server()
+
+
+def test_engine_hot_path_records_spans(tiny_engine):
+    torch = pytest.importorskip("torch")
+    previous = telemetry.sample_rate
+    telemetry.configure(sample_rate=1.0)
+    try:
+        before = telemetry.snapshot()["histograms"].get("encoder_seconds", {}).get("", {}).get("count", 0)
+        audio = torch.from_numpy(np.zeros((1, 8000), dtype=np.float32))
+        tiny_engine.calculate_gop_from_tensor(audio, "나는")
+        histograms = telemetry.snapshot()["histograms"]
+    finally:
+        telemetry.configure(sample_rate=previous)
+    assert histograms["encoder_seconds"][""]["count"] == before + 1
+    assert "softmax_seconds" in histograms
+
+
+def test_library_modules_leave_logging_configuration_to_the_application():
+    # 라이브러리 모듈은 import만으로 루트 로거에 핸들러를 달지 않음 (설정은 각 main()에서)
+    modules = ["telemetry", "scheduler", "cadence_controller", "posterior_timeline", "result_cache",
+               "audio_ring", "alignment_backends", "memory_governor", "latency_accounting"]
+    code = ("import logging, sys; sys.path.insert(0, 'src'); "
+            + "; ".join(f"import realtime_engine_ko.{name}" for name in modules)
+            + "; print(len(logging.getLogger().handlers))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "0"
@@ -0,0 +1,112 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tokenizers")
+
+from benchmarks.tiny_model import build_tiny_model, tokenizer_vocab_size
+from realtime_engine_ko.w2v_onnx_core import Wav2VecCTCOnnxCore
+
+TOKENIZER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "tokenizer.json")
+
+
+def _engine(tmp_path_factory, **kwargs):
+    out = str(tmp_path_factory.mktemp("model") / "tiny.onnx")
+    build_tiny_model(out, vocab_size=tokenizer_vocab_size(TOKENIZER), hidden_dim=16, **kwargs)
+    return Wav2VecCTCOnnxCore(out, TOKENIZER, alignment_backend="numpy")
+
+
+@pytest.fixture(scope="module")
+def conv_engine(tmp_path_factory):
+    return _engine(tmp_path_factory, conv_stack=True, conv_dim=8)
+
+
+@pytest.fixture(scope="module")
+def frame_engine(tmp_path_factory):
+    return _engine(tmp_path_factory)
+
+
+def _audio(n, seed=0):
+    return torch.from_numpy(np.random.default_rng(seed).standard_normal((1, n)).astype(np.float32))
+
+
+def _session_run(engine, tensor):
+    hidden, logits = engine.session.run([engine.hidden_name, engine.logits_name], {engine.input_name: tensor.numpy()})
+    return hidden[0], logits[0]
+
+
+def _is_bound(engine, array):
+    return any(np.shares_memory(array, buf) for pair in engine._local.buffers.values() for buf in pair)
+
+
+def test_conv_stack_geometry_enables_io_binding(conv_engine, frame_engine):
+    assert conv_engine._bound_geometry == (400, 320)
+    assert frame_engine._bound_geometry is None
+
+
+@pytest.mark.parametrize("num_samples", [400, 719, 720, 721, 16000, 32123])
+def test_io_binding_matches_session_run(conv_engine, num_samples):
+    tensor = _audio(num_samples, seed=num_samples)
+    hidden, logits = conv_engine.encode(tensor)
+    assert _is_bound(conv_engine, logits)
+
+    expected_hidden, expected_logits = _session_run(conv_engine, tensor)
+    assert hidden.shape == expected_hidden.shape
+    assert logits.shape == expected_logits.shape
+    np.testing.assert_allclose(hidden, expected_hidden, rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(logits, expected_logits, rtol=1e-5, atol=1e-6)
+
+
+def test_outputs_past_max_bound_frames_use_session_run(conv_engine):
+    tensor = _audio(400 + 320 * conv_engine.max_bound_frames, seed=1)
+    hidden, logits = conv_engine.encode(tensor)
+    assert logits.shape[0] == conv_engine.max_bound_frames + 1
+    assert not _is_bound(conv_engine, logits)
+
+
+def test_bound_view_is_overwritten_by_next_encode_on_same_thread(conv_engine):
+    first_tensor, second_tensor = _audio(16000, seed=2), _audio(16000, seed=3)
+    _, first = conv_engine.encode(first_tensor)
+    first_values = first.copy()
+    _, second = conv_engine.encode(second_tensor)
+
+    assert np.shares_memory(first, second)
+    np.testing.assert_array_equal(first, second)
+    assert not np.allclose(first, first_values)
+
+    # reuse_outputs=False는 보관 가능한 새 배열
+    _, kept = conv_engine.encode(first_tensor, reuse_outputs=False)
+    conv_engine.encode(second_tensor)
+    np.testing.assert_allclose(kept, first_values, rtol=1e-5, atol=1e-6)
+
+
+def test_each_thread_gets_its_own_buffers(conv_engine):
+    tensor = _audio(16000, seed=4)
+    _, main_logits = conv_engine.encode(tensor)
+    results = {}
+
+    def worker():
+        results["logits"] = conv_engine.encode(_audio(16000, seed=5))[1]
+        results["bytes"] = conv_engine.output_buffer_bytes()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert not np.shares_memory(main_logits, results["logits"])
+    assert results["bytes"] > 0
+    np.testing.assert_allclose(main_logits, _session_run(conv_engine, tensor)[1], rtol=1e-5, atol=1e-6)
+
+
+def test_frame_model_falls_back_to_session_run(frame_engine):
+    tensor = _audio(16000, seed=6)
+    hidden, logits = frame_engine.encode(tensor)
+    expected_hidden, expected_logits = _session_run(frame_engine, tensor)
+    assert logits.shape == (50, expected_logits.shape[1])
+    np.testing.assert_array_equal(logits, expected_logits)
+    assert frame_engine.output_buffer_bytes() == 0